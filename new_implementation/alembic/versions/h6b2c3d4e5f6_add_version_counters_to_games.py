@@ -0,0 +1,37 @@
+"""add games.state_version / games.orders_version for conditional GETs
+
+Two integer write counters ``GameRepo`` bumps on every write to
+``state_json`` and ``pending_orders`` respectively. The state, orders,
+legal-orders and map routes derive their ETags from them (plus
+``phase_code``), so an ``If-None-Match`` can be answered with 304 from a
+narrow column read, before any ``state_json`` decode or map render. Existing
+rows start at 0.
+
+Revision ID: h6b2c3d4e5f6
+Revises: g5a1c2d3e4f5
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "h6b2c3d4e5f6"
+down_revision = "g5a1c2d3e4f5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "games",
+        sa.Column("state_version", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "games",
+        sa.Column("orders_version", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("games", "orders_version")
+    op.drop_column("games", "state_version")
@@ -0,0 +1,27 @@
+"""add games.state_blob: the binary-encoded GameState
+
+``engine.serialization.state_to_bytes`` output, written by ``GameRepo``
+alongside ``state_json`` and read by ``GameService`` in preference to it (no
+JSON parse, no per-unit dict rebuild). Nullable: existing rows keep working off
+``state_json`` and gain a blob on their next write.
+
+Revision ID: i7c3d4e5f6a7
+Revises: h6b2c3d4e5f6
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "i7c3d4e5f6a7"
+down_revision = "h6b2c3d4e5f6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("games", sa.Column("state_blob", sa.LargeBinary(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("games", "state_blob")
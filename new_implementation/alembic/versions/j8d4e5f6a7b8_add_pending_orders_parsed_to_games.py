@@ -0,0 +1,27 @@
+"""add games.pending_orders_parsed: pending orders already parsed
+
+``{power: [order_to_dict(order)]}`` written by ``GameService.submit_orders``
+next to the ``pending_orders`` strings, so ``process_turn`` and the orders map
+decode dicts instead of re-running the order grammar. Nullable: rows without it
+fall back to parsing the strings.
+
+Revision ID: j8d4e5f6a7b8
+Revises: i7c3d4e5f6a7
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "j8d4e5f6a7b8"
+down_revision = "i7c3d4e5f6a7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("games", sa.Column("pending_orders_parsed", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("games", "pending_orders_parsed")
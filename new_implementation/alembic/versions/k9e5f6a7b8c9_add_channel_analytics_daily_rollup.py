@@ -0,0 +1,83 @@
+"""add channel_analytics_daily rollup and covering indexes for channel_analytics
+
+``channel_analytics_daily`` holds per-game, per-channel, per-UTC-day event counts
+by type, subtype, user and power, upserted in the same transaction as each raw
+event (``DatabaseService.log_channel_analytics_event``) and backfilled here from
+the existing rows. The analytics summaries read whole days from it instead of
+aggregating every raw event.
+
+On ``channel_analytics`` the (game_id, channel_id) index is replaced by
+(game_id, channel_id, id) and (game_id, channel_id, event_type, id) for the
+keyset-paginated event list, plus a (game_id, channel_id, created_at) index
+covering the columns the partial-day aggregates read.
+
+Revision ID: k9e5f6a7b8c9
+Revises: j8d4e5f6a7b8
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "k9e5f6a7b8c9"
+down_revision = "j8d4e5f6a7b8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "channel_analytics_daily",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("game_id", sa.Integer(), nullable=False),
+        sa.Column("channel_id", sa.String(255), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("event_type", sa.String(50), nullable=False),
+        sa.Column("event_subtype", sa.String(50), nullable=False, server_default=""),
+        sa.Column("user_id", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("power", sa.String(20), nullable=False, server_default=""),
+        sa.Column("event_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("last_event_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["game_id"], ["games.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "game_id", "channel_id", "day", "event_type", "event_subtype", "user_id", "power",
+            name="uq_channel_analytics_daily_key",
+        ),
+    )
+    op.execute(
+        """
+        INSERT INTO channel_analytics_daily
+            (game_id, channel_id, day, event_type, event_subtype, user_id, power, event_count, last_event_at)
+        SELECT game_id, channel_id, CAST(created_at AS DATE), event_type,
+               COALESCE(event_subtype, ''), COALESCE(user_id, 0), COALESCE(power, ''),
+               COUNT(*), MAX(created_at)
+        FROM channel_analytics
+        GROUP BY game_id, channel_id, CAST(created_at AS DATE), event_type,
+                 COALESCE(event_subtype, ''), COALESCE(user_id, 0), COALESCE(power, '')
+        """
+    )
+
+    op.drop_index("ix_channel_analytics_game_channel", table_name="channel_analytics")
+    op.create_index(
+        "ix_channel_analytics_game_channel_id", "channel_analytics", ["game_id", "channel_id", "id"]
+    )
+    op.create_index(
+        "ix_channel_analytics_game_channel_type_id",
+        "channel_analytics",
+        ["game_id", "channel_id", "event_type", "id"],
+    )
+    op.create_index(
+        "ix_channel_analytics_game_channel_created",
+        "channel_analytics",
+        ["game_id", "channel_id", "created_at"],
+        postgresql_include=["event_type", "event_subtype", "user_id", "power"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_channel_analytics_game_channel_created", table_name="channel_analytics")
+    op.drop_index("ix_channel_analytics_game_channel_type_id", table_name="channel_analytics")
+    op.drop_index("ix_channel_analytics_game_channel_id", table_name="channel_analytics")
+    op.create_index("ix_channel_analytics_game_channel", "channel_analytics", ["game_id", "channel_id"])
+    op.drop_table("channel_analytics_daily")
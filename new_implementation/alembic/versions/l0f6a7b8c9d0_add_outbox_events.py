@@ -0,0 +1,50 @@
+"""add outbox_events for post-turn side effects
+
+``process_turn`` used to run its side effects -- the map snapshot, player DMs,
+the linked channel's notice and map, the deadline update -- one after another
+after the state was committed, so a crash in between lost them and the HTTP
+response waited on Telegram and the renderer. ``GameRepo.save_state`` now
+inserts one ``outbox_events`` row per side effect in the same transaction as
+the new state; ``server/outbox.py`` runs and retries them in the background.
+At most one row per (game, turn, kind).
+
+Revision ID: l0f6a7b8c9d0
+Revises: k9e5f6a7b8c9
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "l0f6a7b8c9d0"
+down_revision = "k9e5f6a7b8c9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "outbox_events",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("game_id", sa.Integer(), nullable=False),
+        sa.Column("turn", sa.Integer(), nullable=False),
+        sa.Column("kind", sa.String(32), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("status", sa.String(16), nullable=False, server_default="pending"),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("next_attempt_at", sa.DateTime(), nullable=False),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("processed_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["game_id"], ["games.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("game_id", "turn", "kind", name="uq_outbox_events_game_turn_kind"),
+    )
+    op.create_index(
+        "ix_outbox_events_status_next_attempt", "outbox_events", ["status", "next_attempt_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_outbox_events_status_next_attempt", table_name="outbox_events")
+    op.drop_table("outbox_events")
@@ -0,0 +1,49 @@
+"""store map_snapshots as keyframes plus deltas
+
+Every processed turn wrote a ``map_snapshots`` row holding the whole board
+twice: the view-shaped ``units``/``supply_centers`` and the full
+``state_json``. Listing a game's snapshots also loaded every one of those
+blobs. Rows are now either a full ``keyframe`` or a ``delta`` against the
+keyframe in ``base_snapshot_id`` (see ``persistence/snapshots.py``), so
+``units`` and ``supply_centers`` become nullable. Existing rows are all
+keyframes, which is the server default for ``kind``.
+``(game_id, turn_number)`` is the lookup behind ``/history/{turn}`` and
+``/map/history/{turn}``.
+
+Revision ID: m1a7b8c9d0e1
+Revises: l0f6a7b8c9d0
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "m1a7b8c9d0e1"
+down_revision = "l0f6a7b8c9d0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "map_snapshots",
+        sa.Column("kind", sa.String(10), nullable=False, server_default="keyframe"),
+    )
+    op.add_column("map_snapshots", sa.Column("base_snapshot_id", sa.Integer(), nullable=True))
+    op.add_column("map_snapshots", sa.Column("delta", sa.JSON(), nullable=True))
+    op.alter_column("map_snapshots", "units", existing_type=sa.JSON(), nullable=True)
+    op.alter_column("map_snapshots", "supply_centers", existing_type=sa.JSON(), nullable=True)
+    op.create_index("ix_map_snapshots_game_turn", "map_snapshots", ["game_id", "turn_number"])
+    op.create_index("ix_map_snapshots_base", "map_snapshots", ["base_snapshot_id"])
+
+
+def downgrade() -> None:
+    # Deltas have no full payload to keep; the old layout can't represent them.
+    op.execute("DELETE FROM map_snapshots WHERE kind = 'delta'")
+    op.drop_index("ix_map_snapshots_base", table_name="map_snapshots")
+    op.drop_index("ix_map_snapshots_game_turn", table_name="map_snapshots")
+    op.alter_column("map_snapshots", "supply_centers", existing_type=sa.JSON(), nullable=False)
+    op.alter_column("map_snapshots", "units", existing_type=sa.JSON(), nullable=False)
+    op.drop_column("map_snapshots", "delta")
+    op.drop_column("map_snapshots", "base_snapshot_id")
+    op.drop_column("map_snapshots", "kind")
@@ -0,0 +1,32 @@
+"""add (game_id, recipient_power, id) and (game_id, sender_user_id, id) on messages
+
+``GET /games/{id}/messages`` now takes ``since_id`` / ``before_id`` cursors
+and a ``limit``. The reader sees broadcasts, messages to their power and
+messages they sent, an ``OR`` of three conditions. With one index per
+branch, ``id`` last, PostgreSQL bitmap-ORs three range scans bounded by the
+cursor. So a poll reads only the messages newer than the caller's last one
+instead of the game's whole history.
+
+Revision ID: n2b8c9d0e1f2
+Revises: m1a7b8c9d0e1
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+
+revision = "n2b8c9d0e1f2"
+down_revision = "m1a7b8c9d0e1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_messages_game_recipient_id", "messages", ["game_id", "recipient_power", "id"]
+    )
+    op.create_index("ix_messages_game_sender_id", "messages", ["game_id", "sender_user_id", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_messages_game_sender_id", table_name="messages")
+    op.drop_index("ix_messages_game_recipient_id", table_name="messages")
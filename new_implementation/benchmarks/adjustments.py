@@ -0,0 +1,128 @@
+"""Benchmark: civil-disorder removal ordering, per-unit BFS vs ``MapData`` distance tables.
+
+Builds winter adjustment states on a crowded board — every province occupied,
+each power keeping only a few of its centers — so almost every unit is owed as a
+disband and nobody ordered one, which makes civil disorder rank them all. The
+same states are adjudicated with the current table-backed ``_distance_to_home``
+and with the breadth-first search it replaced (kept below for comparison); the
+removals must agree.
+
+    cd new_implementation && PYTHONPATH=src python benchmarks/adjustments.py [--states 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import timeit
+from collections import deque
+from unittest import mock
+
+from engine.adjudicator import adjustments
+from engine.map_loader import MapData, load_standard_map
+from engine.types import (
+    GameState,
+    Location,
+    PhaseType,
+    ProvinceType,
+    Season,
+    Unit,
+    UnitKind,
+)
+
+
+def bfs_distance_to_home(map: MapData, power: str, unit: Unit) -> int:
+    """The previous implementation: a fresh BFS for every unit."""
+    homes = map.home_centers.get(power, frozenset())
+    if unit.province in homes:
+        return 0
+    seen = {unit.province}
+    if unit.kind is UnitKind.FLEET:
+        queue: deque = deque([(unit.location, 0)])
+        while queue:
+            loc, d = queue.popleft()
+            for nxt in map.fleet_moves(loc):
+                if nxt.province in seen:
+                    continue
+                if nxt.province in homes:
+                    return d + 1
+                seen.add(nxt.province)
+                queue.append((nxt, d + 1))
+    else:
+        queue = deque([(unit.province, 0)])
+        while queue:
+            prov, d = queue.popleft()
+            steps = set(map.army_moves(prov))
+            for floc in map.fleet_locations(prov):
+                steps.update(n.province for n in map.fleet_moves(floc))
+            for nxt in steps:
+                if nxt in seen:
+                    continue
+                if nxt in homes:
+                    return d + 1
+                seen.add(nxt)
+                queue.append((nxt, d + 1))
+    return 10_000
+
+
+def crowded_winter(map: MapData, rng: random.Random) -> GameState:
+    powers = sorted(map.home_centers)
+    units = []
+    for prov in sorted(map.provinces):
+        power = rng.choice(powers)
+        fleet_locs = map.fleet_locations(prov)
+        if map.province_type(prov) is ProvinceType.WATER or (fleet_locs and rng.random() < 0.5):
+            units.append(Unit(UnitKind.FLEET, power, rng.choice(fleet_locs)))
+        else:
+            units.append(Unit(UnitKind.ARMY, power, Location(prov)))
+    ownership = {
+        sc: power
+        for power, homes in map.home_centers.items()
+        for sc in sorted(homes)[: rng.randint(1, 2)]
+    }
+    return GameState(1905, Season.WINTER, PhaseType.ADJUSTMENT, units=frozenset(units), ownership=ownership)
+
+
+def _per_call_us(fn, number: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--states", type=int, default=20, help="random winter states")
+    parser.add_argument("--number", type=int, default=20, help="calls per timing run")
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    game_map = load_standard_map()
+    states = [crowded_winter(game_map, rng) for _ in range(args.states)]
+
+    def adjudicate(state: GameState):
+        return adjustments.adjudicate_adjustments(game_map, state, [])
+
+    cold = load_standard_map()
+    t0 = timeit.default_timer()
+    adjustments.adjudicate_adjustments(cold, states[0], [])
+    first_us = (timeit.default_timer() - t0) * 1e6
+
+    rows = {"bfs": [], "tables": []}
+    for state in states:
+        tables = adjudicate(state)
+        with mock.patch.object(adjustments, "_distance_to_home", bfs_distance_to_home):
+            assert adjudicate(state) == tables
+            rows["bfs"].append(_per_call_us(lambda s=state: adjudicate(s), args.number))
+        rows["tables"].append(_per_call_us(lambda s=state: adjudicate(s), args.number))
+
+    removals = statistics.median(
+        sum(r.result.name == "DISBAND" for r in adjudicate(s)[0].results) for s in states
+    )
+    print(f"{len(states)} winter states, {len(states[0].units)} units, ~{removals:.0f} removals each")
+    print(f"first call on a cold map (builds the rows it touches): {first_us:.0f} us")
+    print(f"{'distances':10} {'median us':>10}")
+    for name, samples in rows.items():
+        print(f"{name:10} {statistics.median(samples):10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""Benchmark: the hot GET routes on asyncpg vs the sync engine in threads.
+
+Seeds one game (seven seated players, pending orders, a few messages) in the
+database at ``SQLALCHEMY_DATABASE_URL`` (a local PostgreSQL), then for each
+driver starts ``uvicorn server._api_module:app`` in a subprocess and floods
+it with ``--concurrency`` concurrent clients for ``--seconds`` per route:
+
+- ``asyncpg`` -- ``DIPLOMACY_DB_ASYNC=1``: the routes' reads run on the
+  event loop (``persistence/async_reads.py``).
+- ``thread`` -- ``DIPLOMACY_DB_ASYNC=0``: the same queries on the sync
+  psycopg2 engine in ``asyncio.to_thread``, i.e. a bounded thread pool, which
+  is how the ``def`` versions of these routes ran.
+
+Prints requests/s, p50 and p99 latency and the error count per route and
+driver. ``/players`` and the ``/state`` body are response-cached, so those
+two mostly measure the ETag read in front of the cache.
+
+    cd new_implementation && SQLALCHEMY_DATABASE_URL=postgresql+psycopg2://... \\
+        PYTHONPATH=src python benchmarks/api_reads.py [--concurrency 64 --seconds 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from persistence.database_service import DatabaseService
+from persistence.game_repo import GameRepo
+from server.game_service import GameService
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+BOT_SECRET = "bench-secret"
+POWERS = ["AUSTRIA", "ENGLAND", "FRANCE", "GERMANY", "ITALY", "RUSSIA", "TURKEY"]
+
+
+def seed(database_url: str) -> dict[str, Any]:
+    db = DatabaseService(database_url)
+    service = GameService(GameRepo(db.session_factory))
+    game_id = service.create_game()
+    pk = int(db.get_game_by_game_id(game_id).id)
+    tag = uuid.uuid4().hex[:8]
+    users = {}
+    for power in POWERS:
+        user = db.create_user(telegram_id=f"bench_{power.lower()}_{tag}", full_name=power.title())
+        db.create_player(pk, power, int(user.id))
+        users[power] = user
+    service.submit_orders(game_id, "FRANCE", ["A PAR - BUR", "A MAR - SPA", "F BRE - MAO"])
+    for i in range(20):
+        db.create_message(pk, int(users["GERMANY"].id), None if i % 2 else "FRANCE", f"message {i}")
+    return {
+        "game_id": game_id,
+        "telegram_id": str(users["FRANCE"].telegram_id),
+        "telegram_ids": {power: str(user.telegram_id) for power, user in users.items()},
+    }
+
+
+def routes(fixture: dict[str, Any]) -> dict[str, str]:
+    gid, tid = fixture["game_id"], fixture["telegram_id"]
+    auth = f"telegram_id={tid}&bot_secret={BOT_SECRET}"
+    return {
+        "state": f"/games/{gid}/state",
+        "players": f"/games/{gid}/players",
+        "orders": f"/games/{gid}/orders/FRANCE?{auth}",
+        "messages": f"/games/{gid}/messages?{auth}",
+        "legal_orders": f"/games/{gid}/legal_orders/FRANCE",
+        "waiting_list": "/waiting_list",
+    }
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(driver: str, port: int) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join(filter(None, [str(SRC), os.environ.get("PYTHONPATH")])),
+        "DIPLOMACY_DB_ASYNC": "1" if driver == "asyncpg" else "0",
+        "DIPLOMACY_BOT_SECRET": BOT_SECRET,
+        "DIPLOMACY_DAIDE_PORT": str(_free_port()),
+    }
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "server._api_module:app",
+         "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+        env=env,
+    )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/waiting_list", timeout=1).status_code == 200:
+                return proc
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    proc.kill()
+    raise RuntimeError(f"{driver} server did not start on port {port}")
+
+
+async def flood(base: str, path: str, concurrency: int, seconds: float) -> tuple[float, list[float], int]:
+    latencies: list[float] = []
+    errors = 0
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base, limits=limits, timeout=30) as client:
+        await client.get(path)  # warm the route (and its cache) first
+        stop = time.perf_counter() + seconds
+
+        async def worker() -> None:
+            nonlocal errors
+            while time.perf_counter() < stop:
+                started = time.perf_counter()
+                resp = await client.get(path)
+                latencies.append(time.perf_counter() - started)
+                errors += resp.status_code != 200
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    return len(latencies) / elapsed, sorted(latencies), errors
+
+
+def _pct(sorted_values: list[float], q: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))] * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--seconds", type=float, default=5.0, help="per route and driver")
+    parser.add_argument("--drivers", default="thread,asyncpg")
+    parser.add_argument("--routes", default=None, help="comma-separated subset of the routes")
+    args = parser.parse_args()
+
+    database_url = os.environ.get("SQLALCHEMY_DATABASE_URL")
+    if not database_url:
+        sys.exit("set SQLALCHEMY_DATABASE_URL to a local PostgreSQL database")
+    paths = routes(seed(database_url))
+    if args.routes:
+        paths = {name: paths[name] for name in args.routes.split(",")}
+
+    print(f"{args.concurrency} concurrent clients, {args.seconds:g}s per route")
+    print(f"{'route':14} {'driver':8} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    for driver in args.drivers.split(","):
+        port = _free_port()
+        proc = start_server(driver, port)
+        try:
+            for name, path in paths.items():
+                rate, latencies, errors = asyncio.run(
+                    flood(f"http://127.0.0.1:{port}", path, args.concurrency, args.seconds)
+                )
+                print(
+                    f"{name:14} {driver:8} {rate:8.0f} {_pct(latencies, 0.5):8.1f} "
+                    f"{_pct(latencies, 0.99):8.1f} {errors:7d}"
+                )
+        finally:
+            proc.terminate()
+            proc.wait(timeout=30)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""API cases for ``suite.py``: one client against uvicorn on a local PostgreSQL.
+
+Starts ``server._api_module:app`` the way ``api_reads.py`` does (asyncpg
+reads, a bot secret) against ``SQLALCHEMY_DATABASE_URL`` and times single
+requests, one at a time -- latency, not throughput (``api_reads.py`` floods):
+
+- ``api.view`` -- ``GET /games/{id}/state`` of a seeded game.
+- ``api.submit_orders`` -- ``POST /games/set_orders``: France's three opening
+  orders, replacing its pending orders each time.
+- ``api.process_turn`` -- ``POST /games/{id}/process_turn`` on a second
+  game. Before each call, untimed, every power submits ``simple_ai`` orders
+  for the phase through ``/games/set_orders``; the benchmark plays the same
+  orders on a local ``Game`` to know the next phase, and seeds a new game if
+  the two ever disagree. The post-turn outbox (snapshot, map pre-render) runs
+  on the server afterwards and may overlap later samples.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+from contextlib import ExitStack
+from typing import Any
+
+import httpx
+import sqlalchemy.exc
+from api_reads import BOT_SECRET, POWERS, _free_port, seed, start_server
+from harness import Case, Unavailable
+
+from engine.game import Game
+from engine.orders.parser import format_order
+from engine.simple_ai import generate_orders
+from engine.types import GameStatus, Order
+
+OPENING = ["A PAR - BUR", "A MAR - SPA", "F BRE - MAO"]
+
+
+class _TurnPlayer:
+    """Keeps a server game and a local ``Game`` on the same phase."""
+
+    def __init__(self, client: httpx.Client, database_url: str) -> None:
+        self.client = client
+        self.database_url = database_url
+        self.rng = random.Random(1)
+        self.fixture: dict[str, Any] = {}
+        self.game: Game | None = None
+        self.submitted: list[Order] = []
+        self.server_phase: str | None = None
+
+    def _new_game(self) -> None:
+        self.fixture = seed(self.database_url)
+        self.game = Game.new_standard()
+        self.server_phase = None
+
+    def submit_phase(self) -> None:
+        if self.game is not None and self.server_phase is not None:
+            _, self.game = self.game.adjudicate(self.submitted)
+            if self.game.state.phase_name != self.server_phase or self.game.state.status is not GameStatus.ACTIVE:
+                self.game = None
+        if self.game is None:
+            self._new_game()
+        assert self.game is not None
+        state = self.game.state
+        kinds = {u.province: u.kind.value for u in state.units}
+        self.submitted = []
+        for power in POWERS:
+            orders = generate_orders(self.game.map, state, power, self.rng)
+            if not orders:
+                continue
+            self.client.post("/games/set_orders", json={
+                "game_id": self.fixture["game_id"],
+                "power": power,
+                "orders": [format_order(o, kinds) for o in orders],
+                "telegram_id": self.fixture["telegram_ids"][power],
+                "bot_secret": BOT_SECRET,
+            }).raise_for_status()
+            self.submitted.extend(orders)
+        self.server_phase = None
+
+    def process(self) -> None:
+        resp = self.client.post(
+            f"/games/{self.fixture['game_id']}/process_turn", headers={"X-Bot-Secret": BOT_SECRET}
+        )
+        resp.raise_for_status()
+        self.server_phase = resp.json()["phase"]
+
+
+def cases(stack: ExitStack) -> list[Case]:
+    database_url = os.environ.get("SQLALCHEMY_DATABASE_URL")
+    if not database_url:
+        raise Unavailable("set SQLALCHEMY_DATABASE_URL to a local PostgreSQL database")
+    try:
+        fixture = seed(database_url)
+    except sqlalchemy.exc.OperationalError as e:
+        raise Unavailable(f"cannot reach SQLALCHEMY_DATABASE_URL: {str(e.orig).splitlines()[0]}") from e
+    port = _free_port()
+    try:
+        proc = start_server("asyncpg", port)
+    except RuntimeError as e:
+        raise Unavailable(str(e)) from e
+    stack.callback(proc.wait, timeout=30)
+    stack.callback(proc.terminate)
+    client = stack.enter_context(httpx.Client(base_url=f"http://127.0.0.1:{port}", timeout=60))
+    game_id = fixture["game_id"]
+
+    def view() -> None:
+        client.get(f"/games/{game_id}/state").raise_for_status()
+
+    def submit_orders() -> None:
+        client.post("/games/set_orders", json={
+            "game_id": game_id,
+            "power": "FRANCE",
+            "orders": OPENING,
+            "telegram_id": fixture["telegram_id"],
+            "bot_secret": BOT_SECRET,
+        }).raise_for_status()
+
+    player = _TurnPlayer(client, database_url)
+    return [
+        Case("api.view", view, repeat=50, description="GET /games/{id}/state"),
+        Case("api.submit_orders", submit_orders, repeat=50, description="POST /games/set_orders, 3 orders"),
+        Case("api.process_turn", player.process, setup=player.submit_phase, repeat=20,
+             description="POST /games/{id}/process_turn, all seven powers ordered"),
+    ]
@@ -0,0 +1,110 @@
+"""Engine cases for ``suite.py``: adjudication, self-play, legal orders, codecs.
+
+- ``engine.adjudicate_datc`` -- every movement position the DATC tests
+  (``tests/datc``) build, adjudicated once each. The positions are collected
+  by running those tests with ``adjudicate_movement`` recorded, so new DATC
+  cases join the benchmark without being copied here.
+- ``engine.self_play_game`` -- one seeded ``simple_ai`` game from Spring 1901,
+  orders and adjudication for every phase, up to ``MAX_PHASES``.
+- ``engine.legal_orders`` -- ``legal_orders_for_power`` for all seven powers
+  over the states of a self-play game (``state_codec.sample_states``).
+- ``engine.codec_json`` / ``engine.codec_binary`` -- encode + decode round
+  trips of those states, as ``state_codec.py`` measures them.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import sys
+from contextlib import ExitStack
+from pathlib import Path
+from unittest import mock
+
+from harness import Case
+from state_codec import sample_states
+
+from engine.adjudicator.movement import adjudicate_movement
+from engine.game import Game
+from engine.map_loader import MapData
+from engine.serialization import state_from_bytes, state_from_dict, state_to_bytes, state_to_dict
+from engine.simple_ai import generate_orders
+from engine.types import GameState, GameStatus, Order
+from server.legal_orders import legal_orders_for_power
+
+MAX_PHASES = 120
+POWERS = ("AUSTRIA", "ENGLAND", "FRANCE", "GERMANY", "ITALY", "RUSSIA", "TURKEY")
+
+
+def datc_positions() -> list[tuple[MapData, GameState, list[Order]]]:
+    # tests/ lives beside src/, which is all PYTHONPATH normally holds.
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    import tests.datc as datc_package
+    from tests.datc import harness as datc_harness
+
+    positions: list[tuple[MapData, GameState, list[Order]]] = []
+
+    def record(map: MapData, state: GameState, orders: list[Order]):
+        positions.append((map, state, list(orders)))
+        return adjudicate_movement(map, state, orders)
+
+    with mock.patch.object(datc_harness, "adjudicate_movement", record):
+        for path in sorted(Path(datc_package.__file__).parent.glob("test_datc_*.py")):
+            module = __import__(f"tests.datc.{path.stem}", fromlist=["_"])
+            for name in sorted(dir(module)):
+                if name.startswith("test_"):
+                    try:
+                        getattr(module, name)()
+                    except Exception:  # noqa: BLE001, S110 -- xfail cases still contribute their position
+                        pass
+    return positions
+
+
+def self_play(seed: int = 1) -> Game:
+    game = Game.new_standard()
+    rng = random.Random(seed)
+    for _ in range(MAX_PHASES):
+        if game.state.status is not GameStatus.ACTIVE:
+            break
+        orders = [o for p in POWERS for o in generate_orders(game.map, game.state, p, rng)]
+        _, game = game.adjudicate(orders)
+    return game
+
+
+def cases(stack: ExitStack) -> list[Case]:
+    positions = datc_positions()
+    game_map = Game.new_standard().map
+    states = sample_states(40)
+    texts = [json.dumps(state_to_dict(s)) for s in states]
+    blobs = [state_to_bytes(s, game_map) for s in states]
+    phases = len(self_play().history)
+
+    def adjudicate_all() -> None:
+        for position_map, state, orders in positions:
+            adjudicate_movement(position_map, state, orders)
+
+    def legal_orders() -> None:
+        for state in states:
+            for power in POWERS:
+                legal_orders_for_power(game_map, state, power)
+
+    def codec_json() -> None:
+        for state in states:
+            state_from_dict(json.loads(json.dumps(state_to_dict(state))))
+
+    def codec_binary() -> None:
+        for state in states:
+            state_from_bytes(state_to_bytes(state, game_map), game_map)
+
+    return [
+        Case("engine.adjudicate_datc", adjudicate_all, repeat=20, items=len(positions),
+             description=f"{len(positions)} DATC movement positions"),
+        Case("engine.self_play_game", self_play, repeat=5, items=phases,
+             description=f"seeded simple_ai game, {phases} phases"),
+        Case("engine.legal_orders", legal_orders, repeat=10, items=len(states) * len(POWERS),
+             description=f"legal orders for 7 powers over {len(states)} self-play states"),
+        Case("engine.codec_json", codec_json, repeat=20, items=len(states),
+             description=f"state_to_dict + json round trip, {len(states)} states ({sum(map(len, texts))} bytes)"),
+        Case("engine.codec_binary", codec_binary, repeat=20, items=len(states),
+             description=f"state_to_bytes round trip, {len(states)} states ({sum(map(len, blobs))} bytes)"),
+    ]
@@ -0,0 +1,103 @@
+"""Rendering cases for ``suite.py``: base, orders and resolution maps, cold and warm.
+
+The board is Fall 1902 of a seeded self-play game (every power has units
+out and orders that support, bounce and dislodge), turned into the same
+renderer inputs the map routes build from a ``GameService.view``
+(``rendering.view_adapter``, ``rendering.order_overlay``):
+
+- ``rendering.<map>.cold`` -- ``MapCache`` (memory and the shared disk
+  directory) cleared before every render, i.e. a first request. The
+  parsed-SVG and font caches are process-wide and stay warm, as they are on a
+  running server.
+- ``rendering.<map>.warm`` -- the same render again: a ``MapCache`` hit.
+
+Run from ``new_implementation/`` so ``maps/standard.svg`` resolves.
+"""
+
+from __future__ import annotations
+
+import random
+from contextlib import ExitStack
+from typing import Any
+
+from harness import Case, Unavailable
+
+from engine.game import Game
+from engine.serialization import resolution_to_dict, unit_to_dict
+from engine.simple_ai import generate_orders
+from engine.types import GameState, Order
+
+POWERS = ("AUSTRIA", "ENGLAND", "FRANCE", "GERMANY", "ITALY", "RUSSIA", "TURKEY")
+PHASE = "F1902M"
+
+
+def _view(state: GameState) -> dict[str, Any]:
+    units_by_power: dict[str, list[dict[str, Any]]] = {}
+    for u in sorted(state.units, key=lambda x: str(x.location)):
+        units_by_power.setdefault(u.power, []).append(unit_to_dict(u))
+    return {
+        "year": state.year,
+        "season": state.season.value,
+        "phase_type": state.phase_type.value,
+        "phase": state.phase_name,
+        "units_by_power": units_by_power,
+        "ownership": dict(state.ownership),
+        "contested": sorted(state.contested),
+    }
+
+
+def _phase(seed: int = 1) -> tuple[GameState, dict[str, list[Order]], dict[str, Any], GameState]:
+    """The state at ``PHASE``, its orders by power, their resolution and the state after."""
+    game = Game.new_standard()
+    rng = random.Random(seed)
+    while True:
+        orders = {p: generate_orders(game.map, game.state, p, rng) for p in POWERS}
+        resolution, after = game.adjudicate([o for os_ in orders.values() for o in os_])
+        if game.state.phase_name == PHASE:
+            return game.state, orders, resolution_to_dict(resolution), after.state
+        game = after
+
+
+def cases(stack: ExitStack) -> list[Case]:
+    try:
+        from rendering.cache import clear_map_cache
+        from rendering.map import Map
+    except (ImportError, OSError) as e:  # cairosvg, or the cairo library it loads
+        raise Unavailable(f"rendering needs cairosvg and cairo: {str(e).splitlines()[0]}") from e
+    from rendering.order_overlay import orders_by_power_to_viz, resolution_dict_to_viz
+    from rendering.view_adapter import phase_info, svg_path_for_map_name, units_for_render
+
+    state, orders, resolution, after = _phase()
+    svg_path = svg_path_for_map_name("standard")
+    before_view, after_view = _view(state), _view(after)
+
+    def kinds(view: dict[str, Any]) -> dict[str, str]:
+        return {u["location"].split("/")[0]: u["kind"] for us in view["units_by_power"].values() for u in us}
+
+    def base() -> bytes:
+        return Map.render_board_png(
+            svg_path, units_for_render(before_view), phase_info=phase_info(before_view, 4),
+            supply_center_control=before_view["ownership"],
+        )
+
+    def orders_map() -> bytes:
+        return Map.render_board_png_orders(
+            svg_path, units_for_render(before_view), orders_by_power_to_viz(orders, kinds(before_view)),
+            phase_info=phase_info(before_view, 4), supply_center_control=before_view["ownership"],
+        )
+
+    def resolution_map() -> bytes:
+        conflicts = {"conflicts": [{"province": p, "result": "standoff"} for p in after_view["contested"]]}
+        return Map.render_board_png_resolution(
+            svg_path, units_for_render(after_view), resolution_dict_to_viz(resolution, kinds(after_view)),
+            conflicts, phase_info=phase_info(after_view, 5), supply_center_control=after_view["ownership"],
+        )
+
+    stack.callback(clear_map_cache)
+    out = []
+    for name, render in (("base", base), ("orders", orders_map), ("resolution", resolution_map)):
+        out.append(Case(f"rendering.{name}.cold", render, setup=clear_map_cache, repeat=10,
+                        description=f"{name} map of {PHASE}, empty MapCache"))
+        out.append(Case(f"rendering.{name}.warm", render, number=20, repeat=10,
+                        description=f"{name} map of {PHASE}, MapCache hit"))
+    return out
@@ -0,0 +1,128 @@
+"""Benchmark: DAIDE framing + token codec throughput under many local clients.
+
+Starts an in-process TCP listener and floods it from ``--clients`` concurrent
+connections, each pipelining ``--messages`` order-sized diplomacy messages
+(a ``SUB`` of a support order). The listener decodes every payload into tokens
+and answers each with a ``THX``-sized frame, using one of two loops:
+
+- ``legacy`` -- what `DaideSession` did before: ``wire.read_message`` (two
+  ``readexactly`` awaits per frame), a ``Token.from_bytes`` per 2-byte slice,
+  and ``write_message`` (one ``drain`` per reply).
+- ``current`` -- `wire.FrameReader`, `tokens.decode_tokens`, and replies queued
+  for a writer task that flushes each burst with one ``write_frames`` call.
+
+Only the wire layer is exercised (no `GameService`, no database), so the
+numbers are the framing/codec ceiling, not end-to-end game throughput -- see
+``python -m server.daide.loadtest`` for that.
+
+    cd new_implementation && PYTHONPATH=src python benchmarks/daide_wire.py [--clients 50 --messages 2000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from server.daide import tokens as t
+from server.daide import wire
+
+_ORDER = [
+    t.SUB, t.OPEN_PAREN, t.OPEN_PAREN, t.FRA, t.AMY, t.PAR, t.CLOSE_PAREN, t.SUP,
+    t.OPEN_PAREN, t.FRA, t.AMY, t.MAR, t.CLOSE_PAREN, t.MTO, t.BUR, t.CLOSE_PAREN,
+]
+_REQUEST = wire.DiplomacyMessage(t.encode_tokens(_ORDER)).to_bytes()
+
+
+def _reply_for(tokens_: list[t.Token]) -> bytes:
+    return wire.DiplomacyMessage(t.encode_tokens([t.THX, *tokens_[1:], t.OPEN_PAREN, t.MBV, t.CLOSE_PAREN])).to_bytes()
+
+
+async def _legacy(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        while True:
+            msg = await wire.read_message(reader)
+            if isinstance(msg, wire.FinalMessage):
+                break
+            payload = msg.payload
+            tokens_ = [t.Token.from_bytes(bytes(payload[i : i + 2])) for i in range(0, len(payload), 2)]
+            writer.write(_reply_for(tokens_))
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def _current(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    outbox: asyncio.Queue[bytes | None] = asyncio.Queue()
+
+    async def drain() -> None:
+        while True:
+            burst = [await outbox.get()]
+            while not outbox.empty():
+                burst.append(outbox.get_nowait())
+            if None in burst:
+                await wire.write_frames(writer, burst[: burst.index(None)])
+                return
+            await wire.write_frames(writer, burst)
+
+    writer_task = asyncio.create_task(drain())
+    frames = wire.FrameReader(reader)
+    try:
+        while True:
+            msg = await frames.read_message()
+            if isinstance(msg, wire.FinalMessage):
+                break
+            outbox.put_nowait(_reply_for(t.decode_tokens(msg.payload)))
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        outbox.put_nowait(None)
+        await writer_task
+        writer.close()
+
+
+async def _client(port: int, messages: int) -> None:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    frames = wire.FrameReader(reader)
+
+    async def send() -> None:
+        for start in range(0, messages, 100):
+            writer.write(_REQUEST * min(100, messages - start))
+            await writer.drain()
+
+    sender = asyncio.create_task(send())
+    for _ in range(messages):
+        await frames.read_message()
+    await sender
+    await wire.write_message(writer, wire.FinalMessage())
+    writer.close()
+
+
+async def run(handler, clients: int, messages: int) -> float:
+    server = await asyncio.start_server(handler, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    start = time.perf_counter()
+    await asyncio.gather(*(_client(port, messages) for _ in range(clients)))
+    elapsed = time.perf_counter() - start
+    server.close()
+    await server.wait_closed()
+    return clients * messages / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--messages", type=int, default=2000, help="messages per client")
+    args = parser.parse_args()
+
+    print(f"{args.clients} clients x {args.messages} messages ({len(_ORDER)} tokens each)")
+    print(f"{'loop':8} {'msgs/s':>10}")
+    for name, handler in (("legacy", _legacy), ("current", _current)):
+        rate = asyncio.run(run(handler, args.clients, args.messages))
+        print(f"{name:8} {rate:10.0f}")
+
+
+if __name__ == "__main__":
+    main()
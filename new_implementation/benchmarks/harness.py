@@ -0,0 +1,177 @@
+"""Timing, machine metadata, JSON results and baseline comparison for ``suite.py``.
+
+A suite module (``bench_engine.py``, ``bench_rendering.py``, ``bench_api.py``)
+exposes ``cases(stack) -> list[Case]``; anything it has to start or clean up
+(a uvicorn subprocess) goes on the ``ExitStack``, and a suite that cannot run
+here (no database, no cairo) raises ``Unavailable`` so the run records why it
+was skipped instead of failing.
+
+- **Per-call seconds.** A sample times ``number`` back-to-back calls of
+  ``Case.run`` and divides; ``Case.setup`` runs untimed before each sample (a
+  cold cache, the next phase's orders). One untimed warm-up call comes first.
+- **Medians compared.** Results keep min, median, mean and stdev; ``compare``
+  judges the median, which one noisy sample on a shared box cannot move much.
+- **Same machine or it's noise.** A result file carries the machine it ran on
+  (CPU model and count, OS, Python, git commit); ``compare`` warns when the
+  baseline came from a different CPU or Python.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import socket
+import statistics
+import subprocess
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+SCHEMA = 1
+HERE = Path(__file__).resolve().parent
+
+
+class Unavailable(Exception):
+    """A suite cannot run in this environment; the message says why."""
+
+
+@dataclass
+class Case:
+    name: str
+    run: Callable[[], object]
+    setup: Callable[[], object] | None = None
+    number: int = 1
+    repeat: int = 10
+    items: int = 1  # positions / states / renders one ``run`` covers, for per-item figures
+    description: str = ""
+
+
+def time_case(case: Case, repeat: int | None = None) -> dict[str, Any]:
+    repeat = repeat or case.repeat
+    if case.setup:
+        case.setup()
+    case.run()  # warm-up
+    samples = []
+    for _ in range(repeat):
+        if case.setup:
+            case.setup()
+        started = time.perf_counter()
+        for _ in range(case.number):
+            case.run()
+        samples.append((time.perf_counter() - started) / case.number)
+    return {
+        "description": case.description,
+        "unit": "seconds",
+        "median": statistics.median(samples),
+        "min": min(samples),
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "repeat": repeat,
+        "number": case.number,
+        "items": case.items,
+    }
+
+
+def _cpu_model() -> str:
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+def _git(*args: str) -> str:
+    try:
+        out = subprocess.run(["git", *args], cwd=HERE, capture_output=True, text=True, timeout=10, check=True)
+    except (OSError, subprocess.SubprocessError):
+        return ""
+    return out.stdout.strip()
+
+
+def _version(package: str) -> str | None:
+    try:
+        return metadata.version(package)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def machine_info() -> dict[str, Any]:
+    try:
+        memory = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (ValueError, OSError, AttributeError):
+        memory = None
+    return {
+        "hostname": socket.gethostname(),
+        "cpu": _cpu_model(),
+        "cpu_count": os.cpu_count(),
+        "memory_bytes": memory,
+        "os": platform.platform(),
+        "python": f"{platform.python_implementation()} {platform.python_version()}",
+        "packages": {p: _version(p) for p in ("pillow", "cairosvg", "sqlalchemy", "fastapi", "uvicorn")},
+        "git_commit": _git("rev-parse", "HEAD"),
+        "git_dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+    }
+
+
+def new_result() -> dict[str, Any]:
+    return {
+        "schema": SCHEMA,
+        "created": datetime.now(UTC).isoformat(timespec="seconds"),
+        "machine": machine_info(),
+        "skipped": {},
+        "results": {},
+    }
+
+
+def write_result(result: dict[str, Any], path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(result, indent=2, sort_keys=True) + "\n")
+
+
+def load_result(path: Path) -> dict[str, Any]:
+    result = json.loads(path.read_text())
+    if result.get("schema") != SCHEMA:
+        raise ValueError(f"{path}: unsupported result schema {result.get('schema')!r}")
+    return result
+
+
+@dataclass
+class Comparison:
+    name: str
+    baseline: float | None
+    current: float | None
+
+    @property
+    def change(self) -> float | None:
+        """Relative change of the median; +0.25 is 25% slower."""
+        if not self.baseline or self.current is None:
+            return None
+        return self.current / self.baseline - 1
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any]) -> list[Comparison]:
+    names = sorted(baseline["results"].keys() | current["results"].keys())
+    return [
+        Comparison(
+            name,
+            baseline["results"].get(name, {}).get("median"),
+            current["results"].get(name, {}).get("median"),
+        )
+        for name in names
+    ]
+
+
+def machine_mismatches(baseline: dict[str, Any], current: dict[str, Any]) -> list[str]:
+    return [
+        f"{key}: {baseline['machine'].get(key)} -> {current['machine'].get(key)}"
+        for key in ("cpu", "cpu_count", "python")
+        if baseline["machine"].get(key) != current["machine"].get(key)
+    ]
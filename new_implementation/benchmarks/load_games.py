@@ -0,0 +1,269 @@
+"""Load generator: many concurrent games played through the HTTP API.
+
+Sizes an instance before a tournament. Against a server it starts itself
+(``uvicorn server._api_module:app`` on ``SQLALCHEMY_DATABASE_URL``, as
+``api_reads.py`` does) or an existing one (``--url``), it creates ``--games``
+games, registers and seats seven simulated players in each through the bot's
+endpoints, and plays up to ``--phases`` phases of every game at once. Each
+phase, every player does what a Telegram player's bot session does:
+
+- ``GET /games/{id}/state`` and ``GET /games/{id}/legal_orders/{power}``
+  (the status message and the order menu);
+- ``POST /games/set_orders`` with ``simple_ai`` orders for the state it read;
+- ``GET /games/{id}/map`` for a ``--map-share`` of players (``/map``).
+
+Once all seven have submitted, the game takes a slot from a shared pacer
+(``--turn-rate`` ``process_turn`` calls per second across all games, ``0``
+for as fast as possible), calls ``POST /games/{id}/process_turn`` and fetches
+``/games/{id}/map/resolution`` as the channel post does. Players pause up to
+``--think`` seconds between requests.
+
+Prints requests, errors, requests/s and p50/p95/p99 latency per endpoint
+(route templates, not game ids), turns per second overall, and how many
+submitted orders the server rejected (``set_orders`` answers 200 either way,
+so a client/server rules mismatch would not show up as errors); ``--json``
+also writes them with the machine they ran on (``harness.machine_info``).
+
+    cd new_implementation && SQLALCHEMY_DATABASE_URL=postgresql+psycopg2://... \\
+        PYTHONPATH=src python benchmarks/load_games.py [--games 20 --phases 12 --turn-rate 2]
+    PYTHONPATH=src python benchmarks/load_games.py --url http://staging:8000 --bot-secret ...
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+import uuid
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+import httpx
+from api_reads import BOT_SECRET, POWERS, _free_port, _pct, start_server
+from harness import machine_info
+
+from engine.map_loader import MapData, load_standard_map
+from engine.orders.parser import format_order
+from engine.serialization import state_from_dict
+from engine.simple_ai import generate_orders
+from engine.types import GameStatus
+
+
+class Recorder:
+    """Latencies and failures per endpoint template."""
+
+    def __init__(self) -> None:
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+        self.statuses: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self.rejected_orders = 0
+
+    async def call(
+        self, client: httpx.AsyncClient, method: str, endpoint: str, url: str, **kwargs: Any
+    ) -> httpx.Response | None:
+        name = f"{method} {endpoint}"
+        started = time.perf_counter()
+        try:
+            resp = await client.request(method, url, **kwargs)
+        except httpx.HTTPError as e:
+            self.latencies[name].append(time.perf_counter() - started)
+            self.errors[name] += 1
+            self.statuses[name][type(e).__name__] += 1
+            return None
+        self.latencies[name].append(time.perf_counter() - started)
+        self.statuses[name][str(resp.status_code)] += 1
+        if not resp.is_success:
+            self.errors[name] += 1
+            return None
+        return resp
+
+    def report(self, elapsed: float) -> dict[str, dict[str, Any]]:
+        out = {}
+        for name in sorted(self.latencies):
+            values = sorted(self.latencies[name])
+            out[name] = {
+                "requests": len(values),
+                "errors": self.errors[name],
+                "error_rate": self.errors[name] / len(values),
+                "requests_per_second": len(values) / elapsed,
+                "p50_ms": _pct(values, 0.5),
+                "p95_ms": _pct(values, 0.95),
+                "p99_ms": _pct(values, 0.99),
+                "statuses": dict(self.statuses[name]),
+            }
+        return out
+
+
+class Pacer:
+    """Spaces callers ``1 / rate`` seconds apart across every game."""
+
+    def __init__(self, rate: float) -> None:
+        self.interval = 1 / rate if rate > 0 else 0.0
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        if not self.interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        await asyncio.sleep(slot - now)
+
+
+class SimulatedGame:
+    def __init__(self, index: int, tag: str, client: httpx.AsyncClient, rec: Recorder,
+                 pacer: Pacer, game_map: MapData, args: argparse.Namespace) -> None:
+        self.client = client
+        self.rec = rec
+        self.pacer = pacer
+        self.map = game_map
+        self.args = args
+        self.rng = random.Random(index)
+        self.telegram_ids = {p: f"load_{tag}_{index}_{p.lower()}" for p in POWERS}
+        self.game_id = ""
+        self.turns = 0
+
+    async def _think(self) -> None:
+        if self.args.think:
+            await asyncio.sleep(self.rng.uniform(0, self.args.think))
+
+    async def setup(self) -> bool:
+        secret = self.args.bot_secret
+        resp = await self.rec.call(self.client, "POST", "/games/create", "/games/create",
+                                   json={"map_name": "standard"}, headers={"X-Bot-Secret": secret})
+        if resp is None:
+            return False
+        self.game_id = str(resp.json()["game_id"])
+        for power, telegram_id in self.telegram_ids.items():
+            body = {"telegram_id": telegram_id, "full_name": f"Load {power.title()}", "bot_secret": secret}
+            if await self.rec.call(self.client, "POST", "/users/persistent_register",
+                                   "/users/persistent_register", json=body) is None:
+                return False
+            body = {"telegram_id": telegram_id, "power": power, "bot_secret": secret}
+            if await self.rec.call(self.client, "POST", "/games/{id}/join",
+                                   f"/games/{self.game_id}/join", json=body) is None:
+                return False
+        return True
+
+    async def play_power(self, power: str) -> None:
+        gid = self.game_id
+        resp = await self.rec.call(self.client, "GET", "/games/{id}/state", f"/games/{gid}/state")
+        if resp is None:
+            return
+        view = resp.json()
+        await self._think()
+        await self.rec.call(self.client, "GET", "/games/{id}/legal_orders/{power}",
+                            f"/games/{gid}/legal_orders/{power}")
+        if self.rng.random() < self.args.map_share:
+            await self._think()
+            await self.rec.call(self.client, "GET", "/games/{id}/map", f"/games/{gid}/map")
+        state = state_from_dict(view)
+        orders = generate_orders(self.map, state, power, self.rng)
+        if not orders:
+            return
+        kinds = {u["location"].split("/")[0]: u["kind"] for u in view["units"]}
+        await self._think()
+        resp = await self.rec.call(self.client, "POST", "/games/set_orders", "/games/set_orders", json={
+            "game_id": gid,
+            "power": power,
+            "orders": [format_order(o, kinds) for o in orders],
+            "telegram_id": self.telegram_ids[power],
+            "bot_secret": self.args.bot_secret,
+        })
+        if resp is not None:
+            self.rec.rejected_orders += sum(not r["success"] for r in resp.json()["results"])
+
+    async def play(self) -> None:
+        if not await self.setup():
+            return
+        for _ in range(self.args.phases):
+            await asyncio.gather(*(self.play_power(p) for p in POWERS))
+            await self.pacer.wait()
+            resp = await self.rec.call(self.client, "POST", "/games/{id}/process_turn",
+                                       f"/games/{self.game_id}/process_turn",
+                                       headers={"X-Bot-Secret": self.args.bot_secret})
+            if resp is None:
+                continue
+            self.turns += 1
+            await self.rec.call(self.client, "GET", "/games/{id}/map/resolution",
+                                f"/games/{self.game_id}/map/resolution")
+            if resp.json().get("game_status") == GameStatus.COMPLETED.value:
+                break
+
+
+async def run(base: str, args: argparse.Namespace) -> tuple[Recorder, int, float]:
+    rec = Recorder()
+    pacer = Pacer(args.turn_rate)
+    game_map = load_standard_map()
+    tag = uuid.uuid4().hex[:8]
+    limits = httpx.Limits(max_connections=args.connections, max_keepalive_connections=args.connections)
+    async with httpx.AsyncClient(base_url=base, limits=limits, timeout=args.timeout) as client:
+        games = [SimulatedGame(i, tag, client, rec, pacer, game_map, args) for i in range(args.games)]
+        started = time.perf_counter()
+        await asyncio.gather(*(g.play() for g in games))
+        elapsed = time.perf_counter() - started
+    return rec, sum(g.turns for g in games), elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=10)
+    parser.add_argument("--phases", type=int, default=12, help="most phases to play per game")
+    parser.add_argument("--turn-rate", type=float, default=2.0, help="process_turn calls/s across all games (0: unpaced)")
+    parser.add_argument("--map-share", type=float, default=0.3, help="share of players fetching the board each phase")
+    parser.add_argument("--think", type=float, default=0.2, help="longest pause between a player's requests, seconds")
+    parser.add_argument("--connections", type=int, default=100)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--url", help="an already running server (default: start one on SQLALCHEMY_DATABASE_URL)")
+    parser.add_argument("--bot-secret", default=os.environ.get("DIPLOMACY_BOT_SECRET", BOT_SECRET),
+                        help="the server's DIPLOMACY_BOT_SECRET (only with --url)")
+    parser.add_argument("--json", help="also write the report to this file")
+    args = parser.parse_args()
+
+    proc = None
+    if args.url:
+        base = args.url.rstrip("/")
+    else:
+        if not os.environ.get("SQLALCHEMY_DATABASE_URL"):
+            sys.exit("set SQLALCHEMY_DATABASE_URL to a local PostgreSQL database, or pass --url")
+        args.bot_secret = BOT_SECRET
+        port = _free_port()
+        proc = start_server("asyncpg", port)
+        base = f"http://127.0.0.1:{port}"
+    try:
+        rec, turns, elapsed = asyncio.run(run(base, args))
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait(timeout=30)
+
+    report = rec.report(elapsed)
+    requests = sum(r["requests"] for r in report.values())
+    errors = sum(r["errors"] for r in report.values())
+    print(f"{args.games} games, {turns} turns in {elapsed:.1f}s: {turns / elapsed:.2f} turns/s, "
+          f"{requests / elapsed:.0f} req/s, {errors} errors, {rec.rejected_orders} rejected orders")
+    print(f"{'endpoint':38} {'reqs':>6} {'err %':>6} {'req/s':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for name, r in report.items():
+        print(f"{name:38} {r['requests']:6d} {r['error_rate']:6.1%} {r['requests_per_second']:7.1f} "
+              f"{r['p50_ms']:8.1f} {r['p95_ms']:8.1f} {r['p99_ms']:8.1f}")
+    if args.json:
+        Path(args.json).write_text(json.dumps({
+            "machine": machine_info(),
+            "settings": {k: v for k, v in vars(args).items() if k not in ("bot_secret", "json")},
+            "elapsed_seconds": elapsed,
+            "turns": turns,
+            "turns_per_second": turns / elapsed,
+            "rejected_orders": rec.rejected_orders,
+            "endpoints": report,
+        }, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Benchmark: binary vs JSON ``GameState`` codec (``engine.serialization``).
+
+Plays a seeded self-play game with ``simple_ai`` and, for a sample of the states
+it passes through, reports encode/decode microseconds and bytes per state for
+both codecs. The JSON numbers include ``json.dumps``/``json.loads``, since that
+is what a ``state_json`` round-trip through the database costs.
+
+    cd new_implementation && PYTHONPATH=src python benchmarks/state_codec.py [--phases 40]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import timeit
+
+from engine.game import Game
+from engine.serialization import (
+    state_from_bytes,
+    state_from_dict,
+    state_to_bytes,
+    state_to_dict,
+)
+from engine.simple_ai import generate_orders
+from engine.types import GameState, GameStatus
+
+
+def sample_states(phases: int, seed: int = 1) -> list[GameState]:
+    game = Game.new_standard()
+    rng = random.Random(seed)
+    states = [game.state]
+    for _ in range(phases):
+        if game.state.status is not GameStatus.ACTIVE:
+            break
+        powers = sorted({u.power for u in game.state.units} | set(game.state.ownership.values()))
+        orders = [o for p in powers for o in generate_orders(game.map, game.state, p, rng)]
+        _, game = game.adjudicate(orders)
+        states.append(game.state)
+    return states
+
+
+def _per_call_us(fn, number: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--phases", type=int, default=40, help="self-play phases to sample")
+    parser.add_argument("--number", type=int, default=2000, help="calls per timing run")
+    args = parser.parse_args()
+
+    game_map = Game.new_standard().map
+    states = sample_states(args.phases)
+    rows = {"json": [], "binary": []}
+    for state in states:
+        text = json.dumps(state_to_dict(state))
+        blob = state_to_bytes(state, game_map)
+        assert state_from_bytes(blob, game_map) == state_from_dict(json.loads(text)) == state
+        rows["json"].append(
+            (
+                _per_call_us(lambda s=state: json.dumps(state_to_dict(s)), args.number),
+                _per_call_us(lambda t=text: state_from_dict(json.loads(t)), args.number),
+                len(text.encode()),
+            )
+        )
+        rows["binary"].append(
+            (
+                _per_call_us(lambda s=state: state_to_bytes(s, game_map), args.number),
+                _per_call_us(lambda b=blob: state_from_bytes(b, game_map), args.number),
+                len(blob),
+            )
+        )
+
+    print(f"{len(states)} states ({states[0].phase_name} .. {states[-1].phase_name}), medians:")
+    print(f"{'codec':8} {'encode us':>10} {'decode us':>10} {'bytes':>7}")
+    for codec, samples in rows.items():
+        enc, dec, size = (statistics.median(col) for col in zip(*samples))
+        print(f"{codec:8} {enc:10.1f} {dec:10.1f} {size:7.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Benchmark suite: engine, rendering and API hot paths, with stored results.
+
+``run`` times every case in the chosen suites (``bench_engine.py``,
+``bench_rendering.py``, ``bench_api.py``) and writes one JSON file: each
+case's per-call median/min/mean/stdev in seconds, plus the machine it ran on.
+``compare`` reads a stored baseline and a new result and flags every case
+whose median got slower by more than ``--threshold`` percent, exiting 1 if
+any did, so CI or a pre-merge check can gate on it::
+
+    cd new_implementation
+    PYTHONPATH=src python benchmarks/suite.py run --output baseline.json
+    # ... change things ...
+    PYTHONPATH=src python benchmarks/suite.py run --output current.json
+    PYTHONPATH=src python benchmarks/suite.py compare baseline.json current.json
+
+Suites that cannot run here are recorded as skipped, not failed: ``rendering``
+needs cairo, ``api`` needs ``SQLALCHEMY_DATABASE_URL`` (a local PostgreSQL;
+it starts its own uvicorn). Compare results from the same machine; ``compare``
+says so when the baseline's CPU or Python differs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import importlib
+import sys
+from contextlib import ExitStack
+from pathlib import Path
+
+import harness
+
+SUITES = ("engine", "rendering", "api")
+
+
+def run(args: argparse.Namespace) -> int:
+    result = harness.new_result()
+    for suite in args.suites.split(","):
+        module = importlib.import_module(f"bench_{suite}")
+        with ExitStack() as stack:
+            try:
+                cases = module.cases(stack)
+            except harness.Unavailable as e:
+                result["skipped"][suite] = str(e)
+                print(f"{suite}: skipped ({e})")
+                continue
+            for case in cases:
+                if args.filter and not fnmatch.fnmatch(case.name, args.filter):
+                    continue
+                timing = harness.time_case(case, args.repeat)
+                result["results"][case.name] = timing
+                per_item = f"  ({timing['median'] / case.items * 1e6:.1f} us/item)" if case.items > 1 else ""
+                print(f"{case.name:28} {timing['median'] * 1000:10.3f} ms{per_item}  {case.description}")
+    harness.write_result(result, Path(args.output))
+    print(f"wrote {args.output}")
+    return 0
+
+
+def compare(args: argparse.Namespace) -> int:
+    baseline = harness.load_result(Path(args.baseline))
+    current = harness.load_result(Path(args.current))
+    for mismatch in harness.machine_mismatches(baseline, current):
+        print(f"warning: different machine ({mismatch}); differences may not be regressions")
+    threshold = args.threshold / 100
+    regressions = 0
+    print(f"{'case':28} {'baseline ms':>12} {'current ms':>12} {'change':>8}")
+    for row in harness.compare(baseline, current):
+        if row.change is None:
+            print(f"{row.name:28} {'':>12} {'':>12} {'':>8}  only in {'baseline' if row.current is None else 'current'}")
+            continue
+        flag = ""
+        if row.change > threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        elif row.change < -threshold:
+            flag = "  faster"
+        print(f"{row.name:28} {row.baseline * 1000:12.3f} {row.current * 1000:12.3f} {row.change:+8.1%}{flag}")
+    for suite, reason in current["skipped"].items():
+        print(f"{suite}: not run ({reason})")
+    print(f"{regressions} regression(s) beyond {args.threshold:g}%")
+    return 1 if regressions else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="time the suites and write a JSON result")
+    run_parser.add_argument("--suites", default=",".join(SUITES), help="comma-separated subset of " + ", ".join(SUITES))
+    run_parser.add_argument("-k", "--filter", help="only cases matching this glob, e.g. 'engine.*'")
+    run_parser.add_argument("--repeat", type=int, help="samples per case (default: each case's own)")
+    run_parser.add_argument("--output", default="benchmark-results.json")
+    run_parser.set_defaults(func=run)
+
+    compare_parser = commands.add_parser("compare", help="flag regressions against a stored baseline")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=10.0, help="percent slower that counts (default 10)")
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args()
+    sys.exit(args.func(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import { describe, it, expect, vi, afterEach } from 'vitest'
+import { subscribeGameEvents } from './events'
+
+class FakeEventSource {
+  static last: FakeEventSource | null = null
+  url: string
+  closed = false
+  listeners: Record<string, (e: { data: string }) => void> = {}
+
+  constructor(url: string) {
+    this.url = url
+    FakeEventSource.last = this
+  }
+
+  addEventListener(type: string, fn: (e: { data: string }) => void) {
+    this.listeners[type] = fn
+  }
+
+  close() {
+    this.closed = true
+  }
+}
+
+describe('subscribeGameEvents', () => {
+  afterEach(() => {
+    vi.unstubAllGlobals()
+    FakeEventSource.last = null
+  })
+
+  it('is a no-op without EventSource', () => {
+    vi.stubGlobal('EventSource', undefined)
+    const onEvent = vi.fn()
+    const unsubscribe = subscribeGameEvents('42', onEvent)
+    expect(() => unsubscribe()).not.toThrow()
+    expect(onEvent).not.toHaveBeenCalled()
+  })
+
+  it('passes parsed events to the handler and closes on unsubscribe', () => {
+    vi.stubGlobal('EventSource', FakeEventSource)
+    const onEvent = vi.fn()
+    const unsubscribe = subscribeGameEvents('42', onEvent)
+    const source = FakeEventSource.last!
+    expect(source.url).toMatch(/\/games\/42\/events$/)
+
+    source.listeners.phase({ data: '{"game_id": "42", "phase": "F1901M"}' })
+    source.listeners.resync({ data: '' })
+    expect(onEvent).toHaveBeenNthCalledWith(1, 'phase', { game_id: '42', phase: 'F1901M' })
+    expect(onEvent).toHaveBeenNthCalledWith(2, 'resync', {})
+
+    unsubscribe()
+    expect(source.closed).toBe(true)
+  })
+})
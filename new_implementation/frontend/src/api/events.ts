@@ -0,0 +1,40 @@
+import { API_BASE } from './client'
+
+/** Event types published on `GET /games/{id}/events` (see `server/events.py`). */
+export type GameEventType = 'phase' | 'orders' | 'draw_vote' | 'message' | 'state' | 'resync'
+
+export const GAME_EVENT_TYPES: GameEventType[] = [
+  'phase',
+  'orders',
+  'draw_vote',
+  'message',
+  'state',
+  'resync',
+]
+
+/**
+ * Subscribe to a game's server-sent events. Events only say *what* changed; the
+ * handler re-fetches through the usual routes. `EventSource` reconnects (and
+ * resumes via `Last-Event-ID`) on its own. Returns an unsubscribe function; a
+ * no-op where `EventSource` is unavailable (jsdom, very old browsers), in which
+ * case the page simply keeps its fetch-on-load behaviour.
+ */
+export function subscribeGameEvents(
+  gameId: string,
+  onEvent: (type: GameEventType, data: Record<string, unknown>) => void
+): () => void {
+  if (typeof EventSource === 'undefined') return () => {}
+  const source = new EventSource(`${API_BASE}/games/${encodeURIComponent(gameId)}/events`)
+  for (const type of GAME_EVENT_TYPES) {
+    source.addEventListener(type, (e) => {
+      let data: Record<string, unknown> = {}
+      try {
+        data = JSON.parse((e as MessageEvent<string>).data || '{}')
+      } catch {
+        // resync frames carry no body worth parsing
+      }
+      onEvent(type, data)
+    })
+  }
+  return () => source.close()
+}
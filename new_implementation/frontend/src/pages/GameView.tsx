@@ -1,7 +1,8 @@
-import { useCallback, useEffect, useMemo, useState } from 'react'
+import { useCallback, useEffect, useMemo, useRef, useState } from 'react'
 import { useParams, Link } from 'react-router-dom'
 import { toast } from 'sonner'
 import { apiJson, apiFetch, API_BASE, ApiError } from '@/api/client'
+import { subscribeGameEvents } from '@/api/events'
 import {
   glossOrder,
   provinceLabel,
@@ -487,6 +488,8 @@ export default function GameView() {
   const [state, setState] = useState<GameState | null>(null)
   const [players, setPlayers] = useState<Player[]>([])
   const [messages, setMessages] = useState<Message[]>([])
+  /** Id of the newest message held: later fetches ask only for newer ones (`since_id`). */
+  const lastMessageId = useRef<number | null>(null)
   const [mapUrl, setMapUrl] = useState<string | null>(null)
   const [loading, setLoading] = useState(true)
   const [error, setError] = useState('')
@@ -528,10 +531,13 @@ export default function GameView() {
    * Static per map, so it is fetched once and never refreshed; `{}` until it arrives, which
    * every consumer renders correctly by falling back to the code. */
   const [provinceNames, setProvinceNames] = useState<ProvinceNames>({})
+  /** Bumped by the game's event stream so the matching effects below refetch mid-phase. */
+  const [liveTick, setLiveTick] = useState({ orders: 0, message: 0, draw_vote: 0 })
 
-  const load = useCallback(() => {
+  // `quiet` reloads (from the event stream) skip the loading state so the page doesn't flash.
+  const load = useCallback((quiet = false) => {
     if (!gameId) return
-    setLoading(true)
+    if (!quiet) setLoading(true)
     setError('')
     Promise.all([
       apiJson<GameState>(`/games/${gameId}/state`),
@@ -551,6 +557,16 @@ export default function GameView() {
 
   useEffect(() => { load() }, [load])
 
+  // Live updates: a processed turn, a restore or a lost stream reloads state (the per-phase
+  // effects follow from there); orders, messages and draw votes refetch just their panel.
+  useEffect(() => {
+    if (!gameId) return
+    return subscribeGameEvents(gameId, (type) => {
+      if (type === 'phase' || type === 'state' || type === 'resync') load(true)
+      else setLiveTick((t) => ({ ...t, [type]: t[type] + 1 }))
+    })
+  }, [gameId, load])
+
   useEffect(() => {
     const id = setInterval(() => setNow(Date.now()), 30000)
     return () => clearInterval(id)
@@ -601,12 +617,38 @@ export default function GameView() {
     }
   }, [resolution, mapModeTouched])
 
+  // The first fetch for a game/viewer loads the history; later ones (a new phase, a
+  // live "message" event, our own send) append only what arrived since. A send and the
+  // live event it triggers can fetch from the same id at once, so the append skips
+  // anything already held.
+  const loadMessages = useCallback(async () => {
+    if (!gameId) return
+    const since = lastMessageId.current
+    const d = await apiJson<{ messages?: Message[] }>(
+      since == null ? `/games/${gameId}/messages` : `/games/${gameId}/messages?since_id=${since}`,
+    )
+    const fresh = d.messages || []
+    const newest = fresh[fresh.length - 1]?.id
+    if (newest != null && (lastMessageId.current == null || newest > lastMessageId.current)) {
+      lastMessageId.current = newest
+    }
+    setMessages((prev) => {
+      if (since == null) return fresh
+      const held = prev[prev.length - 1]?.id ?? since
+      const unseen = fresh.filter((m) => m.id != null && m.id > held)
+      return unseen.length ? [...prev, ...unseen] : prev
+    })
+  }, [gameId])
+
+  useEffect(() => {
+    lastMessageId.current = null
+    setMessages([])
+  }, [gameId, user])
+
   useEffect(() => {
     if (!gameId || !user) return
-    apiJson<{ messages?: Message[] }>(`/games/${gameId}/messages`)
-      .then((d) => setMessages(d.messages || []))
-      .catch(() => {})
-  }, [gameId, user, state?.phase])
+    loadMessages().catch(() => {})
+  }, [gameId, user, state?.phase, liveTick.message, loadMessages])
 
   useEffect(() => {
     if (!gameId || !myPower || !state || state.status !== 'ACTIVE') {
@@ -616,7 +658,7 @@ export default function GameView() {
     apiJson<DrawVoteStatus>(`/games/${gameId}/draw_vote_status`)
       .then(setDrawStatus)
       .catch(() => setDrawStatus(null))
-  }, [gameId, myPower, state?.status, state?.phase])
+  }, [gameId, myPower, state?.status, state?.phase, liveTick.draw_vote])
 
   // orders_status and deadline are unauthenticated status reads (same as draw_vote_status) --
   // fetch them for every viewer, not just the logged-in power, so anyone watching the game
@@ -633,7 +675,7 @@ export default function GameView() {
     apiJson<{ deadline: string | null }>(`/games/${gameId}/deadline`)
       .then((d) => setDeadlineIso(d.deadline ?? null))
       .catch(() => setDeadlineIso(null))
-  }, [gameId, state?.status, state?.phase])
+  }, [gameId, state?.status, state?.phase, liveTick.orders])
 
   // Depends on state.phase (not just gameId/myPower) so that: (a) a phase change refetches
   // and resets selections instead of letting a previous phase's picks survive into the new
@@ -864,8 +906,7 @@ export default function GameView() {
       }
       setMessageText('')
       toast.success('Message sent')
-      const res = await apiJson<{ messages?: Message[] }>(`/games/${gameId}/messages`)
-      setMessages(res.messages || [])
+      await loadMessages()
     } catch (e) {
       setError(describeActionError(e, 'Send failed'))
     } finally {
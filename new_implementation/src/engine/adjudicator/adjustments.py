@@ -21,15 +21,12 @@ Everything is a pure function ``(map, state, orders) -> (Resolution, new_state)`
 
 from __future__ import annotations
 
-from collections import deque
-
 from engine.map_loader import MapData
 from engine.orders.validation import validate
 from engine.types import (
     Build,
     Disband,
     GameState,
-    Location,
     Order,
     OrderResult,
     Resolution,
@@ -195,43 +192,13 @@ def _distance_to_home(map: MapData, power: str, unit: Unit) -> int:
     """Shortest route (any adjacency, i.e. including convoys) to a home SC.
 
     Armies traverse land *and* sea steps (a convoy could carry them); fleets are
-    restricted to fleet adjacency. Returns a large sentinel if home is unreachable.
+    restricted to fleet adjacency. Both are lookups in the map's precomputed
+    distance tables. Returns a large sentinel if home is unreachable.
     """
-    homes = map.home_centers.get(power, frozenset())
-    if unit.province in homes:
-        return 0
-
-    seen = {unit.province}
-    if unit.kind is UnitKind.FLEET:
-        queue: deque[tuple[Location, int]] = deque([(unit.location, 0)])
-        while queue:
-            loc, d = queue.popleft()
-            for nxt in map.fleet_moves(loc):
-                if nxt.province in seen:
-                    continue
-                if nxt.province in homes:
-                    return d + 1
-                seen.add(nxt.province)
-                queue.append((nxt, d + 1))
-    else:
-        prov_queue: deque[tuple[str, int]] = deque([(unit.province, 0)])
-        while prov_queue:
-            prov, d = prov_queue.popleft()
-            for nxt_prov in _all_neighbors(map, prov):
-                if nxt_prov in seen:
-                    continue
-                if nxt_prov in homes:
-                    return d + 1
-                seen.add(nxt_prov)
-                prov_queue.append((nxt_prov, d + 1))
-
-    return 10_000  # unreachable (shouldn't happen on the standard map)
-
-
-def _all_neighbors(map: MapData, province: str) -> set[str]:
-    """All adjacent provinces regardless of type (land + sea) — convoy-inclusive."""
-    out: set[str] = set(map.army_moves(province))
-    for floc in map.fleet_locations(province):
-        for nxt in map.fleet_moves(floc):
-            out.add(nxt.province)
-    return out
+    kind = UnitKind.FLEET if unit.kind is UnitKind.FLEET else None
+    dists = [
+        d
+        for home in map.home_centers.get(power, frozenset())
+        if (d := map.distance(unit.location, home, kind)) is not None
+    ]
+    return min(dists, default=10_000)  # unreachable: shouldn't happen on the standard map
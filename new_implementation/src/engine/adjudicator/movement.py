@@ -128,16 +128,21 @@ class _Resolver:
 
         # Build resolvable items keyed by province. A Move/Support/Convoy that is
         # not legal is treated as a hold (kept out of `items`) and marked void.
-        self.items: dict[str, _Item] = {}
-        for prov, o in self.order_by_prov.items():
-            unit = self.unit_by_prov[prov]
-            if isinstance(o, Move):
-                if self._legal_move(o, unit):
-                    self.items[prov] = _Item(o, unit)
-                else:
-                    self.void.add(prov)
-            elif isinstance(o, (SupportHold, SupportMove, Convoy)):
-                self.items[prov] = _Item(o, unit)
+        # Move legality looks at the other orders (convoys on offer, swaps), so
+        # every move is judged against the full set before any is dropped --
+        # otherwise the outcome would depend on the order orders were given in.
+        self.items: dict[str, _Item] = {
+            prov: _Item(o, self.unit_by_prov[prov])
+            for prov, o in self.order_by_prov.items()
+            if isinstance(o, (Move, SupportHold, SupportMove, Convoy))
+        }
+        for prov in [
+            p
+            for p, item in self.items.items()
+            if isinstance(item.order, Move) and not self._legal_move(item.order, item.unit)
+        ]:
+            del self.items[prov]
+            self.void.add(prov)
 
         self._deps: list[str] = []
 
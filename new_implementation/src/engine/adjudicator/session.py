@@ -0,0 +1,277 @@
+"""Incremental re-adjudication of one phase for live order preview.
+
+:class:`AdjudicationSession` holds a phase's ``(map, state)`` and a working set
+of orders that can be edited one at a time, and answers "what would happen?"
+with exactly the result :func:`~engine.adjudicator.movement.adjudicate_movement`
+gives for the same orders -- without re-running the whole resolver per edit.
+
+## Why components
+
+The movement resolver's predicates (``move_succeeds``, ``support_given``,
+``convoy_survives``) only ever look at orders that name a province in common:
+the unit's own province, a move's destination, a support's target / origin /
+destination, a convoy's origin / destination. Joining orders that share such a
+province gives the *interaction components* of the position -- an undirected
+closure of every dependency edge the resolver could follow, cycles (circular
+movement, convoy paradoxes) included. A component's outcome is a pure function
+of its own orders, so the session caches each component's resolution keyed by
+its order set. Adding, changing or removing an order re-resolves only the
+component(s) it touches (before and after the edit); everything else is reused.
+
+The one genuinely global step -- retreat options, which depend on where *every*
+unit ends up and on every standoff -- is recomputed over the assembled board on
+each :meth:`AdjudicationSession.resolve`; it is a linear pass.
+
+Retreat and adjustment phases have no interdependent predicates worth caching;
+the session simply re-runs their adjudicator when an order changed.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+
+from engine.adjudicator.adjustments import adjudicate_adjustments
+from engine.adjudicator.movement import _Resolver
+from engine.adjudicator.retreats import adjudicate_retreats, compute_retreat_options
+from engine.map_loader import MapData
+from engine.types import (
+    Convoy,
+    DislodgedUnit,
+    GameState,
+    Hold,
+    Location,
+    Move,
+    Order,
+    OrderResult,
+    PhaseType,
+    Resolution,
+    SupportHold,
+    SupportMove,
+    Unit,
+)
+
+__all__ = ["AdjudicationSession"]
+
+# Resolved components kept between ``results_for`` calls before the cache is
+# dropped and refilled (``resolve`` keeps only the current position's anyway).
+COMPONENT_CACHE_SIZE = 4096
+
+
+@dataclass(frozen=True)
+class _Component:
+    """One resolved interaction component, before the global retreat pass."""
+
+    results: tuple[OrderResult, ...]
+    units: frozenset[Unit]
+    dislodged: tuple[DislodgedUnit, ...]
+    contested: frozenset[str]
+
+
+class AdjudicationSession:
+    """Adjudicate one phase repeatedly while its orders are edited.
+
+    Orders are keyed by the province of the unit they command (the last order
+    set for a unit wins, as in a full adjudication); a movement-phase order for a
+    province with no unit is ignored. :meth:`resolve` returns the same
+    ``(Resolution, GameState)`` as the phase's full adjudicator, with results
+    listed in province order. Not thread-safe: one session serves one caller.
+    """
+
+    def __init__(self, map: MapData, state: GameState) -> None:
+        self.map = map
+        self.state = state
+        self._units: dict[str, Unit] = {u.province: u for u in state.units}
+        self._orders: dict[str, Order] = {}
+        self._components: dict[frozenset[Order], _Component] = {}
+        self._result: tuple[Resolution, GameState] | None = None
+        # Components (or whole non-movement phases) resolved so far; a cache hit
+        # leaves it unchanged, which is what the tests assert on.
+        self.resolved = 0
+
+    # -- editing ------------------------------------------------------------
+
+    @property
+    def orders(self) -> list[Order]:
+        """The current working orders, in the order they were first set."""
+        return list(self._orders.values())
+
+    def set_order(self, order: Order) -> None:
+        """Add ``order``, replacing any order already set for the same unit."""
+        key = _order_key(order, self._orders)
+        if self.state.phase_type is PhaseType.MOVEMENT and key not in self._units:
+            return
+        if self._orders.get(key) != order:
+            self._orders[key] = order
+            self._result = None
+
+    def remove_order(self, unit: Location | str) -> None:
+        """Drop the order for the unit at ``unit`` (it goes back to holding)."""
+        key = unit.province if isinstance(unit, Location) else unit.upper()
+        if self._orders.pop(key, None) is not None:
+            self._result = None
+
+    def set_orders(self, orders: Iterable[Order]) -> None:
+        """Replace the working orders with ``orders``, as a diff of single edits.
+
+        Outside movement phases order matters (builds are honoured in order) and
+        nothing is cached per order, so the list is simply swapped in.
+        """
+        wanted: dict[str, Order] = {}
+        for order in orders:
+            wanted[_order_key(order, wanted)] = order
+        if self.state.phase_type is not PhaseType.MOVEMENT:
+            if list(wanted.items()) != list(self._orders.items()):
+                self._orders = wanted
+                self._result = None
+            return
+        for key in [k for k in self._orders if k not in wanted]:
+            self.remove_order(key)
+        for order in wanted.values():
+            self.set_order(order)
+
+    # -- resolving ----------------------------------------------------------
+
+    def resolve(self) -> tuple[Resolution, GameState]:
+        """The phase's ``Resolution`` and post-phase ``GameState`` for the
+        current orders (before the phase machine's transition -- the same pair
+        the phase adjudicator returns)."""
+        if self._result is None:
+            if self.state.phase_type is PhaseType.MOVEMENT:
+                self._result = self._resolve_movement()
+            else:
+                adjudicate = (
+                    adjudicate_retreats
+                    if self.state.phase_type is PhaseType.RETREAT
+                    else adjudicate_adjustments
+                )
+                self._result = adjudicate(self.map, self.state, self.orders)
+                self.resolved += 1
+        return self._result
+
+    def results_for(self, provinces: Iterable[str]) -> list[OrderResult]:
+        """Movement-phase results for the units in ``provinces`` only.
+
+        Resolves just the components those units belong to, and keeps every
+        resolved component cached across calls -- so repeatedly re-sampling the
+        rest of the board (``server.odds``) mostly hits the cache. The results'
+        ``retreat_options`` are not recomputed against the whole board; use
+        :meth:`resolve` when they matter.
+        """
+        if self.state.phase_type is not PhaseType.MOVEMENT:
+            raise ValueError("results_for is only defined for movement phases")
+        wanted = set(provinces)
+        if len(self._components) > COMPONENT_CACHE_SIZE:
+            self._components = {}
+        out: list[OrderResult] = []
+        for group in self._partition():
+            if not any(_order_province(o) in wanted for o in group):
+                continue
+            component = self._components.get(group)
+            if component is None:
+                component = self._components[group] = self._resolve_component(group)
+                self.resolved += 1
+            out.extend(r for r in component.results if _order_province(r.order) in wanted)
+        return out
+
+    def _resolve_movement(self) -> tuple[Resolution, GameState]:
+        components: dict[frozenset[Order], _Component] = {}
+        for group in self._partition():
+            component = self._components.get(group)
+            if component is None:
+                component = self._resolve_component(group)
+                self.resolved += 1
+            components[group] = component
+        # Keep only what the current position uses; an edited-away component
+        # is unlikely to come back verbatim.
+        self._components = components
+
+        units = frozenset().union(*(c.units for c in components.values()))
+        contested = frozenset().union(*(c.contested for c in components.values()))
+        occupied = frozenset(u.province for u in units)
+        dislodged: dict[str, DislodgedUnit] = {}
+        for component in components.values():
+            for d in component.dislodged:
+                retreats = compute_retreat_options(
+                    self.map, d.unit, d.attacker_origin, occupied, contested
+                )
+                dislodged[d.unit.province] = replace(d, retreats=retreats)
+
+        results: list[OrderResult] = []
+        for component in components.values():
+            for r in component.results:
+                if r.dislodged and _order_province(r.order) in dislodged:
+                    r = replace(r, retreat_options=dislodged[_order_province(r.order)].retreats)
+                results.append(r)
+        results.sort(key=lambda r: _order_province(r.order) or "")
+
+        post = GameState(
+            year=self.state.year,
+            season=self.state.season,
+            phase_type=self.state.phase_type,
+            units=units,
+            ownership=dict(self.state.ownership),
+            dislodged=tuple(dislodged[p] for p in sorted(dislodged)),
+            contested=contested,
+        )
+        return Resolution(tuple(results)), post
+
+    def _partition(self) -> list[frozenset[Order]]:
+        """Group the effective orders (implicit holds included) into components."""
+        parent: dict[str, str] = {}
+
+        def find(p: str) -> str:
+            parent.setdefault(p, p)
+            while parent[p] != p:
+                parent[p] = parent[parent[p]]
+                p = parent[p]
+            return p
+
+        effective: list[Order] = []
+        for prov, unit in self._units.items():
+            order = self._orders.get(prov) or Hold(unit.power, unit.location)
+            effective.append(order)
+            root = find(prov)
+            for other in _touched_provinces(order):
+                parent[find(other)] = root
+
+        groups: dict[str, list[Order]] = {}
+        for order in effective:
+            groups.setdefault(find(_order_province(order) or ""), []).append(order)
+        return [frozenset(g) for g in groups.values()]
+
+    def _resolve_component(self, group: frozenset[Order]) -> _Component:
+        units = frozenset(self._units[_order_province(o) or ""] for o in group)
+        sub_state = replace(self.state, units=units, dislodged=(), contested=frozenset())
+        resolution, post = _Resolver(self.map, sub_state, list(group)).run()
+        return _Component(
+            results=resolution.results,
+            units=post.units,
+            dislodged=post.dislodged,
+            contested=post.contested,
+        )
+
+
+def _order_key(order: Order, existing: dict[str, Order]) -> str:
+    """An order's unit province, or a fresh per-power slot for a ``Waive``."""
+    province = _order_province(order)
+    if province is not None:
+        return province
+    n = sum(1 for k in existing if k.startswith(f"{order.power}#"))
+    return f"{order.power}#{n}"
+
+
+def _order_province(order: Order) -> str | None:
+    loc = getattr(order, "unit", None) or getattr(order, "location", None)
+    return loc.province if loc is not None else None
+
+
+def _touched_provinces(order: Order) -> tuple[str, ...]:
+    """Provinces besides its own that ``order``'s predicates can look at."""
+    if isinstance(order, Move):
+        return (order.dest.province,)
+    if isinstance(order, SupportHold):
+        return (order.target.province,)
+    if isinstance(order, (SupportMove, Convoy)):
+        return (order.origin.province, order.dest.province)
+    return ()
@@ -44,6 +44,8 @@ their own (Switzerland) are impassable and dropped.
 from __future__ import annotations
 
 import re
+from collections import deque
+from collections.abc import Hashable, Iterable
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
@@ -90,6 +92,12 @@ class MapData:
       - ``province_type(prov)``     → ProvinceType
       - ``coasts_of(prov)``         → the split coasts, e.g. ``("EC", "SC")`` or ()
       - ``fleet_locations(prov)``   → fleet nodes for a province
+      - ``distance(frm, to, kind)`` → fewest moves from a unit position to a province
+      - ``nearest_supply_centers(frm, kind)`` → ``(distance, sc)`` pairs, nearest first
+
+    Distances come from all-pairs tables (``_DistanceTable``), one per graph,
+    whose rows are filled on first use and kept for the life of the map — so
+    civil disorder and the AI heuristics cost a lookup per unit, not a BFS.
     """
 
     provinces: frozenset[str]
@@ -105,6 +113,10 @@ class MapData:
     _army_adj: dict[str, frozenset[str]] = field(default_factory=dict)
     _fleet_adj: dict[Location, frozenset[Location]] = field(default_factory=dict)
     _split_coasts: dict[str, tuple[str, ...]] = field(default_factory=dict)
+    # Lazily built distance tables, keyed by unit kind (None = mixed graph).
+    _distances: dict[Optional[UnitKind], _DistanceTable] = field(
+        default_factory=dict, compare=False, repr=False
+    )
 
     # -- queries -----------------------------------------------------------
 
@@ -147,6 +159,111 @@ class MapData:
             return b.province in self.army_moves(a.province)
         return b in self.fleet_moves(a)
 
+    # -- distances ---------------------------------------------------------
+
+    def distance(
+        self, frm: Location | str, to: str, kind: Optional[UnitKind] = None
+    ) -> Optional[int]:
+        """Fewest moves from ``frm`` to province ``to``; ``None`` if unreachable.
+
+        ``kind`` picks the graph: ``ARMY`` walks army adjacency, ``FLEET`` walks
+        fleet adjacency from the exact coast of ``frm``, and ``None`` (mixed)
+        takes an edge of either kind — an army's route counting convoys, which
+        is what the civil-disorder rule measures.
+        """
+        table = self._distance_table(kind)
+        row = table.row(self, self._distance_node(frm, kind))
+        col = table.columns.get(to.upper())
+        if row is None or col is None or row[col] == _UNREACHABLE:
+            return None
+        return row[col]
+
+    def nearest_supply_centers(
+        self, frm: Location | str, kind: Optional[UnitKind] = None
+    ) -> tuple[tuple[int, str], ...]:
+        """Every reachable supply center as ``(distance, sc)``, nearest first."""
+        return self._distance_table(kind).nearest_scs(self, self._distance_node(frm, kind))
+
+    def _distance_node(self, frm: Location | str, kind: Optional[UnitKind]) -> Hashable:
+        if isinstance(frm, str):
+            frm = Location(frm.upper())
+        return frm if kind is UnitKind.FLEET else frm.province
+
+    def _distance_table(self, kind: Optional[UnitKind]) -> _DistanceTable:
+        table = self._distances.get(kind)
+        if table is None:
+            table = self._distances[kind] = _DistanceTable.build(self, kind)
+        return table
+
+
+_UNREACHABLE = 255  # sentinel byte in a distance row; no board is 255 moves wide
+
+
+@dataclass
+class _DistanceTable:
+    """All-pairs fewest-move counts over one adjacency graph.
+
+    ``columns`` numbers the provinces once; each source node's row is a ``bytes``
+    holding one distance per column (``_UNREACHABLE`` where there is no route),
+    filled by a single BFS the first time that row is read. A split-coast
+    destination counts as reached on whichever coast comes first. Plain data
+    only, so a map with warm tables still pickles into worker processes.
+    """
+
+    kind: Optional[UnitKind]
+    columns: dict[str, int]
+    rows: dict[Hashable, bytes] = field(default_factory=dict)
+    nearest: dict[Hashable, tuple[tuple[int, str], ...]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, map: MapData, kind: Optional[UnitKind]) -> _DistanceTable:
+        return cls(kind, {p: i for i, p in enumerate(sorted(map.provinces))})
+
+    def _neighbours(self, map: MapData, node: Hashable) -> Iterable[Hashable]:
+        if self.kind is UnitKind.FLEET:
+            return map.fleet_moves(node)
+        if self.kind is UnitKind.ARMY:
+            return map.army_moves(node)
+        out = set(map.army_moves(node))
+        for loc in map.fleet_locations(node):
+            out.update(nxt.province for nxt in map.fleet_moves(loc))
+        return out
+
+    def _province(self, node: Hashable) -> str:
+        return node.province if self.kind is UnitKind.FLEET else node
+
+    def row(self, map: MapData, node: Hashable) -> Optional[bytes]:
+        row = self.rows.get(node)
+        if row is None:
+            start = self._province(node)
+            if start not in self.columns:
+                return None
+            dist = bytearray([_UNREACHABLE]) * len(self.columns)
+            dist[self.columns[start]] = 0
+            seen = {node}
+            queue = deque([(node, 0)])
+            while queue:
+                here, d = queue.popleft()
+                for nxt in self._neighbours(map, here):
+                    if nxt in seen:
+                        continue
+                    seen.add(nxt)
+                    col = self.columns[self._province(nxt)]
+                    dist[col] = min(dist[col], d + 1)
+                    queue.append((nxt, d + 1))
+            row = self.rows[node] = bytes(dist)
+        return row
+
+    def nearest_scs(self, map: MapData, node: Hashable) -> tuple[tuple[int, str], ...]:
+        nearest = self.nearest.get(node)
+        if nearest is None:
+            row = self.row(map, node)
+            pairs = [(row[self.columns[sc]], sc) for sc in map.supply_centers] if row else []
+            nearest = self.nearest[node] = tuple(
+                sorted(p for p in pairs if p[0] != _UNREACHABLE)
+            )
+        return nearest
+
 
 def load_map(path: str | Path) -> MapData:
     """Parse a ``.map`` file at ``path`` into a ``MapData``."""
@@ -1,20 +1,28 @@
 """Order grammar: parsing, canonical formatting, and validation.
 
 ``parser`` owns the one grammar for turning order text into ``engine.types``
-``Order`` dataclasses (and back). ``validation`` owns the one structural
-validation path used everywhere an order needs a legality check before
-adjudication.
+``Order`` dataclasses (and back), one at a time or in cached batches
+(``parse_orders_bulk``). ``validation`` owns the one structural validation path
+used everywhere an order needs a legality check before adjudication.
 """
 
 from __future__ import annotations
 
-from engine.orders.parser import OrderParseError, format_order, parse_order
-from engine.orders.validation import ValidationResult, validate
+from engine.orders.parser import OrderParseError, format_order, parse_order, parse_orders_bulk
+from engine.orders.validation import (
+    ValidationContext,
+    ValidationResult,
+    validate,
+    validate_orders,
+)
 
 __all__ = [
     "OrderParseError",
+    "ValidationContext",
     "ValidationResult",
     "format_order",
     "parse_order",
+    "parse_orders_bulk",
     "validate",
+    "validate_orders",
 ]
@@ -26,11 +26,17 @@ Design notes:
   round-trip safe because the parsed ``Order`` values compare equal either
   way; only the *human-facing* kind letter is lossy, and that loss is
   inherent to the ``Order`` model, not this module.
+- ``parse_orders_bulk`` is the batch entry point for servers: it memoizes
+  successful parses in a bounded LRU keyed by (map, power, token form), so the
+  same order text resubmitted, re-displayed or re-adjudicated is parsed once.
 """
 
 from __future__ import annotations
 
 import re
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
 from typing import Optional
 
 from engine.map_loader import MapData
@@ -49,7 +55,7 @@ from engine.types import (
     Waive,
 )
 
-__all__ = ["OrderParseError", "parse_order", "format_order"]
+__all__ = ["OrderParseError", "parse_order", "parse_orders_bulk", "format_order"]
 
 
 class OrderParseError(ValueError):
@@ -277,6 +283,46 @@ def parse_order(text: str, *, power: str, map: MapData) -> Order:
     raise OrderParseError(f"unrecognized order verb: {verb!r}")
 
 
+# Bounded LRU of successful parses: (id(map), power, token form) -> (map, Order).
+# The map is kept in the value so a recycled id() can never alias another map.
+# Failures aren't cached -- they're rare, and their messages quote the raw text.
+PARSE_CACHE_SIZE = 4096
+_parse_cache: OrderedDict[tuple[int, str, str], tuple[MapData, Order]] = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
+
+def parse_orders_bulk(
+    texts: Iterable[str], *, power: str, map: MapData
+) -> list[Order | OrderParseError]:
+    """Parse many order strings for ``power``, one result per input, in order.
+
+    Each result is the ``Order``, or the ``OrderParseError`` its text raised --
+    errors are returned rather than raised so one bad line doesn't abort a
+    batch. Texts that tokenize the same (case, spacing) share a cache entry;
+    ``Order`` values are frozen, so cached instances are shared safely.
+    """
+    results: list[Order | OrderParseError] = []
+    for text in texts:
+        key = (id(map), power, " ".join(_tokenize(text)))
+        with _parse_cache_lock:
+            hit = _parse_cache.get(key)
+            if hit is not None and hit[0] is map:
+                _parse_cache.move_to_end(key)
+                results.append(hit[1])
+                continue
+        try:
+            order = parse_order(text, power=power, map=map)
+        except OrderParseError as exc:
+            results.append(exc)
+            continue
+        with _parse_cache_lock:
+            _parse_cache[key] = (map, order)
+            if len(_parse_cache) > PARSE_CACHE_SIZE:
+                _parse_cache.popitem(last=False)
+        results.append(order)
+    return results
+
+
 def _kind_letter(loc: Location, kind_by_province: Optional[dict[str, str]] = None) -> str:
     """Display kind for ``loc``: the board unit's actual kind when known via
     ``kind_by_province`` (province code → ``"A"``/``"F"``), else ``F`` if ``loc``
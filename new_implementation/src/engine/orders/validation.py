@@ -7,6 +7,10 @@ resolving standoffs, matching convoy chains). It answers questions like "does
 a unit belonging to this power actually stand here", "is the destination
 reachable", "is the coast valid" — the kind of thing that is wrong no matter
 what everyone else orders this phase.
+
+Finding "the unit at this province" is a scan of ``state.units``; a
+``ValidationContext`` indexes units and dislodged units by province once per
+state, so ``validate_orders`` checks a whole phase's batch in linear time.
 """
 
 from __future__ import annotations
@@ -34,7 +38,13 @@ from engine.types import (
     Waive,
 )
 
-__all__ = ["ValidationResult", "validate", "legal_builds"]
+__all__ = [
+    "ValidationContext",
+    "ValidationResult",
+    "validate",
+    "validate_orders",
+    "legal_builds",
+]
 
 
 @dataclass(frozen=True)
@@ -45,11 +55,23 @@ class ValidationResult:
     reason: str | None = None
 
 
-def _find_unit(loc: Location, pool: frozenset[Unit]) -> Unit | None:
-    for unit in pool:
-        if unit.province == loc.province:
-            return unit
-    return None
+class ValidationContext:
+    """Province-indexed lookups over one ``GameState``, built once and shared by
+    every ``validate`` call against that state."""
+
+    def __init__(self, state: GameState) -> None:
+        self.state = state
+        self.units: dict[str, Unit] = {u.province: u for u in state.units}
+        self.dislodged: dict[str, DislodgedUnit] = {}
+        for du in state.dislodged:
+            # First record wins, matching GameState.dislodged_at.
+            self.dislodged.setdefault(du.province, du)
+
+    def unit_at(self, province: str) -> Unit | None:
+        return self.units.get(province)
+
+    def dislodged_at(self, province: str) -> DislodgedUnit | None:
+        return self.dislodged.get(province)
 
 
 def _can_reach_province(map: MapData, frm: Location, kind: UnitKind, dest_province: str) -> bool:
@@ -62,16 +84,22 @@ def _can_reach_province(map: MapData, frm: Location, kind: UnitKind, dest_provin
     return any(loc.province == dest_province for loc in map.fleet_moves(frm))
 
 
-def validate(order: Order, state: GameState, map: MapData) -> ValidationResult:
-    """Validate ``order`` against the current ``state`` and ``map`` topology."""
+def validate(
+    order: Order, state: GameState, map: MapData, context: ValidationContext | None = None
+) -> ValidationResult:
+    """Validate ``order`` against the current ``state`` and ``map`` topology.
+
+    Pass a ``ValidationContext`` for ``state`` when validating several orders.
+    """
     if isinstance(order, Waive):
         return ValidationResult(True)
 
+    ctx = context if context is not None else ValidationContext(state)
     if isinstance(order, Build):
-        return _validate_build(order, state, map)
+        return _validate_build(order, ctx, map)
 
     if isinstance(order, Retreat):
-        du = state.dislodged_at(order.unit.province)
+        du = ctx.dislodged_at(order.unit.province)
         if du is None:
             return ValidationResult(False, f"no dislodged unit at {order.unit.province}")
         ownership_error = _check_ownership(order, du.unit)
@@ -81,10 +109,10 @@ def validate(order: Order, state: GameState, map: MapData) -> ValidationResult:
 
     if isinstance(order, Disband):
         if state.phase_type is PhaseType.RETREAT:
-            du = state.dislodged_at(order.unit.province)
+            du = ctx.dislodged_at(order.unit.province)
             unit = du.unit if du is not None else None
         else:
-            unit = _find_unit(order.unit, state.units)
+            unit = ctx.unit_at(order.unit.province)
         if unit is None:
             return ValidationResult(False, f"no unit to disband at {order.unit.province}")
         ownership_error = _check_ownership(order, unit)
@@ -93,7 +121,7 @@ def validate(order: Order, state: GameState, map: MapData) -> ValidationResult:
         return ValidationResult(True)
 
     # Hold / Move / SupportHold / SupportMove / Convoy: an on-board unit.
-    unit = state.unit_at(order.unit.province)
+    unit = ctx.unit_at(order.unit.province)
     if unit is None:
         return ValidationResult(False, f"no unit at {order.unit.province}")
     ownership_error = _check_ownership(order, unit)
@@ -120,6 +148,14 @@ def validate(order: Order, state: GameState, map: MapData) -> ValidationResult:
     return ValidationResult(False, f"unsupported order type: {order.order_type}")
 
 
+def validate_orders(
+    orders: list[Order], state: GameState, map: MapData
+) -> list[ValidationResult]:
+    """``validate`` each of ``orders`` against one shared ``ValidationContext``."""
+    ctx = ValidationContext(state)
+    return [validate(order, state, map, ctx) for order in orders]
+
+
 def _check_ownership(order: Order, unit: Unit) -> ValidationResult | None:
     if unit.power != order.power:
         return ValidationResult(
@@ -228,10 +264,12 @@ def legal_builds(power: str, state: GameState, map: MapData) -> list[Build]:
                 )
         elif ptype is not ProvinceType.LAND:
             candidates.append(Build(power, location=Location(province), kind=UnitKind.FLEET))
-    return [b for b in candidates if _validate_build(b, state, map).ok]
+    ctx = ValidationContext(state)
+    return [b for b in candidates if _validate_build(b, ctx, map).ok]
 
 
-def _validate_build(order: Build, state: GameState, map: MapData) -> ValidationResult:
+def _validate_build(order: Build, ctx: ValidationContext, map: MapData) -> ValidationResult:
+    state = ctx.state
     loc = order.location
     province = loc.province
 
@@ -239,7 +277,7 @@ def _validate_build(order: Build, state: GameState, map: MapData) -> ValidationR
         return ValidationResult(False, f"{province} is not a home supply center of {order.power}")
     if state.ownership.get(province) != order.power:
         return ValidationResult(False, f"{province} is not currently owned by {order.power}")
-    if state.unit_at(province) is not None:
+    if ctx.unit_at(province) is not None:
         return ValidationResult(False, f"{province} is occupied")
 
     ptype = map.province_type(province)
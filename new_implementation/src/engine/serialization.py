@@ -9,13 +9,26 @@ Locations are encoded as their canonical string (``"PAR"`` / ``"SPA/SC"``); ever
 enum as its ``.value``; frozensets/tuples as JSON arrays. Decoding reconstructs the
 exact frozen dataclasses, so value equality holds regardless of array order for the
 set-valued fields (``units``, ``contested``).
+
+``GameState`` also has a compact binary form (``state_to_bytes`` /
+``state_from_bytes``) for the hot load/save path: a versioned header, then every
+province, coast and power as a one-byte index into the map's interning table
+(``_Codebook``), then a CRC-32. It decodes to exactly the state the JSON codec
+does, reuses the map's ``Location``/``Unit`` instances instead of rebuilding them,
+and ``peek_state_header`` reads phase and status without touching the body. JSON
+stays the canonical, human-readable form.
 """
 
 from __future__ import annotations
 
 import json
+import struct
+import zlib
+from dataclasses import dataclass
+from operator import itemgetter
 from typing import Any
 
+from engine.map_loader import MapData, load_standard_map
 from engine.types import (
     Build,
     Convoy,
@@ -56,6 +69,11 @@ __all__ = [
     "state_from_json",
     "order_from_json",
     "resolution_from_json",
+    "STATE_CODEC_VERSION",
+    "StateHeader",
+    "state_to_bytes",
+    "state_from_bytes",
+    "peek_state_header",
 ]
 
 
@@ -278,3 +296,309 @@ def order_from_json(s: str) -> Order:
 
 def resolution_from_json(s: str) -> Resolution:
     return resolution_from_dict(json.loads(s))
+
+
+# ---------------------------------------------------------------------------
+# Binary GameState codec
+# ---------------------------------------------------------------------------
+#
+# Layout (little-endian):
+#
+#   header   magic "DS" | version u8 | flags u8 | year u16 | season u8 |
+#            phase_type u8 | status u8 | codebook fingerprint u32
+#   extras   count u16, then (len u8, utf-8) per name missing from the codebook
+#   body     symbols, u8 each (u16 with FLAG_WIDE):
+#              units      n, then (kind, power, location) per unit, by location
+#              ownership  n, then (province, power) per SC, by province
+#              dislodged  n, then (kind, power, location, origin+1 or 0,
+#                         n_retreats, retreat...) per record, in order
+#              contested  n, then provinces, sorted
+#              winners    (only with FLAG_WINNERS) n, then powers, sorted
+#   trailer  CRC-32 of everything before it, u32
+#
+# A name symbol below ``len(codebook.names)`` indexes the codebook; larger ones
+# index the blob's own ``extras``. Enum codes are positions in the enum's
+# definition order -- reordering an enum, like any layout change, must bump
+# STATE_CODEC_VERSION.
+
+STATE_CODEC_VERSION = 1
+
+_MAGIC = b"DS"
+_HEADER = struct.Struct("<2sBBHBBBI")
+_CRC = struct.Struct("<I")
+_FLAG_WINNERS = 0x01
+_FLAG_WIDE = 0x02
+
+_SEASONS = tuple(Season)
+_PHASE_TYPES = tuple(PhaseType)
+_STATUSES = tuple(GameStatus)
+_KINDS = tuple(UnitKind)
+_SEASON_CODE = {v: i for i, v in enumerate(_SEASONS)}
+_PHASE_CODE = {v: i for i, v in enumerate(_PHASE_TYPES)}
+_STATUS_CODE = {v: i for i, v in enumerate(_STATUSES)}
+_KIND_CODE = {v: i for i, v in enumerate(_KINDS)}
+_by_location = itemgetter(2)
+
+
+class _Codebook:
+    """Interning table for one map: every province, coast and power gets a small
+    integer, in an order derived only from the map's contents (so every process
+    loading the same map agrees). Also memoizes units both ways -- symbols to
+    ``Unit`` for decoding, ``Unit`` to symbols for encoding -- so a state's units
+    are neither re-created nor re-interned each time."""
+
+    def __init__(self, map: MapData) -> None:
+        provinces = sorted(map.provinces)
+        places = provinces + [f"{p}/{c}" for p in provinces for c in map.coasts_of(p)]
+        self.map = map
+        self.names: tuple[str, ...] = tuple(places) + tuple(sorted(map.home_centers))
+        self.index: dict[str, int] = {name: i for i, name in enumerate(self.names)}
+        self.locations: tuple[Location | None, ...] = tuple(
+            location_from_str(n) if i < len(places) else None for i, n in enumerate(self.names)
+        )
+        self.location_index: dict[Location, int] = {
+            loc: i for i, loc in enumerate(self.locations) if loc is not None
+        }
+        self.fingerprint = zlib.crc32("\n".join(self.names).encode())
+        self.units: dict[tuple[int, int, int], Unit] = {}
+        self.unit_syms: dict[Unit, tuple[int, int, int]] = {}
+
+
+_codebooks: dict[int, _Codebook] = {}
+_standard_map: MapData | None = None
+
+
+def _codebook(map: MapData | None) -> _Codebook:
+    global _standard_map
+    if map is None:
+        if _standard_map is None:
+            _standard_map = load_standard_map()
+        map = _standard_map
+    book = _codebooks.get(id(map))
+    if book is None or book.map is not map:
+        book = _codebooks[id(map)] = _Codebook(map)
+    return book
+
+
+@dataclass(frozen=True)
+class StateHeader:
+    """What ``peek_state_header`` reads from a binary state without decoding it."""
+
+    version: int
+    year: int
+    season: Season
+    phase_type: PhaseType
+    status: GameStatus
+    has_winners: bool
+
+    @property
+    def phase_name(self) -> str:
+        return GameState(self.year, self.season, self.phase_type).phase_name
+
+
+def state_to_bytes(state: GameState, map: MapData | None = None) -> bytes:
+    """Encode ``state`` in the binary layout above, interned against ``map``
+    (the standard map by default). Equal states always encode to equal bytes."""
+    book = _codebook(map)
+    index = book.index
+    location_index = book.location_index
+    extras: list[str] = []
+    extra_index: dict[str, int] = {}
+
+    def name(n: str) -> int:
+        i = index.get(n)
+        if i is None:
+            i = extra_index.get(n)
+            if i is None:
+                i = extra_index[n] = len(book.names) + len(extras)
+                extras.append(n)
+        return i
+
+    def location(loc: Location) -> int:
+        i = location_index.get(loc)
+        return i if i is not None else name(str(loc))
+
+    # Units on the map hit the codebook's memo; the rest are interned in location
+    # order so that the extras (and hence the bytes) don't depend on set order.
+    unit_syms = book.unit_syms
+    triples = []
+    off_map = []
+    for u in state.units:
+        t = unit_syms.get(u)
+        if t is None:
+            off_map.append(u)
+        else:
+            triples.append(t)
+    for u in sorted(off_map, key=lambda u: (u.location.province, u.location.coast or "")):
+        t = (_KIND_CODE[u.kind], name(u.power), location(u.location))
+        if t[1] < len(book.names) and t[2] < len(book.names):
+            unit_syms[u] = t
+        triples.append(t)
+    triples.sort(key=_by_location)
+    syms: list[int] = [len(triples)]
+    for t in triples:
+        syms += t
+    syms.append(len(state.ownership))
+    for province, owner in sorted(state.ownership.items()):
+        syms += (name(province), name(owner))
+    syms.append(len(state.dislodged))
+    for du in state.dislodged:
+        u = du.unit
+        syms += (_KIND_CODE[u.kind], name(u.power), location(u.location))
+        syms.append(name(du.attacker_origin) + 1 if du.attacker_origin is not None else 0)
+        syms.append(len(du.retreats))
+        syms += [location(loc) for loc in du.retreats]
+    syms.append(len(state.contested))
+    syms += [name(p) for p in sorted(state.contested)]
+    flags = 0
+    if state.winners is not None:
+        flags |= _FLAG_WINNERS
+        syms.append(len(state.winners))
+        syms += [name(p) for p in sorted(state.winners)]
+
+    top = max(syms)
+    if top > 0xFF:
+        if top > 0xFFFF:
+            raise ValueError("state too large for the binary codec")
+        flags |= _FLAG_WIDE
+        body = struct.pack(f"<{len(syms)}H", *syms)
+    else:
+        body = bytes(syms)
+    try:
+        header = _HEADER.pack(
+            _MAGIC,
+            STATE_CODEC_VERSION,
+            flags,
+            state.year,
+            _SEASON_CODE[state.season],
+            _PHASE_CODE[state.phase_type],
+            _STATUS_CODE[state.status],
+            book.fingerprint,
+        )
+    except struct.error as e:
+        raise ValueError(f"cannot encode state: {e}") from e
+    parts = [header, len(extras).to_bytes(2, "little")]
+    for n in extras:
+        raw = n.encode()
+        if len(raw) > 0xFF:
+            raise ValueError(f"name too long for the binary codec: {n!r}")
+        parts += (bytes((len(raw),)), raw)
+    parts.append(body)
+    blob = b"".join(parts)
+    return blob + _CRC.pack(zlib.crc32(blob))
+
+
+def _unpack_header(data: bytes) -> tuple[Any, ...]:
+    if len(data) < _HEADER.size:
+        raise ValueError("binary state is truncated")
+    fields = _HEADER.unpack_from(data)
+    if fields[0] != _MAGIC:
+        raise ValueError("not a binary game state")
+    if fields[1] != STATE_CODEC_VERSION:
+        raise ValueError(f"unsupported binary state version {fields[1]}")
+    return fields
+
+
+def peek_state_header(data: bytes) -> StateHeader:
+    """Year, season, phase type and status of an encoded state, from its fixed-size
+    header alone -- no checksum pass, no body decode, no map needed."""
+    _, version, flags, year, season, phase_type, status, _ = _unpack_header(data)
+    try:
+        return StateHeader(
+            version=version,
+            year=year,
+            season=_SEASONS[season],
+            phase_type=_PHASE_TYPES[phase_type],
+            status=_STATUSES[status],
+            has_winners=bool(flags & _FLAG_WINNERS),
+        )
+    except IndexError as e:
+        raise ValueError("corrupt binary state header") from e
+
+
+def state_from_bytes(data: bytes, map: MapData | None = None) -> GameState:
+    """Decode ``state_to_bytes`` output. ``map`` must be the map it was encoded
+    against; raises ``ValueError`` on a wrong map, a bad checksum or a
+    malformed payload."""
+    book = _codebook(map)
+    _, _, flags, year, season, phase_type, status, fingerprint = _unpack_header(data)
+    if fingerprint != book.fingerprint:
+        raise ValueError("binary state was encoded against a different map")
+    if len(data) < _HEADER.size + 2 + _CRC.size:
+        raise ValueError("binary state is truncated")
+    end = len(data) - _CRC.size
+    if zlib.crc32(memoryview(data)[:end]) != _CRC.unpack_from(data, end)[0]:
+        raise ValueError("binary state checksum mismatch")
+
+    pos = _HEADER.size
+    names: list[str] | tuple[str, ...] = book.names
+    n_extras = int.from_bytes(data[pos : pos + 2], "little")
+    pos += 2
+    if n_extras:
+        names = list(names)
+        for _ in range(n_extras):
+            length = data[pos]
+            names.append(data[pos + 1 : pos + 1 + length].decode())
+            pos += 1 + length
+    if flags & _FLAG_WIDE:
+        if (end - pos) % 2:
+            raise ValueError("corrupt binary state body")
+        syms: Any = struct.unpack_from(f"<{(end - pos) // 2}H", data, pos)
+    else:
+        syms = data[pos:end]
+
+    n_book = len(book.names)
+    book_locations = book.locations
+    memo = book.units
+    it = iter(syms)
+    nxt = it.__next__
+
+    def location(i: int) -> Location:
+        loc = book_locations[i] if i < n_book else None
+        return loc if loc is not None else location_from_str(names[i])
+
+    def unit() -> Unit:
+        key = (nxt(), nxt(), nxt())
+        u = memo.get(key)
+        if u is None:
+            kind, power, loc = key
+            u = Unit(kind=_KINDS[kind], power=names[power], location=location(loc))
+            if power < n_book and loc < n_book:
+                memo[key] = u
+        return u
+
+    try:
+        units = frozenset([unit() for _ in range(nxt())])
+        ownership = {names[nxt()]: names[nxt()] for _ in range(nxt())}
+        dislodged = []
+        for _ in range(nxt()):
+            du_unit = unit()
+            origin = nxt()
+            retreats = tuple([location(nxt()) for _ in range(nxt())])
+            dislodged.append(
+                DislodgedUnit(
+                    du_unit,
+                    attacker_origin=names[origin - 1] if origin else None,
+                    retreats=retreats,
+                )
+            )
+        contested = frozenset([names[nxt()] for _ in range(nxt())])
+        winners = (
+            frozenset([names[nxt()] for _ in range(nxt())]) if flags & _FLAG_WINNERS else None
+        )
+        state = GameState(
+            year=year,
+            season=_SEASONS[season],
+            phase_type=_PHASE_TYPES[phase_type],
+            units=units,
+            ownership=ownership,
+            dislodged=tuple(dislodged),
+            contested=contested,
+            status=_STATUSES[status],
+            winners=winners,
+        )
+    except (StopIteration, IndexError) as e:
+        raise ValueError("corrupt binary state body") from e
+    if next(it, None) is not None:
+        raise ValueError("corrupt binary state body: trailing data")
+    return state
@@ -3,7 +3,9 @@
 Not a real AI — a heuristic bot used for demo games and the self-play smoke test.
 It produces *legal-shaped* orders for every phase (movement, retreat, adjustment);
 anything it gets subtly wrong is simply voided by the adjudicator, so it can never
-crash the engine. Determinism is controllable via the ``seed``.
+crash the engine. Determinism is controllable via the ``seed``. The one piece of
+strategy: a moving unit usually heads for the step that brings it closest to a
+supply center its power doesn't own (a lookup in the map's distance tables).
 
 This replaces the legacy ``strategic_ai.OrderGenerator`` (deleted in M6); it depends
 only on the pure engine (``types`` + ``map_loader``) and stdlib.
@@ -50,13 +52,34 @@ def _movement_orders(
     for unit in sorted(state.units_of(power), key=lambda u: str(u.location)):
         dests = _reachable(map, unit)
         if dests and rng.random() < 0.6:
-            dest = rng.choice(dests)
+            dest = rng.choice(_toward_centers(map, state, unit, dests, rng))
             orders.append(Move(power, unit.location, dest))
         else:
             orders.append(Hold(power, unit.location))
     return orders
 
 
+def _toward_centers(
+    map: MapData, state: GameState, unit: Unit, dests: list[Location], rng: random.Random
+) -> list[Location]:
+    """Usually the ``dests`` nearest to a center ``unit``'s power doesn't own, else all.
+
+    Armies are measured over army adjacency, fleets over fleet adjacency from the
+    destination coast; a destination with no such center in reach never wins.
+    """
+    if rng.random() < 0.3:
+        return dests
+
+    def gap(dest: Location) -> int:
+        for d, sc in map.nearest_supply_centers(dest, unit.kind):
+            if state.ownership.get(sc) != unit.power:
+                return d
+        return 255
+
+    best = min(gap(d) for d in dests)
+    return [d for d in dests if gap(d) == best]
+
+
 def _retreat_orders(state: GameState, power: str, rng: random.Random) -> list[Order]:
     orders: list[Order] = []
     for du in state.dislodged:
@@ -0,0 +1,369 @@
+"""Process-wide metrics registry, served as Prometheus text at ``GET /metrics``.
+
+The engine, the renderer, the caches, the deadline scheduler, the outbox and
+the DAIDE listener all run in the API process, but none of them reported how
+long anything took. This module gives them counters, gauges and histograms
+with no third-party dependency (``rendering`` and ``persistence`` import it
+too, so it lives beside them rather than under ``server``)::
+
+    ADJUDICATE = REGISTRY.histogram(
+        "diplomacy_adjudication_seconds", "Adjudication time.", ("phase_type",)
+    )
+    with ADJUDICATE.labels("MOVEMENT").time():
+        ...
+
+- **Cheap to record.** An observation is a lock, an add and (histograms) a
+  ``bisect`` into fixed buckets. Nothing is formatted, sorted or allocated
+  until a scrape; with nobody scraping that is all a metric ever costs. Hot
+  call sites bind their ``labels(...)`` child once, at import.
+- **Bounded label sets.** Label values are phase types, render stages, route
+  templates and the like -- never game ids or users -- so series don't grow
+  with traffic.
+- **Pulled stats stay where they are.** Counters that already exist
+  (executor queues, connection pools, cache sizes) are not duplicated:
+  ``Registry.register_collector`` takes a function that reads them at scrape
+  time and returns ``Sample`` families.
+- **Idempotent registration.** Asking for a metric that exists returns it,
+  so a module imported twice (tests reload some) never raises; asking for it
+  with another type or label set does raise ``ValueError``.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Self
+
+__all__ = [
+    "CONTENT_TYPE",
+    "DEFAULT_BUCKETS",
+    "FAST_BUCKETS",
+    "REGISTRY",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "Registry",
+    "Sample",
+]
+
+#: ``Content-Type`` of ``Registry.render()`` (text exposition format 0.0.4).
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+#: Seconds; for requests, renders and adjudications.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+#: Seconds; for sub-millisecond work such as legal-order generation.
+FAST_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25)
+
+_logger = logging.getLogger("diplomacy.metrics")
+
+_NAME = re.compile(r"^[a-zA-Z_:][a-zA-Z0-9_:]*$")
+_LABEL = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+def _label_text(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values, strict=True)) + "}"
+
+
+@dataclass
+class Sample:
+    """One metric family read at scrape time by a collector: ``kind`` is
+    ``"counter"`` or ``"gauge"``; ``values`` maps label values (in
+    ``labelnames`` order) to the current value."""
+
+    name: str
+    help: str
+    kind: str
+    labelnames: tuple[str, ...] = ()
+    values: dict[tuple[str, ...], float] = field(default_factory=dict)
+
+
+class _Timer:
+    """``with metric.time():`` -- observes the elapsed seconds on exit."""
+
+    __slots__ = ("_child", "_started")
+
+    def __init__(self, child: _HistogramChild) -> None:
+        self._child = child
+
+    def __enter__(self) -> Self:
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self._child.observe(time.perf_counter() - self._started)
+
+
+class _CounterChild:
+    __slots__ = ("_lock", "value")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError("counters only go up")
+        with self._lock:
+            self.value += amount
+
+
+class _GaugeChild:
+    __slots__ = ("_lock", "value")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = float(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value -= amount
+
+
+class _HistogramChild:
+    __slots__ = ("_buckets", "_counts", "_lock", "count", "sum")
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self._lock = threading.Lock()
+        self._buckets = buckets
+        # One slot per upper bound plus +Inf; made cumulative on render.
+        self._counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        i = bisect_left(self._buckets, value)
+        with self._lock:
+            self._counts[i] += 1
+            self.count += 1
+            self.sum += value
+
+    def time(self) -> _Timer:
+        return _Timer(self)
+
+    def snapshot(self) -> tuple[list[int], int, float]:
+        with self._lock:
+            counts, count, total = list(self._counts), self.count, self.sum
+        running = 0
+        for i, n in enumerate(counts):
+            running += n
+            counts[i] = running
+        return counts, count, total
+
+
+class _Metric[C](ABC):
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        if not _NAME.match(name):
+            raise ValueError(f"invalid metric name {name!r}")
+        for label in labelnames:
+            if not _LABEL.match(label) or label.startswith("__") or label == "le":
+                raise ValueError(f"invalid label name {label!r}")
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], C] = {}
+        self._lock = threading.Lock()
+        self._default = None if self.labelnames else self.labels()
+
+    @abstractmethod
+    def _new_child(self) -> C: ...
+
+    def labels(self, *values: Any) -> C:
+        """The child for these label values, created on first use."""
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name} takes labels {self.labelnames}, got {key}")
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _unlabeled(self) -> C:
+        if self._default is None:
+            raise ValueError(f"{self.name} has labels {self.labelnames}; use .labels()")
+        return self._default
+
+    def _items(self) -> list[tuple[tuple[str, ...], C]]:
+        with self._lock:
+            return sorted(self._children.items())
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {_escape(self.help)}"
+        yield f"# TYPE {self.name} {self.kind}"
+        for values, child in self._items():
+            yield f"{self.name}{_label_text(self.labelnames, values)} {_format_value(child.value)}"  # type: ignore[attr-defined]
+
+
+class Counter(_Metric[_CounterChild]):
+    """A total that only goes up (requests, cache lookups, errors)."""
+
+    kind = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._unlabeled().inc(amount)
+
+
+class Gauge(_Metric[_GaugeChild]):
+    """A value that goes up and down (open connections)."""
+
+    kind = "gauge"
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+    def set(self, value: float) -> None:
+        self._unlabeled().set(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._unlabeled().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._unlabeled().dec(amount)
+
+
+class Histogram(_Metric[_HistogramChild]):
+    """Observations counted into fixed ``buckets`` (upper bounds; ``+Inf`` is
+    implied), with their count and sum."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        bounds = tuple(float(b) for b in buckets if b != float("inf"))
+        if not bounds or list(bounds) != sorted(set(bounds)):
+            raise ValueError(f"{name}: buckets must be increasing")
+        self.buckets = bounds
+        super().__init__(name, help, labelnames)
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self._unlabeled().observe(value)
+
+    def time(self) -> _Timer:
+        return self._unlabeled().time()
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {_escape(self.help)}"
+        yield f"# TYPE {self.name} histogram"
+        names = (*self.labelnames, "le")
+        bounds = [_format_value(b) for b in self.buckets] + ["+Inf"]
+        for values, child in self._items():
+            counts, count, total = child.snapshot()
+            for bound, n in zip(bounds, counts, strict=True):
+                yield f"{self.name}_bucket{_label_text(names, (*values, bound))} {n}"
+            labels = _label_text(self.labelnames, values)
+            yield f"{self.name}_sum{labels} {_format_value(total)}"
+            yield f"{self.name}_count{labels} {count}"
+
+
+Collector = Callable[[], Iterable[Sample]]
+
+
+class Registry:
+    """A set of metrics and collectors, rendered together."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric[Any]] = {}
+        self._collectors: list[Collector] = []
+        self._lock = threading.Lock()
+
+    def _get_or_add[M: _Metric[Any]](self, cls: type[M], name: str, *args: Any, **kwargs: Any) -> M:
+        with self._lock:
+            existing = self._metrics.get(name)
+            if existing is None:
+                metric = self._metrics[name] = cls(name, *args, **kwargs)
+                return metric
+        labelnames = tuple(args[1] if len(args) > 1 else kwargs.get("labelnames", ()))
+        if type(existing) is not cls or existing.labelnames != labelnames:
+            raise ValueError(f"metric {name} is already registered as another {existing.kind}")
+        return existing  # type: ignore[return-value]
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_add(Counter, name, help, labelnames)
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get_or_add(Gauge, name, help, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._get_or_add(Histogram, name, help, labelnames, buckets=buckets)
+
+    def register_collector(self, collector: Collector) -> None:
+        """Call ``collector`` on every scrape for extra families. Registering
+        the same function again is a no-op."""
+        with self._lock:
+            if collector not in self._collectors:
+                self._collectors.append(collector)
+
+    def get(self, name: str) -> _Metric[Any] | None:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Every metric and collected family in text exposition format."""
+        with self._lock:
+            metrics = sorted(self._metrics.items())
+            collectors = list(self._collectors)
+        lines: list[str] = []
+        for _, metric in metrics:
+            lines.extend(metric.render())
+        for collector in collectors:
+            try:
+                samples = list(collector())
+            except Exception as e:  # noqa: BLE001 -- one broken source must not fail the scrape
+                _logger.warning(f"Metrics collector {getattr(collector, '__name__', collector)} failed: {e}")
+                continue
+            for sample in samples:
+                lines.append(f"# HELP {sample.name} {_escape(sample.help)}")
+                lines.append(f"# TYPE {sample.name} {sample.kind}")
+                for values, value in sorted(sample.values.items()):
+                    lines.append(f"{sample.name}{_label_text(sample.labelnames, values)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+#: The process's registry, which ``GET /metrics`` serves.
+REGISTRY = Registry()
@@ -1,5 +1,8 @@
-"""Persistence layer: SQLAlchemy models (``database``) and the data-access
-service (``database_service``). Moved out of ``engine`` in M6 so the engine
+"""Persistence layer: SQLAlchemy models (``database``), the data-access
+service (``database_service``) and the shared, pooled engine they run on
+(``engine``), plus awaitable versions of the API's hottest reads
+(``async_reads``) and the keyframe + delta codec for map snapshots
+(``snapshots``). Moved out of ``engine`` in M6 so the engine
 package stays pure rules-logic. All non-engine code goes through
 ``DatabaseService`` rather than touching ORM models directly.
 """
@@ -0,0 +1,433 @@
+"""
+Non-blocking reads for the API's hottest ``GET`` routes.
+
+``DatabaseService`` and ``GameRepo`` are synchronous, so every ``def`` route
+that uses them holds one of the worker's few threadpool threads for the
+length of its queries; under load the pool, not the database, is the limit.
+``AsyncReadRepo`` serves the reads behind ``/state``, ``/players``,
+``/orders/{power}``, ``/messages`` (and ``/messages/unread``),
+``/legal_orders/{power}`` and ``/waiting_list`` from ``async def`` routes
+instead.
+
+- **asyncpg when it can.** Against PostgreSQL, with asyncpg installed, the
+  reads run on an ``AsyncEngine`` (``engine.create_async_db_engine``) and
+  never leave the event loop. Anything else -- SQLite, no asyncpg, or
+  ``DIPLOMACY_DB_ASYNC=0`` -- runs the same queries on the shared sync engine
+  in ``asyncio.to_thread``, which is what the routes did before, so results
+  are the same either way.
+- **One query plan, two drivers.** Each read is a generator that yields Core
+  ``select()`` statements and is sent back their rows; ``_run_async`` and
+  ``_run_sync`` just execute what it yields on one connection. The plans
+  mirror ``GameRepo``'s lookups (a game by ``game_id``, then by integer PK)
+  and its column choices (``state_json`` only when there is no
+  ``state_blob``).
+- **One engine per event loop.** asyncpg connections belong to the loop that
+  opened them. Uvicorn runs one loop per worker; a test client may start a
+  new loop per request, in which case the engine is rebuilt (its counters
+  carry over) and the old one is dropped without touching its connections.
+
+``dispose()`` closes the engine (API lifespan exit); ``pool_status()`` reports
+it like ``engine.pool_status``.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from collections.abc import Generator
+from typing import Any
+
+from sqlalchemy import ColumnElement, Select, and_, func, or_, select
+from sqlalchemy.engine import Engine, Row
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from persistence.database import GameModel, MessageModel, PlayerModel, UserModel, WaitingListModel
+from persistence.engine import create_async_db_engine, get_engine, pool_status
+
+__all__ = ["AsyncReadRepo"]
+
+logger = logging.getLogger("diplomacy.persistence.async_reads")
+
+# A read: yields statements, is sent each one's rows, returns its result.
+type Plan[T] = Generator[Select[Any], list[Row[Any]], T]
+
+
+def _game(game_id: str, *columns: Any) -> Plan[Row[Any] | None]:
+    rows = yield select(*columns).where(GameModel.game_id == str(game_id)).limit(1)
+    if not rows:
+        try:
+            pk = int(game_id)
+        except (ValueError, TypeError):
+            return None
+        rows = yield select(*columns).where(GameModel.id == pk).limit(1)
+    return rows[0] if rows else None
+
+
+def _game_pk(game_id: str) -> Plan[int | None]:
+    row = yield from _game(game_id, GameModel.id)
+    return None if row is None else int(row.id)
+
+
+def _version(game_id: str, with_players: bool) -> Plan[dict[str, Any] | None]:
+    row = yield from _game(
+        game_id,
+        GameModel.id,
+        GameModel.created_at,
+        GameModel.phase_code,
+        GameModel.state_version,
+        GameModel.orders_version,
+    )
+    if row is None:
+        return None
+    version: dict[str, Any] = {
+        "id": row.id,
+        "created_at": row.created_at,
+        "phase_code": row.phase_code,
+        "state_version": int(row.state_version or 0),
+        "orders_version": int(row.orders_version or 0),
+    }
+    if with_players:
+        players = yield (
+            select(PlayerModel.power_name, PlayerModel.user_id, PlayerModel.is_active)
+            .where(PlayerModel.game_id == row.id)
+            .order_by(PlayerModel.power_name)
+        )
+        version["players"] = [(p.power_name, p.user_id, p.is_active) for p in players]
+    return version
+
+
+def _state_payload(row: Row[Any]) -> Plan[bytes | dict[str, Any] | None]:
+    if row.state_blob is not None:
+        return bytes(row.state_blob)
+    rows = yield select(GameModel.state_json).where(GameModel.id == row.id)
+    return dict(rows[0].state_json) if rows and rows[0].state_json else None
+
+
+def _state_payload_for(game_id: str) -> Plan[bytes | dict[str, Any] | None]:
+    row = yield from _game(game_id, GameModel.id, GameModel.state_blob)
+    if row is None:
+        return None
+    return (yield from _state_payload(row))
+
+
+def _view_bundle(game_id: str) -> Plan[dict[str, Any] | None]:
+    row = yield from _game(
+        game_id,
+        GameModel.id,
+        GameModel.game_id,
+        GameModel.map_name,
+        GameModel.phase_code,
+        GameModel.status,
+        GameModel.deadline,
+        GameModel.state_blob,
+        GameModel.pending_orders,
+        GameModel.pending_orders_parsed,
+    )
+    if row is None:
+        return None
+    payload = yield from _state_payload(row)
+    if payload is None:
+        return None
+    players = yield select(
+        PlayerModel.power_name, PlayerModel.user_id, PlayerModel.is_active
+    ).where(PlayerModel.game_id == row.id)
+    # Same normalisation as GameRepo.get_pending_orders_with_parsed.
+    pending = {k: list(v) for k, v in dict(row.pending_orders or {}).items()}
+    parsed = row.pending_orders_parsed
+    if not pending:
+        parsed = {}
+    elif parsed is None or set(parsed) != set(pending):
+        parsed = None
+    else:
+        parsed = {k: list(v) for k, v in dict(parsed).items()}
+    return {
+        "state": payload,
+        "meta": {
+            "game_id": row.game_id,
+            "map_name": row.map_name,
+            "phase_code": row.phase_code,
+            "status": row.status,
+            "deadline": row.deadline,
+        },
+        "players": {
+            p.power_name: {"user_id": p.user_id, "is_active": p.is_active} for p in players
+        },
+        "pending": pending,
+        "parsed": parsed,
+    }
+
+
+def _players(game_id: str) -> Plan[list[dict[str, Any]] | None]:
+    pk = yield from _game_pk(game_id)
+    if pk is None:
+        return None
+    rows = yield (
+        select(
+            PlayerModel.power_name,
+            PlayerModel.user_id,
+            PlayerModel.is_active,
+            UserModel.telegram_id,
+            UserModel.full_name,
+        )
+        .outerjoin(UserModel, UserModel.id == PlayerModel.user_id)
+        .where(PlayerModel.game_id == pk)
+        .order_by(PlayerModel.id)
+    )
+    return [
+        {
+            "power": r.power_name,
+            "user_id": r.user_id,
+            "is_active": r.is_active,
+            "telegram_id": r.telegram_id,
+            "full_name": r.full_name,
+        }
+        for r in rows
+    ]
+
+
+def _player_user_id(game_id: str, power: str) -> Plan[tuple[bool, int | None]]:
+    pk = yield from _game_pk(game_id)
+    if pk is None:
+        return False, None
+    rows = yield (
+        select(PlayerModel.user_id)
+        .where(PlayerModel.game_id == pk, PlayerModel.power_name == power)
+        .limit(1)
+    )
+    return (True, rows[0].user_id) if rows else (False, None)
+
+
+def _visible_messages(game_id: str, user_id: int | None) -> Plan[ColumnElement[bool] | None]:
+    """The ``WHERE`` clause for the game's messages ``user_id`` may see, or
+    ``None`` if there is no such game. Each branch of the ``OR`` leads one of
+    the ``(game_id, recipient_power, id)`` / ``(game_id, sender_user_id, id)``
+    indexes, so PostgreSQL answers it with a bitmap OR of index scans, and an
+    ``id`` cursor bounds each scan."""
+    pk = yield from _game_pk(game_id)
+    if pk is None:
+        return None
+    visible = MessageModel.recipient_power.is_(None)
+    if user_id is not None:
+        rows = yield (
+            select(PlayerModel.power_name)
+            .where(PlayerModel.game_id == pk, PlayerModel.user_id == user_id)
+            .limit(1)
+        )
+        if rows:
+            visible = or_(
+                visible,
+                MessageModel.recipient_power == rows[0].power_name,
+                MessageModel.sender_user_id == user_id,
+            )
+    return and_(MessageModel.game_id == pk, visible)
+
+
+def _messages(
+    game_id: str,
+    user_id: int | None,
+    since_id: int | None,
+    before_id: int | None,
+    limit: int | None,
+) -> Plan[tuple[list[dict[str, Any]], bool] | None]:
+    where = yield from _visible_messages(game_id, user_id)
+    if where is None:
+        return None
+    if since_id is not None:
+        where = and_(where, MessageModel.id > since_id)
+    if before_id is not None:
+        where = and_(where, MessageModel.id < before_id)
+    # A limited page without since_id reads backwards: the newest ``limit``
+    # (before before_id, if given). With since_id it reads forwards from it.
+    backwards = since_id is None and limit is not None
+    stmt = (
+        select(
+            MessageModel.id,
+            MessageModel.sender_user_id,
+            MessageModel.recipient_power,
+            MessageModel.text,
+            MessageModel.timestamp,
+        )
+        .where(where)
+        .order_by(MessageModel.id.desc() if backwards else MessageModel.id.asc())
+    )
+    if limit is not None:
+        stmt = stmt.limit(limit + 1)
+    messages = yield stmt
+    has_more = limit is not None and len(messages) > limit
+    messages = messages[:limit] if limit is not None else messages
+    if backwards:
+        messages = messages[::-1]
+    return [
+        {
+            "id": m.id,
+            "sender_user_id": m.sender_user_id,
+            "recipient_power": m.recipient_power,
+            "text": m.text,
+            "timestamp": m.timestamp.isoformat() if hasattr(m.timestamp, "isoformat") else str(m.timestamp),
+        }
+        for m in messages
+    ], has_more
+
+
+def _unread_messages(game_id: str, user_id: int | None, since_id: int) -> Plan[dict[str, int | None] | None]:
+    where = yield from _visible_messages(game_id, user_id)
+    if where is None:
+        return None
+    rows = yield select(func.count(), func.max(MessageModel.id)).where(where, MessageModel.id > since_id)
+    count, latest = rows[0] if rows else (0, None)
+    return {"unread": int(count or 0), "latest_id": latest}
+
+
+def _scalar(stmt: Select[Any]) -> Plan[Any]:
+    rows = yield stmt
+    return rows[0][0] if rows else None
+
+
+class AsyncReadRepo:
+    """The hot ``GET`` reads, awaitable. See the module docstring."""
+
+    def __init__(self, database_url: str, *, use_async_driver: bool | None = None) -> None:
+        self.database_url = database_url
+        if use_async_driver is None:
+            use_async_driver = os.environ.get("DIPLOMACY_DB_ASYNC", "1").lower() not in ("0", "false", "no")
+        self._use_async = use_async_driver
+        self._engine: AsyncEngine | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def driver(self) -> str:
+        """``"asyncpg"`` or ``"thread"`` (sync engine in ``asyncio.to_thread``)."""
+        return "asyncpg" if self._use_async else "thread"
+
+    async def _async_engine(self) -> AsyncEngine | None:
+        if not self._use_async:
+            return None
+        loop = asyncio.get_running_loop()
+        if self._engine is not None and self._loop is loop:
+            return self._engine
+        try:
+            engine = create_async_db_engine(self.database_url)
+        except (ImportError, ValueError) as e:
+            logger.info(f"Async reads run on the sync engine in threads: {e}")
+            self._use_async = False
+            return None
+        if self._engine is not None:
+            # The old loop is gone (or going); its connections can't be used
+            # or closed from here, so the pool is just dropped.
+            engine.sync_engine.pool.metrics = self._engine.sync_engine.pool.metrics  # type: ignore[attr-defined]
+            old, self._engine = self._engine, None
+            await old.dispose(close=False)
+        self._engine, self._loop = engine, loop
+        return engine
+
+    def _sync_engine(self) -> Engine:
+        return get_engine(self.database_url)
+
+    async def _run[T](self, plan: Plan[T]) -> T:
+        engine = await self._async_engine()
+        if engine is None:
+            return await asyncio.to_thread(_run_sync, self._sync_engine(), plan)
+        return await _run_async(engine, plan)
+
+    # -- reads ----------------------------------------------------------------
+
+    async def get_version(self, game_id: str, *, with_players: bool = False) -> dict[str, Any] | None:
+        """``GameRepo.get_version``."""
+        return await self._run(_version(game_id, with_players))
+
+    async def get_state_payload(self, game_id: str) -> bytes | dict[str, Any] | None:
+        """``GameRepo.get_state_payload``."""
+        return await self._run(_state_payload_for(game_id))
+
+    async def get_view_bundle(self, game_id: str) -> dict[str, Any] | None:
+        """Everything ``GameService.view`` reads, on one connection: ``state``
+        (as ``get_state_payload``), ``meta`` (``GameRepo.get_meta``),
+        ``players`` (``GameRepo.players``), and ``pending`` / ``parsed``
+        (``GameRepo.get_pending_orders_with_parsed``). ``None`` if the game
+        doesn't exist."""
+        return await self._run(_view_bundle(game_id))
+
+    async def get_players(self, game_id: str) -> list[dict[str, Any]] | None:
+        """Each player's power, user and the user's Telegram id and name (one
+        join), or ``None`` if the game doesn't exist."""
+        return await self._run(_players(game_id))
+
+    async def get_player_user_id(self, game_id: str, power: str) -> tuple[bool, int | None]:
+        """``(found, user_id)`` for the player holding ``power``."""
+        return await self._run(_player_user_id(game_id, power))
+
+    async def get_messages(self, game_id: str, user_id: int | None) -> list[dict[str, Any]] | None:
+        """The game's messages ``user_id`` may see, oldest first: broadcasts,
+        plus (for a player in the game) those sent to their power or by them.
+        ``None`` if the game doesn't exist."""
+        page = await self.get_message_page(game_id, user_id)
+        return None if page is None else page[0]
+
+    async def get_message_page(
+        self,
+        game_id: str,
+        user_id: int | None,
+        *,
+        since_id: int | None = None,
+        before_id: int | None = None,
+        limit: int | None = None,
+    ) -> tuple[list[dict[str, Any]], bool] | None:
+        """``(messages, has_more)``: the visible messages with ``since_id < id <
+        before_id``, oldest first, at most ``limit`` of them. With ``since_id``
+        the page is the oldest ``limit`` after it (polling); without, the
+        newest ``limit`` (before ``before_id``, when scrolling back).
+        ``has_more`` says whether the page's direction holds more."""
+        return await self._run(_messages(game_id, user_id, since_id, before_id, limit))
+
+    async def count_unread_messages(
+        self, game_id: str, user_id: int | None, since_id: int = 0
+    ) -> dict[str, int | None] | None:
+        """``{"unread", "latest_id"}``: how many visible messages are newer than
+        ``since_id`` (the last one the caller has seen), and the newest id."""
+        return await self._run(_unread_messages(game_id, user_id, since_id))
+
+    async def count_waiting_list(self) -> int:
+        return int(await self._run(_scalar(select(func.count()).select_from(WaitingListModel))) or 0)
+
+    async def get_active_user_id(self, user_id: int) -> int | None:
+        """``user_id`` if that user exists and is active."""
+        stmt = select(UserModel.id).where(UserModel.id == user_id, UserModel.is_active.isnot(False))
+        return await self._run(_scalar(stmt))
+
+    async def get_user_id_by_telegram_id(self, telegram_id: str) -> int | None:
+        stmt = select(UserModel.id).where(UserModel.telegram_id == str(telegram_id)).limit(1)
+        return await self._run(_scalar(stmt))
+
+    # -- lifecycle ------------------------------------------------------------
+
+    def pool_status(self) -> dict[str, Any]:
+        status: dict[str, Any] = {"driver": self.driver}
+        if self._engine is not None:
+            status.update(pool_status(self._engine.sync_engine))
+        return status
+
+    async def dispose(self) -> None:
+        engine, loop, self._engine, self._loop = self._engine, self._loop, None, None
+        if engine is not None:
+            # Connections opened on another (finished) loop can only be dropped.
+            await engine.dispose(close=loop is asyncio.get_running_loop())
+
+
+def _run_sync[T](engine: Engine, plan: Plan[T]) -> T:
+    with engine.connect() as conn:
+        try:
+            stmt = next(plan)
+            while True:
+                stmt = plan.send(list(conn.execute(stmt)))
+        except StopIteration as done:
+            return done.value
+
+
+async def _run_async[T](engine: AsyncEngine, plan: Plan[T]) -> T:
+    async with engine.connect() as conn:
+        try:
+            stmt = next(plan)
+            while True:
+                stmt = plan.send(list(await conn.execute(stmt)))
+        except StopIteration as done:
+            return done.value
@@ -5,9 +5,9 @@ This migration implements the comprehensive database schema defined in data_spec
 with proper foreign key relationships and data validation constraints.
 """
 
-from sqlalchemy import create_engine, Column, Integer, String, Boolean, DateTime, Text, ForeignKey, UniqueConstraint, CheckConstraint, Index, text, inspect
+from sqlalchemy import create_engine, Column, Integer, String, Boolean, Date, DateTime, Text, ForeignKey, UniqueConstraint, CheckConstraint, Index, LargeBinary, text, inspect
 from sqlalchemy.orm import declarative_base
-from sqlalchemy.orm import relationship, sessionmaker
+from sqlalchemy.orm import deferred, relationship, sessionmaker
 from sqlalchemy import JSON
 from datetime import datetime, timezone
 
@@ -44,7 +44,16 @@ class GameModel(Base):
     # submitted-but-not-yet-adjudicated orders keyed by power ({power: [order_str]}).
     # These supersede the legacy relational units/orders/supply_centers storage.
     state_json = Column(JSON, nullable=True)
+    # The same GameState in engine.serialization's binary codec (state_to_bytes),
+    # which GameService loads in preference to state_json. GameRepo writes both
+    # together and clears this on any state_json write that doesn't supply it, so
+    # it is either NULL or in sync.
+    state_blob = Column(LargeBinary, nullable=True)
     pending_orders = Column(JSON, nullable=True)
+    # pending_orders already parsed, {power: [engine.serialization.order_to_dict]},
+    # so process_turn doesn't reparse them. Written with pending_orders and cleared
+    # by any write that doesn't supply it (readers then fall back to parsing).
+    pending_orders_parsed = Column(JSON, nullable=True)
     # Per-phase draw-vote yes-votes, {power: "yes"} -- absence means no/not-voted.
     # Cleared whenever a turn is processed (same phase-scoped lifetime as
     # pending_orders): a vote is "did this power vote yes to draw this phase",
@@ -57,6 +66,11 @@ class GameModel(Base):
     # appended each process_turn. Powers the /orders/history endpoint (state itself is
     # a single snapshot and does not retain past orders).
     order_history = Column(JSON, nullable=True)
+    # Write counters for conditional GETs (see server/etag.py): GameRepo bumps
+    # state_version on every write to state_json and orders_version on every write
+    # to pending_orders, so an ETag can be checked without loading the JSON columns.
+    state_version = Column(Integer, nullable=False, default=0, server_default='0')
+    orders_version = Column(Integer, nullable=False, default=0, server_default='0')
     deadline = Column(DateTime, nullable=True)  # Optional deadline for turn processing
     channel_id = Column(String(255), nullable=True)  # Telegram channel ID for channel-linked games
     channel_settings = Column(JSON, nullable=True)  # Channel settings (auto_post_maps, etc.)
@@ -288,15 +302,28 @@ class TurnHistoryModel(Base):
 
 
 class MapSnapshotModel(Base):
-    """Map snapshots table"""
+    """Map snapshots table.
+
+    Stored as keyframes plus deltas (see ``persistence/snapshots.py``). A
+    ``keyframe`` row carries ``units``/``supply_centers``/``state_json`` in
+    full. A ``delta`` row carries only ``delta``, the changes from the
+    snapshot before it; ``base_snapshot_id`` is its keyframe. The payload
+    columns are deferred, so listing a game's snapshots reads metadata only.
+    ``DatabaseService`` fills in ``units``/``supply_centers``/``state_json``
+    on the single snapshots it returns.
+    """
     __tablename__ = 'map_snapshots'
     
     id = Column(Integer, primary_key=True)
     game_id = Column(Integer, ForeignKey('games.id', ondelete='CASCADE'), nullable=False)
     turn_number = Column(Integer, nullable=False)
     phase_code = Column(String(10), nullable=False)
-    units = Column(JSON, nullable=False)
-    supply_centers = Column(JSON, nullable=False)
+    kind = Column(String(10), nullable=False, default='keyframe', server_default='keyframe')
+    # Not a foreign key: a game's snapshots are only ever deleted together, and
+    # a self-referencing cascade would race the ORM's own cascade from games.
+    base_snapshot_id = Column(Integer, nullable=True)
+    units = deferred(Column(JSON, nullable=True), group='payload')
+    supply_centers = deferred(Column(JSON, nullable=True), group='payload')
     map_image_path = Column(String(255))
     created_at = Column(DateTime, default=utcnow_naive)
     # The full serialized GameState (engine.serialization.state_to_dict) captured at
@@ -304,7 +331,13 @@ class MapSnapshotModel(Base):
     # Purely additive: nullable, so snapshots created before this column existed
     # (which only carry the view-shaped units/supply_centers above) keep working for
     # /history and /replay, they just can't be restored (see restore_game_snapshot).
-    state_json = Column(JSON, nullable=True)
+    state_json = deferred(Column(JSON, nullable=True), group='payload')
+    delta = deferred(Column(JSON, nullable=True), group='payload')
+
+    __table_args__ = (
+        Index('ix_map_snapshots_game_turn', 'game_id', 'turn_number'),
+        Index('ix_map_snapshots_base', 'base_snapshot_id'),
+    )
 
     # Relationships
     game = relationship("GameModel", back_populates="map_snapshots")
@@ -324,6 +357,10 @@ class MessageModel(Base):
     # Constraints and indexes
     __table_args__ = (
         Index('ix_messages_game', 'game_id'),
+        # Cursor reads (GET /messages?since_id=): one index per branch of the
+        # visibility OR -- broadcasts/to my power, and sent by me -- with id last.
+        Index('ix_messages_game_recipient_id', 'game_id', 'recipient_power', 'id'),
+        Index('ix_messages_game_sender_id', 'game_id', 'sender_user_id', 'id'),
     )
     
     # Relationships
@@ -404,9 +441,17 @@ class ChannelAnalyticsModel(Base):
     event_data = Column(JSON, nullable=True)  # Additional event data (message_id, response_time, etc.)
     created_at = Column(DateTime, default=utcnow_naive, nullable=False)
     
-    # Indexes for efficient querying
+    # Indexes for efficient querying. The (game, channel, id) pair serves the
+    # keyset-paginated event list; the created_at one covers the partial-day
+    # aggregates the summaries read from raw rows (see ChannelAnalyticsDailyModel).
     __table_args__ = (
-        Index('ix_channel_analytics_game_channel', 'game_id', 'channel_id'),
+        Index('ix_channel_analytics_game_channel_id', 'game_id', 'channel_id', 'id'),
+        Index('ix_channel_analytics_game_channel_type_id', 'game_id', 'channel_id', 'event_type', 'id'),
+        Index(
+            'ix_channel_analytics_game_channel_created',
+            'game_id', 'channel_id', 'created_at',
+            postgresql_include=['event_type', 'event_subtype', 'user_id', 'power'],
+        ),
         Index('ix_channel_analytics_event_type', 'event_type'),
         Index('ix_channel_analytics_created_at', 'created_at'),
         Index('ix_channel_analytics_user', 'user_id'),
@@ -417,6 +462,60 @@ class ChannelAnalyticsModel(Base):
     user = relationship("UserModel")
 
 
+class ChannelAnalyticsDailyModel(Base):
+    """Per-day rollup of ``channel_analytics``: one row per game, channel, UTC day,
+    event type, subtype, user and power, upserted in the same transaction that logs
+    each event. Absent subtype/user/power are stored as ``''``/``0``/``''`` so they
+    can take part in the unique key."""
+    __tablename__ = 'channel_analytics_daily'
+    
+    id = Column(Integer, primary_key=True)
+    game_id = Column(Integer, ForeignKey('games.id', ondelete='CASCADE'), nullable=False)
+    channel_id = Column(String(255), nullable=False)
+    day = Column(Date, nullable=False)
+    event_type = Column(String(50), nullable=False)
+    event_subtype = Column(String(50), nullable=False, default='')
+    user_id = Column(Integer, nullable=False, default=0)
+    power = Column(String(20), nullable=False, default='')
+    event_count = Column(Integer, nullable=False, default=0)
+    last_event_at = Column(DateTime, nullable=False)
+    
+    __table_args__ = (
+        UniqueConstraint(
+            'game_id', 'channel_id', 'day', 'event_type', 'event_subtype', 'user_id', 'power',
+            name='uq_channel_analytics_daily_key',
+        ),
+    )
+
+
+class OutboxEventModel(Base):
+    """Side effects of a processed turn (snapshot, notifications, channel post,
+    map pre-render), inserted by ``GameRepo.save_state`` in the same transaction
+    as the new state and run afterwards by ``server/outbox.py``'s dispatcher.
+
+    ``status`` is ``pending`` until a handler succeeds (``done``) or the retry
+    budget is spent (``dead``). A claimed row's ``next_attempt_at`` is pushed out
+    by a lease, so a crashed worker's rows become due again on their own."""
+    __tablename__ = 'outbox_events'
+
+    id = Column(Integer, primary_key=True)
+    game_id = Column(Integer, ForeignKey('games.id', ondelete='CASCADE'), nullable=False)
+    turn = Column(Integer, nullable=False)  # games.current_turn the turn advanced to
+    kind = Column(String(32), nullable=False)
+    payload = Column(JSON, nullable=False, default=dict)
+    status = Column(String(16), nullable=False, default='pending')
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, default=utcnow_naive)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=utcnow_naive, nullable=False)
+    processed_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint('game_id', 'turn', 'kind', name='uq_outbox_events_game_turn_kind'),
+        Index('ix_outbox_events_status_next_attempt', 'status', 'next_attempt_at'),
+    )
+
+
 class TournamentModel(Base):
     """Tournaments table (for bracket/tournament organization)."""
     __tablename__ = 'tournaments'
@@ -554,7 +653,9 @@ def clear_database(database_url: str):
 
 
 def get_session_factory(database_url: str):
-    """Get a session factory for database operations"""
-    engine = create_engine(database_url)
-    return sessionmaker(bind=engine)
+    """Get a session factory for database operations, bound to the process's
+    shared, configured engine for ``database_url`` (``persistence.engine``)."""
+    from .engine import get_engine
+
+    return sessionmaker(bind=get_engine(database_url))
 
@@ -6,25 +6,79 @@ to ensure proper data integrity and consistency.
 """
 
 from typing import List, Optional, Dict, Any, Tuple
-from datetime import datetime, timezone, timedelta
-from sqlalchemy.orm import Session
+from datetime import date, datetime, time, timezone, timedelta
+from sqlalchemy.orm import Session, sessionmaker, undefer_group
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy import text
 from sqlalchemy import func as sa_func
 import logging
 from .database import (
     GameModel, PlayerModel, OrderModel, TurnHistoryModel, MapSnapshotModel, MessageModel, UserModel, LinkCodeModel, PasswordResetTokenModel,
     TournamentModel, TournamentGameModel, TournamentPlayerModel,
-    SpectatorModel, WaitingListModel,
-    get_session_factory,
+    SpectatorModel, WaitingListModel, OutboxEventModel,
     utcnow_naive,
 )
+from .engine import get_engine
+from . import snapshots as snapshot_codec
+
+
+def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """``value`` as naive UTC, matching the naive ``DateTime`` columns (see
+    ``utcnow_naive``); naive input is already taken to be UTC."""
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _replay_snapshot_chain(chain: List[MapSnapshotModel]) -> Dict[str, Any]:
+    """The snapshot document for the last row of ``chain``: a keyframe followed
+    by its deltas in id order, payloads loaded (see ``persistence/snapshots.py``)."""
+    keyframe, *deltas = chain
+    payload = snapshot_codec.decode_keyframe(keyframe.units, keyframe.supply_centers, keyframe.state_json)
+    for row in deltas:
+        payload = snapshot_codec.apply_delta(payload, row.delta or {})
+    return payload
+
+
+def _analytics_window(
+    start: Optional[datetime], end: Optional[datetime]
+) -> Tuple[bool, Optional[date], Optional[date], List[Tuple[datetime, datetime, bool]]]:
+    """Split the inclusive window ``[start, end]`` for the analytics rollup.
+
+    Returns ``(use_rollup, first_day, last_day, edges)``: the whole UTC days
+    ``first_day..last_day`` (``None`` = unbounded) are answered from
+    channel_analytics_daily, and each ``(lo, hi, hi_inclusive)`` edge -- at most
+    the partial first and last day -- from raw channel_analytics rows.
+    """
+    start, end = _naive_utc(start), _naive_utc(end)
+    if start is not None and end is not None:
+        if start > end:
+            return False, None, None, []
+        if start.date() == end.date():
+            return False, None, None, [(start, end, True)]
+    first_day = last_day = None
+    edges: List[Tuple[datetime, datetime, bool]] = []
+    if start is not None:
+        midnight = datetime.combine(start.date(), time.min)
+        if start == midnight:
+            first_day = start.date()
+        else:
+            first_day = start.date() + timedelta(days=1)
+            edges.append((start, midnight + timedelta(days=1), False))
+    if end is not None:
+        last_day = end.date() - timedelta(days=1)
+        edges.append((datetime.combine(end.date(), time.min), end, True))
+    return True, first_day, last_day, edges
 
 
 class DatabaseService:
     """Service for database operations"""
     
     def __init__(self, database_url: str):
-        self.session_factory = get_session_factory(database_url)
+        # One pooled engine per URL for the whole process (see persistence/engine.py);
+        # GameRepo is handed this session_factory, so it shares the pool too.
+        self.engine = get_engine(database_url)
+        self.session_factory = sessionmaker(bind=self.engine)
         self.logger = logging.getLogger("diplomacy.persistence.database_service")
     
     # --- Users ---
@@ -620,32 +674,118 @@ class DatabaseService:
         columns, kept for ``/history`` and ``/replay``). ``state_json``, when given,
         is the raw serialized ``GameState`` (``engine.serialization.state_to_dict``)
         -- the only shape ``restore_game_snapshot`` can rebuild a ``Game`` from.
+
+        The row is stored as a delta against the game's previous snapshot, or
+        as a new keyframe when one is due (see ``persistence/snapshots.py``).
+        The returned snapshot carries the full payload either way.
         """
-        units = game_state.get('units', {})
-        supply_centers = game_state.get('supply_centers', {})
+        payload = {
+            "units": game_state.get('units', {}),
+            "supply_centers": game_state.get('supply_centers', {}),
+            "state_json": state_json,
+        }
         with self.session_factory() as session:
-            snap = MapSnapshotModel(
-                game_id=game_id,
-                turn_number=turn,
-                phase_code=phase_code,
-                units=units,
-                supply_centers=supply_centers,
-                state_json=state_json,
-            )
-            # dynamic attribute for compatibility
-            setattr(snap, 'phase', phase)
+            snap = MapSnapshotModel(game_id=game_id, turn_number=turn, phase_code=phase_code)
+            chain = self._snapshot_chain_for_delta(session, game_id)
+            delta = None
+            if chain:
+                delta = snapshot_codec.encode_delta(_replay_snapshot_chain(chain), payload)
+                if not snapshot_codec.worth_a_delta(delta, payload):
+                    delta = None
+            if delta is None:
+                snap.kind = snapshot_codec.KEYFRAME
+                for name, value in snapshot_codec.encode_keyframe(payload).items():
+                    setattr(snap, name, value)
+            else:
+                snap.kind = snapshot_codec.DELTA
+                snap.base_snapshot_id = chain[0].id
+                snap.delta = delta
             session.add(snap)
             session.commit()
             session.refresh(snap)
+            for name, value in payload.items():
+                set_committed_value(snap, name, value)
+            # dynamic attribute for compatibility
+            setattr(snap, 'phase', phase)
             return snap
 
+    @staticmethod
+    def _snapshot_chain_for_delta(session: Session, game_id: int) -> List[MapSnapshotModel]:
+        """The game's latest keyframe and its deltas, payloads loaded, or ``[]``
+        when the next snapshot should be a keyframe itself (no keyframe yet, or
+        the chain already holds ``keyframe_interval()`` rows).
+
+        The keyframe row is locked until the caller commits, so concurrent
+        writers for one game append to the chain one at a time.
+        """
+        keyframe = (
+            session.query(MapSnapshotModel)
+            .options(undefer_group('payload'))
+            .filter_by(game_id=game_id, kind=snapshot_codec.KEYFRAME)
+            .order_by(MapSnapshotModel.id.desc())
+            .with_for_update()
+            .first()
+        )
+        if keyframe is None:
+            return []
+        deltas = (
+            session.query(MapSnapshotModel)
+            .options(undefer_group('payload'))
+            .filter_by(base_snapshot_id=keyframe.id)
+            .order_by(MapSnapshotModel.id)
+            .all()
+        )
+        if len(deltas) + 1 >= snapshot_codec.keyframe_interval():
+            return []
+        return [keyframe, *deltas]
+
+    @staticmethod
+    def _materialize_snapshot(session: Session, snap: Optional[MapSnapshotModel]) -> Optional[MapSnapshotModel]:
+        """Fill in ``units``/``supply_centers``/``state_json`` from the snapshot's
+        keyframe and the deltas up to it, so callers see the same full snapshot
+        whichever way it was stored. ``snap`` must have been loaded with its
+        payload (``undefer_group('payload')``)."""
+        if snap is None:
+            return None
+        chain = [snap]
+        if snap.kind == snapshot_codec.DELTA:
+            chain = (
+                session.query(MapSnapshotModel)
+                .options(undefer_group('payload'))
+                .filter(
+                    (MapSnapshotModel.id == snap.base_snapshot_id)
+                    | ((MapSnapshotModel.base_snapshot_id == snap.base_snapshot_id) & (MapSnapshotModel.id <= snap.id))
+                )
+                .order_by(MapSnapshotModel.id)
+                .all()
+            )
+            if not chain or chain[0].id != snap.base_snapshot_id:
+                raise ValueError(f"snapshot {snap.id} refers to missing keyframe {snap.base_snapshot_id}")
+        for name, value in _replay_snapshot_chain(chain).items():
+            set_committed_value(snap, name, value)
+        return snap
+
+    def _query_full_snapshots(self, session: Session):
+        return session.query(MapSnapshotModel).options(undefer_group('payload'))
+
+    def has_game_snapshot(self, game_id: int, turn: int, phase_code: str) -> bool:
+        """Whether a snapshot of ``phase_code`` exists at ``turn``; reads no payload."""
+        with self.session_factory() as session:
+            return session.query(
+                session.query(MapSnapshotModel.id)
+                .filter_by(game_id=game_id, turn_number=turn, phase_code=phase_code)
+                .exists()
+            ).scalar()
+
     def get_game_snapshot_by_game_id_and_turn(self, game_id: int, turn: int) -> Optional[MapSnapshotModel]:
         with self.session_factory() as session:
-            return session.query(MapSnapshotModel).filter_by(game_id=game_id, turn_number=turn).first()
+            snap = self._query_full_snapshots(session).filter_by(game_id=game_id, turn_number=turn).first()
+            return self._materialize_snapshot(session, snap)
 
     def get_latest_game_snapshot_by_game_id_and_phase_code(self, game_id: int, phase_code: str) -> Optional[MapSnapshotModel]:
         with self.session_factory() as session:
-            return session.query(MapSnapshotModel).filter_by(game_id=game_id, phase_code=phase_code).order_by(MapSnapshotModel.id.desc()).first()
+            snap = self._query_full_snapshots(session).filter_by(game_id=game_id, phase_code=phase_code).order_by(MapSnapshotModel.id.desc()).first()
+            return self._materialize_snapshot(session, snap)
 
     def update_game_snapshot_map_image_path(self, snapshot_id: int, map_path: str) -> None:
         with self.session_factory() as session:
@@ -655,15 +795,17 @@ class DatabaseService:
                 session.commit()
 
     def get_game_snapshots_by_game_id(self, game_id: int) -> List[MapSnapshotModel]:
+        """A game's snapshots in creation order, metadata only: the payload
+        columns stay deferred, so reading ``units`` & co. on these raises."""
         with self.session_factory() as session:
-            return session.query(MapSnapshotModel).filter_by(game_id=game_id).all()
+            return session.query(MapSnapshotModel).filter_by(game_id=game_id).order_by(MapSnapshotModel.id).all()
 
     def get_game_snapshot_by_id(self, id: int, game_id: Optional[int] = None) -> Optional[MapSnapshotModel]:
         with self.session_factory() as session:
-            q = session.query(MapSnapshotModel).filter_by(id=id)
+            q = self._query_full_snapshots(session).filter_by(id=id)
             if game_id is not None:
                 q = q.filter_by(game_id=game_id)
-            return q.first()
+            return self._materialize_snapshot(session, q.first())
 
     def get_game_snapshots_with_old_map_images(self, cutoff_time: datetime) -> List[MapSnapshotModel]:
         """
@@ -701,7 +843,95 @@ class DatabaseService:
             session.query(GameModel).delete()
             session.commit()
 
+    # --- Outbox ---
+    # Post-turn side effects, inserted by GameRepo.save_state in the turn's own
+    # transaction. These claim, finish and reschedule them for server/outbox.py.
+
+    def claim_outbox_events(self, limit: int, lease: timedelta) -> List[Dict[str, Any]]:
+        """Lease up to ``limit`` due ``pending`` outbox rows, oldest first.
+
+        Each claimed row's ``attempts`` goes up and its ``next_attempt_at`` moves
+        ``lease`` ahead, in one short transaction. Other dispatchers therefore
+        skip it (``FOR UPDATE SKIP LOCKED`` on Postgres), and it comes due again by
+        itself if this one dies before calling ``complete_outbox_event`` or
+        ``retry_outbox_event``.
+        """
+        now = utcnow_naive()
+        with self.session_factory() as session:
+            rows = (
+                session.query(OutboxEventModel, GameModel.game_id)
+                .join(GameModel, OutboxEventModel.game_id == GameModel.id)
+                .filter(OutboxEventModel.status == 'pending', OutboxEventModel.next_attempt_at <= now)
+                .order_by(OutboxEventModel.id)
+                .limit(limit)
+                .with_for_update(skip_locked=True, of=OutboxEventModel)
+                .all()
+            )
+            claimed = []
+            for event, game_id in rows:
+                event.attempts = int(event.attempts or 0) + 1
+                event.next_attempt_at = now + lease
+                claimed.append({
+                    "id": event.id,
+                    "game_pk": event.game_id,
+                    "game_id": str(game_id),
+                    "turn": event.turn,
+                    "kind": event.kind,
+                    "payload": dict(event.payload or {}),
+                    "attempts": event.attempts,
+                })
+            session.commit()
+            return claimed
+
+    def complete_outbox_event(self, event_id: int) -> None:
+        with self.session_factory() as session:
+            session.query(OutboxEventModel).filter_by(id=event_id).update(
+                {"status": "done", "processed_at": utcnow_naive(), "last_error": None}
+            )
+            session.commit()
+
+    def retry_outbox_event(self, event_id: int, error: str, retry_at: Optional[datetime]) -> None:
+        """Record a failed attempt: due again at ``retry_at`` (naive UTC), or
+        ``dead`` when it is ``None``."""
+        values: Dict[str, Any] = {"last_error": error[:2000]}
+        if retry_at is None:
+            values.update(status="dead", processed_at=utcnow_naive())
+        else:
+            values["next_attempt_at"] = retry_at
+        with self.session_factory() as session:
+            session.query(OutboxEventModel).filter_by(id=event_id).update(values)
+            session.commit()
+
+    def get_outbox_events(self, game_id: int) -> List[Dict[str, Any]]:
+        """Every outbox row for a game (numeric id), oldest first."""
+        with self.session_factory() as session:
+            rows = (
+                session.query(OutboxEventModel)
+                .filter_by(game_id=game_id)
+                .order_by(OutboxEventModel.id)
+                .all()
+            )
+            return [
+                {
+                    "id": r.id,
+                    "turn": r.turn,
+                    "kind": r.kind,
+                    "payload": r.payload,
+                    "status": r.status,
+                    "attempts": r.attempts,
+                    "last_error": r.last_error,
+                    "next_attempt_at": r.next_attempt_at,
+                    "processed_at": r.processed_at,
+                }
+                for r in rows
+            ]
+
     # --- Channel Analytics ---
+    # Every event is written twice in one transaction: the raw row in
+    # channel_analytics and a +1 on its channel_analytics_daily rollup row. The
+    # summaries read whole days from the rollup and only the partial first/last
+    # day of a date window from raw rows (see _analytics_window), all in one
+    # UNION ALL query, so their cost tracks users x types x days, not events.
     def log_channel_analytics_event(
         self,
         game_id: str | int,
@@ -724,27 +954,168 @@ class DatabaseService:
             power: Optional power associated with the event
             metadata: Optional additional event data (message_id, response_time, etc.)
         """
+        self.log_channel_analytics_events([{
+            "game_id": game_id,
+            "channel_id": channel_id,
+            "event_type": event_type,
+            "event_subtype": event_subtype,
+            "user_id": user_id,
+            "power": power,
+            "metadata": metadata,
+        }])
+
+    def log_channel_analytics_events(self, events: List[Dict[str, Any]]) -> int:
+        """
+        Log a batch of analytics events in one transaction.
+
+        Each event takes ``log_channel_analytics_event``'s keyword arguments,
+        plus an optional ``created_at`` (naive UTC; defaults to now). Raw rows
+        go in with a single multi-row ``INSERT``, and the daily rollup gets one
+        upsert per distinct key. Events for unknown games are skipped.
+
+        Returns:
+            Number of events written
+        """
+        from sqlalchemy import insert, select
         from .database import ChannelAnalyticsModel
-        
+
+        if not events:
+            return 0
         with self.session_factory() as session:
-            # Get game model to ensure it exists
-            game_model = self._get_game_model_by_game_id_string(session, str(game_id))
-            if not game_model:
-                self.logger.warning(f"Cannot log analytics: game {game_id} not found")
-                return
-            
-            analytics_event = ChannelAnalyticsModel(
-                game_id=game_model.id,
-                channel_id=channel_id,
-                event_type=event_type,
-                event_subtype=event_subtype,
-                user_id=user_id,
-                power=power,
-                event_data=metadata or {}
-            )
-            
-            session.add(analytics_event)
+            game_ids = {str(e["game_id"]) for e in events}
+            game_pks = dict(session.execute(
+                select(GameModel.game_id, GameModel.id).where(GameModel.game_id.in_(game_ids))
+            ).all())
+            for missing in sorted(game_ids - game_pks.keys()):
+                self.logger.warning(f"Cannot log analytics: game {missing} not found")
+
+            now = utcnow_naive()
+            rows: List[Dict[str, Any]] = []
+            rollup: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+            for e in events:
+                game_pk = game_pks.get(str(e["game_id"]))
+                if game_pk is None:
+                    continue
+                created_at = e.get("created_at") or now
+                rows.append({
+                    "game_id": game_pk,
+                    "channel_id": e["channel_id"],
+                    "event_type": e["event_type"],
+                    "event_subtype": e.get("event_subtype"),
+                    "user_id": e.get("user_id"),
+                    "power": e.get("power"),
+                    "event_data": e.get("metadata") or {},
+                    "created_at": created_at,
+                })
+                key = (
+                    game_pk, e["channel_id"], created_at.date(), e["event_type"],
+                    e.get("event_subtype") or "", e.get("user_id") or 0, e.get("power") or "",
+                )
+                agg = rollup.get(key)
+                if agg is None:
+                    rollup[key] = {"event_count": 1, "last_event_at": created_at}
+                else:
+                    agg["event_count"] += 1
+                    agg["last_event_at"] = max(agg["last_event_at"], created_at)
+            if not rows:
+                return 0
+
+            session.execute(insert(ChannelAnalyticsModel), rows)
+            session.execute(self._analytics_rollup_upsert(session, [
+                {
+                    "game_id": key[0], "channel_id": key[1], "day": key[2], "event_type": key[3],
+                    "event_subtype": key[4], "user_id": key[5], "power": key[6], **agg,
+                }
+                for key, agg in rollup.items()
+            ]))
             session.commit()
+            return len(rows)
+
+    @staticmethod
+    def _analytics_rollup_upsert(session: Session, values: List[Dict[str, Any]]) -> Any:
+        """Multi-row ``INSERT ... ON CONFLICT DO UPDATE`` adding each row's
+        ``event_count`` to the matching channel_analytics_daily row (Postgres,
+        or SQLite in tests). Keys in ``values`` must be distinct."""
+        from sqlalchemy import case
+        from .database import ChannelAnalyticsDailyModel
+
+        if session.get_bind().dialect.name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+        table = ChannelAnalyticsDailyModel.__table__
+        stmt = insert(table).values(values)
+        return stmt.on_conflict_do_update(
+            index_elements=[
+                table.c.game_id, table.c.channel_id, table.c.day, table.c.event_type,
+                table.c.event_subtype, table.c.user_id, table.c.power,
+            ],
+            set_={
+                "event_count": table.c.event_count + stmt.excluded.event_count,
+                "last_event_at": case(
+                    (stmt.excluded.last_event_at > table.c.last_event_at, stmt.excluded.last_event_at),
+                    else_=table.c.last_event_at,
+                ),
+            },
+        )
+
+    def _analytics_grouped(
+        self,
+        session: Session,
+        game_pk: int,
+        keys: Tuple[str, ...],
+        channel_id: Optional[str] = None,
+        event_type: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[Tuple[Any, ...]]:
+        """``(*keys, count, last_event_at)`` rows over ``[start_date, end_date]``
+        in one query: whole days from the rollup, partial edge days from raw
+        events. A key may appear once per source; callers sum them. Absent
+        subtype/user/power come back as ``''``/``0``/``''`` from both sources."""
+        from sqlalchemy import and_, or_, select, union_all
+        from .database import ChannelAnalyticsDailyModel as Daily, ChannelAnalyticsModel as Raw
+
+        use_rollup, first_day, last_day, edges = _analytics_window(start_date, end_date)
+        parts = []
+        if use_rollup:
+            cols = [getattr(Daily, k) for k in keys]
+            q = select(
+                *cols, sa_func.sum(Daily.event_count), sa_func.max(Daily.last_event_at)
+            ).where(Daily.game_id == game_pk)
+            if channel_id:
+                q = q.where(Daily.channel_id == channel_id)
+            if event_type:
+                q = q.where(Daily.event_type == event_type)
+            if first_day is not None:
+                q = q.where(Daily.day >= first_day)
+            if last_day is not None:
+                q = q.where(Daily.day <= last_day)
+            parts.append(q.group_by(*cols))
+        if edges:
+            raw_cols = {
+                "event_type": Raw.event_type,
+                "event_subtype": sa_func.coalesce(Raw.event_subtype, ""),
+                "user_id": sa_func.coalesce(Raw.user_id, 0),
+                "power": sa_func.coalesce(Raw.power, ""),
+            }
+            cols = [raw_cols[k] for k in keys]
+            q = select(*cols, sa_func.count(Raw.id), sa_func.max(Raw.created_at)).where(
+                Raw.game_id == game_pk,
+                or_(*(
+                    and_(Raw.created_at >= lo, Raw.created_at <= hi if hi_inclusive else Raw.created_at < hi)
+                    for lo, hi, hi_inclusive in edges
+                )),
+            )
+            if channel_id:
+                q = q.where(Raw.channel_id == channel_id)
+            if event_type:
+                q = q.where(Raw.event_type == event_type)
+            parts.append(q.group_by(*cols))
+        if not parts:
+            return []
+        stmt = parts[0] if len(parts) == 1 else union_all(*parts)
+        return [tuple(row) for row in session.execute(stmt).all()]
 
     def get_channel_analytics(
         self,
@@ -752,10 +1123,12 @@ class DatabaseService:
         channel_id: Optional[str] = None,
         event_type: Optional[str] = None,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
+        end_date: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        before_id: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """
-        Get analytics events for a game/channel.
+        Get analytics events for a game/channel, newest first.
         
         Args:
             game_id: Game ID (string or int)
@@ -763,6 +1136,9 @@ class DatabaseService:
             event_type: Optional event type filter
             start_date: Optional start date filter
             end_date: Optional end date filter
+            limit: Optional page size
+            before_id: Optional keyset cursor -- only events with a smaller id
+                (the previous page's last ``id``)
             
         Returns:
             List of analytics event dictionaries
@@ -783,11 +1159,19 @@ class DatabaseService:
             if event_type:
                 query = query.filter(ChannelAnalyticsModel.event_type == event_type)
             if start_date:
-                query = query.filter(ChannelAnalyticsModel.created_at >= start_date)
+                query = query.filter(ChannelAnalyticsModel.created_at >= _naive_utc(start_date))
             if end_date:
-                query = query.filter(ChannelAnalyticsModel.created_at <= end_date)
+                query = query.filter(ChannelAnalyticsModel.created_at <= _naive_utc(end_date))
+            if before_id is not None:
+                query = query.filter(ChannelAnalyticsModel.id < before_id)
             
-            events = query.order_by(ChannelAnalyticsModel.created_at.desc()).all()
+            # ids are assigned in insertion order, which is created_at order;
+            # ordering by id lets the (game, channel[, type], id) indexes serve
+            # each page without a sort.
+            query = query.order_by(ChannelAnalyticsModel.id.desc())
+            if limit is not None:
+                query = query.limit(limit)
+            events = query.all()
             
             return [
                 {
@@ -823,107 +1207,81 @@ class DatabaseService:
         Returns:
             Dictionary with aggregated metrics
         """
-        from .database import ChannelAnalyticsModel
-        from sqlalchemy import func
+        with self.session_factory() as session:
+            game_model = self._get_game_model_by_game_id_string(session, str(game_id))
+            rows = (
+                self._analytics_grouped(
+                    session,
+                    game_model.id,
+                    ("event_type", "event_subtype", "user_id"),
+                    channel_id=channel_id,
+                    start_date=start_date,
+                    end_date=end_date,
+                )
+                if game_model
+                else []
+            )
+        
+        events_by_type: Dict[str, int] = {}
+        events_by_subtype: Dict[str, int] = {}
+        users: set[int] = set()
+        for event_type, event_subtype, user_id, count, _ in rows:
+            count = int(count)
+            events_by_type[event_type] = events_by_type.get(event_type, 0) + count
+            if event_subtype:
+                events_by_subtype[event_subtype] = events_by_subtype.get(event_subtype, 0) + count
+            if user_id:
+                users.add(user_id)
         
+        return {
+            "total_events": sum(events_by_type.values()),
+            "events_by_type": events_by_type,
+            "events_by_subtype": events_by_subtype,
+            "unique_users": len(users),
+            "message_count": events_by_type.get("message_posted", 0),
+            "player_activity_count": events_by_type.get("player_activity", 0)
+        }
+
+    def get_channel_player_activity(
+        self,
+        game_id: str | int,
+        channel_id: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Per-player ``player_activity`` counts for a game/channel.
+        
+        Players are keyed by user when the event had one, else by power; each
+        entry carries the power of its most recent event.
+        
+        Returns:
+            List of ``{user_id, power, activity_count, last_activity}`` dicts
+        """
         with self.session_factory() as session:
             game_model = self._get_game_model_by_game_id_string(session, str(game_id))
             if not game_model:
-                return {
-                    "total_events": 0,
-                    "events_by_type": {},
-                    "events_by_subtype": {},
-                    "unique_users": 0,
-                    "message_count": 0,
-                    "player_activity_count": 0
-                }
-            
-            query = session.query(ChannelAnalyticsModel).filter(
-                ChannelAnalyticsModel.game_id == game_model.id
-            )
-            
-            if channel_id:
-                query = query.filter(ChannelAnalyticsModel.channel_id == channel_id)
-            if start_date:
-                query = query.filter(ChannelAnalyticsModel.created_at >= start_date)
-            if end_date:
-                query = query.filter(ChannelAnalyticsModel.created_at <= end_date)
-            
-            # Total events
-            total_events = query.count()
-            
-            # Events by type
-            events_by_type = {}
-            type_counts = session.query(
-                ChannelAnalyticsModel.event_type,
-                func.count(ChannelAnalyticsModel.id).label('count')
-            ).filter(
-                ChannelAnalyticsModel.game_id == game_model.id
-            )
-            if channel_id:
-                type_counts = type_counts.filter(ChannelAnalyticsModel.channel_id == channel_id)
-            if start_date:
-                type_counts = type_counts.filter(ChannelAnalyticsModel.created_at >= start_date)
-            if end_date:
-                type_counts = type_counts.filter(ChannelAnalyticsModel.created_at <= end_date)
-            type_counts = type_counts.group_by(ChannelAnalyticsModel.event_type).all()
-            
-            for event_type, count in type_counts:
-                events_by_type[event_type] = count
-            
-            # Events by subtype
-            events_by_subtype = {}
-            subtype_counts = session.query(
-                ChannelAnalyticsModel.event_subtype,
-                func.count(ChannelAnalyticsModel.id).label('count')
-            ).filter(
-                ChannelAnalyticsModel.game_id == game_model.id,
-                ChannelAnalyticsModel.event_subtype.isnot(None)
+                return []
+            rows = self._analytics_grouped(
+                session,
+                game_model.id,
+                ("user_id", "power"),
+                channel_id=channel_id,
+                event_type="player_activity",
+                start_date=start_date,
+                end_date=end_date,
             )
-            if channel_id:
-                subtype_counts = subtype_counts.filter(ChannelAnalyticsModel.channel_id == channel_id)
-            if start_date:
-                subtype_counts = subtype_counts.filter(ChannelAnalyticsModel.created_at >= start_date)
-            if end_date:
-                subtype_counts = subtype_counts.filter(ChannelAnalyticsModel.created_at <= end_date)
-            subtype_counts = subtype_counts.group_by(ChannelAnalyticsModel.event_subtype).all()
-            
-            for event_subtype, count in subtype_counts:
-                events_by_subtype[event_subtype] = count
-            
-            # Unique users
-            unique_users = session.query(
-                func.count(func.distinct(ChannelAnalyticsModel.user_id))
-            ).filter(
-                ChannelAnalyticsModel.game_id == game_model.id,
-                ChannelAnalyticsModel.user_id.isnot(None)
+        
+        players: Dict[str, Dict[str, Any]] = {}
+        for user_id, power, count, last in sorted(rows, key=lambda r: r[3]):
+            key = f"user_{user_id}" if user_id else f"power_{power}" if power else "unknown"
+            entry = players.setdefault(
+                key, {"user_id": user_id or None, "power": None, "activity_count": 0, "last_activity": None}
             )
-            if channel_id:
-                unique_users = unique_users.filter(ChannelAnalyticsModel.channel_id == channel_id)
-            if start_date:
-                unique_users = unique_users.filter(ChannelAnalyticsModel.created_at >= start_date)
-            if end_date:
-                unique_users = unique_users.filter(ChannelAnalyticsModel.created_at <= end_date)
-            unique_users_count = unique_users.scalar() or 0
-            
-            # Message count (message_posted events)
-            message_count = query.filter(
-                ChannelAnalyticsModel.event_type == 'message_posted'
-            ).count()
-            
-            # Player activity count
-            player_activity_count = query.filter(
-                ChannelAnalyticsModel.event_type == 'player_activity'
-            ).count()
-            
-            return {
-                "total_events": total_events,
-                "events_by_type": events_by_type,
-                "events_by_subtype": events_by_subtype,
-                "unique_users": unique_users_count,
-                "message_count": message_count,
-                "player_activity_count": player_activity_count
-            }
+            entry["activity_count"] += int(count)
+            entry["power"] = power or entry["power"]
+            entry["last_activity"] = last.isoformat() if last else entry["last_activity"]
+        return list(players.values())
 
     # --- Tournaments ---
     def create_tournament(
@@ -0,0 +1,300 @@
+"""
+The one place SQLAlchemy engines are built for the persistence layer.
+
+``DatabaseService`` (and through its ``session_factory``, ``GameRepo``) used to
+get an engine from a bare ``create_engine(database_url)``: SQLAlchemy's
+default pool of 5 + 10 overflow connections, no liveness check, connections
+kept forever, no statement timeout, and a separate pool per
+``DatabaseService`` instance. ``get_engine`` builds one configured engine per
+URL and hands the same one to every caller in the process.
+
+- **Configurable.** ``PoolSettings.from_env`` reads ``DIPLOMACY_DB_POOL_SIZE``,
+  ``DIPLOMACY_DB_MAX_OVERFLOW``, ``DIPLOMACY_DB_POOL_TIMEOUT`` (seconds to wait
+  for a free connection before raising), ``DIPLOMACY_DB_POOL_RECYCLE``
+  (seconds before a connection is replaced), ``DIPLOMACY_DB_POOL_PRE_PING``
+  (check a connection before handing it out, so a database restart costs a
+  reconnect rather than a failed request) and
+  ``DIPLOMACY_DB_STATEMENT_TIMEOUT_MS`` (PostgreSQL ``statement_timeout`` for
+  every connection; 0 leaves the server default).
+- **Instrumented.** ``InstrumentedQueuePool`` counts checkouts, how long each
+  waited for a connection (total and max), checkouts that timed out, new
+  connections and invalidated ones, and the peak number in use.
+  ``pool_status(engine)`` returns those with the pool's live gauges (size,
+  in use, idle, overflow); ``GET /admin/connection_pool_status`` serves it.
+- **Resettable.** ``reset_pool(engine)`` disposes the pool: idle connections
+  are closed now, connections in use are closed when returned, and later
+  checkouts open fresh ones. The counters carry over.
+- **Round-trips counted.** Every statement either engine sends increments
+  ``diplomacy_db_statements_total`` (``metrics``), and, inside
+  ``counting_statements()``, that context's tally: the API's request
+  middleware uses it to record the round-trips each route makes.
+
+SQLite in-memory URLs keep SQLAlchemy's own single-connection pool; the
+tests and tools that use them have nothing to tune. ``create_async_db_engine``
+builds the asyncpg counterpart, with the same settings and counters, for
+``persistence.async_reads``.
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, fields
+from typing import Any
+
+from sqlalchemy import create_engine, event, exc
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from metrics import REGISTRY
+
+__all__ = [
+    "InstrumentedAsyncQueuePool",
+    "InstrumentedQueuePool",
+    "PoolSettings",
+    "counting_statements",
+    "create_async_db_engine",
+    "create_db_engine",
+    "get_engine",
+    "pool_status",
+    "reset_pool",
+]
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    pool_recycle: int = 1800
+    pre_ping: bool = True
+    statement_timeout_ms: int = 0
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str] = os.environ) -> PoolSettings:
+        def get(name: str, default: Any) -> str:
+            return environ.get(name, "") or str(default)
+
+        return cls(
+            pool_size=int(get("DIPLOMACY_DB_POOL_SIZE", cls.pool_size)),
+            max_overflow=int(get("DIPLOMACY_DB_MAX_OVERFLOW", cls.max_overflow)),
+            pool_timeout=float(get("DIPLOMACY_DB_POOL_TIMEOUT", cls.pool_timeout)),
+            pool_recycle=int(get("DIPLOMACY_DB_POOL_RECYCLE", cls.pool_recycle)),
+            pre_ping=get("DIPLOMACY_DB_POOL_PRE_PING", "1").lower() not in ("0", "false", "no"),
+            statement_timeout_ms=int(get("DIPLOMACY_DB_STATEMENT_TIMEOUT_MS", cls.statement_timeout_ms)),
+        )
+
+
+@dataclass
+class PoolMetrics:
+    checkouts: int = 0
+    checkout_wait_seconds_total: float = 0.0
+    checkout_wait_seconds_max: float = 0.0
+    timeouts: int = 0
+    connects: int = 0
+    invalidations: int = 0
+    resets: int = 0
+    peak_in_use: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            values = {f.name: getattr(self, f.name) for f in fields(self) if not f.name.startswith("_")}
+        values["checkout_wait_seconds_mean"] = (
+            values["checkout_wait_seconds_total"] / values["checkouts"] if values["checkouts"] else 0.0
+        )
+        return values
+
+
+class _InstrumentedPool:
+    """Mixin for a ``QueuePool`` that records how long each checkout waited,
+    and its timeouts. ``metrics`` survives ``Engine.dispose()`` (``recreate``)."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def connect(self) -> Any:
+        started = time.perf_counter()
+        try:
+            conn = super().connect()  # type: ignore[misc]
+        except exc.TimeoutError:
+            with self.metrics._lock:
+                self.metrics.timeouts += 1
+            raise
+        waited = time.perf_counter() - started
+        in_use = self.checkedout()  # type: ignore[attr-defined]
+        m = self.metrics
+        with m._lock:
+            m.checkouts += 1
+            m.checkout_wait_seconds_total += waited
+            m.checkout_wait_seconds_max = max(m.checkout_wait_seconds_max, waited)
+            m.peak_in_use = max(m.peak_in_use, in_use)
+        return conn
+
+    def recreate(self) -> Any:
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class InstrumentedQueuePool(_InstrumentedPool, QueuePool):
+    """The sync engines' pool."""
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPool, AsyncAdaptedQueuePool):
+    """The asyncpg engine's pool (``create_async_db_engine``)."""
+
+
+def _is_memory_sqlite(url: Any) -> bool:
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+def create_db_engine(database_url: str, settings: PoolSettings | None = None) -> Engine:
+    """A new engine for ``database_url`` with ``settings`` (default: from the
+    environment). Most callers want the shared ``get_engine`` instead."""
+    settings = settings or PoolSettings.from_env()
+    url = make_url(database_url)
+    if _is_memory_sqlite(url):
+        return create_engine(url)
+
+    connect_args: dict[str, Any] = {}
+    if settings.statement_timeout_ms > 0 and url.get_backend_name() == "postgresql":
+        connect_args["options"] = f"-c statement_timeout={settings.statement_timeout_ms}"
+    engine = create_engine(
+        url,
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.pool_size,
+        max_overflow=settings.max_overflow,
+        pool_timeout=settings.pool_timeout,
+        pool_recycle=settings.pool_recycle,
+        pool_pre_ping=settings.pre_ping,
+        connect_args=connect_args,
+    )
+    _count_connections(engine)
+    _count_statements(engine)
+    return engine
+
+
+_STATEMENTS = REGISTRY.counter(
+    "diplomacy_db_statements_total", "SQL statements sent to the database, by driver.", ("driver",)
+)
+_statement_tally: ContextVar[list[int] | None] = ContextVar("diplomacy_statement_tally", default=None)
+
+
+@contextmanager
+def counting_statements() -> Iterator[list[int]]:
+    """Count the statements run in this context into the yielded ``[n]``.
+
+    Work handed to a thread with a copy of the context (``asyncio.to_thread``,
+    ``server.executors.run_blocking``, FastAPI's ``def`` routes) counts too.
+    """
+    tally = [0]
+    token = _statement_tally.set(tally)
+    try:
+        yield tally
+    finally:
+        _statement_tally.reset(token)
+
+
+def _count_statements(engine: Engine) -> None:
+    total = _STATEMENTS.labels(engine.dialect.driver)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _on_execute(*_: Any) -> None:
+        total.inc()
+        tally = _statement_tally.get()
+        if tally is not None:
+            tally[0] += 1
+
+
+def _count_connections(engine: Engine) -> None:
+    # engine.pool.metrics is looked up per event: a caller may hand the pool
+    # another engine's counters after this (AsyncReadRepo does).
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection: Any, record: Any) -> None:
+        metrics = engine.pool.metrics  # type: ignore[attr-defined]
+        with metrics._lock:
+            metrics.connects += 1
+
+    @event.listens_for(engine, "invalidate")
+    def _on_invalidate(dbapi_connection: Any, record: Any, exception: Any) -> None:
+        metrics = engine.pool.metrics  # type: ignore[attr-defined]
+        with metrics._lock:
+            metrics.invalidations += 1
+
+
+def create_async_db_engine(database_url: str, settings: PoolSettings | None = None) -> AsyncEngine:
+    """An asyncpg engine for the PostgreSQL database at ``database_url`` (any
+    ``postgresql+<driver>`` URL; the driver is swapped), pooled and timed out
+    like ``create_db_engine``. Raises ``ValueError`` for other databases and
+    ``ImportError`` when asyncpg (or greenlet) is not installed."""
+    settings = settings or PoolSettings.from_env()
+    url = make_url(database_url)
+    if url.get_backend_name() != "postgresql":
+        raise ValueError(f"async reads need PostgreSQL, not {url.get_backend_name()}")
+    import asyncpg  # noqa: F401 -- fail here, not on the first query
+    import greenlet  # noqa: F401
+
+    connect_args: dict[str, Any] = {}
+    if settings.statement_timeout_ms > 0:
+        connect_args["server_settings"] = {"statement_timeout": str(settings.statement_timeout_ms)}
+    engine = create_async_engine(
+        url.set(drivername="postgresql+asyncpg"),
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=settings.pool_size,
+        max_overflow=settings.max_overflow,
+        pool_timeout=settings.pool_timeout,
+        pool_recycle=settings.pool_recycle,
+        pool_pre_ping=settings.pre_ping,
+        connect_args=connect_args,
+    )
+    _count_connections(engine.sync_engine)
+    _count_statements(engine.sync_engine)
+    return engine
+
+
+_engines: dict[str, Engine] = {}
+_engines_lock = threading.Lock()
+
+
+def get_engine(database_url: str) -> Engine:
+    """The process's engine for ``database_url``, created on first use."""
+    with _engines_lock:
+        engine = _engines.get(database_url)
+        if engine is None:
+            engine = _engines[database_url] = create_db_engine(database_url)
+        return engine
+
+
+def pool_status(engine: Engine) -> dict[str, Any]:
+    """Live gauges and cumulative counters for ``engine``'s pool."""
+    pool = engine.pool
+    status: dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            max_overflow=pool._max_overflow,
+            in_use=pool.checkedout(),
+            idle=pool.checkedin(),
+            overflow=max(0, pool.overflow()),
+            timeout_seconds=pool.timeout(),
+        )
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        status.update(metrics.snapshot())
+    return status
+
+
+def reset_pool(engine: Engine) -> None:
+    """Close idle connections and start a fresh pool (connections in use are
+    closed when they are returned)."""
+    engine.dispose()
+    metrics = getattr(engine.pool, "metrics", None)
+    if metrics is not None:
+        with metrics._lock:
+            metrics.resets += 1
@@ -2,8 +2,18 @@
 
 A game is persisted as ``games.state_json`` (the serialized ``GameState``) plus
 ``games.pending_orders`` (``{power: [order_str]}`` submitted-but-not-adjudicated).
+Writers may also pass ``state_blob`` (the same state in the binary codec), which
+``get_state_payload`` returns in preference to the JSON; a ``state_json`` write
+without one clears it, so a stale blob can never outlive its JSON. Pending orders
+work the same way: ``set_pending_orders`` may also store their parsed form
+(``pending_orders_parsed``), which is cleared whenever it isn't supplied.
+Every write to either bumps ``games.state_version`` / ``games.orders_version``
+respectively, which is what the API's ETags are built from (``get_version``).
 The denormalised ``current_*``/``phase_code``/``status`` columns are kept in sync so
 existing peripheral code (deadline scheduler, channels, listings) keeps working.
+``save_state`` can also write the game's next deadline and ``outbox_events`` rows
+(``PostTurnWrites``) in the same transaction, so a processed turn and its side
+effects are committed together.
 
 Player→power assignments live in the ``players`` table (not engine-coupled) and are
 read here for convenience.
@@ -11,12 +21,13 @@ read here for convenience.
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Optional
 
-from persistence.database import GameModel, PlayerModel
+from persistence.database import GameModel, OutboxEventModel, PlayerModel
 
-__all__ = ["GameRepo", "StaleGameError"]
+__all__ = ["GameRepo", "PostTurnWrites", "StaleGameError"]
 
 
 class StaleGameError(RuntimeError):
@@ -28,6 +39,17 @@ class StaleGameError(RuntimeError):
     guard, checked at the point of writing the result back."""
 
 
+@dataclass(frozen=True)
+class PostTurnWrites:
+    """Extra writes ``save_state`` commits with the new state: the game's next
+    ``deadline`` (naive UTC, or ``None`` to clear it) and ``outbox`` entries
+    ``(kind, payload)``, stored as ``outbox_events`` rows for the turn the game
+    advances to."""
+
+    deadline: Optional[datetime] = None
+    outbox: tuple[tuple[str, dict[str, Any]], ...] = ()
+
+
 class GameRepo:
     def __init__(self, session_factory: Any) -> None:
         self._session_factory = session_factory
@@ -43,6 +65,17 @@ class GameRepo:
                 row = None
         return row
 
+    def _columns(self, session: Any, game_id: str, *columns: Any) -> Any:
+        """Just ``columns`` of the game's row (by ``game_id``, then integer PK),
+        for reads that must not load the JSON columns ``_row`` pulls in."""
+        row = session.query(*columns).filter(GameModel.game_id == str(game_id)).first()
+        if row is None:
+            try:
+                row = session.query(*columns).filter(GameModel.id == int(game_id)).first()
+            except (ValueError, TypeError):
+                row = None
+        return row
+
     def exists(self, game_id: str) -> bool:
         with self._session_factory() as session:
             return self._row(session, game_id) is not None
@@ -52,13 +85,43 @@ class GameRepo:
             row = self._row(session, game_id)
             return dict(row.state_json) if row is not None and row.state_json else None
 
+    def get_state_payload(self, game_id: str) -> Optional[bytes | dict[str, Any]]:
+        """The stored state as cheaply as it can be read: the ``state_blob`` bytes
+        when present (without loading ``state_json``), else the JSON dict. ``None``
+        if the game doesn't exist."""
+        with self._session_factory() as session:
+            row = self._columns(session, game_id, GameModel.id, GameModel.state_blob)
+            if row is None:
+                return None
+            if row.state_blob is not None:
+                return bytes(row.state_blob)
+            sj = session.query(GameModel.state_json).filter(GameModel.id == row.id).scalar()
+            return dict(sj) if sj else None
+
     def get_pending_orders(self, game_id: str) -> dict[str, list[str]]:
         with self._session_factory() as session:
-            row = self._row(session, game_id)
+            row = self._columns(session, game_id, GameModel.pending_orders)
             if row is None or not row.pending_orders:
                 return {}
             return {k: list(v) for k, v in dict(row.pending_orders).items()}
 
+    def get_pending_orders_with_parsed(
+        self, game_id: str
+    ) -> tuple[dict[str, list[str]], Optional[dict[str, list[dict[str, Any]]]]]:
+        """``get_pending_orders`` plus the stored parsed form, or ``None`` for the
+        latter when it is missing or doesn't cover exactly the same powers."""
+        with self._session_factory() as session:
+            row = self._columns(
+                session, game_id, GameModel.pending_orders, GameModel.pending_orders_parsed
+            )
+            if row is None or not row.pending_orders:
+                return {}, {}
+            pending = {k: list(v) for k, v in dict(row.pending_orders).items()}
+            parsed = row.pending_orders_parsed
+            if parsed is None or set(parsed) != set(pending):
+                return pending, None
+            return pending, {k: list(v) for k, v in dict(parsed).items()}
+
     def get_draw_votes(self, game_id: str) -> dict[str, str]:
         """Current phase's ``{power: "yes"}`` draw votes (empty if none cast)."""
         with self._session_factory() as session:
@@ -85,6 +148,45 @@ class GameRepo:
                 return {}
             return {k: dict(v) for k, v in dict(row.order_history).items()}
 
+    def get_version(
+        self, game_id: str, *, with_players: bool = False
+    ) -> Optional[dict[str, Any]]:
+        """Everything a game's GET responses are derived from, minus the data itself.
+
+        Selects only the identity, ``phase_code`` and write-counter columns --
+        never ``state_json`` -- so a conditional GET can be answered before any
+        JSON is loaded or decoded. ``created_at`` is included so a recreated
+        database can't hand a new game an old game's ETag. ``with_players`` adds
+        the ``(power, user_id, is_active)`` assignments, for responses that embed
+        them (``GameService.view``). ``None`` if the game does not exist.
+        """
+        columns = (
+            GameModel.id,
+            GameModel.created_at,
+            GameModel.phase_code,
+            GameModel.state_version,
+            GameModel.orders_version,
+        )
+        with self._session_factory() as session:
+            row = self._columns(session, game_id, *columns)
+            if row is None:
+                return None
+            version: dict[str, Any] = {
+                "id": row.id,
+                "created_at": row.created_at,
+                "phase_code": row.phase_code,
+                "state_version": int(row.state_version or 0),
+                "orders_version": int(row.orders_version or 0),
+            }
+            if with_players:
+                version["players"] = [
+                    (p.power_name, p.user_id, p.is_active)
+                    for p in session.query(
+                        PlayerModel.power_name, PlayerModel.user_id, PlayerModel.is_active
+                    ).filter(PlayerModel.game_id == row.id).order_by(PlayerModel.power_name)
+                ]
+            return version
+
     def get_meta(self, game_id: str) -> Optional[dict[str, Any]]:
         with self._session_factory() as session:
             row = self._row(session, game_id)
@@ -120,6 +222,7 @@ class GameRepo:
         state_json: dict[str, Any],
         phase_code: str,
         game_id: Optional[str] = None,
+        state_blob: Optional[bytes] = None,
     ) -> str:
         """Insert a new game row and return its ``game_id`` string.
 
@@ -131,6 +234,7 @@ class GameRepo:
                 game_id=str(game_id) if game_id is not None else "",
                 map_name=map_name,
                 state_json=state_json,
+                state_blob=state_blob,
                 pending_orders={},
                 draw_votes={},
                 phase_code=phase_code,
@@ -157,6 +261,8 @@ class GameRepo:
         expected_phase_code: Optional[str] = None,
         last_resolution: Optional[dict[str, Any]] = None,
         order_history_entry: Optional[dict[str, list[str]]] = None,
+        state_blob: Optional[bytes] = None,
+        post_turn: Optional[PostTurnWrites] = None,
     ) -> None:
         """Persist the next ``GameState`` and bump the phase counter. When given, the
         adjudication ``last_resolution`` is stored for later resolution-map rendering,
@@ -167,7 +273,10 @@ class GameRepo:
         ``phase_code`` or a ``StaleGameError`` is raised instead of writing --
         the optimistic-concurrency check that keeps two concurrent
         ``process_turn`` calls (e.g. from two uvicorn workers) from both adjudicating
-        the same phase and one silently clobbering the other's result."""
+        the same phase and one silently clobbering the other's result.
+
+        ``post_turn``, when given, sets ``games.deadline`` and inserts its outbox
+        rows in the same transaction (see ``PostTurnWrites``)."""
         with self._session_factory() as session:
             row = self._row(session, game_id)
             if row is None:
@@ -179,6 +288,8 @@ class GameRepo:
                     "concurrently"
                 )
             row.state_json = state_json
+            row.state_blob = state_blob
+            row.state_version = GameModel.state_version + 1
             row.phase_code = phase_code
             row.status = status
             if last_resolution is not None:
@@ -193,10 +304,21 @@ class GameRepo:
             row.current_season = str(state_json.get("season", "SPRING")).capitalize()
             row.current_phase = str(state_json.get("phase_type", "MOVEMENT")).capitalize()
             row.updated_at = datetime.now(timezone.utc)
+            if post_turn is not None:
+                row.deadline = post_turn.deadline
+                session.add_all(
+                    OutboxEventModel(game_id=row.id, turn=row.current_turn, kind=kind, payload=payload)
+                    for kind, payload in post_turn.outbox
+                )
             session.commit()
 
     def restore_state(
-        self, game_id: str, state_json: dict[str, Any], *, phase_code: str
+        self,
+        game_id: str,
+        state_json: dict[str, Any],
+        *,
+        phase_code: str,
+        state_blob: Optional[bytes] = None,
     ) -> None:
         """Overwrite the live ``state_json``/``phase_code`` from a snapshot.
 
@@ -212,19 +334,30 @@ class GameRepo:
             if row is None:
                 raise ValueError(f"game {game_id} not found")
             row.state_json = state_json
+            row.state_blob = state_blob
+            row.state_version = GameModel.state_version + 1
             row.phase_code = phase_code
             row.status = "active"
             row.pending_orders = {}
+            row.pending_orders_parsed = {}
+            row.orders_version = GameModel.orders_version + 1
             row.draw_votes = {}
             row.updated_at = datetime.now(timezone.utc)
             session.commit()
 
-    def set_pending_orders(self, game_id: str, pending: dict[str, list[str]]) -> None:
+    def set_pending_orders(
+        self,
+        game_id: str,
+        pending: dict[str, list[str]],
+        parsed: Optional[dict[str, list[dict[str, Any]]]] = None,
+    ) -> None:
         with self._session_factory() as session:
             row = self._row(session, game_id)
             if row is None:
                 raise ValueError(f"game {game_id} not found")
             row.pending_orders = pending
+            row.pending_orders_parsed = parsed
+            row.orders_version = GameModel.orders_version + 1
             session.commit()
 
     def set_draw_votes(self, game_id: str, votes: dict[str, str]) -> None:
@@ -236,7 +369,13 @@ class GameRepo:
             session.commit()
 
     def update_state_json(
-        self, game_id: str, state_json: dict[str, Any], *, phase_code: str, status: str
+        self,
+        game_id: str,
+        state_json: dict[str, Any],
+        *,
+        phase_code: str,
+        status: str,
+        state_blob: Optional[bytes] = None,
     ) -> None:
         """Overwrite ``state_json``/``phase_code``/``status`` in place, without the
         turn-counter bump or ``pending_orders`` clearing ``save_state`` does.
@@ -251,6 +390,8 @@ class GameRepo:
             if row is None:
                 raise ValueError(f"game {game_id} not found")
             row.state_json = state_json
+            row.state_blob = state_blob
+            row.state_version = GameModel.state_version + 1
             row.phase_code = phase_code
             row.status = status
             row.updated_at = datetime.now(timezone.utc)
@@ -0,0 +1,268 @@
+"""Keyframe + delta encoding for ``map_snapshots`` rows.
+
+A snapshot is three documents. The view-shaped ``units`` list and
+``supply_centers`` map serve ``/history``, ``/map/history`` and
+``/replay``. The serialized ``GameState`` in ``state_json`` serves
+``/restore``. Storing all three in full on every phase repeats the whole
+board, twice, every turn, although a phase moves only a handful of units.
+So ``DatabaseService.create_game_snapshot`` writes a **keyframe** every
+``keyframe_interval()`` snapshots of a game and a **delta** in between.
+This module is the codec: pure functions over plain JSON values, with no
+SQLAlchemy.
+
+- **A delta is against the snapshot before it.** It holds the unit moves
+  and ownership changes of one phase. Every delta row points at its
+  keyframe (``base_snapshot_id``), so rebuilding any snapshot is one query
+  for the keyframe and its deltas up to the target, then a replay in id
+  order. Writers lock the keyframe row, so a chain never forks.
+- **Keyframes don't store the board twice.** When the view columns are
+  exactly what ``state_json`` holds (units in location order, ownership
+  equal), which is the case for every snapshot the server takes,
+  ``units``/``supply_centers`` are left ``NULL`` and derived on read.
+- **Units are keyed by ``location``.** A diff is ``{"set": {loc: entry},
+  "del": [loc]}``, with keys sorted so equal changes encode equally. A
+  plain ``kind``/``power``/``location`` unit is stored as the entry
+  ``[kind, power]``. Ownership maps use the same shape, keyed by province.
+  Rebuilt unit lists come back in location order, which is the order
+  ``GameService.view`` and the post-turn outbox write them in. Order
+  doesn't matter inside ``state_json``, because ``state_from_dict`` makes
+  a frozenset of the units.
+- **``state_json`` reuses the view's diff.** When the ``state_json`` unit
+  or ownership change equals the view's, the delta stores the marker
+  ``"units"`` / ``"supply_centers"`` rather than a second copy.
+- **Anything else is stored whole** (``{"=": value}``): a unit list that
+  isn't keyable, a non-dict ownership map, a missing ``state_json``. The
+  codec never guesses. The small scalar ``state_json`` fields (phase,
+  dislodged, contested, status, winners) are copied only when they change.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Mapping
+from typing import Any
+
+KEYFRAME = "keyframe"
+DELTA = "delta"
+
+DEFAULT_KEYFRAME_INTERVAL = 20
+
+#: The parts of a snapshot document, as ``DatabaseService`` hands them out.
+FIELDS = ("units", "supply_centers", "state_json")
+
+_UNIT_KEYS = ("kind", "power", "location")
+
+_SEASON_BY_CODE = {"S": "SPRING", "F": "FALL", "W": "WINTER"}
+_PHASE_TYPE_BY_CODE = {"M": "MOVEMENT", "R": "RETREAT", "A": "ADJUSTMENT"}
+
+
+def keyframe_interval(environ: Mapping[str, str] = os.environ) -> int:
+    """Snapshots per keyframe: ``DIPLOMACY_SNAPSHOT_KEYFRAME_INTERVAL``,
+    default 20. ``1`` stores every snapshot in full."""
+    raw = environ.get("DIPLOMACY_SNAPSHOT_KEYFRAME_INTERVAL", "") or str(DEFAULT_KEYFRAME_INTERVAL)
+    return max(1, int(raw))
+
+
+def phase_fields(phase_code: str) -> dict[str, Any]:
+    """``year``/``season``/``phase_type`` decoded from a phase code such as
+    ``"S1901M"`` (season letter, year digits, phase-type letter).
+    ``map_snapshots`` keeps only the code, so listings derive the rest from it."""
+    code = str(phase_code)
+    try:
+        year: int | None = int(code[1:-1])
+    except ValueError:
+        year = None
+    return {
+        "year": year,
+        "season": _SEASON_BY_CODE.get(code[:1], "SPRING"),
+        "phase_type": _PHASE_TYPE_BY_CODE.get(code[-1:], "MOVEMENT"),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Keyed maps
+# ---------------------------------------------------------------------------
+
+
+def _keyed_units(units: Any) -> dict[str, Any] | None:
+    """``{location: unit}``, or ``None`` when ``units`` isn't a list of unit
+    dicts with distinct locations (such a list is stored whole)."""
+    if not isinstance(units, list):
+        return None
+    keyed: dict[str, Any] = {}
+    for unit in units:
+        if not isinstance(unit, dict) or not isinstance(unit.get("location"), str):
+            return None
+        keyed[unit["location"]] = unit
+    return keyed if len(keyed) == len(units) else None
+
+
+def _sorted_units(keyed: Mapping[str, Any]) -> list[Any]:
+    return [keyed[loc] for loc in sorted(keyed)]
+
+
+def _diff_map(old: Mapping[str, Any], new: Mapping[str, Any]) -> dict[str, Any]:
+    diff: dict[str, Any] = {}
+    changed = {k: new[k] for k in sorted(new) if k not in old or old[k] != new[k]}
+    removed = sorted(k for k in old if k not in new)
+    if changed:
+        diff["set"] = changed
+    if removed:
+        diff["del"] = removed
+    return diff
+
+
+def _apply_map(base: Mapping[str, Any], diff: Mapping[str, Any]) -> dict[str, Any]:
+    out = dict(base)
+    for key in diff.get("del", ()):
+        out.pop(key, None)
+    out.update(diff.get("set", {}))
+    return out
+
+
+def _pack_unit(unit: dict[str, Any]) -> Any:
+    if tuple(unit) == _UNIT_KEYS:
+        return [unit["kind"], unit["power"]]
+    return unit
+
+
+def _unpack_unit(location: str, entry: Any) -> dict[str, Any]:
+    if isinstance(entry, list):
+        return {"kind": entry[0], "power": entry[1], "location": location}
+    return entry
+
+
+def _diff_units(old: Any, new: Any) -> dict[str, Any]:
+    old_keyed, new_keyed = _keyed_units(old), _keyed_units(new)
+    if old_keyed is None or new_keyed is None:
+        return {} if old == new else {"=": new}
+    diff = _diff_map(old_keyed, new_keyed)
+    if "set" in diff:
+        diff["set"] = {loc: _pack_unit(unit) for loc, unit in diff["set"].items()}
+    return diff
+
+
+def _apply_units(base: Any, diff: Mapping[str, Any]) -> Any:
+    if "=" in diff:
+        return diff["="]
+    if not diff:
+        return base
+    changed = {loc: _unpack_unit(loc, entry) for loc, entry in diff.get("set", {}).items()}
+    return _sorted_units(_apply_map(_keyed_units(base) or {}, {**diff, "set": changed}))
+
+
+def _diff_owners(old: Any, new: Any) -> dict[str, Any]:
+    if isinstance(old, dict) and isinstance(new, dict):
+        return _diff_map(old, new)
+    return {} if old == new else {"=": new}
+
+
+def _apply_owners(base: Any, diff: Mapping[str, Any]) -> Any:
+    if "=" in diff:
+        return diff["="]
+    return _apply_map(base, diff) if diff else base
+
+
+# ---------------------------------------------------------------------------
+# state_json
+# ---------------------------------------------------------------------------
+
+
+def _diff_state(old: Any, new: Any, units_diff: dict[str, Any], owners_diff: dict[str, Any]) -> dict[str, Any]:
+    if not isinstance(old, dict) or not isinstance(new, dict):
+        return {} if old == new else {"=": new}
+    diff: dict[str, Any] = {}
+    sub = _diff_units(old.get("units"), new.get("units"))
+    if sub:
+        diff["units"] = "units" if sub == units_diff else sub
+    sub = _diff_owners(old.get("ownership"), new.get("ownership"))
+    if sub:
+        diff["ownership"] = "supply_centers" if sub == owners_diff else sub
+    rest = _diff_map(
+        {k: v for k, v in old.items() if k not in ("units", "ownership")},
+        {k: v for k, v in new.items() if k not in ("units", "ownership")},
+    )
+    if rest:
+        diff["fields"] = rest
+    return diff
+
+
+def _apply_state(base: Any, diff: Mapping[str, Any], delta: Mapping[str, Any]) -> Any:
+    if "=" in diff:
+        return diff["="]
+    if not diff:
+        return base
+    out = _apply_map(base, diff.get("fields", {}))
+    units = diff.get("units")
+    if units is not None:
+        out["units"] = _apply_units(base.get("units"), delta["units"] if units == "units" else units)
+    owners = diff.get("ownership")
+    if owners is not None:
+        out["ownership"] = _apply_owners(
+            base.get("ownership"), delta["supply_centers"] if owners == "supply_centers" else owners
+        )
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Snapshots
+# ---------------------------------------------------------------------------
+
+
+def encode_keyframe(snapshot: Mapping[str, Any]) -> dict[str, Any]:
+    """The column values for a keyframe row. ``units``/``supply_centers`` are
+    ``None`` when ``decode_keyframe`` can derive them from ``state_json``."""
+    columns = {name: snapshot.get(name) for name in FIELDS}
+    state = columns["state_json"]
+    if not isinstance(state, dict):
+        return columns
+    state_units = _keyed_units(state.get("units"))
+    if state_units is not None and columns["units"] == _sorted_units(state_units):
+        columns["units"] = None
+    if columns["supply_centers"] == state.get("ownership"):
+        columns["supply_centers"] = None
+    return columns
+
+
+def decode_keyframe(units: Any, supply_centers: Any, state_json: Any) -> dict[str, Any]:
+    """The snapshot document for a keyframe row's column values.
+
+    Rows written before keyframes existed carry all three columns in full.
+    """
+    if isinstance(state_json, dict):
+        if units is None:
+            units = _sorted_units(_keyed_units(state_json.get("units")) or {})
+        if supply_centers is None:
+            supply_centers = dict(state_json.get("ownership") or {})
+    return {"units": units, "supply_centers": supply_centers, "state_json": state_json}
+
+
+def encode_delta(previous: Mapping[str, Any], snapshot: Mapping[str, Any]) -> dict[str, Any]:
+    """The delta that turns the ``previous`` snapshot document into
+    ``snapshot``. Unchanged parts are omitted."""
+    units = _diff_units(previous.get("units"), snapshot.get("units"))
+    owners = _diff_owners(previous.get("supply_centers"), snapshot.get("supply_centers"))
+    state = _diff_state(previous.get("state_json"), snapshot.get("state_json"), units, owners)
+    return {name: part for name, part in zip(FIELDS, (units, owners, state), strict=True) if part}
+
+
+def apply_delta(previous: Mapping[str, Any], delta: Mapping[str, Any]) -> dict[str, Any]:
+    """Rebuild a snapshot document from the one before it and its ``delta``."""
+    return {
+        "units": _apply_units(previous.get("units"), delta.get("units", {})),
+        "supply_centers": _apply_owners(previous.get("supply_centers"), delta.get("supply_centers", {})),
+        "state_json": _apply_state(previous.get("state_json"), delta.get("state_json", {}), delta),
+    }
+
+
+def encoded_size(value: Any) -> int:
+    """Bytes ``value`` takes as compact JSON, roughly what a JSON column stores."""
+    return len(json.dumps(value, separators=(",", ":")))
+
+
+def worth_a_delta(delta: Mapping[str, Any], snapshot: Mapping[str, Any]) -> bool:
+    """Whether to store ``delta`` rather than start a new keyframe with
+    ``snapshot``. Not when the delta is over half the keyframe's size, as
+    after a restore to a much earlier phase."""
+    return encoded_size(delta) * 2 < encoded_size(encode_keyframe(snapshot))
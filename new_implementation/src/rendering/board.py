@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import logging
 import os
+import time
 import xml.etree.ElementTree as ET
 from io import BytesIO
 from typing import Any
@@ -21,6 +22,7 @@ from PIL import Image, ImageDraw, ImageFont
 
 from engine.map_loader import MapData, load_standard_map
 from engine.types import ProvinceType
+from metrics import REGISTRY
 
 from .cache import _map_cache
 from .icons import _draw_army_icon, _draw_fleet_icon
@@ -28,6 +30,20 @@ from .visualization_config import get_config
 
 logger = logging.getLogger("diplomacy.rendering.map")
 
+# Stages of a render that missed the map cache; ``rendering.overlays`` uses
+# the same histogram for its overlay pass and encode.
+_RENDER_STAGE_SECONDS = REGISTRY.histogram(
+    "diplomacy_render_stage_seconds",
+    "Time spent in each stage of a board render (cache misses only).",
+    ("stage",),
+)
+_STAGE_SVG = _RENDER_STAGE_SECONDS.labels("svg")
+_STAGE_COLOR = _RENDER_STAGE_SECONDS.labels("color")
+_STAGE_UNITS = _RENDER_STAGE_SECONDS.labels("units")
+_STAGE_OVERLAYS = _RENDER_STAGE_SECONDS.labels("overlays")
+_STAGE_LEGEND = _RENDER_STAGE_SECONDS.labels("legend")
+_STAGE_ENCODE = _RENDER_STAGE_SECONDS.labels("encode")
+
 _engine_map_data: MapData | None = None
 
 
@@ -276,10 +292,11 @@ def render_board_png(
     # Optimize for empty maps (no units) - skip expensive operations
     if not units:
         # For empty maps, just convert SVG to PNG and add phase info
-        png_bytes = cairosvg.svg2png(url=str(svg_path), output_width=1835, output_height=1360)  # type: ignore
-        if png_bytes is None:
-            raise ValueError("cairosvg.svg2png returned None")
-        bg = Image.open(BytesIO(png_bytes)).convert("RGBA")  # type: ignore
+        with _STAGE_SVG.time():
+            png_bytes = cairosvg.svg2png(url=str(svg_path), output_width=1835, output_height=1360)  # type: ignore
+            if png_bytes is None:
+                raise ValueError("cairosvg.svg2png returned None")
+            bg = Image.open(BytesIO(png_bytes)).convert("RGBA")  # type: ignore
 
         # Add phase information if provided
         if phase_info:
@@ -294,7 +311,8 @@ def render_board_png(
                 pass
             bg.save(output_path, format="PNG")
         output = BytesIO()
-        bg.save(output, format="PNG")
+        with _STAGE_ENCODE.time():
+            bg.save(output, format="PNG")
         img_bytes = output.getvalue()
 
         # Cache the generated image
@@ -306,10 +324,11 @@ def render_board_png(
     # 1. Convert SVG to PNG (background) with EXACT SVG size - NO SCALING
     # The SVG has viewBox="0 0 1835 1360" - use exact size to avoid coordinate scaling issues
     # This gives us 1835x1360 pixels - no scaling, coordinates match exactly
-    png_bytes = cairosvg.svg2png(url=str(svg_path), output_width=1835, output_height=1360)  # type: ignore
-    if png_bytes is None:
-        raise ValueError("cairosvg.svg2png returned None")
-    bg = Image.open(BytesIO(png_bytes)).convert("RGBA")  # type: ignore
+    with _STAGE_SVG.time():
+        png_bytes = cairosvg.svg2png(url=str(svg_path), output_width=1835, output_height=1360)  # type: ignore
+        if png_bytes is None:
+            raise ValueError("cairosvg.svg2png returned None")
+        bg = Image.open(BytesIO(png_bytes)).convert("RGBA")  # type: ignore
     draw = ImageDraw.Draw(bg)
     # 2. Get province coordinates (cached)
     coords = get_svg_province_coordinates(svg_path)
@@ -325,9 +344,11 @@ def render_board_png(
             supply_centers_set = set()
 
     # First pass: Color provinces based on power control using proper transparency
-    _color_provinces_by_power_with_transparency(bg, units, power_colors, svg_path, supply_center_control, phase_info.get('phase') if phase_info else None, color_only_supply_centers, supply_centers_set)
+    with _STAGE_COLOR.time():
+        _color_provinces_by_power_with_transparency(bg, units, power_colors, svg_path, supply_center_control, phase_info.get('phase') if phase_info else None, color_only_supply_centers, supply_centers_set)
 
     # Second pass: Draw units on top
+    units_started = time.perf_counter()
     for power, unit_list in units.items():
         color = power_colors.get(power.upper(), "black")
         for unit in unit_list:
@@ -407,14 +428,16 @@ def render_board_png(
                     _draw_army_icon(draw, (x, y), rgb_color, outline_color, unit_diameter, bg)
                 else:  # F
                     _draw_fleet_icon(draw, (x, y), rgb_color, outline_color, unit_diameter, bg)
+    _STAGE_UNITS.observe(time.perf_counter() - units_started)
 
-    # 5. Add phase information to bottom right corner
-    if phase_info:
-        _draw_phase_info(draw, phase_info, bg.size)
+    with _STAGE_LEGEND.time():
+        # 5. Add phase information to bottom right corner
+        if phase_info:
+            _draw_phase_info(draw, phase_info, bg.size)
 
-    # 6. Add legend showing power colors
-    active_powers = list(units.keys())
-    _draw_legend(bg, "initial", active_powers)
+        # 6. Add legend showing power colors
+        active_powers = list(units.keys())
+        _draw_legend(bg, "initial", active_powers)
 
     # 7. Save or return PNG
     if isinstance(output_path, str) and output_path:
@@ -424,7 +447,8 @@ def render_board_png(
             pass
         bg.save(output_path, format="PNG")
     output = BytesIO()
-    bg.save(output, format="PNG")
+    with _STAGE_ENCODE.time():
+        bg.save(output, format="PNG")
     img_bytes = output.getvalue()
 
     # Cache the generated image
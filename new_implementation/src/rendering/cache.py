@@ -4,7 +4,8 @@
 keyed by a hash of the render inputs (svg path, units, phase info, orders, moves).
 ``render_board_png``/``render_board_png_orders``/``render_board_png_resolution``
 (``rendering.board``/``rendering.overlays``) all read and write through the single
-module-level ``_map_cache`` instance here.
+module-level ``_map_cache`` instance here. Every ``get`` counts as a hit or a
+miss in ``diplomacy_map_cache_lookups_total`` (``GET /metrics``).
 """
 from __future__ import annotations
 
@@ -15,8 +16,16 @@ import os
 import time
 from typing import Any
 
+from metrics import REGISTRY
+
 logger = logging.getLogger("diplomacy.rendering.map")
 
+_LOOKUPS = REGISTRY.counter(
+    "diplomacy_map_cache_lookups_total", "Rendered-map cache lookups, by result.", ("result",)
+)
+_HIT = _LOOKUPS.labels("hit")
+_MISS = _LOOKUPS.labels("miss")
+
 
 class MapCache:
     """Comprehensive map caching system for performance optimization."""
@@ -99,12 +108,16 @@ class MapCache:
                         with open(cache_file, 'rb') as f:
                             img_bytes = f.read()
                             self.cache[cache_key] = (img_bytes, time.time())
+                            _HIT.inc()
                             return img_bytes
                     except OSError as e:
                         self.logger.warning(f"Could not load cached image {cache_key}: {e}")
 
-            return self.cache[cache_key][0]
+            img_bytes = self.cache[cache_key][0]
+            (_HIT if img_bytes is not None else _MISS).inc()
+            return img_bytes
 
+        _MISS.inc()
         return None
 
     def put(self, cache_key: str, img_bytes: bytes) -> None:
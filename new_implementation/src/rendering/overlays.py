@@ -25,6 +25,9 @@ from .arrows import (
     _draw_support_cut_indicator,
 )
 from .board import (
+    _STAGE_ENCODE,
+    _STAGE_LEGEND,
+    _STAGE_OVERLAYS,
     _convert_color_to_rgb,
     _get_power_colors_dict,
     get_dislodged_unit_coordinates,
@@ -601,18 +604,20 @@ def render_board_png_orders(
 
     # Draw order visualizations onto a supersampled layer so the arrows come out
     # anti-aliased -- ImageDraw itself does no anti-aliasing (see rendering.antialias).
-    with antialiased_overlay(bg) as draw:
+    with _STAGE_OVERLAYS.time(), antialiased_overlay(bg) as draw:
         _draw_comprehensive_order_visualization(draw, pending_orders, coords, power_colors, units, dislodged_coords)
 
     # Add orders legend
     active_powers = list(units.keys())
-    _draw_legend(bg, "orders", active_powers)
+    with _STAGE_LEGEND.time():
+        _draw_legend(bg, "orders", active_powers)
 
     # Save or return PNG
     if isinstance(output_path, str) and output_path:
         bg.save(output_path, format="PNG")
     output = BytesIO()
-    bg.save(output, format="PNG")
+    with _STAGE_ENCODE.time():
+        bg.save(output, format="PNG")
     img_bytes = output.getvalue()
 
     # Cache the generated image
@@ -697,7 +702,7 @@ def render_board_png_resolution(
 
     # Same supersampled layer as the orders map: order arrows *and* the conflict/standoff
     # markers, since the markers are stars and circles that alias just as badly.
-    with antialiased_overlay(bg) as draw:
+    with _STAGE_OVERLAYS.time(), antialiased_overlay(bg) as draw:
         # Draw order visualizations with status indicators
         _draw_comprehensive_order_visualization(draw, orders, coords, power_colors, units, dislodged_coords)
 
@@ -717,13 +722,15 @@ def render_board_png_resolution(
 
     # Add resolution legend
     active_powers = list(units.keys())
-    _draw_legend(bg, "resolution", active_powers)
+    with _STAGE_LEGEND.time():
+        _draw_legend(bg, "resolution", active_powers)
 
     # Save or return PNG
     if isinstance(output_path, str) and output_path:
         bg.save(output_path, format="PNG")
     output = BytesIO()
-    bg.save(output, format="PNG")
+    with _STAGE_ENCODE.time():
+        bg.save(output, format="PNG")
     img_bytes = output.getvalue()
 
     # Cache the generated image
@@ -9,9 +9,11 @@ Route modules are organized by functionality:
 - messages: Private and broadcast messaging
 - maps: Map image generation
 - admin: Administrative endpoints
-- dashboard: Dashboard API endpoints
+- dashboard: Dashboard API endpoints (incl. slow-request profiles from ``RequestProfilerMiddleware``)
 - auth: Register, login, JWT, link Telegram
 - health: Health check endpoints
+- events: Server-Sent Events stream of game updates
+- metrics: Prometheus scrape endpoint (``RequestMetricsMiddleware`` times every request)
 """
 import os
 from fastapi import FastAPI, HTTPException
@@ -28,10 +30,14 @@ from pathlib import Path
 from .db_config import SQLALCHEMY_DATABASE_URL
 from .api import shared as _api_shared
 from .api.shared import deadline_scheduler, db_service
-from .daide.server import DaideServer, DEFAULT_PORT as DAIDE_DEFAULT_PORT
+from .daide.server import DaideServer, DEFAULT_MAX_GAMES as DAIDE_DEFAULT_MAX_GAMES, DEFAULT_PORT as DAIDE_DEFAULT_PORT
+from .events import PostgresEventBridge, bridge_enabled, game_events
+from .executors import shutdown_executors
+from .request_metrics import RequestMetricsMiddleware
+from .request_profiler import RequestProfilerMiddleware
 
 # Import route modules
-from .api.routes import games, orders, users, messages, maps, admin, dashboard, channels, tournaments, health, auth, waiting_list
+from .api.routes import games, orders, users, messages, maps, admin, dashboard, channels, tournaments, health, auth, waiting_list, events, metrics
 
 # Set up logger
 logger = logging.getLogger("diplomacy.server.api")
@@ -140,10 +146,10 @@ async def lifespan(app: FastAPI):
 
     task = asyncio.create_task(deadline_scheduler())
 
-    # DAIDE listener (Track D, D4): one game per listener, following the
-    # daide_protocol.DAIDEServer default of port 8432 (overridable via
-    # DIPLOMACY_DAIDE_PORT, mainly so tests/CI running multiple app instances
-    # don't fight over the same port). start() only binds the socket -- it
+    # DAIDE listener (Track D, D4): a lobby of up to DIPLOMACY_DAIDE_MAX_GAMES
+    # games, following the daide_protocol.DAIDEServer default of port 8432
+    # (overridable via DIPLOMACY_DAIDE_PORT, mainly so tests/CI running
+    # multiple app instances don't fight over the same port). start() only binds the socket -- it
     # does not create a game (see DaideServer.start()'s docstring for why:
     # this repo auto-deploys to prod on every merge to main, and eager
     # creation would mint an orphan game row on every single restart).
@@ -151,23 +157,51 @@ async def lifespan(app: FastAPI):
     # crashing the whole API -- DAIDE is one integration among several this
     # process serves, not a prerequisite for the others.
     daide_port = int(os.environ.get("DIPLOMACY_DAIDE_PORT", str(DAIDE_DEFAULT_PORT)))
-    _api_shared.daide_server = DaideServer(_api_shared.game_service, db_service=_api_shared.db_service, port=daide_port)
+    daide_max_games = int(os.environ.get("DIPLOMACY_DAIDE_MAX_GAMES", str(DAIDE_DEFAULT_MAX_GAMES)))
+    _api_shared.daide_server = DaideServer(
+        _api_shared.game_service, db_service=_api_shared.db_service, port=daide_port, max_games=daide_max_games
+    )
     try:
         await _api_shared.daide_server.start()
     except Exception as e:
         logger.error(f"DAIDE listener failed to start on port {daide_port}: {e}")
         _api_shared.daide_server = None
 
+    # Cross-worker game events (SSE): only needed when several uvicorn workers
+    # serve the same database, so opt-in. Like DAIDE, a failure to connect is
+    # logged rather than fatal -- streams then only see this worker's events.
+    event_bridge = None
+    if bridge_enabled():
+        try:
+            event_bridge = PostgresEventBridge(
+                game_events, PostgresEventBridge.dsn_from_url(SQLALCHEMY_DATABASE_URL)
+            )
+            await asyncio.to_thread(event_bridge.start)
+        except Exception as e:
+            logger.error(f"Game event bridge failed to start: {e}")
+            event_bridge = None
+
+    # Post-turn side effects committed as outbox rows (snapshots, DMs, channel
+    # posts, map pre-renders); also runs rows left over from before a restart.
+    _api_shared.outbox.start()
+
     try:
         yield
     finally:
+        await asyncio.to_thread(_api_shared.outbox.stop)
         task.cancel()
         with contextlib.suppress(asyncio.CancelledError):
             await task
+        if event_bridge is not None:
+            await asyncio.to_thread(event_bridge.stop)
         if _api_shared.daide_server is not None:
             with contextlib.suppress(Exception):
                 await _api_shared.daide_server.stop()
             _api_shared.daide_server = None
+        await asyncio.to_thread(_api_shared.analytics_buffer.stop)
+        await _api_shared.async_reads.dispose()
+        # Last: the steps above may still be waiting on blocking-pool calls.
+        await asyncio.to_thread(shutdown_executors)
 
 # Initialize schema immediately when module is imported (for TestClient compatibility)
 # TestClient doesn't always trigger lifespan, so initialize here as well
@@ -185,6 +219,9 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(RequestProfilerMiddleware, profiler=_api_shared.request_profiler)
+# Outermost, so the recorded latency includes CORS and every other layer.
+app.add_middleware(RequestMetricsMiddleware)
 
 # Register all route modules
 app.include_router(games.router)
@@ -197,8 +234,10 @@ app.include_router(dashboard.router)
 app.include_router(channels.router, tags=["channels"])
 app.include_router(tournaments.router)
 app.include_router(health.router, tags=["health"])
+app.include_router(events.router, tags=["events"])
 app.include_router(auth.router)
 app.include_router(waiting_list.router, tags=["waiting-list"])
+app.include_router(metrics.router, tags=["metrics"])
 
 # --- Core System Endpoints ---
 @app.get("/scheduler/status")
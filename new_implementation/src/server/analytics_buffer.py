@@ -0,0 +1,213 @@
+"""
+Buffered, batched ingestion of channel analytics events.
+
+Every channel post, broadcast, proposal and dashboard in
+``telegram_bot/channels.py`` logs an analytics event. Writing each one through
+``DatabaseService.log_channel_analytics_event`` cost a session, a commit and a
+round-trip on the path of sending the Telegram message. ``AnalyticsBuffer``
+takes the event instead and returns immediately. A daemon thread writes
+events in bulk with one ``INSERT ... VALUES`` (plus the daily-rollup upsert)
+per batch, through ``DatabaseService.log_channel_analytics_events``.
+
+- **Thresholds.** A batch is written once it holds ``max_batch`` events, or
+  once its oldest event has waited ``flush_interval`` seconds, whichever
+  comes first.
+- **Bounded.** At most ``max_pending`` events wait in memory. When the queue
+  is full, ``add`` blocks the caller for up to ``put_timeout`` seconds (so a
+  brief write stall slows producers rather than losing data). After that the
+  event is dropped and counted -- analytics must never wedge a channel post.
+- **Durable on shutdown.** ``flush()`` waits until everything accepted so far
+  is written; ``stop()`` flushes and then ends the thread. The API lifespan
+  and the Telegram bot's ``post_shutdown`` call ``stop()``, and an ``atexit``
+  hook covers any other orderly exit.
+
+Writes are best-effort, as the synchronous path was: a failed batch is
+logged and counted, not retried.
+"""
+from __future__ import annotations
+
+import atexit
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from persistence.database import utcnow_naive
+
+logger = logging.getLogger("diplomacy.server.analytics_buffer")
+
+DEFAULT_MAX_BATCH = 500
+DEFAULT_FLUSH_INTERVAL = 2.0
+DEFAULT_MAX_PENDING = 10_000
+DEFAULT_PUT_TIMEOUT = 0.05
+
+_STOP = object()
+
+
+@dataclass
+class AnalyticsBufferStats:
+    accepted: int = 0
+    written: int = 0
+    dropped: int = 0
+    failed: int = 0
+    batches: int = 0
+
+
+class AnalyticsBuffer:
+    """Accepts analytics events without blocking; a background thread writes them in batches.
+
+    ``writer`` receives a list of event dicts (``log_channel_analytics_event``'s
+    keyword arguments plus ``created_at``) and persists them in one transaction.
+    The thread starts on the first ``add``.
+    """
+
+    def __init__(
+        self,
+        writer: Callable[[list[dict[str, Any]]], Any],
+        *,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        put_timeout: float = DEFAULT_PUT_TIMEOUT,
+    ) -> None:
+        self.writer = writer
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+        self.stats = AnalyticsBufferStats()
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max_pending)
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._atexit_registered = False
+
+    @property
+    def pending(self) -> int:
+        """Events accepted but not yet handed to ``writer`` (approximate)."""
+        return self._queue.qsize()
+
+    def add(
+        self,
+        game_id: str | int,
+        channel_id: str,
+        event_type: str,
+        event_subtype: str | None = None,
+        user_id: int | None = None,
+        power: str | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> bool:
+        """Queue one event, stamped with the current time. False if it was
+        dropped because the buffer stayed full for ``put_timeout``."""
+        event = {
+            "game_id": game_id,
+            "channel_id": channel_id,
+            "event_type": event_type,
+            "event_subtype": event_subtype,
+            "user_id": user_id,
+            "power": power,
+            "metadata": metadata,
+            "created_at": utcnow_naive(),
+        }
+        self._ensure_started()
+        try:
+            self._queue.put(event, timeout=self.put_timeout)
+        except queue.Full:
+            with self._lock:
+                self.stats.dropped += 1
+                dropped = self.stats.dropped
+            if dropped == 1 or dropped % 1000 == 0:
+                logger.warning(f"Analytics buffer full; dropped {dropped} event(s) so far")
+            return False
+        with self._lock:
+            self.stats.accepted += 1
+        return True
+
+    def flush(self, timeout: float | None = 10.0) -> bool:
+        """Write everything accepted before this call. True once it has been
+        written (or failed and been counted), False on timeout."""
+        if self._thread is None:
+            return True
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def stop(self, timeout: float | None = 10.0) -> None:
+        """Flush, then stop the writer thread (idempotent). A later ``add``
+        starts a new one."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            logger.warning("Analytics buffer still full at shutdown; unwritten events are lost")
+            return
+        thread.join(timeout)
+
+    # -- writer thread ----------------------------------------------------
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="analytics-buffer", daemon=True)
+            self._thread.start()
+            if not self._atexit_registered:
+                atexit.register(self.stop)
+                self._atexit_registered = True
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            batch: list[dict[str, Any]] = []
+            waiters: list[threading.Event] = []
+            deadline = time.monotonic() + self.flush_interval
+            # Collect until the batch is full, the oldest event is due, or a
+            # flush/stop marker arrives; markers always end the batch.
+            while True:
+                if item is _STOP:
+                    self._write(batch)
+                    self._release(waiters)
+                    return
+                if isinstance(item, threading.Event):
+                    waiters.append(item)
+                    break
+                batch.append(item)
+                if len(batch) >= self.max_batch:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            self._write(batch)
+            self._release(waiters)
+
+    def _write(self, batch: list[dict[str, Any]]) -> None:
+        if not batch:
+            return
+        try:
+            self.writer(batch)
+        except Exception as e:  # noqa: BLE001 -- best-effort, counted below
+            logger.warning(f"Failed to write {len(batch)} analytics event(s): {e}")
+            with self._lock:
+                self.stats.failed += len(batch)
+            return
+        with self._lock:
+            self.stats.written += len(batch)
+            self.stats.batches += 1
+
+    @staticmethod
+    def _release(waiters: list[threading.Event]) -> None:
+        for waiter in waiters:
+            waiter.set()
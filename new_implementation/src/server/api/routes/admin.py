@@ -8,8 +8,10 @@ from typing import Dict, Any
 from datetime import datetime, timezone, timedelta
 import os
 
-from ..shared import db_service, server, logger, ADMIN_TOKEN
+from ..shared import async_reads, db_service, server, logger, ADMIN_TOKEN
 from ...response_cache import get_cache_stats, clear_response_cache, invalidate_cache
+from ...executors import executor_stats
+from persistence.engine import pool_status, reset_pool
 
 router = APIRouter()
 
@@ -134,11 +136,15 @@ def preload_common_maps() -> Dict[str, Any]:
 
 @router.get("/admin/connection_pool_status", dependencies=[Depends(require_admin)])
 def get_connection_pool_status() -> Dict[str, Any]:
-    """Get database connection pool status for monitoring."""
+    """Get database connection pool status for monitoring: size, connections in
+    use and idle, checkout wait times and timeouts (``persistence/engine.py``).
+    ``async_pool_status`` is the same for the async reads' engine
+    (``persistence/async_reads.py``; just ``driver`` until it has one)."""
     try:
         return {
             "status": "ok",
-            "pool_status": "N/A (DAL-managed)",
+            "pool_status": pool_status(db_service.engine),
+            "async_pool_status": async_reads.pool_status(),
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
     except Exception as e:
@@ -146,11 +152,14 @@ def get_connection_pool_status() -> Dict[str, Any]:
 
 @router.post("/admin/connection_pool_reset", dependencies=[Depends(require_admin)])
 def reset_connection_pool() -> Dict[str, Any]:
-    """Reset database connection pool (use with caution)."""
+    """Reset database connection pool (use with caution): idle connections are
+    closed now, connections in use when they are returned."""
     try:
+        reset_pool(db_service.engine)
         return {
             "status": "ok",
-            "message": "Connection pool reset (simulated)"
+            "message": "Connection pool reset",
+            "pool_status": pool_status(db_service.engine),
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -168,6 +177,15 @@ def get_response_cache_stats() -> Dict[str, Any]:
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/admin/executor_stats", dependencies=[Depends(require_admin)])
+def get_executor_stats() -> Dict[str, Any]:
+    """Queue depth and wait times of the blocking-work pools (``server/executors.py``)."""
+    return {
+        "status": "ok",
+        "executors": executor_stats(),
+        "timestamp": datetime.now(timezone.utc).isoformat()
+    }
+
 @router.post("/admin/clear_response_cache", dependencies=[Depends(require_admin)])
 def clear_response_cache_endpoint() -> Dict[str, Any]:
     """Clear all cached API responses."""
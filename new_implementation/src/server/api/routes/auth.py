@@ -19,7 +19,7 @@ from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer, OAuth2PasswordRequestForm
 from pydantic import BaseModel, field_validator
 
-from ..shared import db_service, BOT_SECRET
+from ..shared import async_reads, db_service, BOT_SECRET
 
 # Password hashing: use bcrypt directly (avoids passlib/bcrypt version quirks)
 try:
@@ -288,6 +288,25 @@ def get_current_user_optional(
     return user
 
 
+async def resolve_user_id_optional(
+    credentials: Optional[HTTPAuthorizationCredentials],
+    telegram_id: Optional[str] = None,
+    bot_secret: Optional[str] = None,
+) -> Optional[int]:
+    """``get_current_user_optional`` plus the telegram_id+bot_secret fallback,
+    for ``async def`` routes: the caller's user id, or None. Reads through
+    ``shared.async_reads``."""
+    if credentials:
+        user_id = _decode_token(credentials.credentials, "access")
+        if user_id is not None:
+            user_id = await async_reads.get_active_user_id(user_id)
+            if user_id is not None:
+                return user_id
+    if telegram_id and BOT_SECRET and bot_secret == BOT_SECRET:
+        return await async_reads.get_user_id_by_telegram_id(telegram_id)
+    return None
+
+
 def resolve_user_or_telegram(
     credentials: Optional[HTTPAuthorizationCredentials],
     telegram_id: Optional[str],
@@ -539,23 +539,32 @@ def post_battle_results(game_id: str) -> Dict[str, Any]:
 
 
 # --- Analytics Endpoints ---
+ANALYTICS_PAGE_MAX = 1000
+
+
 @router.get("/games/{game_id}/channel/analytics")
 def get_channel_analytics(
     game_id: str,
     channel_id: Optional[str] = None,
     event_type: Optional[str] = None,
     start_date: Optional[datetime] = None,
-    end_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None,
+    limit: int = 100,
+    before_id: Optional[int] = None
 ) -> Dict[str, Any]:
     """
-    Get analytics events for a game's channel.
+    Get one page of analytics events for a game's channel, newest first.
     
     Query parameters:
     - channel_id: Optional channel ID filter
     - event_type: Optional event type filter ('message_posted', 'player_activity', 'order_submitted', 'vote_cast', 'message_read')
     - start_date: Optional start date filter (ISO format)
     - end_date: Optional end date filter (ISO format)
+    - limit: Page size (1-1000, default 100)
+    - before_id: Keyset cursor: pass the previous page's ``next_before_id``
     """
+    if not 1 <= limit <= ANALYTICS_PAGE_MAX:
+        raise HTTPException(status_code=400, detail=f"limit must be between 1 and {ANALYTICS_PAGE_MAX}")
     try:
         # Get channel info if channel_id not provided
         if not channel_id:
@@ -564,21 +573,26 @@ def get_channel_analytics(
                 raise HTTPException(status_code=404, detail=f"Game {game_id} is not linked to a channel")
             channel_id = channel_info.get("channel_id")
         
-        # Get analytics events
+        # One extra row tells whether another page follows.
         events = db_service.get_channel_analytics(
             game_id=game_id,
             channel_id=channel_id,
             event_type=event_type,
             start_date=start_date,
-            end_date=end_date
+            end_date=end_date,
+            limit=limit + 1,
+            before_id=before_id
         )
+        has_more = len(events) > limit
+        events = events[:limit]
         
         return {
             "status": "ok",
             "game_id": game_id,
             "channel_id": channel_id,
             "event_count": len(events),
-            "events": events
+            "events": events,
+            "next_before_id": events[-1]["id"] if has_more else None
         }
     except HTTPException:
         raise
@@ -732,42 +746,20 @@ def get_player_activity_stats(
                 raise HTTPException(status_code=404, detail=f"Game {game_id} is not linked to a channel")
             channel_id = channel_info.get("channel_id")
         
-        # Get analytics events filtered by player activity
-        events = db_service.get_channel_analytics(
+        # Grouped by user/power in the database (from the daily rollup)
+        players = db_service.get_channel_player_activity(
             game_id=game_id,
             channel_id=channel_id,
-            event_type='player_activity',
             start_date=start_date,
             end_date=end_date
         )
         
-        # Group by user/power
-        player_stats: Dict[str, Dict[str, Any]] = {}
-        for event in events:
-            user_id = event.get("user_id")
-            power = event.get("power")
-            key = f"user_{user_id}" if user_id else f"power_{power}" if power else "unknown"
-            
-            if key not in player_stats:
-                player_stats[key] = {
-                    "user_id": user_id,
-                    "power": power,
-                    "activity_count": 0,
-                    "last_activity": None
-                }
-            
-            player_stats[key]["activity_count"] += 1
-            event_time = event.get("created_at")
-            if event_time:
-                if not player_stats[key]["last_activity"] or event_time > player_stats[key]["last_activity"]:
-                    player_stats[key]["last_activity"] = event_time
-        
         return {
             "status": "ok",
             "game_id": game_id,
             "channel_id": channel_id,
-            "player_count": len(player_stats),
-            "players": list(player_stats.values())
+            "player_count": len(players),
+            "players": players
         }
     except HTTPException:
         raise
@@ -2,16 +2,18 @@
 Dashboard API routes.
 
 This module contains endpoints for the admin dashboard, including service management,
-database inspection, and logging.
+database inspection, logging, and slow-request profiles (see ``server.request_profiler``).
 """
 from fastapi import APIRouter, Depends, Header, HTTPException
-from typing import Dict, Any
+from pydantic import BaseModel
+from typing import Dict, Any, Optional
 import subprocess
 import re
 from datetime import datetime
 from sqlalchemy import text
 
-from ..shared import db_service, ADMIN_TOKEN
+from ..shared import db_service, ADMIN_TOKEN, request_profiler
+from ...request_profiler import ProfilerConfig
 
 
 def require_admin(x_admin_token: str = Header(...)) -> None:
@@ -316,3 +318,69 @@ def get_database_stats() -> Dict[str, Any]:
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+
+class ProfilerConfigRequest(BaseModel):
+    """Fields left out keep their current value; ``routes`` replaces the whole map."""
+    slow_ms: Optional[float] = None
+    default_rate: Optional[float] = None
+    routes: Optional[Dict[str, float]] = None
+    top: Optional[int] = None
+
+
+def _profiler_config() -> Dict[str, Any]:
+    config = request_profiler.config
+    return {
+        "slow_ms": config.slow_ms,
+        "default_rate": config.default_rate,
+        "routes": dict(config.routes),
+        "top": config.top,
+    }
+
+
+@router.get("/dashboard/api/profiles", dependencies=[Depends(require_admin)])
+def list_request_profiles() -> Dict[str, Any]:
+    """Kept slow-request profiles (newest first, without their functions), the sampling config and outcome counts."""
+    return {
+        "config": _profiler_config(),
+        "stats": request_profiler.stats(),
+        "profiles": [p.summary() for p in request_profiler.profiles()],
+    }
+
+
+@router.get("/dashboard/api/profiles/config", dependencies=[Depends(require_admin)])
+def get_profiler_config() -> Dict[str, Any]:
+    """Current slow-request threshold, per-route sampling rates and top-N size."""
+    return _profiler_config()
+
+
+@router.put("/dashboard/api/profiles/config", dependencies=[Depends(require_admin)])
+def update_profiler_config(request: ProfilerConfigRequest) -> Dict[str, Any]:
+    """Change the profiling threshold or sampling rates until the next restart."""
+    current = request_profiler.config
+    config = ProfilerConfig(
+        slow_ms=current.slow_ms if request.slow_ms is None else request.slow_ms,
+        default_rate=current.default_rate if request.default_rate is None else request.default_rate,
+        routes=current.routes if request.routes is None else request.routes,
+        top=current.top if request.top is None else request.top,
+    )
+    try:
+        request_profiler.configure(config)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    return _profiler_config()
+
+
+@router.delete("/dashboard/api/profiles", dependencies=[Depends(require_admin)])
+def clear_request_profiles() -> Dict[str, Any]:
+    """Empty the profile ring buffer."""
+    request_profiler.clear()
+    return {"status": "ok"}
+
+
+@router.get("/dashboard/api/profiles/{profile_id}", dependencies=[Depends(require_admin)])
+def get_request_profile(profile_id: int) -> Dict[str, Any]:
+    """One kept profile with its top functions by cumulative time."""
+    profile = request_profiler.get(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return {**profile.summary(), "functions": profile.functions}
@@ -0,0 +1,66 @@
+"""
+Server-Sent Events stream of a game's updates.
+
+``GET /games/{game_id}/events`` is a ``text/event-stream`` a browser opens with
+``EventSource``: one frame per published game event (see ``server.events``),
+a comment line every ``HEARTBEAT_SECONDS`` so proxies keep the connection
+open, and ``Last-Event-ID`` resumption handled by the bus.
+"""
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter, Header, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+
+from ...events import GameEventBus, game_events
+from ..shared import game_service
+
+router = APIRouter()
+
+# Keep-alive comment interval; also how often a disconnected client is noticed.
+HEARTBEAT_SECONDS = 15.0
+# Tells EventSource how long to wait before reconnecting (milliseconds).
+RETRY_MS = 3000
+
+
+async def _stream(
+    request: Request, bus: GameEventBus, game_id: str, last_event_id: int | None
+) -> AsyncIterator[str]:
+    sub = bus.subscribe(game_id, last_event_id=last_event_id)
+    try:
+        yield f"retry: {RETRY_MS}\n\n"
+        while not await request.is_disconnected():
+            event = await sub.get(timeout=HEARTBEAT_SECONDS)
+            yield event.to_sse() if event is not None else ": keep-alive\n\n"
+    finally:
+        sub.close()
+
+
+@router.get("/games/{game_id}/events")
+async def game_event_stream(
+    game_id: str,
+    request: Request,
+    last_event_id: str | None = Header(None),
+    since: int | None = None,
+) -> StreamingResponse:
+    """Stream ``game_id``'s events: ``phase``, ``orders``, ``draw_vote``,
+    ``message``, ``state`` and ``resync`` (refetch everything).
+
+    No auth: events name what changed, never the private content (orders,
+    message text); clients re-fetch through the routes that do check. ``since``
+    is the query-string equivalent of ``Last-Event-ID`` for clients that can't
+    set headers on the first connect.
+    """
+    if await run_in_threadpool(game_service.version, game_id) is None:
+        raise HTTPException(status_code=404, detail="Game not found")
+    resume_from = since
+    if last_event_id is not None:
+        try:
+            resume_from = int(last_event_id)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Last-Event-ID must be an integer")
+    return StreamingResponse(
+        _stream(request, game_events, game_id, resume_from),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -4,10 +4,10 @@ Game management API routes.
 This module contains all endpoints related to game creation, state management,
 player management (join/quit/replace), deadlines, snapshots, and history.
 """
-from fastapi import APIRouter, HTTPException, Body, Depends, Header
+from fastapi import APIRouter, HTTPException, Body, Depends, Header, Request, Response
 from pydantic import BaseModel
 from typing import Dict, List, Any, Optional
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timedelta
 
 import requests
 from fastapi.security import HTTPAuthorizationCredentials
@@ -16,11 +16,15 @@ from .orders import _authorize_power
 from .. import shared as api_shared
 from ..shared import (
     db_service, game_service, logger, scheduler_logger, NOTIFY_URL, ADMIN_TOKEN, BOT_SECRET,
-    notify_players, notify_turn_processed, get_process_turn_lock,
+    notify_players, notify_turn_processed, post_turn_writes, get_process_turn_lock,
+    game_etag_async, async_reads,
 )
+from ...etag import etag_headers, not_modified
+from ...executors import run_blocking
 from ...legal_orders import legal_orders_for_power
 from ...response_cache import cached_response, invalidate_cache
 from persistence.game_repo import StaleGameError
+from persistence.snapshots import phase_fields
 from server.game_service import OrderError
 
 router = APIRouter()
@@ -245,12 +249,27 @@ async def process_turn(
     lock = get_process_turn_lock(game_id)
     if lock.locked():
         raise HTTPException(status_code=409, detail="Turn processing already in progress for this game")
+    # The next deadline (24h, cleared once the game ends) and the side effects
+    # -- snapshot, player DMs (the caller is skipped: the resolution is already
+    # in their response below), the linked channel's post, map pre-render -- are
+    # committed with the turn and run by the outbox dispatcher, so this reply
+    # never waits on Telegram or the renderer and a crash cannot lose them.
+    def post_turn(state):
+        return post_turn_writes(
+            state,
+            trigger="manual",
+            exclude_telegram_id=caller_telegram_id,
+            next_deadline=timedelta(hours=24),
+            snapshot=True,
+        )
+
     async with lock:
         try:
-            turn_result = game_service.process_turn(game_id)
+            turn_result = await run_blocking(game_service.process_turn, game_id, post_turn=post_turn)
         except StaleGameError as e:
             raise HTTPException(status_code=409, detail=str(e)) from e
     invalidate_cache(f"games/{game_id}")
+    api_shared.outbox.wake()
 
     if api_shared.daide_server is not None:
         try:
@@ -258,42 +277,6 @@ async def process_turn(
         except Exception as e:
             logger.error(f"DAIDE notify_game_processed failed for {game_id}: {e}")
 
-    try:
-        row = db_service.get_game_by_game_id(game_id)
-        view = game_service.view(game_id)
-        if row is not None and view is not None:
-            try:
-                db_service.create_game_snapshot(
-                    game_id=int(row.id),
-                    turn=int(getattr(row, "current_turn", 0) or 0),
-                    year=view["year"],
-                    season=view["season"],
-                    phase=view["phase_type"],
-                    phase_code=view["phase"],
-                    game_state=view,
-                    state_json=game_service.state_json(game_id),
-                )
-            except Exception as e:
-                logger.debug(f"process_turn: snapshot failed: {e}")
-            game_ended = view["status"] == "COMPLETED"
-            if not game_ended:
-                db_service.update_game_deadline(int(row.id), datetime.now(timezone.utc) + timedelta(hours=24))
-            else:
-                db_service.update_game_deadline(int(row.id), None)
-            # Before G3 this branch notified *only* on game end, so the ordinary
-            # case -- everyone submitted, one player pressed the button -- told the
-            # other six players nothing and posted nothing to the linked channel.
-            # Same fan-out as the deadline path now; the caller is skipped because
-            # the resolution is already in their response below.
-            notify_turn_processed(
-                game_id,
-                int(row.id),
-                trigger="manual",
-                game_ended=game_ended,
-                exclude_telegram_id=caller_telegram_id,
-            )
-    except Exception as e:
-        scheduler_logger.error(f"process_turn post-processing error: {e}")
     return {
         "status": "ok",
         "phase": turn_result["phase"],
@@ -314,10 +297,27 @@ def start_game(game_id: str) -> Dict[str, Any]:
 
 
 @router.get("/games/{game_id}/state")
-@cached_response(ttl=30, key_params=["game_id"])
-def get_game_state(game_id: str) -> Dict[str, Any]:
-    """Current game state in the new GameState-native shape (see GameService.view)."""
-    view = game_service.view(game_id)
+async def get_game_state(game_id: str, request: Request, response: Response) -> Dict[str, Any]:
+    """Current game state in the new GameState-native shape (see GameService.view).
+
+    Sent with a strong ``ETag`` (``shared.game_etag``); a poller that sends it
+    back in ``If-None-Match`` gets a bodiless 304 until the next write, decided
+    before the state is loaded. Native async: both reads go through
+    ``shared.async_reads``, so polling never waits for a threadpool thread.
+    """
+    etag = await game_etag_async(game_id, "state", players=True)
+    unchanged = not_modified(request, etag)
+    if unchanged is not None:
+        return unchanged
+    response.headers.update(etag_headers(etag))
+    return await _game_state_view(game_id=game_id, etag=etag)
+
+
+@cached_response(ttl=30, key_params=["game_id", "etag"])
+async def _game_state_view(game_id: str, etag: str) -> Dict[str, Any]:
+    """``GameService.view`` cached per ETag, so a cached body is never older than
+    the ETag it goes out with (every write changes the key)."""
+    view = await game_service.view_async(game_id)
     if view is None:
         raise HTTPException(status_code=404, detail="Game not found")
     return view
@@ -492,26 +492,16 @@ def list_games() -> Dict[str, Any]:
 
 @router.get("/games/{game_id}/players")
 @cached_response(ttl=60, key_params=["game_id"])
-def get_players(game_id: str) -> List[Dict[str, Any]]:
-    """Get all players in a game."""
+async def get_players(game_id: str) -> List[Dict[str, Any]]:
+    """Get all players in a game, with each one's Telegram id and name (one
+    join, through ``shared.async_reads``)."""
     try:
-        game = db_service.get_game_by_game_id(game_id)
-        if not game:
-            raise HTTPException(status_code=404, detail="Game not found")
-        players = db_service.get_players_by_game_id(int(game.id))  # type: ignore
-        result = []
-        for p in players:
-            user = db_service.get_user_by_id(int(p.user_id)) if p.user_id else None  # type: ignore
-            result.append({
-                "power": p.power_name,
-                "user_id": p.user_id,
-                "is_active": getattr(p, 'is_active', True),
-                "telegram_id": getattr(user, 'telegram_id', None) if user else None,
-                "full_name": getattr(user, 'full_name', None) if user else None,
-            })
-        return result
+        players = await async_reads.get_players(game_id)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    if players is None:
+        raise HTTPException(status_code=404, detail="Game not found")
+    return players
 
 
 @router.post("/games/{game_id}/spectate")
@@ -814,7 +804,14 @@ def get_game_history(game_id: int, turn: int) -> Dict[str, Any]:
         snapshot = db_service.get_game_snapshot_by_game_id_and_turn(game_id=game_id, turn=turn)
         if not snapshot:
             raise HTTPException(status_code=404, detail="No game state found for this turn.")
-        return {"game_id": game_id, "turn": turn, "phase": snapshot.phase, "state": snapshot.state}
+        return {
+            "game_id": game_id,
+            "turn": turn,
+            "phase": snapshot.phase_code,
+            "state": {"units": snapshot.units, "supply_centers": snapshot.supply_centers},
+        }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -848,19 +845,23 @@ def get_game_snapshots(game_id: str) -> Dict[str, Any]:
         game = db_service.get_game_by_game_id(game_id)
         if not game:
             raise HTTPException(status_code=404, detail="Game not found")
+        # Metadata only: year/season/phase come from the phase code, not the payload.
         snapshots = db_service.get_game_snapshots_by_game_id(int(game.id))  # type: ignore
         result = []
         for snap in snapshots:
+            fields = phase_fields(snap.phase_code)
             result.append({
                 "id": snap.id,
                 "turn": snap.turn_number,
-                "year": snap.year,
-                "season": snap.season,
-                "phase": snap.phase,
+                "year": fields["year"],
+                "season": fields["season"],
+                "phase": fields["phase_type"],
                 "phase_code": snap.phase_code,
                 "created_at": snap.created_at.isoformat() if hasattr(snap, 'created_at') and snap.created_at else None
             })
         return {"status": "ok", "snapshots": result}
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -911,7 +912,9 @@ def debug_unit_locations(game_id: str) -> Dict[str, Any]:
 
 
 @router.get("/games/{game_id}/legal_orders/{power}")
-def get_legal_orders_for_power(game_id: str, power: str) -> Dict[str, Any]:
+async def get_legal_orders_for_power(
+    game_id: str, power: str, request: Request, response: Response
+) -> Dict[str, Any]:
     """Phase-aware legal order strings for every unit ``power`` controls.
 
     Primary legal-orders endpoint. Delegates to the pure
@@ -919,8 +922,17 @@ def get_legal_orders_for_power(game_id: str, power: str) -> Dict[str, Any]:
     enumerates movement orders in a movement phase, retreat/disband orders in
     a retreat phase (from the dislodged unit's precomputed legal retreats),
     and build/waive or disband orders in an adjustment phase.
+
+    Conditional like ``/state``; the ETag ignores pending orders (legal orders
+    only depend on the board), so it holds for the whole phase. Native async,
+    like ``/state``.
     """
-    game = game_service.load(game_id)
+    etag = await game_etag_async(game_id, "legal_orders", power.upper(), orders=False)
+    unchanged = not_modified(request, etag)
+    if unchanged is not None:
+        return unchanged
+    response.headers.update(etag_headers(etag))
+    game = await game_service.load_async(game_id)
     if game is None:
         raise HTTPException(status_code=404, detail="Game not found")
     return legal_orders_for_power(game_service.map, game.state, power.upper())
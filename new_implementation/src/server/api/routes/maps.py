@@ -8,12 +8,14 @@ functionally it already runs on the new engine here.)
 """
 import os
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import Response
 
-from ..shared import db_service, game_service
+from ..shared import db_service, game_etag, game_service
+from ...etag import etag_headers, not_modified, strong_etag
+from persistence.snapshots import phase_fields
 from rendering.map import Map
 from rendering.order_overlay import orders_by_power_to_viz, resolution_dict_to_viz
 from rendering.view_adapter import phase_info, svg_path_for_map_name, units_for_render
@@ -36,10 +38,6 @@ def _kind_by_province(view: Dict[str, Any]) -> Dict[str, str]:
     return out
 
 
-_SEASON_BY_CODE = {"S": "SPRING", "F": "FALL", "W": "WINTER"}
-_PHASE_TYPE_BY_CODE = {"M": "MOVEMENT", "R": "RETREAT", "A": "ADJUSTMENT"}
-
-
 def _view_from_snapshot(map_name: str, snapshot: Any) -> Dict[str, Any]:
     """Reconstruct a minimal view-shaped dict from a persisted ``MapSnapshotModel``.
 
@@ -47,27 +45,43 @@ def _view_from_snapshot(map_name: str, snapshot: Any) -> Dict[str, Any]:
     stores only ``units`` (the flat ``GameService.view()["units"]`` list),
     ``supply_centers`` and ``phase_code`` — there are no ``year``/``season``/
     ``phase_type`` columns, so they are decoded from the phase code (e.g.
-    ``"S1901M"``: season letter, year digits, phase-type letter). ``map_name``
+    ``"S1901M"``, see ``persistence.snapshots.phase_fields``). ``map_name``
     doesn't vary across a game's turns, so it comes from the ``games`` row instead.
     """
     phase_code = str(snapshot.phase_code)
-    season = _SEASON_BY_CODE.get(phase_code[:1], "SPRING")
-    phase_type = _PHASE_TYPE_BY_CODE.get(phase_code[-1:], "MOVEMENT")
-    year = int(phase_code[1:-1])
+    fields = phase_fields(phase_code)
     units_by_power: Dict[str, List[Dict[str, Any]]] = {}
     for u in snapshot.units or []:
         units_by_power.setdefault(u["power"], []).append(u)
     return {
         "map_name": map_name,
-        "year": year,
-        "season": season,
-        "phase_type": phase_type,
+        "year": fields["year"],
+        "season": fields["season"],
+        "phase_type": fields["phase_type"],
         "phase": phase_code,
         "units_by_power": units_by_power,
         "ownership": dict(snapshot.supply_centers or {}),
     }
 
 
+def _png_response(request: Request, etag: str, render: Callable[[], bytes]) -> Response:
+    """``304`` if the client already holds ``etag``, else render and send the PNG.
+
+    The game-map routes take their ETag from ``shared.game_etag`` (row version
+    plus render kind), so a 304 is decided before the game is even loaded. The
+    Telegram bot sends ``If-None-Match`` with the ETag of every board it has
+    uploaded, and re-sends Telegram's ``file_id`` on a 304 instead of the bytes.
+    """
+    unchanged = not_modified(request, etag)
+    if unchanged is not None:
+        return unchanged
+    try:
+        img_bytes = render()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Map render failed: {e}")
+    return Response(content=img_bytes, media_type="image/png", headers=etag_headers(etag))
+
+
 def _turn_of(game_id: str) -> int:
     row = db_service.get_game_by_game_id(game_id)
     return int(getattr(row, "current_turn", 0) or 0) if row is not None else 0
@@ -108,7 +122,7 @@ def get_map_provinces(map_name: str) -> Dict[str, Any]:
 
 
 @router.get("/maps/{map_name}/preview.png", response_class=Response)
-def get_map_preview_png(map_name: str) -> Response:
+def get_map_preview_png(map_name: str, request: Request) -> Response:
     """Return a unit-less, ownership-less board PNG for ``map_name``.
 
     This is the "sample map" shown to bot users who aren't in a game yet -- the
@@ -123,34 +137,28 @@ def get_map_preview_png(map_name: str) -> Response:
     if map_name not in _KNOWN_MAP_NAMES:
         raise HTTPException(status_code=404, detail=f"Unknown map: {map_name}")
     svg_path = svg_path_for_map_name(map_name)
-    try:
-        img_bytes = Map.render_board_png(svg_path, {}, supply_center_control=None)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Map render failed: {e}")
-    return Response(content=img_bytes, media_type="image/png")
+    return _png_response(
+        request,
+        strong_etag("preview", svg_path),
+        lambda: Map.render_board_png(svg_path, {}, supply_center_control=None),
+    )
 
 
 @router.get("/games/{game_id}/map", response_class=Response)
-def get_game_map_png(game_id: str) -> Response:
+def get_game_map_png(game_id: str, request: Request) -> Response:
     """Return the current game state as a PNG map."""
+    etag = game_etag(game_id, "board", orders=False)
+    unchanged = not_modified(request, etag)
+    if unchanged is not None:
+        return unchanged
     view = game_service.view(game_id)
     if view is None:
         raise HTTPException(status_code=404, detail="Game not found")
-    svg_path = svg_path_for_map_name(view["map_name"])
-    try:
-        img_bytes = Map.render_board_png(
-            svg_path,
-            units_for_render(view),
-            phase_info=phase_info(view, _turn_of(game_id)),
-            supply_center_control=dict(view["ownership"]),
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Map render failed: {e}")
-    return Response(content=img_bytes, media_type="image/png")
+    return _png_response(request, etag, _board_render(game_id, view))
 
 
 @router.get("/games/{game_id}/map/orders", response_class=Response)
-def get_game_orders_map_png(game_id: str) -> Response:
+def get_game_orders_map_png(game_id: str, request: Request) -> Response:
     """Stream the orders-overlay PNG (board + arrows for pending orders) as bytes.
 
     Mirrors ``GET /games/{game_id}/map`` -- same view lookup, same rendering
@@ -162,6 +170,10 @@ def get_game_orders_map_png(game_id: str) -> Response:
     for callers that still use it (e.g. the bot's channel auto-post), but a
     browser needs actual bytes.
     """
+    etag = game_etag(game_id, "orders_map")
+    unchanged = not_modified(request, etag)
+    if unchanged is not None:
+        return unchanged
     view = game_service.view(game_id)
     if view is None:
         raise HTTPException(status_code=404, detail="Game not found")
@@ -169,21 +181,20 @@ def get_game_orders_map_png(game_id: str) -> Response:
     order_viz = orders_by_power_to_viz(
         game_service.pending_orders_parsed(game_id), _kind_by_province(view)
     )
-    try:
-        img_bytes = Map.render_board_png_orders(
-            svg_path,
-            units_for_render(view),
-            order_viz,
-            phase_info=phase_info(view, _turn_of(game_id)),
-            supply_center_control=dict(view["ownership"]),
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Map render failed: {e}")
-    return Response(content=img_bytes, media_type="image/png")
+    units = units_for_render(view)
+    info = phase_info(view, _turn_of(game_id))
+    ownership = dict(view["ownership"])
+    return _png_response(
+        request,
+        etag,
+        lambda: Map.render_board_png_orders(
+            svg_path, units, order_viz, phase_info=info, supply_center_control=ownership
+        ),
+    )
 
 
 @router.get("/games/{game_id}/map/resolution", response_class=Response)
-def get_game_resolution_map_png(game_id: str) -> Response:
+def get_game_resolution_map_png(game_id: str, request: Request) -> Response:
     """Stream the resolution-overlay PNG (board + adjudicated order arrows,
     coloured by result, plus standoff markers) as bytes.
 
@@ -191,41 +202,64 @@ def get_game_resolution_map_png(game_id: str) -> Response:
     Falls back to a plain board PNG when no turn has been processed yet (no
     ``last_resolution``), matching ``POST .../generate_map/resolution``.
     """
+    # last_resolution is written together with the state, so the state
+    # counter covers it.
+    etag = game_etag(game_id, "resolution", orders=False)
+    unchanged = not_modified(request, etag)
+    if unchanged is not None:
+        return unchanged
     view = game_service.view(game_id)
     if view is None:
         raise HTTPException(status_code=404, detail="Game not found")
+    return _png_response(request, etag, _resolution_render(game_id, view))
+
+
+def _board_render(game_id: str, view: Dict[str, Any]) -> Callable[[], bytes]:
+    """The plain-board render behind ``GET /games/{id}/map``."""
     svg_path = svg_path_for_map_name(view["map_name"])
+    units = units_for_render(view)
+    info = phase_info(view, _turn_of(game_id))
+    ownership = dict(view["ownership"])
+    return lambda: Map.render_board_png(
+        svg_path, units, phase_info=info, supply_center_control=ownership
+    )
+
+
+def _resolution_render(game_id: str, view: Dict[str, Any]) -> Callable[[], bytes]:
+    """The render behind ``GET /games/{id}/map/resolution`` (a plain board
+    until a turn has been processed)."""
     resolution = game_service.last_resolution(game_id)
-    try:
-        if not resolution:
-            img_bytes = Map.render_board_png(
-                svg_path,
-                units_for_render(view),
-                phase_info=phase_info(view, _turn_of(game_id)),
-                supply_center_control=dict(view["ownership"]),
-            )
-        else:
-            order_viz = resolution_dict_to_viz(resolution, _kind_by_province(view))
-            resolution_data = {
-                "conflicts": [
-                    {"province": prov, "result": "standoff"} for prov in view.get("contested", [])
-                ],
-            }
-            img_bytes = Map.render_board_png_resolution(
-                svg_path,
-                units_for_render(view),
-                order_viz,
-                resolution_data,
-                phase_info=phase_info(view, _turn_of(game_id)),
-                supply_center_control=dict(view["ownership"]),
-            )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Map render failed: {e}")
-    return Response(content=img_bytes, media_type="image/png")
+    if not resolution:
+        return _board_render(game_id, view)
+    svg_path = svg_path_for_map_name(view["map_name"])
+    units = units_for_render(view)
+    info = phase_info(view, _turn_of(game_id))
+    ownership = dict(view["ownership"])
+    order_viz = resolution_dict_to_viz(resolution, _kind_by_province(view))
+    resolution_data = {
+        "conflicts": [
+            {"province": prov, "result": "standoff"} for prov in view.get("contested", [])
+        ],
+    }
+    return lambda: Map.render_board_png_resolution(
+        svg_path, units, order_viz, resolution_data,
+        phase_info=info, supply_center_control=ownership,
+    )
+
+
+def prerender_game_maps(game_id: str) -> None:
+    """Render the board and resolution maps for the game's current phase so the
+    first ``GET .../map`` and ``.../map/resolution`` after a turn are
+    ``MapCache`` hits. Run from the post-turn outbox (``shared._outbox_prerender``)."""
+    view = game_service.view(game_id)
+    if view is None:
+        return
+    _board_render(game_id, view)()
+    _resolution_render(game_id, view)()
 
 
 @router.get("/games/{game_id}/map/history/{turn}", response_class=Response)
-def get_game_map_history_png(game_id: str, turn: int) -> Response:
+def get_game_map_history_png(game_id: str, turn: int, request: Request) -> Response:
     """Return the rendered PNG for a historical turn.
 
     Historical state comes from ``map_snapshots`` (``MapSnapshotModel``), written
@@ -242,16 +276,16 @@ def get_game_map_history_png(game_id: str, turn: int) -> Response:
         raise HTTPException(status_code=404, detail="No map snapshot found for this turn.")
     hist_view = _view_from_snapshot(str(row.map_name), snapshot)
     svg_path = svg_path_for_map_name(hist_view["map_name"])
-    try:
-        img_bytes = Map.render_board_png(
-            svg_path,
-            units_for_render(hist_view),
-            phase_info=phase_info(hist_view, turn),
-            supply_center_control=dict(hist_view["ownership"]),
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Map render failed: {e}")
-    return Response(content=img_bytes, media_type="image/png")
+    units = units_for_render(hist_view)
+    info = phase_info(hist_view, turn)
+    ownership = dict(hist_view["ownership"])
+    return _png_response(
+        request,
+        strong_etag("history", svg_path, units, info, ownership),
+        lambda: Map.render_board_png(
+            svg_path, units, phase_info=info, supply_center_control=ownership
+        ),
+    )
 
 
 def _render_and_save(
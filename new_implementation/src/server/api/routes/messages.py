@@ -9,9 +9,9 @@ from pydantic import BaseModel
 from typing import Dict, Any, Optional
 import requests
 
-from .auth import resolve_user_or_telegram, get_current_user_optional, http_bearer
-from ..shared import db_service, scheduler_logger, logger, NOTIFY_URL, notify_players, BOT_SECRET
-from persistence.database import MessageModel
+from .auth import resolve_user_or_telegram, resolve_user_id_optional, http_bearer
+from ..shared import async_reads, db_service, scheduler_logger, logger, NOTIFY_URL, notify_players
+from ...events import game_events
 
 router = APIRouter()
 
@@ -54,6 +54,8 @@ def send_private_message(
                 detail=f"Cannot send a private message to {req.recipient_power}: no player is assigned to that power.",
             )
         msg = db_service.create_message(game_id=int(game_model.id), sender_user_id=int(user.id), recipient_power=req.recipient_power, text=req.text)  # type: ignore
+        # No sender/recipient in the event: who talks to whom is private.
+        game_events.publish(str(game_model.game_id), "message", {"message_id": msg.id})
         # Private message notification
         try:
             recipient_user_id = getattr(recipient_player, "user_id", None)
@@ -91,6 +93,7 @@ def send_broadcast_message(
         if player is None:
             raise HTTPException(status_code=403, detail="Sender not in game")
         msg = db_service.create_message(game_id=game_id, sender_user_id=int(user.id), recipient_power=None, text=req.text)  # type: ignore
+        game_events.publish(str(game_id), "message", {"message_id": msg.id, "broadcast": True})
         # Broadcast message notification
         try:
             notify_players(game_id, f"Broadcast in game {game_id} from {user.full_name or getattr(user, 'telegram_id', None)}: {req.text}")
@@ -119,55 +122,71 @@ def send_broadcast_message(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+# Largest page GET /messages returns; bigger ``limit`` values are clamped.
+MAX_MESSAGE_PAGE = 200
+
+
 @router.get("/games/{game_id}/messages")
-def get_game_messages(
+async def get_game_messages(
     game_id: str,
     telegram_id: Optional[str] = None,
     bot_secret: Optional[str] = None,
+    since_id: Optional[int] = None,
+    before_id: Optional[int] = None,
+    limit: Optional[int] = None,
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(http_bearer),
 ) -> Dict[str, Any]:
+    """The game's messages visible to the caller, oldest first.
+
+    Unauthenticated callers and non-players see broadcasts only; a player also
+    sees messages sent to their power or by them (``AsyncReadRepo.get_message_page``).
+    Native async: every read goes through ``shared.async_reads``.
+
+    Cursors are message ids. ``since_id`` returns only newer messages (poll
+    with the last id you hold), ``before_id`` only older ones (scroll back
+    with the first). ``limit`` caps the page (at most ``MAX_MESSAGE_PAGE``):
+    the oldest after ``since_id`` or, without it, the newest.
+    ``has_more`` says whether that direction has more. No cursor and no limit
+    is the whole history, as before.
+    """
+    if limit is not None and limit < 1:
+        raise HTTPException(status_code=400, detail="limit must be at least 1")
+    if limit is not None:
+        limit = min(limit, MAX_MESSAGE_PAGE)
     try:
-        user = get_current_user_optional(credentials)
-        if user is None and telegram_id and BOT_SECRET and bot_secret == BOT_SECRET:
-            user = db_service.get_user_by_telegram_id(telegram_id)
-        # Get game model to get numeric ID
-        game_model = db_service.get_game_by_game_id(str(game_id))
-        if not game_model:
+        user_id = await resolve_user_id_optional(credentials, telegram_id, bot_secret)
+        page = await async_reads.get_message_page(
+            str(game_id), user_id, since_id=since_id, before_id=before_id, limit=limit
+        )
+        if page is None:
             raise HTTPException(status_code=404, detail="Game not found")
-        # Retrieve all messages for the game, filter private messages to only those sent to or from the user
-        query = db_service.get_messages_by_game_id(int(game_model.id))
-        if user:
-            # Show broadcasts and private messages sent to or from this user
-            player = db_service.get_player_by_game_id_and_user_id(game_id=int(game_model.id), user_id=int(user.id))  # type: ignore
-            if player:
-                power = player.power_name
-                from sqlalchemy import or_
-                query = query.filter(
-                    or_(
-                        MessageModel.recipient_power.is_(None),
-                        MessageModel.recipient_power == power,
-                        MessageModel.sender_user_id == user.id,
-                    )
-                )
-            else:
-                query = query.filter(MessageModel.recipient_power.is_(None))  # Only broadcasts
-        else:
-            # Unauthenticated: only return public broadcast messages (no private messages)
-            query = query.filter(MessageModel.recipient_power.is_(None))
-        messages = query.order_by(MessageModel.timestamp.asc()).all()
-        result = [
-            {
-                "id": m.id,
-                "sender_user_id": m.sender_user_id,
-                "recipient_power": m.recipient_power,
-                "text": m.text,
-                "timestamp": m.timestamp.isoformat() if hasattr(m.timestamp, 'isoformat') else str(m.timestamp)
-            }
-            for m in messages
-        ]
-        return {"messages": result}
+        messages, has_more = page
+        return {"messages": messages, "has_more": has_more}
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+
+@router.get("/games/{game_id}/messages/unread")
+async def get_unread_message_count(
+    game_id: str,
+    since_id: int = 0,
+    telegram_id: Optional[str] = None,
+    bot_secret: Optional[str] = None,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(http_bearer),
+) -> Dict[str, Any]:
+    """How many messages visible to the caller are newer than ``since_id``,
+    the last message id the client has seen, and ``latest_id``, the newest of
+    them (``null`` if there are none). A count over the cursor indexes; no
+    message bodies are read."""
+    try:
+        user_id = await resolve_user_id_optional(credentials, telegram_id, bot_secret)
+        counts = await async_reads.count_unread_messages(str(game_id), user_id, since_id)
+        if counts is None:
+            raise HTTPException(status_code=404, detail="Game not found")
+        return counts
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,82 @@
+"""
+Prometheus scrape endpoint.
+
+``GET /metrics`` renders ``metrics.REGISTRY`` in the text exposition format:
+the histograms and counters recorded on the hot paths (adjudication, legal
+orders, render stages, cache lookups, requests and their SQL round-trips,
+scheduler lag, notifications, outbox rows, DAIDE commands), plus the stats
+other modules already keep, read at scrape time by ``_collect_server_stats``
+(blocking pools, connection pools, cache sizes). With
+``DIPLOMACY_METRICS_TOKEN`` set the scraper must send it as
+``Authorization: Bearer <token>``.
+"""
+from __future__ import annotations
+
+import hmac
+import os
+from collections.abc import Iterable
+from typing import Any
+
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import Response
+
+from metrics import CONTENT_TYPE, REGISTRY, Sample
+from persistence.engine import pool_status
+from rendering.cache import _map_cache
+
+from ...executors import executor_stats
+from ...response_cache import get_cache_stats
+from ..shared import async_reads, db_service
+
+router = APIRouter()
+
+METRICS_TOKEN = os.environ.get("DIPLOMACY_METRICS_TOKEN", "")
+
+# (metric, kind, help, key in executor_stats() / pool_status())
+_EXECUTOR_FIELDS = (
+    ("diplomacy_executor_queued", "gauge", "Calls waiting for a blocking-pool worker.", "queued"),
+    ("diplomacy_executor_in_flight", "gauge", "Calls running on a blocking-pool worker.", "in_flight"),
+    ("diplomacy_executor_completed_total", "counter", "Blocking-pool calls completed.", "completed"),
+    ("diplomacy_executor_failed_total", "counter", "Blocking-pool calls that raised.", "failed"),
+    ("diplomacy_executor_wait_seconds_total", "counter", "Time calls waited for a worker.", "wait_seconds_total"),
+)
+_POOL_FIELDS = (
+    ("diplomacy_db_pool_in_use", "gauge", "Connections checked out of the pool.", "in_use"),
+    ("diplomacy_db_pool_idle", "gauge", "Connections idle in the pool.", "idle"),
+    ("diplomacy_db_pool_checkouts_total", "counter", "Connection checkouts.", "checkouts"),
+    ("diplomacy_db_pool_checkout_wait_seconds_total", "counter", "Time checkouts waited.", "checkout_wait_seconds_total"),
+    ("diplomacy_db_pool_timeouts_total", "counter", "Checkouts that timed out.", "timeouts"),
+)
+
+
+def _fields(
+    fields: Iterable[tuple[str, str, str, str]], label: str, stats: dict[str, dict[str, Any]]
+) -> list[Sample]:
+    return [
+        Sample(name, help, kind, (label,), {(key,): s[field] for key, s in stats.items() if field in s})
+        for name, kind, help, field in fields
+    ]
+
+
+def _collect_server_stats() -> list[Sample]:
+    pools = {"sync": pool_status(db_service.engine), "async": async_reads.pool_status()}
+    response_cache = get_cache_stats()
+    return [
+        *_fields(_EXECUTOR_FIELDS, "pool", executor_stats()),
+        *_fields(_POOL_FIELDS, "engine", pools),
+        Sample("diplomacy_response_cache_entries", "Entries in the response cache.", "gauge",
+               values={(): response_cache["cache_size"]}),
+        Sample("diplomacy_map_cache_entries", "Rendered maps in the in-memory map cache.", "gauge",
+               values={(): len(_map_cache.cache)}),
+    ]
+
+
+REGISTRY.register_collector(_collect_server_stats)
+
+
+@router.get("/metrics")
+def get_metrics(authorization: str | None = Header(None)) -> Response:
+    """Every metric in Prometheus text format (``text/plain; version=0.0.4``)."""
+    if METRICS_TOKEN and not hmac.compare_digest(authorization or "", f"Bearer {METRICS_TOKEN}"):
+        raise HTTPException(status_code=401, detail="Invalid metrics token")
+    return Response(REGISTRY.render(), media_type=CONTENT_TYPE)
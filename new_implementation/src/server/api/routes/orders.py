@@ -2,14 +2,19 @@
 
 Orders are validated by the engine and stored per power in ``games.pending_orders``
 via ``GameService``; they are consumed and cleared when the turn is processed.
+``POST /games/{game_id}/preview`` adjudicates a draft without storing it, and
+``GET /games/{game_id}/orders/{power}/odds`` estimates how the submitted orders fare
+against sampled opponents (``server.odds``).
 """
-from fastapi import APIRouter, HTTPException, Body, Depends
+from fastapi import APIRouter, HTTPException, Body, Depends, Request, Response
 from fastapi.security import HTTPAuthorizationCredentials
 from pydantic import BaseModel
 from typing import Any, Dict, List, Optional
 
-from .auth import get_current_user_optional, resolve_user_or_telegram, http_bearer
-from ..shared import db_service, game_service, logger, BOT_SECRET
+from .auth import get_current_user_optional, resolve_user_id_optional, resolve_user_or_telegram, http_bearer
+from ..shared import async_reads, db_service, game_service, logger, BOT_SECRET, game_etag, game_etag_async
+from ...etag import etag_headers, not_modified
+from ...odds import MAX_BUDGET_S, POLICIES, cached_estimate, estimate_order_odds, odds_executor
 
 router = APIRouter()
 
@@ -58,6 +63,8 @@ def set_orders(
 @router.get("/games/{game_id}/orders")
 def get_orders(
     game_id: str,
+    request: Request,
+    response: Response,
     telegram_id: Optional[str] = None,
     bot_secret: Optional[str] = None,
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(http_bearer),
@@ -66,19 +73,25 @@ def get_orders(
 
     Accepts a Bearer token (browser) or ``telegram_id``+``bot_secret`` query params
     (Telegram bot; GET has no body to carry them in) — same fallback pattern as
-    ``GET /games/{game_id}/messages``.
+    ``GET /games/{game_id}/messages``. Conditional per caller (ETag via
+    ``shared.game_etag``); the state is only loaded on a miss.
     """
-    view = game_service.view(game_id)
-    if view is None:
-        raise HTTPException(status_code=404, detail="Game not found")
     user = get_current_user_optional(credentials)
     if user is None and telegram_id and BOT_SECRET and bot_secret == BOT_SECRET:
         user = db_service.get_user_by_telegram_id(telegram_id)
+    etag = game_etag(game_id, "orders", user.id if user is not None else None, players=True)
     if user is None:
         return []
+    unchanged = not_modified(request, etag)
+    if unchanged is not None:
+        return unchanged
     player = db_service.get_player_by_game_id_and_user_id(game_id=int(game_id), user_id=int(user.id))
     if player is None:
         return []
+    response.headers.update(etag_headers(etag))
+    view = game_service.view(game_id)
+    if view is None:
+        raise HTTPException(status_code=404, detail="Game not found")
     power = player.power_name
     return [
         {"player_id": player.id, "power": power, "order": o}
@@ -98,9 +111,11 @@ def get_order_history(game_id: str) -> Dict[str, Any]:
 
 
 @router.get("/games/{game_id}/orders/{power}")
-def get_orders_for_power(
+async def get_orders_for_power(
     game_id: str,
     power: str,
+    request: Request,
+    response: Response,
     telegram_id: Optional[str] = None,
     bot_secret: Optional[str] = None,
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(http_bearer),
@@ -109,11 +124,46 @@ def get_orders_for_power(
 
     Accepts a Bearer token (browser) or ``telegram_id``+``bot_secret`` query params
     (Telegram bot; GET has no body to carry them in) — same fallback pattern as
-    ``GET /games/{game_id}/messages``.
+    ``GET /games/{game_id}/messages``. Conditional (ETag via ``shared.game_etag``),
+    checked after authorization and before the state is loaded. Native async:
+    every read goes through ``shared.async_reads``.
     """
-    view = game_service.view(game_id)
+    etag = await game_etag_async(game_id, "orders", power.upper())
+    user_id = await resolve_user_id_optional(credentials, telegram_id, bot_secret)
+    found, player_user_id = await async_reads.get_player_user_id(game_id, power)
+    if not found:
+        raise HTTPException(status_code=404, detail="Player not found")
+    if user_id is None or player_user_id is None or int(player_user_id) != user_id:
+        raise HTTPException(status_code=403, detail="You are not authorized to view orders for this power.")
+    unchanged = not_modified(request, etag)
+    if unchanged is not None:
+        return unchanged
+    response.headers.update(etag_headers(etag))
+    view = await game_service.view_async(game_id)
     if view is None:
         raise HTTPException(status_code=404, detail="Game not found")
+    return {"power": power, "orders": view["orders"].get(power.upper(), [])}
+
+
+@router.get("/games/{game_id}/orders/{power}/odds")
+def get_order_odds(
+    game_id: str,
+    power: str,
+    policy: str = "legal",
+    budget_ms: int = 1000,
+    telegram_id: Optional[str] = None,
+    bot_secret: Optional[str] = None,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(http_bearer),
+) -> Dict[str, Any]:
+    """Estimated success probability (with a 95% interval) of each submitted order.
+
+    Opponents' orders are sampled (``policy``: ``legal`` = uniform over each unit's
+    legal orders, ``simple_ai`` = the demo bot) and adjudicated until the
+    estimates converge or ``budget_ms`` (capped at ``MAX_BUDGET_S``) runs out; see
+    ``server.odds``. Only the assigned user may ask. Results are cached per game,
+    phase, state version, power, orders and policy; a cached estimate that ran
+    out of a shorter budget than this request's is recomputed.
+    """
     user = get_current_user_optional(credentials)
     if user is None and telegram_id and BOT_SECRET and bot_secret == BOT_SECRET:
         user = db_service.get_user_by_telegram_id(telegram_id)
@@ -122,7 +172,38 @@ def get_orders_for_power(
         raise HTTPException(status_code=404, detail="Player not found")
     if user is None or int(getattr(player, "user_id", -1)) != int(user.id):
         raise HTTPException(status_code=403, detail="You are not authorized to view orders for this power.")
-    return {"power": power, "orders": view["orders"].get(power.upper(), [])}
+    if policy not in POLICIES:
+        raise HTTPException(status_code=400, detail=f"policy must be one of: {', '.join(POLICIES)}")
+    version = game_service.version(game_id)
+    game = game_service.load(game_id)
+    if version is None or game is None:
+        raise HTTPException(status_code=404, detail="Game not found")
+    orders = game_service.pending_orders_parsed(game_id).get(power.upper(), [])
+    key = (
+        game_id,
+        version["phase_code"],
+        version["state_version"],
+        power.upper(),
+        tuple(sorted(str(o) for o in orders)),
+        policy,
+    )
+    budget = min(max(budget_ms, 0) / 1000, MAX_BUDGET_S)
+    try:
+        return cached_estimate(
+            key,
+            lambda: estimate_order_odds(
+                game_service.map,
+                game.state,
+                power,
+                orders,
+                policy=policy,
+                budget=budget,
+                executor=odds_executor(),
+            ),
+            budget=budget,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e)) from e
 
 
 class ClearOrdersRequest(BaseModel):
@@ -141,3 +222,38 @@ def clear_orders_for_power(
     _authorize_power(credentials, str(game_id), power, req.telegram_id, req.bot_secret)
     game_service.clear_orders(str(game_id), power)
     return {"status": "ok"}
+
+
+class PreviewOrdersRequest(BaseModel):
+    """Draft orders for ``power``, plus optional hypothetical orders for others."""
+    power: str
+    orders: list[str]
+    assume: Dict[str, List[str]] = {}
+    telegram_id: Optional[str] = None
+    bot_secret: Optional[str] = None
+
+
+@router.post("/games/{game_id}/preview")
+def preview_orders(
+    game_id: str,
+    req: PreviewOrdersRequest,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(http_bearer),
+) -> Dict[str, Any]:
+    """Adjudicate the current phase as if ``power`` played ``orders``.
+
+    Nothing is stored, and other powers' pending orders are never used: their
+    units hold unless ``assume`` gives them orders. Only the assigned user may
+    preview; each user keeps an incremental adjudication session per game (see
+    ``GameService.preview``), so re-previewing after editing one order is cheap.
+    """
+    user, _ = _authorize_power(credentials, game_id, req.power, req.telegram_id, req.bot_secret)
+    preview = game_service.preview(
+        game_id,
+        req.power,
+        req.orders,
+        assumed=req.assume,
+        session_key=(int(user.id), game_id, req.power.upper()),
+    )
+    if preview is None:
+        raise HTTPException(status_code=404, detail="Game not found")
+    return preview
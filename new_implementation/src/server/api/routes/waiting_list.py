@@ -32,7 +32,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 
 from .auth import require_bot_or_user
-from ..shared import NOTIFY_URL, db_service, game_service, logger, notify_players
+from ..shared import NOTIFY_URL, async_reads, db_service, game_service, logger, notify_players
 
 router = APIRouter()
 
@@ -202,13 +202,13 @@ def leave_waiting_list(
 
 
 @router.get("/waiting_list")
-def waiting_list_status() -> Dict[str, Any]:
+async def waiting_list_status() -> Dict[str, Any]:
     """How full the queue is. Read-only, no auth (same as other status reads).
 
     Deliberately returns counts, not the queued players' Telegram ids -- who is
     waiting for a game is not public information, and no client needs it.
     """
-    size = db_service.count_waiting_list()
+    size = await async_reads.count_waiting_list()
     return {
         "size": size,
         "required": WAITING_LIST_SIZE,
@@ -8,15 +8,29 @@ import asyncio
 import logging
 import os
 import requests
+import time
 import pytz
 from datetime import datetime, timezone, timedelta
 from typing import Dict, Any, Optional, TYPE_CHECKING
 
+from fastapi import HTTPException
+
 from ..db_config import SQLALCHEMY_DATABASE_URL
+from persistence.async_reads import AsyncReadRepo
 from persistence.database_service import DatabaseService
-from persistence.game_repo import GameRepo, StaleGameError
+from persistence.game_repo import GameRepo, PostTurnWrites, StaleGameError
+from persistence.database import utcnow_naive
+from engine.serialization import state_to_dict, unit_to_dict
+from engine.types import GameState, GameStatus
 from ..server import Server
 from ..game_service import GameService
+from ..etag import strong_etag
+from ..events import game_events
+from ..analytics_buffer import AnalyticsBuffer
+from ..outbox import OutboxDispatcher
+from ..executors import run_blocking
+from ..request_profiler import RequestProfiler
+from metrics import REGISTRY
 
 if TYPE_CHECKING:
     from ..daide.server import DaideServer
@@ -25,9 +39,19 @@ _shared_logger = logging.getLogger(__name__)
 
 # Shared service instances
 db_service = DatabaseService(SQLALCHEMY_DATABASE_URL)
+# The hot GET routes' reads, awaitable (asyncpg on PostgreSQL; see
+# `persistence/async_reads.py`). Disposed on shutdown.
+async_reads = AsyncReadRepo(SQLALCHEMY_DATABASE_URL)
 # New engine: all game state/adjudication goes through GameService (over GameRepo).
-game_service = GameService(GameRepo(db_service.session_factory))
+game_service = GameService(GameRepo(db_service.session_factory), events=game_events, reads=async_reads)
 server = Server()
+# Channel analytics are queued here and written in batches by a background
+# thread (see `analytics_buffer.py`); stopped (= flushed) on shutdown.
+analytics_buffer = AnalyticsBuffer(
+    db_service.log_channel_analytics_events,
+    max_batch=int(os.environ.get("DIPLOMACY_ANALYTICS_BATCH_SIZE", "500")),
+    flush_interval=float(os.environ.get("DIPLOMACY_ANALYTICS_FLUSH_SECONDS", "2.0")),
+)
 
 # The DAIDE TCP listener. None until `_api_module.py`'s lifespan starts it (or
 # forever None in test contexts that never trigger lifespan / that have no DB
@@ -37,6 +61,26 @@ server = Server()
 # captured at import time and never sees the later reassignment below.
 daide_server: "Optional[DaideServer]" = None
 
+# How late the scheduler woke up and processed each due deadline, and how
+# long each player DM took to hand to the bot's notify server.
+SCHEDULER_INTERVAL = 30
+SCHEDULER_TICK_LAG_SECONDS = REGISTRY.histogram(
+    "diplomacy_scheduler_tick_lag_seconds",
+    "How much later than its interval the deadline scheduler woke (event loop stalls).",
+)
+DEADLINE_LAG_SECONDS = REGISTRY.histogram(
+    "diplomacy_deadline_lag_seconds",
+    "Time between a game's deadline and the scheduler processing its turn.",
+    buckets=(1, 5, 10, 30, 45, 60, 120, 300, 600, 1800, 3600),
+)
+NOTIFICATION_SECONDS = REGISTRY.histogram(
+    "diplomacy_notification_seconds",
+    "Time to deliver one player notification to the notify server, by outcome.",
+    ("outcome",),
+)
+_NOTIFICATION_SENT = NOTIFICATION_SECONDS.labels("sent")
+_NOTIFICATION_FAILED = NOTIFICATION_SECONDS.labels("failed")
+
 # Shared loggers
 logger = logging.getLogger("diplomacy.server.api")
 scheduler_logger = logging.getLogger("diplomacy.scheduler")
@@ -67,6 +111,10 @@ if ADMIN_TOKEN == _ADMIN_TOKEN_DEFAULT:
             "Refusing to start with the default value."
         )
 
+# Slow-request profiles for the dashboard; off unless DIPLOMACY_PROFILE_* is set
+# or an admin sends X-Profile: 1.
+request_profiler = RequestProfiler.from_env(admin_token=ADMIN_TOKEN)
+
 # Bot secret: used to authenticate Telegram bot calls that use telegram_id instead of Bearer token
 BOT_SECRET = os.environ.get("DIPLOMACY_BOT_SECRET", "")
 
@@ -90,10 +138,45 @@ def game_view(game_id: str) -> Optional[Dict[str, Any]]:
     return game_service.view(str(game_id))
 
 
+def game_etag(
+    game_id: str, *parts: Any, orders: bool = True, players: bool = False
+) -> str:
+    """Strong ETag for a per-game GET, decided without loading the game's state.
+
+    Built from ``GameService.version`` (row identity, ``phase_code``, write
+    counters) plus the route's own ``parts`` (power, render kind, caller).
+    ``orders=False`` leaves the pending-orders counter out, for responses that
+    don't depend on submitted orders (legal orders, the plain board), so they
+    stay cached while players submit. ``players=True`` folds in the power
+    assignments for responses that embed them. 404 if the game doesn't exist.
+    """
+    version = game_service.version(str(game_id), with_players=players)
+    return _etag_from_version(game_id, version, parts, orders)
+
+
+async def game_etag_async(
+    game_id: str, *parts: Any, orders: bool = True, players: bool = False
+) -> str:
+    """``game_etag`` for ``async def`` routes (``GameService.version_async``)."""
+    version = await game_service.version_async(str(game_id), with_players=players)
+    return _etag_from_version(game_id, version, parts, orders)
+
+
+def _etag_from_version(
+    game_id: str, version: Optional[Dict[str, Any]], parts: tuple[Any, ...], orders: bool
+) -> str:
+    if version is None:
+        raise HTTPException(status_code=404, detail="Game not found")
+    if not orders:
+        version.pop("orders_version")
+    return strong_etag(str(game_id), version, *parts)
+
+
 def notify_players(
     game_id: int,
     message: str,
     exclude_telegram_id: Optional[str] = None,
+    event: Optional[str] = None,
 ) -> None:
     """Notify all players in a game.
 
@@ -101,6 +184,9 @@ def notify_players(
     ``process_turn`` route, whose caller already has the resolution in their HTTP
     response and does not need to be told a second time.
 
+    ``event`` (e.g. ``"turn_processed"``) is sent along with ``game_id`` so the
+    bot can invalidate what it has cached for the game (``telegram_bot/cache.py``).
+
     **This function used to send nothing at all, ever.** It iterated
     ``PlayerModel`` rows and read ``getattr(player, 'telegram_id', None)``, but
     ``telegram_id`` is a column on ``UserModel`` (players reference a user by
@@ -119,11 +205,16 @@ def notify_players(
         try:
             # Only send notification if telegram_id is numeric (skip test IDs like "u1")
             telegram_id_int = int(telegram_id_val)
-            requests.post(
-                NOTIFY_URL,
-                json={"telegram_id": telegram_id_int, "message": message},
-                timeout=2,
-            )
+            payload: Dict[str, Any] = {"telegram_id": telegram_id_int, "message": message}
+            if event is not None:
+                payload.update(game_id=game_id, event=event)
+            started = time.perf_counter()
+            try:
+                requests.post(NOTIFY_URL, json=payload, timeout=2)
+            except Exception:
+                _NOTIFICATION_FAILED.observe(time.perf_counter() - started)
+                raise
+            _NOTIFICATION_SENT.observe(time.perf_counter() - started)
             scheduler_logger.info(f"Notified telegram_id {telegram_id_val} for game {game_id}: {message}")
         except ValueError:
             # Skip non-numeric telegram_ids (test IDs)
@@ -134,17 +225,19 @@ def notify_players(
 
 def _notify_daide_processed(game_id: str, resolved_phase: Optional[str]) -> None:
     """Bridge `DaideServer.notify_game_processed` (async) into whatever
-    context a *synchronous* call site (`process_due_deadlines`, run from the
-    scheduler's `async def` loop without an `await`, and directly from tests)
-    happens to run in. No-op when no DAIDE listener is up (`daide_server` is
-    `None` in most test contexts and whenever the listener failed to bind).
+    context a *synchronous* call site (`process_due_deadlines`, run by the
+    scheduler on a blocking-pool thread, and directly from tests) happens to
+    run in. No-op when no DAIDE listener is up (`daide_server` is `None` in
+    most test contexts and whenever the listener failed to bind).
 
     There's no existing sync-calls-async bridge elsewhere in this codebase to
     mirror (`notify_players`, cited as a precedent when this task was scoped,
     turned out to be a sync function called from a sync context -- not an
     actual bridge) -- this is deliberately the smallest one that works both
-    with a running loop (schedule a task, don't block it) and without one
-    (run to completion via `asyncio.run`, e.g. a script or a sync test calling
+    with a running loop (schedule a task, don't block it) and without one: from
+    a pool thread the coroutine is handed to the listener's own loop (its
+    sessions' writers belong to that loop); with no listener loop running it
+    runs to completion via `asyncio.run` (e.g. a script or a sync test calling
     `process_due_deadlines` directly).
     """
     if daide_server is None:
@@ -156,6 +249,11 @@ def _notify_daide_processed(game_id: str, resolved_phase: Optional[str]) -> None
     if loop is not None:
         loop.create_task(daide_server.notify_game_processed(game_id, resolved_phase=resolved_phase))
         return
+    if daide_server.loop is not None and daide_server.loop.is_running():
+        asyncio.run_coroutine_threadsafe(
+            daide_server.notify_game_processed(game_id, resolved_phase=resolved_phase), daide_server.loop
+        )
+        return
     try:
         asyncio.run(daide_server.notify_game_processed(game_id, resolved_phase=resolved_phase))
     except RuntimeError:
@@ -213,14 +311,16 @@ def notify_turn_processed(
     game_ended: bool = False,
     exclude_telegram_id: Optional[str] = None,
 ) -> None:
-    """The single fan-out for "a turn was processed". Used by **both** trigger paths.
+    """The single fan-out for "a turn was processed" (or a game ended by draw).
 
     Before this existed the two paths told players wildly different amounts (G3):
     the deadline path DM'd every player, reset the reminder flag and posted a
     notification plus a rendered map to the linked channel, while the manual
     route notified *nobody* unless the game had just ended. So the failure case
-    was richly instrumented and the success case was silent. Both now call here,
-    so they cannot drift again.
+    was richly instrumented and the success case was silent. Both now commit
+    this fan-out as outbox rows (``post_turn_writes``), whose handlers call the
+    same two halves as this function, so they cannot drift again. The draw-vote
+    route, which ends a game without processing a turn, calls it directly.
 
     ``trigger`` is ``"deadline"`` or ``"manual"`` and changes only the *wording*
     of the player DM -- a missed deadline is worth saying out loud, since a
@@ -228,13 +328,29 @@ def notify_turn_processed(
     notified is deliberately identical either way; see the notification matrix in
     ``docs/specs/architecture.md``.
 
-    Synchronous on purpose, so the sync scheduler path and the ``async`` route
-    can share it unchanged. It blocks its caller for up to ``timeout=2`` per
-    player, which is pre-existing behaviour on both paths (the deadline fan-out
-    already ran inside the scheduler's event loop, and the manual route already
-    called ``notify_players`` synchronously for game-end) -- not something this
-    change introduced. Every send is best-effort and logged.
+    Synchronous: it blocks its caller for up to ``timeout=2`` per player, which
+    is why the turn triggers hand it to the outbox dispatcher's thread instead.
+    Every send is best-effort and logged.
     """
+    try:
+        _notify_turn_players(
+            game_id, numeric_game_id, trigger=trigger, game_ended=game_ended,
+            exclude_telegram_id=exclude_telegram_id,
+        )
+    except Exception as e:
+        scheduler_logger.error(f"Failed to notify players for game {game_id}: {e}")
+    _post_turn_to_channel(game_id, _turn_channel_message(game_id, game_ended))
+
+
+def _notify_turn_players(
+    game_id: str,
+    numeric_game_id: int,
+    *,
+    trigger: str,
+    game_ended: bool,
+    exclude_telegram_id: Optional[str] = None,
+) -> None:
+    """The player-DM half of ``notify_turn_processed``."""
     if game_ended:
         player_message = f"Game {game_id} has ended!"
     elif trigger == "deadline":
@@ -247,19 +363,126 @@ def notify_turn_processed(
             f"The turn has been processed for game {game_id}. View the new board state "
             f"and submit your next orders."
         )
-
-    try:
-        notify_players(numeric_game_id, player_message, exclude_telegram_id=exclude_telegram_id)
-    except Exception as e:
-        scheduler_logger.error(f"Failed to notify players for game {game_id}: {e}")
-
+    notify_players(
+        numeric_game_id,
+        player_message,
+        exclude_telegram_id=exclude_telegram_id,
+        event="turn_processed",
+    )
     # A new turn means the next deadline gets its own 10-minute reminder.
     reminder_sent[numeric_game_id] = False
 
-    if not game_ended:
-        _post_turn_to_channel(game_id, "The turn has been processed. New orders are due.")
-    else:
-        _post_turn_to_channel(game_id, f"Game {game_id} has ended.")
+
+def _turn_channel_message(game_id: str, game_ended: bool) -> str:
+    if game_ended:
+        return f"Game {game_id} has ended."
+    return "The turn has been processed. New orders are due."
+
+
+# --- Post-turn outbox --------------------------------------------------------
+# Both turn triggers commit their side effects as outbox rows together with the
+# turn (`post_turn_writes`); `outbox` runs them in the background. Handlers may
+# run more than once for a row (see `server/outbox.py`), so each checks first.
+
+def post_turn_writes(
+    state: GameState,
+    *,
+    trigger: str,
+    exclude_telegram_id: Optional[str] = None,
+    next_deadline: Optional[timedelta] = None,
+    snapshot: bool = False,
+) -> PostTurnWrites:
+    """The deadline and outbox rows a processed turn commits with ``state``.
+
+    The fan-out is the one ``notify_turn_processed`` describes (player DMs and
+    the linked channel's notice and map), plus a map pre-render. ``snapshot``
+    adds a ``map_snapshots`` row for the new phase. The next deadline is
+    ``now + next_deadline``, cleared when the game has ended or
+    ``next_deadline`` is ``None``.
+    """
+    game_ended = state.status is GameStatus.COMPLETED
+    outbox: list[tuple[str, Dict[str, Any]]] = []
+    if snapshot:
+        outbox.append(("snapshot", {
+            "year": state.year,
+            "season": state.season.value,
+            "phase_type": state.phase_type.value,
+            "phase_code": state.phase_name,
+            "units": [unit_to_dict(u) for u in sorted(state.units, key=lambda x: str(x.location))],
+            "supply_centers": dict(state.ownership),
+            "state_json": state_to_dict(state),
+        }))
+    outbox.append(("notify_players", {
+        "trigger": trigger,
+        "game_ended": game_ended,
+        "exclude_telegram_id": exclude_telegram_id,
+    }))
+    outbox.append(("channel_post", {"game_ended": game_ended}))
+    outbox.append(("prerender", {"phase_code": state.phase_name}))
+    deadline = None
+    if next_deadline is not None and not game_ended:
+        deadline = utcnow_naive() + next_deadline
+    return PostTurnWrites(deadline=deadline, outbox=tuple(outbox))
+
+
+def _turn_is_current(event: Dict[str, Any]) -> bool:
+    """False once the game has moved past the row's turn: a map rendered now
+    would show a later phase, and that turn's own rows will render it."""
+    return int(db_service.get_game_current_turn(event["game_id"]) or 0) == int(event["turn"])
+
+
+def _outbox_snapshot(event: Dict[str, Any]) -> None:
+    payload = event["payload"]
+    if db_service.has_game_snapshot(event["game_pk"], event["turn"], payload["phase_code"]):
+        return
+    db_service.create_game_snapshot(
+        game_id=event["game_pk"],
+        turn=event["turn"],
+        year=payload["year"],
+        season=payload["season"],
+        phase=payload["phase_type"],
+        phase_code=payload["phase_code"],
+        game_state={"units": payload["units"], "supply_centers": payload["supply_centers"]},
+        state_json=payload["state_json"],
+    )
+
+
+def _outbox_notify_players(event: Dict[str, Any]) -> None:
+    payload = event["payload"]
+    _notify_turn_players(
+        event["game_id"],
+        event["game_pk"],
+        trigger=payload["trigger"],
+        game_ended=payload["game_ended"],
+        exclude_telegram_id=payload.get("exclude_telegram_id"),
+    )
+
+
+def _outbox_channel_post(event: Dict[str, Any]) -> None:
+    if not _turn_is_current(event):
+        return
+    _post_turn_to_channel(
+        event["game_id"], _turn_channel_message(event["game_id"], event["payload"]["game_ended"])
+    )
+
+
+def _outbox_prerender(event: Dict[str, Any]) -> None:
+    if not _turn_is_current(event):
+        return
+    from ..api.routes.maps import prerender_game_maps
+    prerender_game_maps(event["game_id"])
+
+
+outbox = OutboxDispatcher(
+    db_service,
+    {
+        "snapshot": _outbox_snapshot,
+        "notify_players": _outbox_notify_players,
+        "channel_post": _outbox_channel_post,
+        "prerender": _outbox_prerender,
+    },
+    poll_interval=float(os.environ.get("DIPLOMACY_OUTBOX_POLL_SECONDS", "5.0")),
+)
 
 
 def process_due_deadlines(now: datetime) -> None:
@@ -281,6 +504,7 @@ def process_due_deadlines(now: datetime) -> None:
                 if now.tzinfo is None or now.tzinfo.utcoffset(now) is None:
                     now = now.replace(tzinfo=pytz.UTC)
                 if deadline <= now:
+                    DEADLINE_LAG_SECONDS.observe((now - deadline).total_seconds())
                     scheduler_logger.warning(f"Missed or due deadline detected for game {game_id_val} (deadline was {deadline}, now {now}). Processing turn immediately.")
                     # Process the turn. Double-processing within this worker is
                     # prevented by GameRepo.save_state's expected_phase_code check
@@ -291,28 +515,30 @@ def process_due_deadlines(now: datetime) -> None:
                     game_id_str = str(getattr(game, 'game_id', None) or game_id_val)
                     prev_view = game_service.view(game_id_str)
                     prev_phase_code = prev_view["phase"] if prev_view else None
+                    # The deadline is cleared, and the player DMs + channel
+                    # notice and map (shared verbatim with the manual
+                    # `POST /games/{id}/process_turn` route so the two triggers
+                    # cannot drift apart again, G3) are queued as outbox rows,
+                    # all in the turn's own transaction.
                     try:
-                        game_service.process_turn(game_id_str)
+                        game_service.process_turn(
+                            game_id_str,
+                            post_turn=lambda state: post_turn_writes(state, trigger="deadline"),
+                        )
                     except StaleGameError:
+                        # The worker that won wrote its own deadline and rows.
                         scheduler_logger.warning(
                             "PROCESS_TURN for game %s already processed concurrently, skipping.",
                             game_id_str,
                         )
+                        continue
                     except Exception as e:
                         scheduler_logger.error(f"Failed to process turn for game {game_id_str}: {e}")
-                    else:
-                        _notify_daide_processed(game_id_str, prev_phase_code)
-                    # Direct SQL update to set deadline to NULL for cross-session visibility
-                    db_service.update_game_deadline(game_id_val, None)
-                    db_service.commit()  # type: ignore
-                    # Player DMs + channel notification + channel map post, shared
-                    # verbatim with the manual `POST /games/{id}/process_turn`
-                    # route so the two triggers cannot drift apart again (G3).
-                    notify_turn_processed(
-                        game_id_str,
-                        game_id_val,  # type: ignore[arg-type]
-                        trigger="deadline",
-                    )
+                        # Don't re-fire a deadline that cannot be processed on every tick.
+                        db_service.update_game_deadline(game_id_val, None)
+                        continue
+                    _notify_daide_processed(game_id_str, prev_phase_code)
+                    outbox.wake()
     except Exception as e:
         scheduler_logger.error(f"Error processing deadlines: {e}")
 
@@ -357,14 +583,20 @@ async def deadline_scheduler() -> None:
     If a game's deadline has passed, processes the turn and clears the deadline.
     Sends reminders 10 minutes before deadline and notifies players after turn processing.
     On startup, immediately process any missed deadlines.
+
+    Both passes run on the shared blocking pool (``server/executors.py``): each
+    is a round of adjudications, commits and Telegram calls that would otherwise
+    stall every request and DAIDE connection on this worker.
     """
     # On startup: process any missed deadlines immediately
     now = datetime.now(timezone.utc)
-    process_due_deadlines(now)
+    await run_blocking(process_due_deadlines, now)
     # Main loop
     while True:
-        await asyncio.sleep(30)  # Check every 30 seconds
+        slept = time.monotonic()
+        await asyncio.sleep(SCHEDULER_INTERVAL)
+        SCHEDULER_TICK_LAG_SECONDS.observe(max(0.0, time.monotonic() - slept - SCHEDULER_INTERVAL))
         now = datetime.now(timezone.utc)
-        process_due_deadlines(now)
-        check_and_send_reminders(now)
+        await run_blocking(process_due_deadlines, now)
+        await run_blocking(check_and_send_reminders, now)
 
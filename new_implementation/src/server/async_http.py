@@ -0,0 +1,128 @@
+"""
+Pooled async HTTP client shared by the bot processes.
+
+The Telegram and Discord bots are thin clients over the HTTP API, and every
+handler they run is an ``async def`` on one event loop. A blocking
+``requests`` call inside a handler stalls that loop for a full API round-trip
+(every other player waits behind a slow map render) and, with no shared
+``Session``, pays a fresh TCP (and TLS) handshake per button press.
+
+``PooledAsyncClient`` wraps one ``httpx.AsyncClient`` per event loop:
+
+- keep-alive connection pooling with bounded limits,
+- HTTP/2 when the optional ``h2`` package is installed (negotiated via ALPN,
+  so it only applies to ``https://`` API URLs; plain HTTP stays on 1.1),
+- per-endpoint timeouts: a map render or a turn adjudication legitimately
+  takes longer than a lookup, and one flat timeout was either too short for
+  the former or far too long for the latter.
+
+The client is created lazily and re-created if the running loop changes
+(``asyncio.run`` in tests, or a bot restart that replaces a closed loop) --
+an ``httpx.AsyncClient`` is bound to the loop that first used it.
+"""
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+import re
+from collections.abc import Sequence
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger("diplomacy.async_http")
+
+# HTTP/2 needs the optional ``h2`` package (``pip install httpx[http2]``).
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class PooledAsyncClient:
+    """A lazily-created, loop-bound ``httpx.AsyncClient`` with per-endpoint timeouts."""
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        default_timeout: float,
+        endpoint_timeouts: Sequence[tuple[str, float]] = (),
+        connect_timeout: float = 5.0,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        """
+        Args:
+            base_url: API root; request endpoints are resolved against it.
+            default_timeout: Read/write/pool timeout (seconds) for endpoints
+                that match no entry in ``endpoint_timeouts``.
+            endpoint_timeouts: ``(regex, seconds)`` pairs, first match wins,
+                searched against the endpoint path.
+            connect_timeout: TCP connect timeout, independent of the endpoint.
+            max_connections / max_keepalive_connections / keepalive_expiry:
+                ``httpx.Limits`` for the shared pool.
+            transport: Optional transport override (tests use
+                ``httpx.MockTransport``).
+        """
+        self.base_url = base_url.rstrip("/")
+        self.default_timeout = default_timeout
+        self.connect_timeout = connect_timeout
+        self._endpoint_timeouts = [(re.compile(p), t) for p, t in endpoint_timeouts]
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def timeout_for(self, endpoint: str) -> float:
+        """The read timeout (seconds) for ``endpoint``; query string ignored."""
+        path = endpoint.split("?", 1)[0]
+        for pattern, seconds in self._endpoint_timeouts:
+            if pattern.search(path):
+                return seconds
+        return self.default_timeout
+
+    def _get_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            # A client left behind by a finished loop can't be closed from this
+            # one; dropping the reference is all that's possible (its sockets
+            # died with the loop).
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                http2=HTTP2_AVAILABLE,
+                limits=self._limits,
+                timeout=httpx.Timeout(self.default_timeout, connect=self.connect_timeout),
+                transport=self._transport,
+            )
+            self._loop = loop
+            logger.debug(f"Opened pooled HTTP client for {self.base_url} (http2={HTTP2_AVAILABLE})")
+        return self._client
+
+    async def request(
+        self, method: str, endpoint: str, *, timeout: float | None = None, **kwargs: Any
+    ) -> httpx.Response:
+        """Send ``method endpoint`` over the pooled client.
+
+        ``timeout`` overrides the per-endpoint table for this one call. Any
+        other keyword (``json``, ``params``, ``headers``) goes to
+        ``httpx.AsyncClient.request`` unchanged.
+        """
+        seconds = timeout if timeout is not None else self.timeout_for(endpoint)
+        client = self._get_client()
+        return await client.request(
+            method,
+            endpoint,
+            timeout=httpx.Timeout(seconds, connect=self.connect_timeout),
+            **kwargs,
+        )
+
+    async def aclose(self) -> None:
+        """Close the pooled client (idempotent). Call on bot shutdown."""
+        client, self._client, self._loop = self._client, None, None
+        if client is not None and not client.is_closed:
+            await client.aclose()
@@ -0,0 +1,503 @@
+"""DAIDE load test: many simulated bots against a local `DaideServer`.
+
+    cd new_implementation && PYTHONPATH=src python -m server.daide.loadtest --games 4 --phases 6
+
+Starts a `DaideServer` on an ephemeral loopback port, backed by a real
+`GameService`/`GameRepo` on ``--database-url`` (by default a fresh SQLite
+file in a temporary directory, removed afterwards; every run creates new games
+and players, so only point it at a throwaway database), and opens ``--bots`` asyncio
+clients that each speak the protocol exactly as an external bot would:
+
+1. **Handshake** -- ``IM`` -> ``RM``, ``NME`` -> ``HLO``. The lobby seats the
+   bots seven to a game across up to ``--games`` games. Timed from
+   ``open_connection`` to the ``HLO``; every bot connects at once.
+2. **Each phase** -- on ``NOW`` the bot asks for ``SCO``, rebuilds the
+   position from the two replies (`state_from_now`, `ownership_from_sco`),
+   generates its orders with `engine.simple_ai` and sends them as one ``SUB``.
+   Timed from the ``SUB`` to its last ``THX``.
+3. **Turns** -- the harness stands in for the deadline scheduler: once every
+   bot on a game has had its orders acknowledged (or ``--phase-timeout``
+   passes), it calls `GameService.process_turn` on the event loop, as the
+   ``POST /games/{id}/process_turn`` route does, then
+   `DaideServer.notify_game_processed`. Timed from the start of
+   ``process_turn`` to each bot reading the pushed ``NOW``.
+
+Bots, listener and turn processing share one event loop, so a bot's own
+decode/order-generation time counts against the latencies it reports -- the
+numbers are what one API process delivers to a crowd of co-located clients,
+not a network benchmark. A game stops after ``--phases`` processed phases (or
+when it completes); each bot then sends ``FM`` and disconnects.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import tempfile
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from engine.map_loader import MapData
+from engine.simple_ai import generate_orders
+from engine.types import DislodgedUnit, GameState, GameStatus, Unit, UnitKind
+from server.daide import clauses, wire
+from server.daide import tokens as t
+from server.daide.server import DaideServer
+from server.daide.session import encode_frame, text_clause, top_level_groups
+from server.daide.tokens import Token
+
+__all__ = [
+    "LoadTestReport",
+    "ownership_from_sco",
+    "percentile",
+    "run_load_test",
+    "state_from_now",
+]
+
+POWERS_PER_GAME = 7
+RECV_TIMEOUT_S = 60.0
+
+
+# ---------------------------------------------------------------------------
+# Reading the board back off the wire
+# ---------------------------------------------------------------------------
+
+
+def state_from_now(tokens_: Sequence[Token], ownership: dict[str, str], *, map: MapData) -> GameState:
+    """``NOW (turn) (unit) ... (unit MRT (retreats)) ...`` plus an `SCO`'s
+    ownership -> the `GameState` a bot needs to generate orders.
+
+    The inverse of `session.build_now_tokens`, as far as the wire carries it:
+    a dislodged unit's ``attacker_origin`` is not sent (its ``retreats`` are
+    already filtered by it), so it comes back as ``None``."""
+    if not tokens_ or tokens_[0] != t.NOW:
+        raise ValueError(f"not a NOW message: {tokens_[:1]!r}")
+    season, phase_type, year = clauses.turn_from_clause(tokens_[1:5])
+    units: list[Unit] = []
+    dislodged: list[DislodgedUnit] = []
+    for group in top_level_groups(tokens_[5:]):
+        if t.MRT not in group:
+            unit, _ = clauses.unit_from_clause([t.OPEN_PAREN, *group, t.CLOSE_PAREN], map=map)
+            units.append(unit)
+            continue
+        split = group.index(t.MRT)
+        unit, _ = clauses.unit_from_clause([t.OPEN_PAREN, *group[:split], t.CLOSE_PAREN], map=map)
+        (retreat_tokens,) = top_level_groups(group[split + 1 :])
+        retreats = []
+        i = 0
+        while i < len(retreat_tokens):
+            loc, consumed = clauses.location_from_clause(
+                retreat_tokens[i:], map=map, fleet=unit.kind is UnitKind.FLEET
+            )
+            retreats.append(loc)
+            i += consumed
+        dislodged.append(DislodgedUnit(unit, None, tuple(retreats)))
+    return GameState(
+        year,
+        season,
+        phase_type,
+        units=frozenset(units),
+        ownership=dict(ownership),
+        dislodged=tuple(dislodged),
+    )
+
+
+def ownership_from_sco(tokens_: Sequence[Token]) -> dict[str, str]:
+    """``SCO (power centre ...) ... (UNO centre ...)`` -> province -> power."""
+    if not tokens_ or tokens_[0] != t.SCO:
+        raise ValueError(f"not an SCO message: {tokens_[:1]!r}")
+    ownership: dict[str, str] = {}
+    for power_token, *centres in top_level_groups(tokens_[1:]):
+        if power_token == t.UNO:
+            continue
+        power = t.engine_power_name(power_token)
+        for centre in centres:
+            ownership[t.engine_province_code(centre)] = power
+    return ownership
+
+
+# ---------------------------------------------------------------------------
+# Report
+# ---------------------------------------------------------------------------
+
+
+def percentile(samples: Sequence[float], q: float) -> float:
+    """Nearest-rank ``q``-th percentile (0 < q <= 100) of ``samples``."""
+    if not samples:
+        return math.nan
+    ordered = sorted(samples)
+    return ordered[max(0, min(len(ordered) - 1, math.ceil(q / 100 * len(ordered)) - 1))]
+
+
+@dataclass
+class LoadTestReport:
+    """Raw latency samples (seconds) from one run, plus its counters."""
+
+    bots: int
+    games: int
+    elapsed: float = 0.0
+    handshake: list[float] = field(default_factory=list)
+    sub_thx: list[float] = field(default_factory=list)
+    turn_now: list[float] = field(default_factory=list)
+    process_turn: list[float] = field(default_factory=list)
+    phases: int = 0
+    rejected: int = 0
+    timed_out_phases: int = 0
+    errors: list[str] = field(default_factory=list)
+
+    SERIES = ("handshake", "sub_thx", "turn_now", "process_turn")
+
+    def summary(self) -> dict[str, Any]:
+        """Counters plus count/p50/p90/p99/max (milliseconds) per latency series."""
+        out: dict[str, Any] = {
+            "bots": self.bots,
+            "games": self.games,
+            "phases": self.phases,
+            "elapsed_s": round(self.elapsed, 3),
+            "rejected": self.rejected,
+            "timed_out_phases": self.timed_out_phases,
+            "errors": list(self.errors),
+        }
+        for name in self.SERIES:
+            samples = getattr(self, name)
+            out[name] = {
+                "count": len(samples),
+                **{f"p{q}": round(percentile(samples, q) * 1000, 2) for q in (50, 90, 99)},
+                "max": round(max(samples, default=math.nan) * 1000, 2),
+            }
+        return out
+
+    def format(self) -> str:
+        summary = self.summary()
+        lines = [
+            (
+                f"{self.bots} bots, {self.games} games, {self.phases} phases processed in {self.elapsed:.1f}s"
+                f" ({self.rejected} rejected, {self.timed_out_phases} phases timed out, {len(self.errors)} errors)"
+            ),
+            f"{'latency (ms)':14} {'count':>7} {'p50':>9} {'p90':>9} {'p99':>9} {'max':>9}",
+        ]
+        for name in self.SERIES:
+            row = summary[name]
+            lines.append(
+                f"{name:14} {row['count']:7d} {row['p50']:9.2f} {row['p90']:9.2f} {row['p99']:9.2f} {row['max']:9.2f}"
+            )
+        return "\n".join(lines)
+
+
+# ---------------------------------------------------------------------------
+# Harness
+# ---------------------------------------------------------------------------
+
+
+class DaideLoadError(RuntimeError):
+    """The server answered a bot with something the protocol doesn't allow."""
+
+
+@dataclass
+class _GameProgress:
+    seated: int = 0
+    ready: int = 0
+    generation: int = 0
+    turn_started: float = 0.0
+    finished: bool = False
+    timer: asyncio.Task | None = None
+
+
+class _Harness:
+    """Seats bots, counts their per-phase readiness, and processes turns."""
+
+    def __init__(
+        self, server: DaideServer, report: LoadTestReport, *, phases: int, phase_timeout: float
+    ) -> None:
+        self.server = server
+        self.report = report
+        self.phases = phases
+        self.phase_timeout = phase_timeout
+        self.games: dict[str, _GameProgress] = {}
+        self.all_seated = asyncio.Event()
+        self._pending_handshakes = report.bots
+        self._advancing: set[asyncio.Task] = set()
+
+    def game_of(self, power: str, passcode: int) -> str:
+        for game_id in self.server.games:
+            session = self.server.sessions_for(game_id).get(power)
+            if session is not None and session.passcode == passcode:
+                return game_id
+        raise RuntimeError(f"no hosted game seats {power} with passcode {passcode}")
+
+    def handshake_done(self, game_id: str | None) -> None:
+        if game_id is not None:
+            self.games.setdefault(game_id, _GameProgress()).seated += 1
+        self._pending_handshakes -= 1
+        if self._pending_handshakes == 0:
+            for hosted in self.games:
+                self._arm_timer(hosted)
+            self.all_seated.set()
+
+    def ready(self, game_id: str, generation: int) -> bool:
+        """A bot is done with phase ``generation``. False once the game is over
+        (the bot should disconnect); a late report for a phase that already
+        timed out is ignored."""
+        progress = self.games[game_id]
+        if progress.finished:
+            return False
+        if generation != progress.generation:
+            return True
+        progress.ready += 1
+        if progress.ready == progress.seated:
+            self._advance(game_id, progress.generation)
+        return True
+
+    def _arm_timer(self, game_id: str) -> None:
+        progress = self.games[game_id]
+        generation = progress.generation
+
+        async def expire() -> None:
+            await asyncio.sleep(self.phase_timeout)
+            if progress.generation == generation and not progress.finished:
+                self.report.timed_out_phases += 1
+                self._advance(game_id, generation)
+
+        progress.timer = asyncio.create_task(expire())
+
+    def _advance(self, game_id: str, generation: int) -> None:
+        task = asyncio.create_task(self._process(game_id, generation))
+        self._advancing.add(task)
+        task.add_done_callback(self._advancing.discard)
+
+    async def _process(self, game_id: str, generation: int) -> None:
+        progress = self.games[game_id]
+        if progress.generation != generation or progress.finished:
+            return
+        progress.generation += 1
+        progress.ready = 0
+        if progress.timer is not None:
+            progress.timer.cancel()
+        service = self.server.game_service
+        resolved_phase = service.version(game_id)["phase_code"]
+        progress.turn_started = time.perf_counter()
+        try:
+            service.process_turn(game_id)
+        except Exception as exc:  # noqa: BLE001 -- recorded, and the game is stopped
+            self.report.errors.append(f"process_turn({game_id}): {exc}")
+            progress.finished = True
+        self.report.process_turn.append(time.perf_counter() - progress.turn_started)
+        self.report.phases += 1
+        view = service.view(game_id)
+        if progress.generation >= self.phases or view is None or view["status"] != GameStatus.ACTIVE.value:
+            progress.finished = True
+        if not progress.finished:
+            self._arm_timer(game_id)
+        await self.server.notify_game_processed(game_id, resolved_phase=resolved_phase)
+
+    async def wait_idle(self) -> None:
+        while self._advancing:
+            await asyncio.gather(*list(self._advancing), return_exceptions=True)
+        for progress in self.games.values():
+            if progress.timer is not None:
+                progress.timer.cancel()
+
+
+class _Bot:
+    """One simulated client: a socket, its power, and its view of the board."""
+
+    def __init__(self, harness: _Harness, index: int, seed: int) -> None:
+        self.harness = harness
+        self.map = harness.server.map
+        self.name = f"loadbot-{index}"
+        self.rng = random.Random(seed)
+        self.game_id: str | None = None
+        self.power: str | None = None
+        self.generation = 0
+        self.ownership: dict[str, str] = {}
+        self.now: list[Token] | None = None
+        self.awaiting_thx = 0
+        self.sub_sent = 0.0
+
+    async def run(self) -> None:
+        report = self.harness.report
+        started = time.perf_counter()
+        writer = None
+        try:
+            try:
+                reader, writer = await asyncio.open_connection(self.harness.server.host, self.harness.server.port)
+                self.writer = writer
+                self.frames = wire.FrameReader(reader)
+                seated = await self._handshake()
+            finally:
+                game_id = self.game_id if self.power is not None else None
+                self.harness.handshake_done(game_id)
+            if not seated:
+                report.rejected += 1
+                return
+            report.handshake.append(time.perf_counter() - started)
+            await self.harness.all_seated.wait()
+            await self._send(t.NOW)
+            while await self._step():
+                pass
+            await wire.write_message(writer, wire.FinalMessage())
+        except (ConnectionError, asyncio.IncompleteReadError, TimeoutError, DaideLoadError) as exc:
+            report.errors.append(f"{self.name} ({self.power}): {type(exc).__name__}: {exc}")
+        finally:
+            if writer is not None:
+                writer.close()
+
+    async def _handshake(self) -> bool:
+        await wire.write_message(self.writer, wire.InitialMessage())
+        if not isinstance(await self._read(), wire.RepresentationMessage):
+            raise DaideLoadError("expected RM after IM")
+        await self._send(t.NME, *text_clause(self.name), *text_clause("1.0"))
+        hlo = await self._recv()
+        if hlo[0] != t.HLO:
+            return False
+        self.power = t.engine_power_name(hlo[2])
+        self.game_id = self.harness.game_of(self.power, int(hlo[5]))
+        return True
+
+    async def _step(self) -> bool:
+        """Handle one incoming message; False once this bot is finished."""
+        tokens_ = await self._recv()
+        head = tokens_[0]
+        if head == t.NOW:
+            progress = self.harness.games[self.game_id]
+            if progress.generation > self.generation:
+                self.generation = progress.generation
+                self.harness.report.turn_now.append(time.perf_counter() - progress.turn_started)
+            self.now = tokens_
+            await self._send(t.SCO)
+        elif head == t.SCO:
+            self.ownership = ownership_from_sco(tokens_)
+            if self.now is not None:
+                return await self._submit()
+        elif head == t.THX:
+            self.awaiting_thx -= 1
+            if self.awaiting_thx == 0:
+                self.harness.report.sub_thx.append(time.perf_counter() - self.sub_sent)
+                return self.harness.ready(self.game_id, self.generation)
+        elif head == t.OFF:
+            return False
+        return True
+
+    async def _submit(self) -> bool:
+        state = state_from_now(self.now, self.ownership, map=self.map)
+        self.now = None
+        orders = generate_orders(self.map, state, self.power, self.rng)
+        if not orders:
+            return self.harness.ready(self.game_id, self.generation)
+        kinds = {u.province: "F" if u.kind is UnitKind.FLEET else "A" for u in state.units}
+        kinds.update({d.province: "F" if d.kind is UnitKind.FLEET else "A" for d in state.dislodged})
+        owners = {u.province: u.power for u in state.units}
+        body: list[Token] = [t.SUB]
+        for order in orders:
+            body += clauses.encode_order(
+                order, phase_type=state.phase_type, map=self.map, kind_by_province=kinds, power_by_province=owners
+            )
+        self.awaiting_thx = len(orders)
+        self.sub_sent = time.perf_counter()
+        await self._send(*body)
+        return True
+
+    async def _send(self, *tokens_: Token) -> None:
+        self.writer.write(encode_frame(tokens_))
+        await self.writer.drain()
+
+    async def _read(self) -> wire.Message:
+        return await asyncio.wait_for(self.frames.read_message(), RECV_TIMEOUT_S)
+
+    async def _recv(self) -> list[Token]:
+        while True:
+            message = await self._read()
+            if isinstance(message, wire.DiplomacyMessage):
+                tokens_ = t.decode_tokens(message.payload)
+                if tokens_:
+                    return tokens_
+            elif isinstance(message, (wire.ErrorMessage, wire.FinalMessage)):
+                raise DaideLoadError(f"server closed the session: {message!r}")
+
+
+async def run_load_test(
+    game_service: Any,
+    *,
+    bots: int,
+    games: int,
+    phases: int,
+    seed: int = 1,
+    phase_timeout: float = 30.0,
+) -> LoadTestReport:
+    """Run ``bots`` clients against a fresh loopback `DaideServer` hosting at
+    most ``games`` games, for ``phases`` processed phases per game."""
+    server = DaideServer(game_service, host="127.0.0.1", port=0, max_games=games)
+    report = LoadTestReport(bots=bots, games=games)
+    await server.start()
+    harness = _Harness(server, report, phases=phases, phase_timeout=phase_timeout)
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(*(_Bot(harness, i, seed * 10_007 + i).run() for i in range(bots)))
+        await harness.wait_idle()
+    finally:
+        report.elapsed = time.perf_counter() - started
+        await server.stop()
+    report.games = len(server.games)
+    return report
+
+
+def _game_service(database_url: str) -> Any:
+    from sqlalchemy.orm import sessionmaker
+
+    from persistence.engine import get_engine
+    from persistence.game_repo import GameRepo
+    from server.game_service import GameService
+
+    engine = get_engine(database_url)
+    if engine.dialect.name == "sqlite":
+        from persistence.database import Base
+
+        Base.metadata.create_all(engine)
+    return GameService(GameRepo(sessionmaker(bind=engine)))
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m server.daide.loadtest",
+        description="Simulated DAIDE bots against a local DaideServer.",
+    )
+    parser.add_argument("--games", type=int, default=4, help="games the lobby may host")
+    parser.add_argument("--bots", type=int, default=None, help="clients to open (default: 7 per game)")
+    parser.add_argument("--phases", type=int, default=6, help="phases to process per game")
+    parser.add_argument("--phase-timeout", type=float, default=30.0, help="seconds before a phase is forced")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument(
+        "--database-url",
+        help="throwaway database to create the games in (default: a temporary SQLite file; "
+        "sqlite:/// URLs get a fresh schema)",
+    )
+    parser.add_argument("--json", metavar="PATH", help="also write the summary as JSON")
+    args = parser.parse_args(argv)
+
+    bots = args.bots if args.bots is not None else args.games * POWERS_PER_GAME
+    with tempfile.TemporaryDirectory(prefix="daide-loadtest-") as tmp:
+        database_url = args.database_url or f"sqlite:///{os.path.join(tmp, 'loadtest.db')}"
+        report = asyncio.run(
+            run_load_test(
+                _game_service(database_url),
+                bots=bots,
+                games=args.games,
+                phases=args.phases,
+                seed=args.seed,
+                phase_timeout=args.phase_timeout,
+            )
+        )
+    print(report.format())
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump(report.summary(), fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,28 @@
 """The DAIDE TCP listener (Track D, D4) -- replaces `server.daide_protocol`.
 
-`DaideServer` is an `asyncio.start_server`-based listener, one instance per
-game: it owns the game a session's `NME`/`IAM` resolves against, the registry
-of which power a live `DaideSession` occupies, the reusable per-power
-passcodes (so `IAM` can reclaim a slot after a dropped connection), and the
-cross-session broadcasts (`notify_game_processed`, draw completion, admin
-chat, press relay).
+`DaideServer` is an `asyncio.start_server`-based listener hosting a *lobby* of
+games: an `NME` joins the first hosted game with a free power (a new game is
+created once they are all full, up to ``max_games`` unfinished games), and an
+`IAM` finds its game from the power + passcode pair, which is unique across the
+lobby. It owns the registry of which power a live `DaideSession` occupies in
+which game, the reusable per-power passcodes (so `IAM` can reclaim a slot after
+a dropped connection), and the cross-session broadcasts
+(`notify_game_processed`, draw completion, admin chat, press relay).
+
+Broadcasts are encoded once and handed to every session as the same ``bytes``:
+`phase_frames` caches each game's `NOW`/`SCO` frames (and the `ORD` frames of
+the phase that produced it) keyed by the game's phase and state version, and
+each session's bounded outbound queue takes the frames without waiting on its
+socket -- one slow bot neither delays the others nor re-encodes anything
+(see `session.py`'s "Outbound queue").
 
 Everything here runs on one asyncio event loop (the process's own), so the
 registry dicts below need no locking beyond "don't `await` in the middle of a
-mutation" -- which none of the mutating methods do.
+mutation" -- which none of the mutating methods do. The one exception is
+`phase_frames` (and the `ORD` frames it caches), which reads the database and
+so runs on the blocking pool (`server.executors.run_blocking`); it only ever
+replaces a cache entry with an equally valid one, so a race between two
+threads costs a rebuild, never a wrong frame.
 """
 
 from __future__ import annotations
@@ -18,26 +31,49 @@ import asyncio
 import contextlib
 import logging
 import random
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Optional
 
+from engine.game import Game
 from engine.serialization import resolution_from_dict
 from engine.types import STANDARD_POWERS
+from metrics import REGISTRY
 from server.daide import clauses
 from server.daide import session as session_mod
 from server.daide import tokens as t
-from server.daide.session import DaideSession
+from server.daide.session import DaideSession, encode_frame
 from server.daide.tokens import Token
+from server.executors import run_blocking
 
-__all__ = ["DaideServer"]
+__all__ = ["DaideServer", "PhaseFrames"]
 
 _logger = logging.getLogger("diplomacy.server.daide")
 
+_CONNECTIONS = REGISTRY.gauge("diplomacy_daide_connections", "Open DAIDE client connections.")
+
 DEFAULT_PORT = 8432
+DEFAULT_MAX_GAMES = 64
+
+
+@dataclass
+class PhaseFrames:
+    """One game phase's broadcast frames, encoded once and shared by every session.
+
+    ``token`` is the game's ``(phase_code, state_version)`` when these were
+    built; ``ord`` maps a just-resolved phase code to its `ORD` frames.
+    """
+
+    token: tuple[str, int]
+    game: Game
+    now: bytes
+    sco: bytes
+    ord: dict[str, tuple[bytes, ...]] = field(default_factory=dict)
 
 
 class DaideServer:
-    """Owns the listening socket, the game it serves, and the connection registry.
+    """Owns the listening socket, the lobby of games it hosts, and the connection registry.
 
     ``game_service`` is the sole entry point into the engine (per
     `CLAUDE.md`'s "non-engine code goes through GameService" rule).
@@ -55,15 +91,21 @@ class DaideServer:
         host: str = "0.0.0.0",  # nosec B104
         port: int = DEFAULT_PORT,
         game_id: Optional[str] = None,
+        max_games: int = DEFAULT_MAX_GAMES,
     ) -> None:
         self.game_service = game_service
         self.map = game_service.map
         self.db_service = db_service
         self.host = host
         self.port = port
-        self._game_id = game_id
+        self.max_games = max_games
         self._server: Optional[asyncio.base_events.Server] = None
+        # The loop `start()` ran on; synchronous code on other threads hands
+        # `notify_game_processed` to it (see `api/shared.py`).
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
 
+        # Hosted games in the order NME fills them; ``game_id`` seeds the lobby.
+        self._games: list[str] = [game_id] if game_id is not None else []
         # game_id -> power -> live session
         self._sessions: dict[str, dict[str, DaideSession]] = {}
         # game_id -> power -> passcode (kept across disconnects for IAM reclaim)
@@ -72,37 +114,57 @@ class DaideServer:
         self._eliminated_seen: dict[str, frozenset[str]] = {}
         # game_id -> has a completion (DRW or SLO) already been broadcast
         self._completion_notified: dict[str, bool] = {}
+        # game_id -> its current phase's encoded frames / the last SCO broadcast
+        self._frames: dict[str, PhaseFrames] = {}
+        self._sco_sent: dict[str, bytes] = {}
+
+    @property
+    def games(self) -> tuple[str, ...]:
+        """Every game the lobby hosts, oldest first."""
+        return tuple(self._games)
 
     @property
     def game_id(self) -> str:
-        """The game this server serves. Raises if none has been created yet --
-        use `current_game_id` for a non-raising check, or `ensure_game_id()`
-        to create one on demand."""
-        if self._game_id is None:
+        """The newest hosted game. Raises if none has been created yet -- use
+        `current_game_id` for a non-raising check."""
+        if not self._games:
             raise RuntimeError(
                 "no game has been created yet -- DaideServer defers game "
-                "creation to the first successful NME (ensure_game_id()), "
+                "creation to the first successful NME (open_game_id()), "
                 "not to start() or accepting a connection; see start()'s "
                 "docstring for why"
             )
-        return self._game_id
+        return self._games[-1]
 
     @property
     def current_game_id(self) -> Optional[str]:
-        """Non-raising peek at `game_id` -- `None` until `ensure_game_id()`
-        has actually run (or a game_id was supplied at construction)."""
-        return self._game_id
+        """Non-raising peek at `game_id` -- `None` until an `NME` has actually
+        opened a game (or a game_id was supplied at construction)."""
+        return self._games[-1] if self._games else None
+
+    def host_game(self, game_id: str) -> None:
+        """Add an existing game (e.g. one created over HTTP) to the lobby."""
+        if game_id not in self._games:
+            self._games.append(game_id)
 
-    def ensure_game_id(self) -> str:
-        """Create this server's game on first real use, if it doesn't exist
-        yet. Idempotent -- a second call returns the same id, no second game.
+    def open_game_id(self) -> Optional[str]:
+        """The game a new `NME` joins: the first hosted, unfinished game with a
+        free power, else a newly created one -- or ``None`` once ``max_games``
+        unfinished games are hosted and every seat is taken. Finished games
+        stay in the lobby (for `IAM`) but no longer count against the cap.
 
         Called from `session.py`'s `NME` handler, deliberately not from
         `start()` or `_handle_client()` -- see `start()`'s docstring for why
         eager creation there is actively harmful for this repo."""
-        if self._game_id is None:
-            self._game_id = self.game_service.create_game()
-        return self._game_id
+        for game_id in self._games:
+            if not self._completion_notified.get(game_id) and self.assign_power(game_id):
+                return game_id
+        unfinished = sum(1 for game_id in self._games if not self._completion_notified.get(game_id))
+        if unfinished >= self.max_games:
+            return None
+        game_id = self.game_service.create_game()
+        self._games.append(game_id)
+        return game_id
 
     # -- lifecycle ------------------------------------------------------------
 
@@ -111,7 +173,7 @@ class DaideServer:
         database.
 
         Game creation is deliberately deferred to the first successful `NME`
-        (`ensure_game_id()`), not done here, because `CLAUDE.md` documents
+        (`open_game_id()`), not done here, because `CLAUDE.md` documents
         that this repo auto-deploys to production on every merge to `main`
         that passes CI (`systemctl restart diplomacy-api`) -- if `start()`
         created a game whenever ``game_id`` wasn't supplied (as it used to),
@@ -124,15 +186,17 @@ class DaideServer:
         its own `asyncio.Task` per connection automatically -- no extra
         bookkeeping needed here for "one task per session".
         """
+        self.loop = asyncio.get_running_loop()
         self._server = await asyncio.start_server(self._handle_client, self.host, self.port)
         if self._server.sockets:
             self.port = self._server.sockets[0].getsockname()[1]
 
     async def stop(self) -> None:
         """Notify every open session (`OFF`) before closing the listener."""
-        for sessions in list(self._sessions.values()):
-            for daide_session in list(sessions.values()):
-                await daide_session.send_off()
+        off = [encode_frame([t.OFF])]
+        await self._broadcast(
+            (s for sessions in list(self._sessions.values()) for s in list(sessions.values())), off
+        )
         if self._server is not None:
             self._server.close()
             await self._server.wait_closed()
@@ -141,10 +205,13 @@ class DaideServer:
     async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
         # No game-creation guard here either (see `start()`'s docstring) --
         # a connection that never sends a successful `NME` never mints a
-        # game; `DaideSession` tolerates `current_game_id` being `None` until
-        # then.
+        # game, and isn't routed to one until its NME/IAM.
         daide_session = DaideSession(reader, writer, self)
-        await daide_session.run()
+        _CONNECTIONS.inc()
+        try:
+            await daide_session.run()
+        finally:
+            _CONNECTIONS.dec()
 
     # -- registry ---------------------------------------------------------
 
@@ -164,10 +231,23 @@ class DaideServer:
         passcodes = self._passcodes.setdefault(game_id, {})
         passcode = passcodes.get(power)
         if passcode is None:
+            # Unique per power across the lobby: IAM routes by this pair alone.
+            taken = {codes.get(power) for codes in self._passcodes.values()}
             passcode = random.randint(1, 8191)
+            while passcode in taken:
+                passcode = random.randint(1, 8191)
             passcodes[power] = passcode
         return passcode
 
+    def reclaim(self, power: str, passcode: int, daide_session: DaideSession) -> Optional[str]:
+        """`IAM (power) (passcode)`: find the game that issued this passcode for
+        ``power`` and reclaim its slot (see `try_reclaim`). Returns the game id,
+        or ``None`` if no game matches or the slot is live elsewhere."""
+        for game_id, passcodes in self._passcodes.items():
+            if passcodes.get(power) == passcode:
+                return game_id if self.try_reclaim(game_id, power, passcode, daide_session) else None
+        return None
+
     def try_reclaim(self, game_id: str, power: str, passcode: int, daide_session: DaideSession) -> bool:
         """`IAM (power) (passcode)` on a new connection: reclaim ``power``'s
         slot if the passcode matches what `register` issued and no other live
@@ -206,16 +286,85 @@ class DaideServer:
         remaining = (deadline - datetime.now(timezone.utc)).total_seconds()
         return max(0, int(remaining))
 
+    # -- shared frames -----------------------------------------------------
+
+    def phase_frames(self, game_id: str) -> Optional[PhaseFrames]:
+        """``game_id``'s current `NOW`/`SCO` frames, rebuilt only when its
+        phase or state version has moved on (one cheap version read per call
+        otherwise). ``None`` if the game doesn't exist."""
+        version = self.game_service.version(game_id)
+        if version is None:
+            return None
+        token = (version["phase_code"], version["state_version"])
+        frames = self._frames.get(game_id)
+        if frames is not None and frames.token == token:
+            return frames
+        game = self.game_service.load(game_id)
+        if game is None:
+            return None
+        frames = PhaseFrames(
+            token=token,
+            game=game,
+            now=encode_frame(session_mod.build_now_tokens(game.state, self.map)),
+            sco=encode_frame(session_mod.build_sco_tokens(game.state.ownership, self.map)),
+        )
+        self._frames[game_id] = frames
+        return frames
+
+    def _ord_frames(self, game_id: str, frames: PhaseFrames, resolved_phase: str) -> tuple[bytes, ...]:
+        """The `ORD` frames for ``resolved_phase`` (the phase whose adjudication
+        produced ``frames``' state), decoded and encoded once per phase."""
+        cached = frames.ord.get(resolved_phase)
+        if cached is not None:
+            return cached
+        out: list[bytes] = []
+        resolution_dict = self.game_service.last_resolution(game_id)
+        if resolution_dict:
+            resolution = resolution_from_dict(resolution_dict)
+            try:
+                season, phase_type, year = session_mod.parse_phase_code(resolved_phase)
+            except ValueError:
+                season = phase_type = year = None  # type: ignore[assignment]
+            if phase_type is not None:
+                turn_tokens = list(clauses.turn_clause(season, phase_type, year))
+                for r in resolution.results:
+                    out.append(
+                        encode_frame(
+                            session_mod.build_ord_tokens(
+                                r.order, r.result, r.dislodged, phase_type, self.map, turn_tokens
+                            )
+                        )
+                    )
+        frames.ord[resolved_phase] = tuple(out)
+        return frames.ord[resolved_phase]
+
+    def _mark_completed(self, game_id: str) -> None:
+        """Record that ``game_id``'s completion was broadcast: it stops counting
+        against ``max_games`` and its cached frames are dropped (a late `NOW`
+        or `SCO` query rebuilds them)."""
+        self._completion_notified[game_id] = True
+        self._frames.pop(game_id, None)
+        self._sco_sent.pop(game_id, None)
+
     # -- broadcasts -----------------------------------------------------------
 
+    @staticmethod
+    async def _deliver(daide_session: DaideSession, frames: Sequence[bytes]) -> None:
+        with contextlib.suppress(ConnectionError, OSError):
+            await daide_session.send_frames(frames)
+
+    async def _broadcast(self, sessions: Iterable[DaideSession], frames: Sequence[bytes]) -> None:
+        """Hand the same encoded ``frames`` to every session at once. With the
+        sessions' writer tasks running this only enqueues; a session whose
+        queue is full is disconnected rather than waited on."""
+        await asyncio.gather(*(self._deliver(s, frames) for s in sessions))
+
     async def broadcast_draw_completion(self, game_id: str) -> None:
         """A `DRW` vote reached quorum: every session on this game gets the
         bare `DRW` completion notification (never `SLO` -- a real solo is only
         ever detected via `notify_game_processed`, see that method's docstring)."""
-        self._completion_notified[game_id] = True
-        for daide_session in self.sessions_for(game_id).values():
-            with contextlib.suppress(ConnectionError, OSError):
-                await daide_session._send(t.DRW)
+        self._mark_completed(game_id)
+        await self._broadcast(self.sessions_for(game_id).values(), [encode_frame([t.DRW])])
 
     async def broadcast_admin(
         self, game_id: str, from_name: str, message_tokens: list[Token], exclude: Optional[DaideSession] = None
@@ -223,11 +372,9 @@ class DaideServer:
         """Relay an `ADM (name) (message)` to every other session on the game
         (echo, no persistence -- there is no admin-chat table in this codebase)."""
         name_clause = session_mod.text_clause(from_name)
-        for daide_session in self.sessions_for(game_id).values():
-            if daide_session is exclude:
-                continue
-            with contextlib.suppress(ConnectionError, OSError):
-                await daide_session._send(t.ADM, *name_clause, t.OPEN_PAREN, *message_tokens, t.CLOSE_PAREN)
+        frame = encode_frame([t.ADM, *name_clause, t.OPEN_PAREN, *message_tokens, t.CLOSE_PAREN])
+        sessions = [s for s in self.sessions_for(game_id).values() if s is not exclude]
+        await self._broadcast(sessions, [frame])
 
     async def relay_press(
         self, game_id: str, from_power: str, to_powers: list[str], message_tokens: list[Token]
@@ -237,24 +384,22 @@ class DaideServer:
         doesn't get it -- no offline mailbox (Track D Ground Rules)."""
         from_token = t.POWER_TOKEN_BY_ENGINE_NAME[from_power]
         to_tokens = [t.POWER_TOKEN_BY_ENGINE_NAME[p] for p in to_powers]
+        frame = encode_frame(
+            [
+                t.FRM,
+                t.OPEN_PAREN,
+                from_token,
+                t.CLOSE_PAREN,
+                t.OPEN_PAREN,
+                *to_tokens,
+                t.CLOSE_PAREN,
+                t.OPEN_PAREN,
+                *message_tokens,
+                t.CLOSE_PAREN,
+            ]
+        )
         sessions = self.sessions_for(game_id)
-        for power in to_powers:
-            daide_session = sessions.get(power)
-            if daide_session is None:
-                continue
-            with contextlib.suppress(ConnectionError, OSError):
-                await daide_session._send(
-                    t.FRM,
-                    t.OPEN_PAREN,
-                    from_token,
-                    t.CLOSE_PAREN,
-                    t.OPEN_PAREN,
-                    *to_tokens,
-                    t.CLOSE_PAREN,
-                    t.OPEN_PAREN,
-                    *message_tokens,
-                    t.CLOSE_PAREN,
-                )
+        await self._broadcast((sessions[p] for p in to_powers if p in sessions), [frame])
 
     async def notify_game_processed(self, game_id: str, *, resolved_phase: Optional[str] = None) -> None:
         """Push post-turn notifications to every session on ``game_id``.
@@ -265,59 +410,47 @@ class DaideServer:
         `GameService.process_turn`) is supplied: `game.state` has already
         advanced past that phase by the time this runs, so without it there is
         no reliable way to know which season/year/phase-type to tag the `ORD`
-        turn clause with, and this deliberately doesn't guess. Sends `OUT` for
-        any power `Game.eliminated_powers()` newly reports. Sends `SLO` if the
+        turn clause with, and this deliberately doesn't guess. Sends `SCO`
+        whenever supply-centre ownership differs from the last `SCO` this
+        game broadcast. Sends `OUT` for any power `Game.eliminated_powers()`
+        newly reports. Sends `SLO` if the
         game just completed via a solo (`Game.winner()` returns a single
         power) and a `DRW` completion wasn't already broadcast for it --
         `Game.draw()` is only ever reached through `submit_draw_vote`, which
         calls `broadcast_draw_completion` itself and marks
         ``_completion_notified`` immediately, so a `COMPLETED` status reaching
         this method un-notified is always a solo, never a multi-power draw.
+
+        Every frame is encoded once (see `phase_frames`) and the same bytes
+        are queued on every session concurrently.
         """
         sessions = self.sessions_for(game_id)
         if not sessions:
             return
-        game = self.game_service.load(game_id)
-        if game is None:
+        frames = await run_blocking(self.phase_frames, game_id)
+        if frames is None:
             return
+        game = frames.game
 
-        now_tokens = session_mod.build_now_tokens(game.state, self.map)
-
-        ord_messages: list[list[Token]] = []
+        out: list[bytes] = [frames.now]
         if resolved_phase is not None:
-            resolution_dict = self.game_service.last_resolution(game_id)
-            if resolution_dict:
-                resolution = resolution_from_dict(resolution_dict)
-                try:
-                    season, phase_type, year = session_mod.parse_phase_code(resolved_phase)
-                except ValueError:
-                    season = phase_type = year = None  # type: ignore[assignment]
-                if phase_type is not None:
-                    turn_tokens = list(clauses.turn_clause(season, phase_type, year))
-                    for r in resolution.results:
-                        ord_messages.append(
-                            session_mod.build_ord_tokens(
-                                r.order, r.result, r.dislodged, phase_type, self.map, turn_tokens
-                            )
-                        )
+            out.extend(await run_blocking(self._ord_frames, game_id, frames, resolved_phase))
+        if self._sco_sent.get(game_id) != frames.sco:
+            self._sco_sent[game_id] = frames.sco
+            out.append(frames.sco)
 
         eliminated_now = game.eliminated_powers()
         eliminated_before = self._eliminated_seen.get(game_id, frozenset())
-        newly_eliminated = sorted(eliminated_now - eliminated_before)
         self._eliminated_seen[game_id] = eliminated_now
+        for power in sorted(eliminated_now - eliminated_before):
+            out.append(encode_frame([t.OUT, t.OPEN_PAREN, t.POWER_TOKEN_BY_ENGINE_NAME[power], t.CLOSE_PAREN]))
 
         completed = game.state.status.value == "COMPLETED"
-        already_notified = self._completion_notified.get(game_id, False)
-        winner = game.winner() if completed and not already_notified else None
-
-        for daide_session in sessions.values():
-            with contextlib.suppress(ConnectionError, OSError):
-                await daide_session._send(*now_tokens)
-                for msg in ord_messages:
-                    await daide_session._send(*msg)
-                for power in newly_eliminated:
-                    await daide_session._send(t.OUT, t.OPEN_PAREN, t.POWER_TOKEN_BY_ENGINE_NAME[power], t.CLOSE_PAREN)
-                if winner is not None:
-                    await daide_session._send(t.SLO, t.OPEN_PAREN, t.POWER_TOKEN_BY_ENGINE_NAME[winner], t.CLOSE_PAREN)
+        if completed and not self._completion_notified.get(game_id, False):
+            winner = game.winner()
+            if winner is not None:
+                out.append(encode_frame([t.SLO, t.OPEN_PAREN, t.POWER_TOKEN_BY_ENGINE_NAME[winner], t.CLOSE_PAREN]))
         if completed:
-            self._completion_notified[game_id] = True
+            self._mark_completed(game_id)
+
+        await self._broadcast(sessions.values(), out)
@@ -15,8 +15,8 @@ by its arguments, where arguments are almost always a run of top-level
 ``( ... )`` groups (``NME (name) (version)``, ``SUB (order) (order) ...``,
 ``NOT (GOF)``, ...). `clauses.py`'s `_read_group` is the order-level
 equivalent of this but is not exported (it is a private module helper), so
-`_top_level_groups` below is a small, independent equivalent scoped to this
-module's needs -- it repeatedly consumes one ``(...)`` group at a time from a
+`top_level_groups` below is a small, independent equivalent scoped to this
+package's needs (the load-test bots read server replies with it too) -- it repeatedly consumes one ``(...)`` group at a time from a
 flat token list, same nesting-aware technique.
 
 ## THX order-note mapping
@@ -61,12 +61,34 @@ in THX's fixed vocabulary (there is no "invalid, unspecified" token).
   press grammar itself is never parsed, per Track D's Ground Rules. A
   recipient with no live session simply does not receive the message (no
   offline mailbox).
+
+## Outbound queue
+
+Once the handshake is done every frame a session sends -- its own replies and
+the server's broadcasts alike -- goes through one bounded queue drained by the
+session's own writer task, so frames stay in order and a broadcast never waits
+on a peer's socket. A peer that lets ``OUTBOX_FRAMES`` frames pile up, or
+whose socket doesn't drain within ``SEND_TIMEOUT_S``, is a slow consumer: it
+is logged and disconnected (its power's passcode still allows an `IAM`
+reclaim). Before the handshake (and in tests that drive the handlers
+directly, with no `run()`), frames are written straight to the writer.
+
+## Blocking calls
+
+Every `GameService` / database read or write a handler makes (`SUB`, `NOT`,
+`DRW`, `MIS`, `TME`, and `phase_frames` behind `NOW`/`SCO`) goes through
+`server.executors.run_blocking`, so a slow commit delays only the session
+that asked for it, not every connection on the loop. `NME`'s
+`open_game_id()` is the exception: its game creation happens once per lobby
+fill, and keeping it on the loop keeps "pick a game, claim a power" atomic.
 """
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import logging
+import time
 from collections.abc import Sequence
 from typing import Any, Optional
 
@@ -80,10 +102,12 @@ from engine.types import (
     ResultCode,
     Season,
 )
+from metrics import REGISTRY
 from server.daide import clauses, wire
 from server.daide import tokens as t
 from server.daide.tokens import Token
 from server.daide.wire import DaideWireError
+from server.executors import run_blocking
 
 __all__ = [
     "DaideSession",
@@ -94,18 +118,31 @@ __all__ = [
     "build_now_tokens",
     "build_mis_tokens",
     "build_ord_tokens",
+    "encode_frame",
     "parse_phase_code",
     "text_clause",
+    "top_level_groups",
     "DAIDE_LEVEL",
 ]
 
 _logger = logging.getLogger("diplomacy.server.daide")
 
+# Per known command only (unknown ones get HUH before this), so the label set
+# stays the handler table's.
+_COMMAND_SECONDS = REGISTRY.histogram(
+    "diplomacy_daide_command_seconds", "Time to handle one DAIDE command, by command.", ("command",)
+)
+
 # This codebase does not implement DAIDE's language-level negotiation depth
 # (the LVL 10 press-time-limit / partial-draw extensions) -- level 0 covers
 # the base gameplay message set this module actually speaks.
 DAIDE_LEVEL = 0
 
+# Slow-consumer limits for the per-session outbound queue (see the module
+# docstring's "Outbound queue").
+OUTBOX_FRAMES = 256
+SEND_TIMEOUT_S = 10.0
+
 
 class SessionProtocolError(ValueError):
     """A message's clause structure doesn't match what its command expects.
@@ -133,7 +170,7 @@ def _parens_balanced(tokens_: Sequence[Token]) -> bool:
     return depth == 0
 
 
-def _top_level_groups(tokens_: Sequence[Token]) -> list[list[Token]]:
+def top_level_groups(tokens_: Sequence[Token]) -> list[list[Token]]:
     """Split a flat token sequence into consecutive top-level ``(...)`` groups.
 
     Every element returned is a group's *inner* tokens (parens stripped).
@@ -309,6 +346,11 @@ def build_ord_tokens(
 # ---------------------------------------------------------------------------
 
 
+def encode_frame(tokens_: Sequence[Token]) -> bytes:
+    """A token stream as one complete DCSP `DiplomacyMessage` frame, header included."""
+    return wire.DiplomacyMessage(payload=t.encode_tokens(tokens_)).to_bytes()
+
+
 def build_hlo_tokens(power: str, passcode: int) -> list[Token]:
     power_token = t.POWER_TOKEN_BY_ENGINE_NAME[power]
     return [
@@ -497,27 +539,27 @@ class DaideSession:
     ``server`` is duck-typed to `server.DaideServer` (not imported here, to
     avoid a circular import -- `server.py` imports *this* module). The
     attributes/methods this class actually calls on it: ``game_service``
-    (a `GameService`), ``map`` (a `MapData`), ``current_game_id`` (a
-    non-raising ``Optional[str]`` property -- ``None`` until a game has
-    actually been created), ``ensure_game_id() -> str`` (creates the game on
-    first successful `NME`, not before -- see `DaideServer.start()`'s
-    docstring for why eager creation is actively harmful for this repo's
-    deploy pipeline), ``assign_power(game_id) -> Optional[str]``,
-    ``register(game_id, power, session) -> int``, ``try_reclaim(game_id,
-    power, passcode, session) -> bool``, ``unregister(game_id, power,
-    session) -> None``, ``deadline_seconds(game_id) -> Optional[int]``,
+    (a `GameService`), ``map`` (a `MapData`), ``open_game_id() ->
+    Optional[str]`` (the lobby game a new `NME` joins -- created on demand,
+    not before; see `DaideServer.start()`'s docstring for why eager creation
+    is actively harmful for this repo's deploy pipeline),
+    ``assign_power(game_id) -> Optional[str]``, ``register(game_id, power,
+    session) -> int``, ``reclaim(power, passcode, session) -> Optional[str]``,
+    ``unregister(game_id, power, session) -> None``,
+    ``phase_frames(game_id) -> Optional[PhaseFrames]``,
+    ``deadline_seconds(game_id) -> Optional[int]``,
     ``broadcast_draw_completion(game_id)``, ``broadcast_admin(game_id,
     from_name, message_tokens, exclude)``, ``relay_press(game_id, from_power,
     to_powers, message_tokens)``.
 
-    ``self.game_id`` starts out ``None`` (mirroring the server's
-    ``current_game_id`` at construction time -- already a real id if this is
-    a second-or-later connection after some earlier session's `NME` created
-    one) and is only ever set to a real id by a successful `_cmd_nme`/
-    `_cmd_iam`, at which point `self.power` is set in the same breath -- every
-    other command handler runs only once `self.power is not None` (the
-    dispatch gate in `_handle_diplomacy`), so by the time any of them read
-    ``self.game_id`` it is guaranteed to be a real id, not `None`.
+    ``self.game_id`` starts out as the server's ``current_game_id`` (its
+    newest game, or ``None``) and is only authoritative once a successful
+    `_cmd_nme`/`_cmd_iam` sets it -- which is also how the lobby routes a
+    connection to one of its games -- at which point `self.power` is set in
+    the same breath. Every other command handler runs only once
+    `self.power is not None` (the dispatch gate in `_handle_diplomacy`), so by
+    the time any of them read ``self.game_id`` it is guaranteed to be a real
+    id, not `None`.
     """
 
     def __init__(self, reader: Any, writer: Any, server: Any) -> None:
@@ -529,13 +571,18 @@ class DaideSession:
         self.client_name: str = ""
         self.client_version: str = ""
         self.passcode: Optional[int] = None
+        self.closed = False
+        # Outbound queue + the task draining it; both None until the handshake.
+        self._outbox: Optional[asyncio.Queue[Optional[bytes]]] = None
+        self._writer_task: Optional[asyncio.Task[None]] = None
 
     # -- connection lifecycle ----------------------------------------------
 
     async def run(self) -> None:
         """Handshake, then dispatch `DiplomacyMessage`s until the peer closes."""
+        frames_in = wire.FrameReader(self.reader)
         try:
-            initial = await wire.read_message(self.reader)
+            initial = await frames_in.read_message()
         except DaideWireError as exc:
             await self._safe_send_error(exc.code)
             return
@@ -549,10 +596,12 @@ class DaideSession:
         except (ConnectionError, OSError):
             return
 
+        self._outbox = asyncio.Queue(maxsize=OUTBOX_FRAMES)
+        self._writer_task = asyncio.create_task(self._drain_outbox())
         try:
-            while True:
+            while not self.closed:
                 try:
-                    msg = await wire.read_message(self.reader)
+                    msg = await frames_in.read_message()
                 except DaideWireError as exc:
                     await self._safe_send_error(exc.code)
                     break
@@ -570,12 +619,13 @@ class DaideSession:
                 break
         finally:
             self.server.unregister(self.game_id, self.power, self)
+            await self._stop_writer()
             with contextlib.suppress(Exception):
                 self.writer.close()
 
     async def _safe_send_error(self, code: wire.ErrorCode) -> None:
         with contextlib.suppress(ConnectionError, OSError):
-            await wire.write_message(self.writer, wire.ErrorMessage(code))
+            await self.send_frames([wire.ErrorMessage(code).to_bytes()])
 
     async def send_off(self) -> None:
         """Server-initiated shutdown notice (`DaideServer.stop()` calls this
@@ -584,13 +634,89 @@ class DaideSession:
             await self._send(t.OFF)
 
     async def _send(self, *tokens_: Token) -> None:
-        payload = b"".join(bytes(tok) for tok in tokens_)
-        await wire.write_message(self.writer, wire.DiplomacyMessage(payload=payload))
+        await self.send_frames([encode_frame(tokens_)])
+
+    async def send_frames(self, frames: Sequence[bytes]) -> None:
+        """Queue complete, already-encoded frames for this peer, in order.
+
+        Never waits on the socket once the writer task is running; a full queue
+        marks the peer a slow consumer and disconnects it instead. Broadcasts
+        hand every session the *same* ``bytes`` objects (see
+        `DaideServer.phase_frames`).
+        """
+        if self.closed:
+            return
+        if self._outbox is None:
+            for frame in frames:
+                self.writer.write(frame)
+            await self.writer.drain()
+            return
+        for frame in frames:
+            try:
+                self._outbox.put_nowait(frame)
+            except asyncio.QueueFull:
+                self._disconnect(f"outbound queue full ({OUTBOX_FRAMES} frames)")
+                return
+
+    async def _drain_outbox(self) -> None:
+        """Write whatever is queued as one burst -- a single ``write`` and
+        ``drain`` however many frames piled up since the last one."""
+        assert self._outbox is not None
+        stopping = False
+        while not stopping:
+            burst = [await self._outbox.get()]
+            while not self._outbox.empty():
+                burst.append(self._outbox.get_nowait())
+            if None in burst:
+                stopping = True
+                burst = burst[: burst.index(None)]
+            if not burst:
+                return
+            try:
+                await asyncio.wait_for(wire.write_frames(self.writer, burst), SEND_TIMEOUT_S)
+            except TimeoutError:
+                self._disconnect(f"socket not drained within {SEND_TIMEOUT_S:g}s")
+                return
+            except (ConnectionError, OSError):
+                self.closed = True
+                return
+
+    async def _stop_writer(self) -> None:
+        """Let the writer flush what's already queued (bounded by the send
+        timeout), then stop it."""
+        task, self._writer_task = self._writer_task, None
+        if task is None:
+            return
+        if not task.done() and self._outbox is not None:
+            with contextlib.suppress(asyncio.QueueFull):
+                self._outbox.put_nowait(None)
+        try:
+            await asyncio.wait_for(task, SEND_TIMEOUT_S)
+        except (TimeoutError, asyncio.CancelledError):
+            pass
+
+    def _disconnect(self, reason: str) -> None:
+        """Drop a slow consumer: free its power slot and abort the socket, which
+        also ends `run()`'s read loop."""
+        if self.closed:
+            return
+        self.closed = True
+        _logger.warning(
+            "DAIDE: disconnecting slow consumer %s (%s/%s): %s",
+            self.client_name or "?", self.game_id, self.power, reason,
+        )
+        self.server.unregister(self.game_id, self.power, self)
+        transport = getattr(self.writer, "transport", None)
+        if transport is not None:
+            transport.abort()
+        else:
+            with contextlib.suppress(Exception):
+                self.writer.close()
 
     # -- dispatch -------------------------------------------------------------
 
     async def _handle_diplomacy(self, payload: bytes) -> None:
-        tokens_ = [Token.from_bytes(payload[i : i + 2]) for i in range(0, len(payload), 2)]
+        tokens_ = t.decode_tokens(payload)
         if not tokens_:
             return
         if not _parens_balanced(tokens_):
@@ -606,25 +732,28 @@ class DaideSession:
         if handler is None:
             await self._send(t.HUH, t.OPEN_PAREN, command, t.ERR, *args, t.CLOSE_PAREN)
             return
+        started = time.perf_counter()
         try:
             await handler(self, args, tokens_)
         except SessionProtocolError:
             await self._send(t.HUH, t.OPEN_PAREN, command, t.ERR, *args, t.CLOSE_PAREN)
+        finally:
+            _COMMAND_SECONDS.labels(command.text).observe(time.perf_counter() - started)
 
     # -- command handlers -----------------------------------------------------
 
     async def _cmd_nme(self, args: list[Token], raw: list[Token]) -> None:
-        groups = _top_level_groups(args)
+        groups = top_level_groups(args)
         if len(groups) != 2:
             raise SessionProtocolError("NME needs (name) (version)")
         self.client_name = _text_of_tokens(groups[0])
         self.client_version = _text_of_tokens(groups[1])
-        # The game is created here, on the first successful NME -- not by
-        # DaideServer.start() or on merely accepting a connection. Idempotent
-        # (a no-op reuse) once some earlier session's NME already created it.
-        game_id = self.server.ensure_game_id()
-        power = self.server.assign_power(game_id)
-        if power is None:
+        # The lobby routes the connection here: the first hosted game with a
+        # free power, or a new one -- created on a successful NME, never by
+        # DaideServer.start() or on merely accepting a connection.
+        game_id = self.server.open_game_id()
+        power = self.server.assign_power(game_id) if game_id is not None else None
+        if game_id is None or power is None:
             await self._send(t.REJ, *_echo(raw))
             return
         self.game_id = game_id
@@ -633,23 +762,19 @@ class DaideSession:
         await self._send(*build_hlo_tokens(power, self.passcode))
 
     async def _cmd_iam(self, args: list[Token], raw: list[Token]) -> None:
-        groups = _top_level_groups(args)
+        groups = top_level_groups(args)
         if len(groups) != 2 or len(groups[0]) != 1 or not groups[1] or not groups[1][0].is_integer:
             raise SessionProtocolError("IAM needs (power) (passcode)")
-        game_id = self.server.current_game_id
-        if game_id is None:
-            # No NME has ever succeeded on this listener -- no game, no
-            # passcode was ever issued, nothing to reclaim. IAM never creates
-            # a game itself (only NME does; see ensure_game_id()'s docstring).
-            await self._send(t.REJ, *_echo(raw))
-            return
         try:
             power = t.engine_power_name(groups[0][0])
         except ValueError:
             await self._send(t.REJ, *_echo(raw))
             return
         passcode = int(groups[1][0])
-        if self.server.try_reclaim(game_id, power, passcode, self):
+        # Passcodes are unique per power across the lobby, so the pair names
+        # the game. IAM never creates a game itself (only NME does).
+        game_id = self.server.reclaim(power, passcode, self)
+        if game_id is not None:
             self.game_id = game_id
             self.power = power
             self.passcode = passcode
@@ -664,24 +789,26 @@ class DaideSession:
         await self._send(*build_mdf_tokens(self.server.map))
 
     async def _cmd_sco(self, args: list[Token], raw: list[Token]) -> None:
-        view = self.server.game_service.view(self.game_id)
-        ownership = view["ownership"] if view else {}
-        await self._send(*build_sco_tokens(ownership, self.server.map))
+        frames = await run_blocking(self.server.phase_frames, self.game_id)
+        if frames is None:
+            await self._send(*build_sco_tokens({}, self.server.map))
+            return
+        await self.send_frames([frames.sco])
 
     async def _cmd_now(self, args: list[Token], raw: list[Token]) -> None:
-        game = self.server.game_service.load(self.game_id)
-        if game is None:
+        frames = await run_blocking(self.server.phase_frames, self.game_id)
+        if frames is None:
             await self._send(t.REJ, *_echo(raw))
             return
-        await self._send(*build_now_tokens(game.state, self.server.map))
+        await self.send_frames([frames.now])
 
     async def _cmd_sub(self, args: list[Token], raw: list[Token]) -> None:
-        game = self.server.game_service.load(self.game_id)
+        game = await run_blocking(self.server.game_service.load, self.game_id)
         if game is None:
             await self._send(t.REJ, *_echo(raw))
             return
         try:
-            order_groups = _top_level_groups(args)
+            order_groups = top_level_groups(args)
         except SessionProtocolError:
             await self._send(t.HUH, t.OPEN_PAREN, t.SUB, t.ERR, *args, t.CLOSE_PAREN)
             return
@@ -702,7 +829,9 @@ class DaideSession:
 
         to_submit = [os for (_, os, err) in decoded if err is None and os is not None]
         results = (
-            self.server.game_service.submit_orders(self.game_id, self.power, to_submit) if to_submit else []
+            await run_blocking(self.server.game_service.submit_orders, self.game_id, self.power, to_submit)
+            if to_submit
+            else []
         )
         result_iter = iter(results)
         for clause_tokens, order_str, decode_err in decoded:
@@ -717,7 +846,7 @@ class DaideSession:
             await self._send(t.THX, *clause_tokens, t.OPEN_PAREN, note, t.CLOSE_PAREN)
 
     async def _cmd_not(self, args: list[Token], raw: list[Token]) -> None:
-        groups = _top_level_groups(args)
+        groups = top_level_groups(args)
         if len(groups) != 1 or not groups[0]:
             raise SessionProtocolError("NOT needs exactly one wrapped sub-command")
         sub_cmd = groups[0][0]
@@ -725,12 +854,12 @@ class DaideSession:
             # Cancelling one specific order isn't supported -- always clears
             # every pending order this power has submitted this phase (see
             # the module docstring's scope-limitation note).
-            self.server.game_service.clear_orders(self.game_id, self.power)
+            await run_blocking(self.server.game_service.clear_orders, self.game_id, self.power)
             await self._send(t.YES, *_echo(raw))
         elif sub_cmd == t.GOF:
             await self._send(t.YES, *_echo(raw))  # no ready-gate to cancel; ack only
         elif sub_cmd == t.DRW:
-            self.server.game_service.submit_draw_vote(self.game_id, self.power, False)
+            await run_blocking(self.server.game_service.submit_draw_vote, self.game_id, self.power, False)
             await self._send(t.YES, *_echo(raw))
         else:
             # Includes NOT(TME): this codebase has no scheduled TME push to
@@ -742,10 +871,13 @@ class DaideSession:
         await self._send(t.YES, *_echo(raw))
 
     async def _cmd_mis(self, args: list[Token], raw: list[Token]) -> None:
-        await self._send(*build_mis_tokens(self.server.game_service, self.server.map, self.game_id, self.power))
+        tokens_ = await run_blocking(
+            build_mis_tokens, self.server.game_service, self.server.map, self.game_id, self.power
+        )
+        await self._send(*tokens_)
 
     async def _cmd_tme(self, args: list[Token], raw: list[Token]) -> None:
-        seconds = self.server.deadline_seconds(self.game_id)
+        seconds = await run_blocking(self.server.deadline_seconds, self.game_id)
         value = -1 if seconds is None else max(0, min(8191, seconds))
         await self._send(t.TME, t.OPEN_PAREN, Token.from_int(value), t.CLOSE_PAREN)
 
@@ -769,7 +901,7 @@ class DaideSession:
         A well-formed request is still acknowledged as a *rejection*, not
         silently dropped or answered with a guess.
         """
-        groups = _top_level_groups(args)
+        groups = top_level_groups(args)
         if len(groups) != 1:
             raise SessionProtocolError("HST needs (turn)")
         try:
@@ -779,20 +911,20 @@ class DaideSession:
         await self._send(t.REJ, *_echo(raw))
 
     async def _cmd_drw(self, args: list[Token], raw: list[Token]) -> None:
-        result = self.server.game_service.submit_draw_vote(self.game_id, self.power, True)
+        result = await run_blocking(self.server.game_service.submit_draw_vote, self.game_id, self.power, True)
         await self._send(t.YES, *_echo(raw))
         if result.get("quorum_reached"):
             await self.server.broadcast_draw_completion(self.game_id)
 
     async def _cmd_adm(self, args: list[Token], raw: list[Token]) -> None:
-        groups = _top_level_groups(args)
+        groups = top_level_groups(args)
         if len(groups) != 2:
             raise SessionProtocolError("ADM needs (name) (message)")
         name_text = _text_of_tokens(groups[0])
         await self.server.broadcast_admin(self.game_id, name_text, groups[1], exclude=self)
 
     async def _cmd_snd(self, args: list[Token], raw: list[Token]) -> None:
-        groups = _top_level_groups(args)
+        groups = top_level_groups(args)
         if len(groups) < 2:
             raise SessionProtocolError("SND needs (power power ...) (press message)")
         to_powers: list[str] = []
@@ -43,10 +43,23 @@ already spoken for elsewhere in the vocabulary:
 
 ``daide_province_token()`` applies that translation; everywhere else, an
 engine province code and its DAIDE token string are identical.
+
+## Bulk codec
+
+`decode_tokens()` turns a whole diplomacy payload into its token list in one
+pass: the payload is read through a ``memoryview`` as big-endian 16-bit codes
+(no per-token ``bytes`` slice) and each code indexes a 65,536-entry list
+holding the `Token` every possible 2-byte value decodes to (``None`` where none
+does). The table is built once, on first decode rather than at import (it is
+~16K `Token` objects, tens of milliseconds). `Token.from_bytes` uses the same
+table. `encode_tokens()` is the matching one-join encoder.
 """
 
 from __future__ import annotations
 
+import functools
+import struct
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Optional
 
@@ -124,9 +137,17 @@ class Token:
     @staticmethod
     def from_bytes(raw: bytes) -> "Token":
         """Decode 2 raw bytes into a named token, ASCII escape, or integer."""
-        raw = bytes(raw)
         if len(raw) != 2:
-            raise ValueError(f"a DAIDE token is exactly 2 bytes, got {raw!r}")
+            raise ValueError(f"a DAIDE token is exactly 2 bytes, got {bytes(raw)!r}")
+        token = _decode_table()[0][(raw[0] << 8) | raw[1]]
+        if token is None:
+            raise ValueError(f"{bytes(raw)!r} does not decode to a known token, escape, or integer")
+        return token
+
+    @staticmethod
+    def _decode_slow(raw: bytes) -> Optional["Token"]:
+        """What 2 raw bytes decode to, from first principles -- used once per
+        code to build `_decode_table()`."""
         known = _BYTES_TO_TOKEN.get(raw)
         if known is not None:
             return known
@@ -135,7 +156,7 @@ class Token:
         if raw[0] < 0x40:
             number = _decode_int14(raw)
             return Token(text=str(number), raw=raw, number=number)
-        raise ValueError(f"{raw!r} does not decode to a known token, escape, or integer")
+        return None
 
 
 def _register(text: str, byte0: int, byte1: int) -> Token:
@@ -768,3 +789,38 @@ def verify_standard_map_coverage() -> None:
 
 
 ALL_TOKENS: tuple[Token, ...] = tuple(_STR_TO_TOKEN.values())
+
+
+# ---------------------------------------------------------------------------
+# Bulk codec (see the module docstring's "Bulk codec")
+# ---------------------------------------------------------------------------
+
+@functools.cache
+def _decode_table() -> tuple[list[Optional[Token]], frozenset[int]]:
+    """Every possible 16-bit code -> the Token it decodes to (or None), plus the
+    set of codes that decode at all. Only ever called after every `_register`
+    above, so named tokens win over escapes/integers."""
+    table = [Token._decode_slow(code.to_bytes(2, "big")) for code in range(0x10000)]
+    return table, frozenset(code for code, token in enumerate(table) if token is not None)
+
+
+def decode_tokens(payload: bytes | bytearray | memoryview) -> list[Token]:
+    """Decode a whole diplomacy payload into its tokens in one pass.
+
+    Raises ``ValueError`` for an odd-length payload or any 2-byte code that is
+    not a named token, ASCII escape, or integer.
+    """
+    view = memoryview(payload)
+    if len(view) % 2:
+        raise ValueError(f"a DAIDE token stream has even length, got {len(view)}")
+    table, valid = _decode_table()
+    codes = struct.unpack(f">{len(view) // 2}H", view)
+    if not valid.issuperset(codes):
+        bad = next(code for code in codes if code not in valid)
+        raise ValueError(f"{bad.to_bytes(2, 'big')!r} does not decode to a known token, escape, or integer")
+    return list(map(table.__getitem__, codes))  # type: ignore[arg-type]
+
+
+def encode_tokens(tokens: Iterable[Token]) -> bytes:
+    """The wire bytes of a token stream (the inverse of `decode_tokens`)."""
+    return b"".join([tok.raw for tok in tokens])
@@ -25,6 +25,12 @@ Five message types make up the handshake and payload exchange:
 - `ErrorMessage` -- a framing-level protocol violation, carrying an
   `ErrorCode` the recipient can log or use to close the connection cleanly.
 
+`read_message`/`write_message` handle one frame per call. The session loop
+uses the batched forms instead: a `FrameReader` pulls whatever bytes have
+arrived in one ``read()`` and parses every complete frame out of its buffer
+(rather than two ``readexactly`` awaits per frame), and `write_messages` /
+`write_frames` put a burst of frames on the wire with a single ``drain()``.
+
 This module is written against `asyncio.StreamReader`/`StreamWriter` because
 the DAIDE listener (Track D's D4) is asyncio-based -- see
 `docs/specs/done_fixes.md`'s Track D Ground Rules for why Tornado (which
@@ -34,6 +40,7 @@ the DAIDE listener (Track D's D4) is asyncio-based -- see
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from enum import IntEnum
 
@@ -42,6 +49,7 @@ MAGIC_NUMBER = 0xDA10
 _SWAPPED_MAGIC_NUMBER = 0x10DA  # what MAGIC_NUMBER looks like on a wrong-endian peer
 
 _HEADER_LENGTH = 4
+_READ_CHUNK = 64 * 1024
 
 
 class MessageType(IntEnum):
@@ -186,6 +194,20 @@ def _decode_error(payload: bytes) -> ErrorMessage:
     return ErrorMessage(code=ErrorCode(payload[1]))
 
 
+def _decode(message_type: int, payload: bytes) -> Message:
+    if message_type == MessageType.INITIAL:
+        return _decode_initial(payload)
+    if message_type == MessageType.REPRESENTATION:
+        return RepresentationMessage()
+    if message_type == MessageType.DIPLOMACY:
+        return _decode_diplomacy(payload)
+    if message_type == MessageType.FINAL:
+        return FinalMessage()
+    if message_type == MessageType.ERROR:
+        return _decode_error(payload)
+    raise ValueError(f"unknown DAIDE message type byte {message_type}")
+
+
 async def read_message(reader: asyncio.StreamReader) -> Message:
     """Read one complete DCSP frame off ``reader``.
 
@@ -201,22 +223,69 @@ async def read_message(reader: asyncio.StreamReader) -> Message:
     header = await reader.readexactly(_HEADER_LENGTH)
     length = (header[2] << 8) | header[3]
     payload = await reader.readexactly(length) if length else b""
+    return _decode(header[0], payload)
 
-    message_type = header[0]
-    if message_type == MessageType.INITIAL:
-        return _decode_initial(payload)
-    if message_type == MessageType.REPRESENTATION:
-        return RepresentationMessage()
-    if message_type == MessageType.DIPLOMACY:
-        return _decode_diplomacy(payload)
-    if message_type == MessageType.FINAL:
-        return FinalMessage()
-    if message_type == MessageType.ERROR:
-        return _decode_error(payload)
-    raise ValueError(f"unknown DAIDE message type byte {message_type}")
+
+class FrameReader:
+    """Buffered `read_message`: one ``reader.read()`` per burst of arrived bytes.
+
+    Frames already sitting in the buffer are returned without touching the
+    stream at all, so a client flooding ``SUB``s costs one await per TCP
+    read, not two per frame. Same errors as `read_message`, including
+    `asyncio.IncompleteReadError` when the stream ends mid-frame (or at a
+    frame boundary -- an empty ``partial``).
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, chunk_size: int = _READ_CHUNK) -> None:
+        self._reader = reader
+        self._chunk_size = chunk_size
+        self._buffer = bytearray()
+        self._pos = 0
+
+    def _next_frame(self) -> tuple[int, bytes] | None:
+        buffer, pos = self._buffer, self._pos
+        if len(buffer) - pos < _HEADER_LENGTH:
+            return None
+        end = pos + _HEADER_LENGTH + ((buffer[pos + 2] << 8) | buffer[pos + 3])
+        if len(buffer) < end:
+            return None
+        with memoryview(buffer) as view:
+            payload = bytes(view[pos + _HEADER_LENGTH : end])
+        message_type = buffer[pos]
+        if end == len(buffer):
+            buffer.clear()
+            self._pos = 0
+        elif end > _READ_CHUNK:
+            del buffer[:end]
+            self._pos = 0
+        else:
+            self._pos = end
+        return message_type, payload
+
+    async def read_message(self) -> Message:
+        while True:
+            frame = self._next_frame()
+            if frame is not None:
+                return _decode(*frame)
+            chunk = await self._reader.read(self._chunk_size)
+            if not chunk:
+                partial = bytes(self._buffer[self._pos :])
+                raise asyncio.IncompleteReadError(partial, None)
+            self._buffer += chunk
 
 
 async def write_message(writer: asyncio.StreamWriter, message: Message) -> None:
     """Write one complete DCSP frame to ``writer`` and flush it."""
     writer.write(message.to_bytes())
     await writer.drain()
+
+
+async def write_frames(writer: asyncio.StreamWriter, frames: Iterable[bytes]) -> None:
+    """Write already-encoded frames in one ``write`` and flush once."""
+    writer.write(b"".join(frames))
+    await writer.drain()
+
+
+async def write_messages(writer: asyncio.StreamWriter, messages: Iterable[Message]) -> None:
+    """Write a burst of complete DCSP frames to ``writer`` with a single flush."""
+    await write_frames(writer, [message.to_bytes() for message in messages])
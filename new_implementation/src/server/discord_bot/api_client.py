@@ -1,34 +1,46 @@
 """
 API client for Discord bot - calls the same Diplomacy backend as the Telegram bot.
+
+Uses the same ``PooledAsyncClient`` class as the Telegram bot
+(``server.async_http``), with its own connection pool, so commands await the
+API on the bot's event loop instead of a worker thread.
 """
 import logging
-import requests
 from typing import Any
 
+import httpx
+
+from ..async_http import PooledAsyncClient
 from .config import API_URL
 
 logger = logging.getLogger("diplomacy.discord_bot.api_client")
 
+DEFAULT_API_TIMEOUT = 10
+
+_pool = PooledAsyncClient(API_URL, default_timeout=DEFAULT_API_TIMEOUT)
+
+
+def _endpoint(endpoint: str) -> str:
+    return endpoint if endpoint.startswith("/") else f"/{endpoint}"
+
 
-def api_get(endpoint: str) -> Any:
+async def api_get(endpoint: str) -> Any:
     """GET request to the Diplomacy API."""
-    url = f"{API_URL}{endpoint}" if endpoint.startswith("/") else f"{API_URL}/{endpoint}"
     try:
-        resp = requests.get(url, timeout=10)
+        resp = await _pool.request("GET", _endpoint(endpoint))
         resp.raise_for_status()
         return resp.json()
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         logger.warning(f"API GET {endpoint}: {e}")
         raise
 
 
-def api_post(endpoint: str, json_data: dict) -> Any:
+async def api_post(endpoint: str, json_data: dict) -> Any:
     """POST request to the Diplomacy API."""
-    url = f"{API_URL}{endpoint}" if endpoint.startswith("/") else f"{API_URL}/{endpoint}"
     try:
-        resp = requests.post(url, json=json_data, timeout=10)
+        resp = await _pool.request("POST", _endpoint(endpoint), json=json_data)
         resp.raise_for_status()
         return resp.json()
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         logger.warning(f"API POST {endpoint}: {e}")
         raise
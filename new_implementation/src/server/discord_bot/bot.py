@@ -2,7 +2,6 @@
 Discord bot - commands mirror core Telegram bot functionality using the same API.
 """
 import logging
-import asyncio
 from typing import Optional
 
 import discord
@@ -37,7 +36,7 @@ def create_bot() -> commands.Bot:
     @bot.command(name="games", help="List all games (from API)")
     async def cmd_games(ctx: commands.Context) -> None:
         try:
-            data = await asyncio.to_thread(api_get, "/games")
+            data = await api_get("/games")
             games_list = data.get("games", [])
             if not games_list:
                 await ctx.send("No games found.")
@@ -64,7 +63,7 @@ def create_bot() -> commands.Bot:
             await ctx.send("Usage: !status <game_id>")
             return
         try:
-            data = await asyncio.to_thread(api_get, f"/games/{game_id}/state")
+            data = await api_get(f"/games/{game_id}/state")
             game_id_val = data.get("game_id", game_id)
             phase_code = data.get("phase_code", "")
             year = data.get("current_year", 1901)
@@ -0,0 +1,56 @@
+"""
+Strong ETags and ``If-None-Match`` handling for the polled GET routes.
+
+The web client polls ``/games/{id}/state`` and the bots re-fetch state, legal
+orders and map PNGs over and over, almost always getting back exactly what they
+already have. Those routes now answer with an ``ETag`` and, when the client
+sends it back in ``If-None-Match``, with an empty ``304 Not Modified``.
+
+The decision has to be cheap to be worth anything, so an ETag is never a digest
+of the response body: it is a digest of what the body is *derived from* --
+the game's row identity, ``phase_code`` and the ``state_version`` /
+``orders_version`` counters ``GameRepo`` bumps on every write (see
+``GameRepo.get_version``), plus the route's own parameters (power, render
+kind, ...). Reading those is one narrow column query; the ``state_json`` decode,
+order humanising and map render only happen on a miss.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any
+
+from fastapi import Request
+from fastapi.responses import Response
+
+
+def strong_etag(*parts: Any) -> str:
+    """A quoted strong ETag digesting ``parts`` (JSON-encoded, keys sorted)."""
+    blob = json.dumps(parts, sort_keys=True, default=str).encode()
+    return '"' + hashlib.sha256(blob).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an ``If-None-Match`` header value names ``etag``.
+
+    Accepts a comma-separated list and ``*``; a weak ``W/`` prefix is ignored
+    (RFC 9110 uses weak comparison for ``If-None-Match``).
+    """
+    if not if_none_match:
+        return False
+    candidates = {c.strip().removeprefix("W/") for c in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
+
+
+def etag_headers(etag: str) -> dict[str, str]:
+    """Headers for a conditional response. ``no-cache`` means "revalidate every
+    time", so a browser's own HTTP cache sends ``If-None-Match`` on the SPA's
+    behalf and hands the poller the cached body when the server says 304."""
+    return {"ETag": etag, "Cache-Control": "no-cache"}
+
+
+def not_modified(request: Request, etag: str) -> Response | None:
+    """An empty ``304`` carrying ``etag`` if the client already holds it, else ``None``."""
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=etag_headers(etag))
+    return None
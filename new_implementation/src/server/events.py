@@ -0,0 +1,361 @@
+"""
+In-process pub/sub for game events, served to browsers as Server-Sent Events.
+
+An open game page used to learn about a processed turn, a submitted order or a
+new message only by re-fetching. ``GameService`` (turns, orders, draw votes,
+concessions, restores) and the message routes now ``publish`` a small event
+here, and ``GET /games/{id}/events`` (``api/routes/events.py``) streams them to
+every subscriber of that game. Events carry no private data -- a client that
+cares re-fetches the authorised route it already uses -- so the stream itself
+needs no auth.
+
+- **Resumable.** Every event has an increasing integer ``id`` (microseconds
+  since the epoch, strictly increasing per process). The bus keeps the last
+  ``history`` events per game; a reconnecting ``EventSource`` sends
+  ``Last-Event-ID`` and gets what it missed. If that id is older than what
+  this process still holds (evicted, or from before a restart), it gets a
+  single ``resync`` event instead: refetch everything.
+- **Bounded.** Each subscriber buffers at most ``max_buffer`` undelivered
+  events. A consumer that falls further behind (a stalled tab, a slow proxy)
+  has its backlog dropped and gets ``resync`` -- one slow client can't make the
+  server hold an unbounded queue.
+- **Thread-safe publish.** Sync routes run in FastAPI's threadpool, so
+  ``publish`` may be called from any thread; delivery hops onto each
+  subscriber's event loop with ``call_soon_threadsafe``.
+
+With several uvicorn workers a publish only reaches subscribers connected to
+the same process. ``PostgresEventBridge`` (opt-in, ``DIPLOMACY_EVENTS_PG_BRIDGE``)
+forwards every local publish through ``pg_notify`` and feeds other workers'
+events into the local bus via ``LISTEN``.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import select
+import threading
+import time
+import uuid
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger("diplomacy.server.events")
+
+DEFAULT_HISTORY = 256
+DEFAULT_MAX_BUFFER = 64
+
+RESYNC = "resync"
+
+
+@dataclass(frozen=True)
+class GameEvent:
+    id: int
+    game_id: str
+    type: str
+    data: dict[str, Any] = field(default_factory=dict)
+
+    def to_sse(self) -> str:
+        """The event as one ``text/event-stream`` frame."""
+        payload = json.dumps({"game_id": self.game_id, **self.data}, default=str)
+        return f"id: {self.id}\nevent: {self.type}\ndata: {payload}\n\n"
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"id": self.id, "game_id": self.game_id, "type": self.type, "data": self.data}
+
+    @classmethod
+    def from_dict(cls, d: dict[str, Any]) -> GameEvent:
+        return cls(id=int(d["id"]), game_id=str(d["game_id"]), type=str(d["type"]), data=dict(d.get("data") or {}))
+
+
+class Subscription:
+    """One consumer's bounded queue of a game's events. Create via ``GameEventBus.subscribe``.
+
+    All queue state is touched on ``loop`` only (deliveries arrive through
+    ``call_soon_threadsafe``), so it needs no lock of its own.
+    """
+
+    def __init__(
+        self, bus: GameEventBus, game_id: str, loop: asyncio.AbstractEventLoop, max_buffer: int
+    ) -> None:
+        self.game_id = game_id
+        self.max_buffer = max_buffer
+        self._bus = bus
+        self._loop = loop
+        self._queue: deque[GameEvent] = deque()
+        self._ready = asyncio.Event()
+        self._resync_id: int | None = None
+        self.closed = False
+        self.dropped = 0
+
+    def _deliver(self, event: GameEvent) -> None:
+        if self.closed:
+            return
+        if len(self._queue) >= self.max_buffer:
+            # Too far behind: drop the backlog, tell the client to refetch.
+            self.dropped += len(self._queue) + 1
+            self._queue.clear()
+            self._resync_id = event.id
+        elif self._resync_id is not None:
+            self._resync_id = event.id
+        else:
+            self._queue.append(event)
+        self._ready.set()
+
+    def _request_resync(self, event_id: int) -> None:
+        self._queue.clear()
+        self._resync_id = event_id
+        self._ready.set()
+
+    async def get(self, timeout: float | None = None) -> GameEvent | None:
+        """The next event, or ``None`` if ``timeout`` passes first (send a keep-alive)."""
+        while True:
+            if self._resync_id is not None:
+                event_id, self._resync_id = self._resync_id, None
+                return GameEvent(id=event_id, game_id=self.game_id, type=RESYNC)
+            if self._queue:
+                return self._queue.popleft()
+            self._ready.clear()
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except TimeoutError:
+                return None
+
+    def close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            self._bus._unsubscribe(self)
+
+
+class GameEventBus:
+    """Per-game event history plus live subscribers; see the module docstring."""
+
+    def __init__(
+        self,
+        history: int = DEFAULT_HISTORY,
+        max_buffer: int = DEFAULT_MAX_BUFFER,
+        clock: Callable[[], int] = time.time_ns,
+    ) -> None:
+        """
+        Args:
+            history: Events kept per game for ``Last-Event-ID`` replay.
+            max_buffer: Default per-subscriber backlog before it is resynced.
+            clock: Nanosecond wall clock the event ids derive from (tests fake it).
+        """
+        self.history = history
+        self.max_buffer = max_buffer
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._last_id = 0
+        self._events: dict[str, deque[GameEvent]] = {}
+        self._evicted_through: dict[str, int] = {}
+        self._subscribers: dict[str, set[Subscription]] = {}
+        # Ids at or before this were issued before the bus existed: unknown.
+        self._epoch = self._next_id()
+        self.forward: Callable[[GameEvent], None] | None = None
+
+    def _next_id(self) -> int:
+        self._last_id = max(self._last_id + 1, self._clock() // 1000)
+        return self._last_id
+
+    def publish(
+        self, game_id: str, event_type: str, data: dict[str, Any] | None = None
+    ) -> GameEvent:
+        """Record ``event_type`` for ``game_id`` and fan it out; safe from any thread.
+
+        Also hands the event to ``forward`` (the Postgres bridge) when one is
+        attached. Never raises on a subscriber problem.
+        """
+        with self._lock:
+            event = GameEvent(
+                id=self._next_id(), game_id=str(game_id), type=event_type, data=dict(data or {})
+            )
+        self.deliver(event)
+        if self.forward is not None:
+            try:
+                self.forward(event)
+            except Exception as e:
+                logger.warning(f"Failed to forward game event {event.type} for {event.game_id}: {e}")
+        return event
+
+    def deliver(self, event: GameEvent) -> None:
+        """Record and fan out an already-numbered event (the bridge's entry point)."""
+        with self._lock:
+            self._last_id = max(self._last_id, event.id)
+            events = self._events.setdefault(event.game_id, deque())
+            if events and events[-1].id > event.id:
+                # From another worker, slightly out of order: keep history sorted.
+                ordered = sorted([*events, event], key=lambda e: e.id)
+                events.clear()
+                events.extend(ordered)
+            else:
+                events.append(event)
+            while len(events) > self.history:
+                self._evicted_through[event.game_id] = events.popleft().id
+            subscribers = list(self._subscribers.get(event.game_id, ()))
+        for sub in subscribers:
+            try:
+                sub._loop.call_soon_threadsafe(sub._deliver, event)
+            except RuntimeError:
+                # The subscriber's loop is gone (closed without unsubscribing).
+                sub.closed = True
+                self._unsubscribe(sub)
+
+    def subscribe(
+        self, game_id: str, last_event_id: int | None = None, max_buffer: int | None = None
+    ) -> Subscription:
+        """Start receiving ``game_id``'s events; call from the consuming event loop.
+
+        With ``last_event_id`` the events published after it are queued first,
+        or a single ``resync`` if they can no longer all be replayed.
+        """
+        game_id = str(game_id)
+        sub = Subscription(self, game_id, asyncio.get_running_loop(), max_buffer or self.max_buffer)
+        with self._lock:
+            self._subscribers.setdefault(game_id, set()).add(sub)
+            if last_event_id is not None:
+                missed = [e for e in self._events.get(game_id, ()) if e.id > last_event_id]
+                horizon = max(self._epoch, self._evicted_through.get(game_id, 0))
+                if last_event_id < horizon:
+                    sub._request_resync(missed[-1].id if missed else self._last_id)
+                else:
+                    for event in missed:
+                        sub._deliver(event)
+        return sub
+
+    def _unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            subs = self._subscribers.get(sub.game_id)
+            if subs is not None:
+                subs.discard(sub)
+                if not subs:
+                    del self._subscribers[sub.game_id]
+
+    def subscriber_count(self, game_id: str | None = None) -> int:
+        with self._lock:
+            if game_id is not None:
+                return len(self._subscribers.get(str(game_id), ()))
+            return sum(len(s) for s in self._subscribers.values())
+
+
+class PostgresEventBridge:
+    """Relays a ``GameEventBus`` across processes with Postgres ``LISTEN``/``NOTIFY``.
+
+    Local publishes go out through ``pg_notify`` (payloads are a few hundred
+    bytes, well under the 8000-byte limit); a daemon thread ``LISTEN``s on the
+    same channel and ``deliver``s other processes' events into the local bus.
+    Each bridge tags its notifications with a random origin so it skips its
+    own. Uses ``psycopg2`` directly -- two dedicated autocommit connections,
+    outside the SQLAlchemy pool.
+    """
+
+    def __init__(self, bus: GameEventBus, dsn: str, channel: str = "diplomacy_game_events") -> None:
+        self.bus = bus
+        self.dsn = dsn
+        self.channel = channel
+        self.origin = uuid.uuid4().hex
+        self._notify_conn: Any = None
+        self._notify_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @staticmethod
+    def dsn_from_url(url: str) -> str:
+        """A libpq DSN from a SQLAlchemy URL (``postgresql+psycopg2://...``)."""
+        from sqlalchemy.engine import make_url
+
+        return make_url(url).set(drivername="postgresql").render_as_string(hide_password=False)
+
+    def _connect(self) -> Any:
+        import psycopg2
+        import psycopg2.extensions
+
+        conn = psycopg2.connect(self.dsn)
+        conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+        return conn
+
+    def start(self) -> None:
+        """Attach to the bus and start listening (idempotent)."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        listening = threading.Event()
+        self._thread = threading.Thread(
+            target=self._listen, args=(listening,), name="game-events-listen", daemon=True
+        )
+        self._thread.start()
+        listening.wait(timeout=5)
+        self.bus.forward = self.notify
+
+    def stop(self) -> None:
+        if self.bus.forward == self.notify:
+            self.bus.forward = None
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        with self._notify_lock:
+            if self._notify_conn is not None:
+                self._notify_conn.close()
+                self._notify_conn = None
+
+    def notify(self, event: GameEvent) -> None:
+        payload = json.dumps({"origin": self.origin, **event.to_dict()}, default=str)
+        with self._notify_lock:
+            for attempt in range(2):
+                try:
+                    if self._notify_conn is None or self._notify_conn.closed:
+                        self._notify_conn = self._connect()
+                    with self._notify_conn.cursor() as cur:
+                        cur.execute("SELECT pg_notify(%s, %s)", (self.channel, payload))
+                    return
+                except Exception:
+                    # A dropped connection: reconnect once, then give up on this event.
+                    self._notify_conn = None
+                    if attempt:
+                        raise
+
+    def _handle(self, payload: str) -> None:
+        try:
+            message = json.loads(payload)
+            if message.get("origin") == self.origin:
+                return
+            self.bus.deliver(GameEvent.from_dict(message))
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring malformed game event notification: {e}")
+
+    def _listen(self, listening: threading.Event) -> None:
+        delay = 1.0
+        while not self._stop.is_set():
+            conn = None
+            try:
+                conn = self._connect()
+                with conn.cursor() as cur:
+                    cur.execute(f'LISTEN "{self.channel}"')
+                listening.set()
+                delay = 1.0
+                while not self._stop.is_set():
+                    if select.select([conn], [], [], 1.0) == ([], [], []):
+                        continue
+                    conn.poll()
+                    while conn.notifies:
+                        self._handle(conn.notifies.pop(0).payload)
+            except Exception as e:
+                logger.warning(f"Game event listener lost its connection ({e}); retrying in {delay:.0f}s")
+                self._stop.wait(delay)
+                delay = min(delay * 2, 30.0)
+            finally:
+                if conn is not None:
+                    conn.close()
+
+
+def bridge_enabled() -> bool:
+    """Whether ``DIPLOMACY_EVENTS_PG_BRIDGE`` asks for the cross-worker bridge."""
+    return os.environ.get("DIPLOMACY_EVENTS_PG_BRIDGE", "").strip().lower() in ("1", "true", "yes")
+
+
+# The process-wide bus: GameService and the message routes publish here.
+game_events = GameEventBus()
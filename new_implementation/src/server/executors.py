@@ -0,0 +1,239 @@
+"""
+Bounded executors for blocking work called from ``async def`` code.
+
+The API's async routes, the DAIDE sessions and the deadline scheduler all run
+on the worker's one event loop. A synchronous ``GameService`` call made
+directly from any of them (``process_turn`` is a load, an adjudication and a
+commit; the scheduler processes every due game in one go) stalls every other
+request and every DAIDE connection on that worker until it returns.
+``run_blocking`` hands the call to a shared pool instead and awaits the
+result::
+
+    result = await run_blocking(game_service.process_turn, game_id, post_turn=post_turn)
+
+- **Two pools.** ``kind="io"`` (the default) is a thread pool of
+  ``DIPLOMACY_BLOCKING_THREADS`` threads (default 16, about the sync
+  SQLAlchemy pool's 5 + 10 overflow connections), for anything that talks to
+  the database or the network. ``kind="cpu"`` is a spawn-context process pool
+  of ``DIPLOMACY_CPU_WORKERS`` processes (falling back to
+  ``DIPLOMACY_ODDS_WORKERS``) for pure, picklable work such as order-odds
+  sampling; with no workers configured it runs on the thread pool.
+- **Bounded.** Each pool runs at most its worker count at once; the rest wait
+  in its queue, so a burst of turns queues rather than opening more database
+  connections than the engine's pool holds.
+- **Observable.** Each pool counts submitted, completed, failed and cancelled
+  calls, the current queue depth, and how long calls waited for a worker
+  (total and max). ``executor_stats()`` returns them (``GET
+  /admin/executor_stats``).
+- **Context-preserving.** Like ``asyncio.to_thread``, a thread-pool call
+  runs in a copy of the caller's ``contextvars`` context, so per-request
+  state (the request's statement tally, ``persistence.engine``) follows it.
+- **Restartable.** ``shutdown_executors()`` (API lifespan exit) waits for
+  calls in flight; the next ``run_blocking`` creates fresh pools, so test
+  clients that enter the lifespan more than once keep working.
+
+``process_turn`` runs on the thread pool, not the process pool: its
+adjudication is a few milliseconds between a load and a commit on the
+caller's ``GameService``, and neither the service nor its session factory can
+cross a process boundary.
+"""
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from multiprocessing import get_context
+from typing import Any
+
+__all__ = [
+    "BlockingPool",
+    "cpu_pool",
+    "executor_stats",
+    "io_pool",
+    "run_blocking",
+    "shutdown_executors",
+]
+
+DEFAULT_BLOCKING_THREADS = 16
+
+
+@dataclass
+class BlockingPoolStats:
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    cancelled: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+    run_seconds_total: float = 0.0
+
+
+def _timed_call[T](fn: Callable[..., T], args: tuple[Any, ...], kwargs: dict[str, Any]) -> tuple[float, T]:
+    # Module-level so a process pool can pickle it; wall-clock time so the
+    # start can be compared with a submit time taken in another process.
+    started = time.time()
+    return started, fn(*args, **kwargs)
+
+
+class _PoolFuture(Future):
+    """The caller's view of a call: the result without the timing wrapper.
+    Cancelling it cancels the underlying call if it has not started."""
+
+    def __init__(self, inner: Future) -> None:
+        super().__init__()
+        self._inner = inner
+
+    def cancel(self) -> bool:
+        # The inner future's done callback cancels this one.
+        return self._inner.cancel()
+
+
+class BlockingPool(Executor):
+    """A thread or process pool that records queue depth and wait times.
+
+    An ``Executor`` in its own right, so it can be passed wherever one is
+    expected (``loop.run_in_executor``, ``odds.estimate_order_odds``).
+    """
+
+    def __init__(self, name: str, executor: Executor, max_workers: int) -> None:
+        self.name = name
+        self._executor = executor
+        self._max_workers = max_workers
+        self.stats = BlockingPoolStats()
+        self._lock = threading.Lock()
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    @property
+    def in_flight(self) -> int:
+        """Calls submitted and not yet finished (running or queued)."""
+        s = self.stats
+        return s.submitted - s.completed - s.failed - s.cancelled
+
+    @property
+    def queued(self) -> int:
+        """Calls waiting for a free worker."""
+        return max(0, self.in_flight - self._max_workers)
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        submitted = time.time()
+        inner = self._executor.submit(_timed_call, fn, args, kwargs)
+        with self._lock:
+            self.stats.submitted += 1
+        outer = _PoolFuture(inner)
+        inner.add_done_callback(lambda f: self._finished(f, outer, submitted))
+        return outer
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            stats = asdict(self.stats)
+        finished = stats["completed"] + stats["failed"]
+        return {
+            "kind": self.name,
+            "max_workers": self._max_workers,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            **stats,
+            "wait_seconds_mean": stats["wait_seconds_total"] / finished if finished else 0.0,
+        }
+
+    def _finished(self, inner: Future, outer: _PoolFuture, submitted: float) -> None:
+        if inner.cancelled():
+            with self._lock:
+                self.stats.cancelled += 1
+            Future.cancel(outer)
+            outer.set_running_or_notify_cancel()
+            return
+        error = inner.exception()
+        if error is not None:
+            with self._lock:
+                self.stats.failed += 1
+            outer.set_exception(error)
+            return
+        started, result = inner.result()
+        now = time.time()
+        waited = max(0.0, started - submitted)
+        with self._lock:
+            self.stats.completed += 1
+            self.stats.wait_seconds_total += waited
+            self.stats.wait_seconds_max = max(self.stats.wait_seconds_max, waited)
+            self.stats.run_seconds_total += max(0.0, now - started)
+        outer.set_result(result)
+
+
+_io_pool: BlockingPool | None = None
+_cpu_pool: BlockingPool | None = None
+_pools_lock = threading.Lock()
+
+
+def _env_int(name: str, default: int) -> int:
+    return int(os.environ.get(name, str(default)) or default)
+
+
+def io_pool() -> BlockingPool:
+    """The shared thread pool for database and network calls."""
+    global _io_pool
+    with _pools_lock:
+        if _io_pool is None:
+            threads = max(1, _env_int("DIPLOMACY_BLOCKING_THREADS", DEFAULT_BLOCKING_THREADS))
+            _io_pool = BlockingPool(
+                "io", ThreadPoolExecutor(max_workers=threads, thread_name_prefix="blocking"), threads
+            )
+        return _io_pool
+
+
+def cpu_pool() -> BlockingPool | None:
+    """The shared process pool for CPU-bound work, or ``None`` when no
+    workers are configured. Workers are spawned, not forked, so they never
+    inherit the server's sockets or database connections."""
+    global _cpu_pool
+    workers = _env_int("DIPLOMACY_CPU_WORKERS", _env_int("DIPLOMACY_ODDS_WORKERS", 0))
+    if workers <= 0:
+        return None
+    with _pools_lock:
+        if _cpu_pool is None:
+            _cpu_pool = BlockingPool(
+                "cpu", ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn")), workers
+            )
+        return _cpu_pool
+
+
+async def run_blocking[T](fn: Callable[..., T], /, *args: Any, kind: str = "io", **kwargs: Any) -> T:
+    """Run ``fn(*args, **kwargs)`` on a shared pool and await its result.
+
+    ``kind="cpu"`` needs ``fn`` and its arguments to be picklable; it runs on
+    the thread pool when no worker processes are configured.
+    """
+    if kind not in ("io", "cpu"):
+        raise ValueError(f"unknown executor kind {kind!r}")
+    pool = cpu_pool() if kind == "cpu" else None
+    if pool is not None:
+        return await asyncio.wrap_future(pool.submit(fn, *args, **kwargs))
+    context = contextvars.copy_context()
+    return await asyncio.wrap_future(io_pool().submit(context.run, fn, *args, **kwargs))
+
+
+def executor_stats() -> dict[str, Any]:
+    """Counters for each pool created so far, keyed by kind."""
+    return {pool.name: pool.snapshot() for pool in (_io_pool, _cpu_pool) if pool is not None}
+
+
+def shutdown_executors(wait: bool = True) -> None:
+    """Shut both pools down (waiting for calls in flight when ``wait``).
+    Later calls create new pools."""
+    global _io_pool, _cpu_pool
+    with _pools_lock:
+        pools, _io_pool, _cpu_pool = (_io_pool, _cpu_pool), None, None
+    for pool in pools:
+        if pool is not None:
+            pool.shutdown(wait=wait)
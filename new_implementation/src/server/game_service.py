@@ -4,41 +4,85 @@ Wraps the pure engine (``game.Game`` + ``serialization`` + ``orders.parser``
 + ``orders.validation``) over ``GameRepo`` persistence. Routes, the CLI ``Server``
 and DAIDE all go through this — none of them touch engine internals.
 
-State lives as a serialized ``GameState`` in ``games.state_json``; submitted orders
-accumulate in ``games.pending_orders`` until ``process_turn`` adjudicates them and
+State lives as a serialized ``GameState`` in ``games.state_json``, mirrored in the
+binary codec in ``games.state_blob``, which is what ``load`` reads when it is
+present; submitted orders accumulate in ``games.pending_orders`` until ``process_turn`` adjudicates them and
 advances the phase (the phase machine inserts retreat/adjustment phases as needed).
+
+Every successful write is also published as a small event on the optional
+``events`` bus (``server.events``), which ``GET /games/{id}/events`` streams to
+open game pages. ``preview`` answers "what if?" for a draft set of orders
+without storing anything, through a cached ``AdjudicationSession`` per caller.
+
+Given ``reads`` (a ``persistence.async_reads.AsyncReadRepo``), the ``*_async``
+methods serve the same reads from ``async def`` routes without a thread; they
+decode and assemble exactly as their sync counterparts do.
 """
 
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from dataclasses import replace
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
-from persistence.game_repo import StaleGameError
+from persistence.game_repo import PostTurnWrites, StaleGameError
 from engine.map_loader import MapData, load_standard_map
 from engine.game import Game
-from engine.orders.parser import OrderParseError, format_order, parse_order
-from engine.orders.validation import validate
+from engine.adjudicator.session import AdjudicationSession
+from engine.orders.parser import OrderParseError, format_order, parse_orders_bulk
+from engine.orders.validation import ValidationContext, validate
 from engine.serialization import (
     order_from_dict,
+    order_to_dict,
     resolution_to_dict,
+    state_from_bytes,
     state_from_dict,
+    state_to_bytes,
     state_to_dict,
     unit_to_dict,
 )
-from engine.types import GameState, PhaseType
+from engine.types import GameState, Order, PhaseType
+from metrics import REGISTRY
 
 __all__ = ["GameService", "OrderError", "StaleGameError"]
 
+# Live preview sessions kept per GameService (least recently used evicted).
+PREVIEW_SESSIONS = 512
+
+_ADJUDICATION_SECONDS = REGISTRY.histogram(
+    "diplomacy_adjudication_seconds",
+    "Time to adjudicate one phase in process_turn, by phase type.",
+    ("phase_type",),
+)
+_ADJUDICATION_BY_PHASE_TYPE = {pt: _ADJUDICATION_SECONDS.labels(pt.value) for pt in PhaseType}
+
 
 class OrderError(ValueError):
     """A submitted order was ill-formed or illegal for the current state."""
 
 
 class GameService:
-    def __init__(self, repo: Any, map: Optional[MapData] = None) -> None:
+    def __init__(
+        self,
+        repo: Any,
+        map: Optional[MapData] = None,
+        events: Optional[Any] = None,
+        reads: Optional[Any] = None,
+    ) -> None:
         self._repo = repo
+        self._reads = reads
         self._map = map or load_standard_map()
+        self._events = events
+        # session key -> ((phase_code, state_version), AdjudicationSession), LRU.
+        self._previews: OrderedDict[Any, tuple[tuple[str, int], AdjudicationSession]] = (
+            OrderedDict()
+        )
+        self._previews_lock = threading.Lock()
+
+    def _publish(self, game_id: str, event_type: str, **data: Any) -> None:
+        if self._events is not None:
+            self._events.publish(game_id, event_type, data)
 
     @property
     def map(self) -> MapData:
@@ -57,17 +101,47 @@ class GameService:
             state_json=state_to_dict(game.state),
             phase_code=game.state.phase_name,
             game_id=game_id,
+            state_blob=state_to_bytes(game.state, self._map),
         )
 
+    def _load_state(self, game_id: str) -> Optional[GameState]:
+        return self._state_from_payload(self._repo.get_state_payload(game_id))
+
+    def _state_from_payload(self, payload: Optional[bytes | dict[str, Any]]) -> Optional[GameState]:
+        if payload is None:
+            return None
+        if isinstance(payload, bytes):
+            return state_from_bytes(payload, self._map)
+        return state_from_dict(payload)
+
+    async def load_async(self, game_id: str) -> Optional[Game]:
+        """``load`` through the async reads."""
+        state = self._state_from_payload(await self._reads.get_state_payload(game_id))
+        return None if state is None else Game(map=self._map, state=state)
+
     def load(self, game_id: str) -> Optional[Game]:
-        sj = self._repo.get_state_json(game_id)
-        if sj is None:
+        state = self._load_state(game_id)
+        if state is None:
             return None
-        return Game(map=self._map, state=state_from_dict(sj))
+        return Game(map=self._map, state=state)
 
     def exists(self, game_id: str) -> bool:
         return self._repo.exists(game_id)
 
+    def version(self, game_id: str, *, with_players: bool = False) -> Optional[dict[str, Any]]:
+        """The game's phase and write counters, read without decoding its state.
+
+        What the API's ETags are derived from (``server.etag``); see
+        ``GameRepo.get_version``. ``None`` if the game does not exist.
+        """
+        return self._repo.get_version(game_id, with_players=with_players)
+
+    async def version_async(
+        self, game_id: str, *, with_players: bool = False
+    ) -> Optional[dict[str, Any]]:
+        """``version`` through the async reads."""
+        return await self._reads.get_version(game_id, with_players=with_players)
+
     # -- orders -----------------------------------------------------------
 
     def submit_orders(
@@ -84,38 +158,92 @@ class GameService:
             raise OrderError(f"game {game_id} not found")
         power = power.upper()
         state = game.state
+        results, accepted = self._check_orders(state, power, order_strings)
+
+        pending, parsed = self._pending(game_id)
+        pending[power] = [format_order(o) for o in accepted]
+        parsed[power] = accepted
+        self._store_pending(game_id, pending, parsed)
+        self._publish(game_id, "orders", phase=state.phase_name, power=power)
+        return results
 
+    def _check_orders(
+        self,
+        state: GameState,
+        power: str,
+        order_strings: list[str],
+        context: Optional[ValidationContext] = None,
+    ) -> tuple[list[dict[str, Any]], list[Order]]:
+        """Parse and validate ``power``'s orders against ``state``.
+
+        Returns one ``{order, ok, reason}`` dict per order, and the accepted
+        ``Order`` objects.
+        """
+        texts = [raw.strip() for raw in order_strings if raw.strip()]
+        context = context or ValidationContext(state)
         results: list[dict[str, Any]] = []
-        accepted: list[str] = []
-        for raw in order_strings:
-            raw = raw.strip()
-            if not raw:
-                continue
-            try:
-                order = parse_order(raw, power=power, map=self._map)
-            except OrderParseError as exc:
-                results.append({"order": raw, "ok": False, "reason": f"parse error: {exc}"})
+        accepted: list[Order] = []
+        for raw, order in zip(texts, parse_orders_bulk(texts, power=power, map=self._map)):
+            if isinstance(order, OrderParseError):
+                results.append({"order": raw, "ok": False, "reason": f"parse error: {order}"})
                 continue
-            vr = validate(order, state, self._map)
+            vr = validate(order, state, self._map, context)
             if vr.ok:
-                accepted.append(format_order(order))
+                accepted.append(order)
                 results.append({"order": raw, "ok": True, "reason": None})
             else:
                 results.append({"order": raw, "ok": False, "reason": vr.reason})
-
-        pending = self._repo.get_pending_orders(game_id)
-        pending[power] = accepted
-        self._repo.set_pending_orders(game_id, pending)
-        return results
+        return results, accepted
 
     def clear_orders(self, game_id: str, power: str) -> None:
-        pending = self._repo.get_pending_orders(game_id)
+        pending, parsed = self._pending(game_id)
         pending.pop(power.upper(), None)
-        self._repo.set_pending_orders(game_id, pending)
+        parsed.pop(power.upper(), None)
+        self._store_pending(game_id, pending, parsed)
+        self._publish(game_id, "orders", power=power.upper())
+
+    def _pending(self, game_id: str) -> tuple[dict[str, list[str]], dict[str, list[Order]]]:
+        """Pending order strings and the same orders parsed, keyed by power.
+
+        The parsed side comes from ``pending_orders_parsed`` when the repo has it
+        (no grammar run at all), else from parsing the strings (cached). Stored
+        strings were validated at submit time, so unparseable ones are skipped.
+        """
+        return self._parse_pending(*self._repo.get_pending_orders_with_parsed(game_id))
+
+    def _parse_pending(
+        self, pending: dict[str, list[str]], stored: Optional[dict[str, list[dict[str, Any]]]]
+    ) -> tuple[dict[str, list[str]], dict[str, list[Order]]]:
+        if stored is not None:
+            parsed = {p: [order_from_dict(d) for d in ds] for p, ds in stored.items()}
+        else:
+            parsed = {
+                p: [
+                    o
+                    for o in parse_orders_bulk(strings, power=p.upper(), map=self._map)
+                    if not isinstance(o, OrderParseError)
+                ]
+                for p, strings in pending.items()
+            }
+        return pending, parsed
+
+    def _store_pending(
+        self, game_id: str, pending: dict[str, list[str]], parsed: dict[str, list[Order]]
+    ) -> None:
+        self._repo.set_pending_orders(
+            game_id,
+            pending,
+            {p: [order_to_dict(o) for o in orders] for p, orders in parsed.items()},
+        )
 
     # -- turn processing --------------------------------------------------
 
-    def process_turn(self, game_id: str) -> dict[str, Any]:
+    def process_turn(
+        self,
+        game_id: str,
+        *,
+        post_turn: Optional[Callable[[GameState], PostTurnWrites]] = None,
+    ) -> dict[str, Any]:
         """Adjudicate all pending orders, advance the phase, persist, clear orders.
 
         Raises ``StaleGameError`` if another process already advanced this game's
@@ -123,27 +251,27 @@ class GameService:
         loaded no longer matches what's persisted) -- the caller (an HTTP route)
         should surface that as 409 rather than silently re-adjudicating or
         clobbering the concurrent result.
+
+        ``post_turn`` is called with the next ``GameState``; the deadline and
+        outbox rows it returns are committed atomically with it (see
+        ``GameRepo.save_state``), so the caller's side effects cannot be lost
+        between the commit and running them.
         """
         game = self.load(game_id)
         if game is None:
             raise OrderError(f"game {game_id} not found")
 
-        pending = self._repo.get_pending_orders(game_id)
-        orders = []
-        for power, strings in pending.items():
-            for s in strings:
-                try:
-                    orders.append(parse_order(s, power=power.upper(), map=self._map))
-                except OrderParseError:
-                    continue
+        pending, parsed = self._pending(game_id)
+        orders = [o for power_orders in parsed.values() for o in power_orders]
 
-        resolution, next_game = game.adjudicate(orders)
+        with _ADJUDICATION_BY_PHASE_TYPE[game.state.phase_type].time():
+            resolution, next_game = game.adjudicate(orders)
 
         # Record the orders players actually submitted (with truthful A/F letters
         # against the pre-adjudication board) before pending is cleared.
         history_entry = {
             power: strings for power, strings in
-            self._humanize_orders(pending, game.state).items() if strings
+            self._humanize_orders(pending, game.state, parsed).items() if strings
         }
 
         # Decorate each result with a truthful order_str, computed against the
@@ -166,18 +294,93 @@ class GameService:
             expected_phase_code=game.state.phase_name,
             last_resolution=resolution_dict,
             order_history_entry=history_entry,
+            state_blob=state_to_bytes(next_game.state, self._map),
+            post_turn=post_turn(next_game.state) if post_turn is not None else None,
         )
-        self._repo.set_pending_orders(game_id, {})
+        self._repo.set_pending_orders(game_id, {}, {})
         # A draw vote is scoped to the phase it was cast in, same as pending
         # orders -- once the phase advances, last phase's votes no longer mean
         # anything for the new phase.
         self._repo.set_draw_votes(game_id, {})
+        self._publish(
+            game_id,
+            "phase",
+            phase=next_game.state.phase_name,
+            previous_phase=game.state.phase_name,
+            status=next_game.state.status.value,
+        )
         return {
             "phase": next_game.state.phase_name,
             "status": next_game.state.status.value,
             "resolution": resolution_dict,
         }
 
+    # -- preview --------------------------------------------------------------
+
+    def preview(
+        self,
+        game_id: str,
+        power: str,
+        order_strings: list[str],
+        *,
+        assumed: Optional[dict[str, list[str]]] = None,
+        session_key: Any = None,
+    ) -> Optional[dict[str, Any]]:
+        """What the current phase would resolve to if ``power`` played
+        ``order_strings`` -- nothing is stored and no one else's pending orders
+        are consulted (they are private). Other powers' units hold unless
+        ``assumed`` supplies hypothetical orders for them.
+
+        Each ``session_key`` (the API uses the caller and game) keeps an
+        ``AdjudicationSession`` for the phase, so a preview after a one-order
+        edit re-resolves only what that order touches. A session is dropped
+        when the game's phase or state moves on. Returns ``{phase, power,
+        orders, assumed, resolution, units}``, or ``None`` if the game does not
+        exist.
+        """
+        version = self._repo.get_version(game_id)
+        if version is None:
+            return None
+        token = (version["phase_code"], version["state_version"])
+        key = session_key if session_key is not None else (game_id, power.upper())
+        with self._previews_lock:
+            entry = self._previews.pop(key, None)
+        if entry is not None and entry[0] == token:
+            session = entry[1]
+        else:
+            state = self._load_state(game_id)
+            if state is None:
+                return None
+            session = AdjudicationSession(self._map, state)
+
+        power = power.upper()
+        state = session.state
+        context = ValidationContext(state)
+        results, accepted = self._check_orders(state, power, order_strings, context)
+        assumed_results: dict[str, list[dict[str, Any]]] = {}
+        for other, strings in (assumed or {}).items():
+            if other.upper() == power:
+                continue
+            assumed_results[other.upper()], other_orders = self._check_orders(
+                state, other.upper(), strings, context
+            )
+            accepted.extend(other_orders)
+        session.set_orders(accepted)
+        resolution, post = session.resolve()
+
+        with self._previews_lock:
+            self._previews[key] = (token, session)
+            while len(self._previews) > PREVIEW_SESSIONS:
+                self._previews.popitem(last=False)
+        return {
+            "phase": state.phase_name,
+            "power": power,
+            "orders": results,
+            "assumed": assumed_results,
+            "resolution": resolution_to_dict(resolution),
+            "units": [unit_to_dict(u) for u in sorted(post.units, key=lambda u: u.province)],
+        }
+
     # -- draw / concede -----------------------------------------------------
 
     def _draw_quorum(self, game: Game) -> frozenset[str]:
@@ -218,9 +421,17 @@ class GameService:
                 phase_code=drawn.state.phase_name,
                 status=drawn.state.status.value.lower(),
                 expected_phase_code=game.state.phase_name,
+                state_blob=state_to_bytes(drawn.state, self._map),
             )
-            self._repo.set_pending_orders(game_id, {})
+            self._repo.set_pending_orders(game_id, {}, {})
             self._repo.set_draw_votes(game_id, {})
+            self._publish(
+                game_id,
+                "phase",
+                phase=drawn.state.phase_name,
+                previous_phase=game.state.phase_name,
+                status=drawn.state.status.value,
+            )
             return {
                 "status": "completed",
                 "game_status": drawn.state.status.value,
@@ -230,6 +441,10 @@ class GameService:
                 "quorum_reached": True,
             }
 
+        self._publish(
+            game_id, "draw_vote", phase=game.state.phase_name, votes=sorted(yes),
+            required=sorted(required),
+        )
         return {
             "status": "recorded",
             "game_status": game.state.status.value,
@@ -285,6 +500,7 @@ class GameService:
             state_to_dict(new_state),
             phase_code=new_state.phase_name,
             status=new_state.status.value.lower(),
+            state_blob=state_to_bytes(new_state, self._map),
         )
         # The conceding power has nothing left to order or vote on this phase.
         self.clear_orders(game_id, power)
@@ -293,6 +509,7 @@ class GameService:
             self._repo.set_draw_votes(game_id, votes)
 
         eliminated = power in Game(map=self._map, state=new_state).eliminated_powers()
+        self._publish(game_id, "state", phase=new_state.phase_name, conceded=power)
         return {
             "status": "ok",
             "power": power,
@@ -304,14 +521,33 @@ class GameService:
 
     def view(self, game_id: str) -> Optional[dict[str, Any]]:
         """The clean, GameState-native API representation of a game."""
-        sj = self._repo.get_state_json(game_id)
-        if sj is None:
+        state = self._load_state(game_id)
+        if state is None:
             return None
         meta = self._repo.get_meta(game_id) or {}
-        state = state_from_dict(sj)
         players = self._repo.players(game_id)
-        pending = self._repo.get_pending_orders(game_id)
-
+        pending, parsed = self._pending(game_id)
+        return self._view(game_id, state, meta, players, pending, parsed)
+
+    async def view_async(self, game_id: str) -> Optional[dict[str, Any]]:
+        """``view`` through the async reads (one round of queries on one
+        connection, ``AsyncReadRepo.get_view_bundle``)."""
+        bundle = await self._reads.get_view_bundle(game_id)
+        state = self._state_from_payload(bundle["state"]) if bundle is not None else None
+        if state is None:
+            return None
+        pending, parsed = self._parse_pending(bundle["pending"], bundle["parsed"])
+        return self._view(game_id, state, bundle["meta"], bundle["players"], pending, parsed)
+
+    def _view(
+        self,
+        game_id: str,
+        state: GameState,
+        meta: dict[str, Any],
+        players: dict[str, dict[str, Any]],
+        pending: dict[str, list[str]],
+        parsed: dict[str, list[Order]],
+    ) -> dict[str, Any]:
         units_by_power: dict[str, list[dict[str, Any]]] = {}
         for u in sorted(state.units, key=lambda x: str(x.location)):
             units_by_power.setdefault(u.power, []).append(unit_to_dict(u))
@@ -332,30 +568,33 @@ class GameService:
             "dislodged": [_dislodged_view(du) for du in state.dislodged],
             "contested": sorted(state.contested),
             "players": players,
-            "orders": self._humanize_orders(pending, state),
+            "orders": self._humanize_orders(pending, state, parsed),
         }
 
     def _humanize_orders(
-        self, pending: dict[str, list[str]], state: GameState
+        self,
+        pending: dict[str, list[str]],
+        state: GameState,
+        parsed: Optional[dict[str, list[Order]]] = None,
     ) -> dict[str, list[str]]:
         """Rewrite stored order strings so unit letters match the board.
 
         Orders are stored via ``format_order``, which infers ``A``/``F`` from coast
         presence — so a fleet at a non-split-coast province is stored as ``A``. For
-        display, reparse each order and reformat it against the current units so the
-        letter is truthful. Anything that fails to reparse is left untouched.
+        display, reformat each order against the current units so the letter is
+        truthful -- from ``parsed`` (``_pending``) when it lines up with the strings,
+        else by reparsing. Anything that fails to reparse is left untouched.
         """
         kind_by_province = _kind_by_province(state)
         out: dict[str, list[str]] = {}
         for power, strings in pending.items():
-            display: list[str] = []
-            for s in strings:
-                try:
-                    order = parse_order(s, power=power.upper(), map=self._map)
-                    display.append(format_order(order, kind_by_province))
-                except OrderParseError:
-                    display.append(s)
-            out[power] = display
+            orders: list[Any] = (parsed or {}).get(power, [])
+            if len(orders) != len(strings):
+                orders = parse_orders_bulk(strings, power=power.upper(), map=self._map)
+            out[power] = [
+                s if isinstance(o, OrderParseError) else format_order(o, kind_by_province)
+                for s, o in zip(strings, orders)
+            ]
         return out
 
     def pending_orders_parsed(self, game_id: str) -> dict[str, list[Any]]:
@@ -364,17 +603,8 @@ class GameService:
         Ill-formed stored orders are skipped (they were validated at submit time, so
         this is defensive). Used by the orders-map renderer.
         """
-        out: dict[str, list[Any]] = {}
-        for power, strings in self._repo.get_pending_orders(game_id).items():
-            orders: list[Any] = []
-            for s in strings:
-                try:
-                    orders.append(parse_order(s, power=power.upper(), map=self._map))
-                except OrderParseError:
-                    continue
-            if orders:
-                out[power] = orders
-        return out
+        _, parsed = self._pending(game_id)
+        return {power: orders for power, orders in parsed.items() if orders}
 
     def last_resolution(self, game_id: str) -> Optional[dict[str, Any]]:
         """The most recent adjudication result (``resolution_to_dict``), or ``None``."""
@@ -420,10 +650,9 @@ class GameService:
         still control at least one unit and haven't. ``None`` if the game doesn't
         exist. A power counts as "submitted" once it has a ``pending_orders`` entry
         for this phase, even an empty one (0 valid orders still means it acted)."""
-        sj = self._repo.get_state_json(game_id)
-        if sj is None:
+        state = self._load_state(game_id)
+        if state is None:
             return None
-        state = state_from_dict(sj)
         submitted = set(self._repo.get_pending_orders(game_id).keys())
         active_powers = sorted({u.power for u in state.units})
         return {
@@ -450,8 +679,14 @@ class GameService:
         pending orders (see ``GameRepo.restore_state``): whatever was pending was
         submitted against the phase being discarded.
         """
-        state_from_dict(state_json)  # raises ValueError if malformed; result unused
-        self._repo.restore_state(game_id, state_json, phase_code=phase_code)
+        state = state_from_dict(state_json)  # raises ValueError if malformed
+        self._repo.restore_state(
+            game_id,
+            state_json,
+            phase_code=phase_code,
+            state_blob=state_to_bytes(state, self._map),
+        )
+        self._publish(game_id, "state", phase=phase_code, restored=True)
 
 
 # ---------------------------------------------------------------------------
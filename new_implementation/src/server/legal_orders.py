@@ -4,7 +4,9 @@ Pure module: no FastAPI, no DB, no ``game_service`` import. It takes a
 ``MapData`` + ``GameState`` (+ a power name) and returns plain data — a dict
 of JSON-serializable values — so it is directly unit-testable without a
 running server or database, and so any caller (the HTTP routes, the
-Telegram bot, a future DAIDE surface) gets the same answer.
+Telegram bot, a future DAIDE surface) gets the same answer. The only state
+it touches is its own timing histogram in ``metrics``
+(``diplomacy_legal_orders_seconds``, by phase type).
 
 The old ``GET /games/{id}/legal_orders/{power}/{unit}`` route enumerated
 moves from map topology alone, ignoring ``state.phase_type`` entirely. That
@@ -38,6 +40,7 @@ every province named in the order keeps every emitted string truthful.
 
 from __future__ import annotations
 
+import time
 from typing import Any
 
 from engine.map_loader import MapData
@@ -59,9 +62,18 @@ from engine.types import (
     Unit,
     UnitKind,
 )
+from metrics import FAST_BUCKETS, REGISTRY
 
 __all__ = ["legal_orders_for_power"]
 
+_GENERATION_SECONDS = REGISTRY.histogram(
+    "diplomacy_legal_orders_seconds",
+    "Time to enumerate one power's legal orders, by phase type.",
+    ("phase_type",),
+    buckets=FAST_BUCKETS,
+)
+_SECONDS_BY_PHASE_TYPE = {pt: _GENERATION_SECONDS.labels(pt.value) for pt in PhaseType}
+
 
 def legal_orders_for_power(map: MapData, state: GameState, power: str) -> dict[str, Any]:
     """All legal order strings for ``power``'s units in the current phase.
@@ -83,6 +95,7 @@ def legal_orders_for_power(map: MapData, state: GameState, power: str) -> dict[s
     is not unit-specific and so appears only in the flat ``orders`` list, not
     under any ``orders_by_unit`` key.
     """
+    started = time.perf_counter()
     power = power.upper()
     out: dict[str, Any] = {
         "phase": state.phase_name,
@@ -110,6 +123,7 @@ def legal_orders_for_power(map: MapData, state: GameState, power: str) -> dict[s
 
     out["orders_by_unit"] = {k: sorted(set(v)) for k, v in orders_by_unit.items()}
     out["orders"] = sorted(set(flat))
+    _SECONDS_BY_PHASE_TYPE[state.phase_type].observe(time.perf_counter() - started)
     return out
 
 
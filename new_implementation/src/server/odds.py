@@ -0,0 +1,373 @@
+"""Monte Carlo estimate of how likely a power's orders are to succeed.
+
+Pure module, like ``legal_orders``: no FastAPI, no DB, no ``game_service``
+import. Given a movement-phase ``GameState``, a power and that power's orders,
+it repeatedly samples every *other* power's orders, adjudicates, and counts how
+often each of the power's orders comes out ``OK`` with its unit still in place.
+Backs ``GET /games/{id}/orders/{power}/odds``.
+
+Opponents are sampled by one of two ``POLICIES``:
+
+- ``legal`` — each opponent unit picks uniformly from its legal orders
+  (``legal_orders.legal_orders_for_power``, parsed once per position);
+- ``simple_ai`` — each opponent plays ``engine.simple_ai.generate_orders``.
+
+Keeping it fast:
+
+- adjudication goes through one ``AdjudicationSession`` per position and
+  ``results_for`` the power's units only: components that don't touch them are
+  never resolved, and the ones that do are cached by their order set across
+  samples;
+- samples run in batches, in-process or — with ``DIPLOMACY_ODDS_WORKERS`` > 0 —
+  spread over a spawn-context process pool whose workers keep their sampler
+  (legal-order lists, session cache) between batches of the same position;
+- sampling stops at the time budget, at ``max_samples``, or as soon as every
+  order's 95% Wilson interval is narrower than ``target_half_width``;
+- finished estimates are cached per (game, phase, state version, power, orders,
+  policy) by :func:`cached_estimate`, and reused for a later request unless it
+  asks for a longer budget than one that ran out.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from typing import Any
+
+from engine.adjudicator.session import AdjudicationSession
+from engine.map_loader import MapData, load_standard_map
+from engine.orders.parser import OrderParseError, format_order, parse_orders_bulk
+from engine.serialization import state_from_bytes, state_to_bytes
+from engine.simple_ai import generate_orders
+from engine.types import GameState, Order, PhaseType, ResultCode
+
+from .executors import cpu_pool
+from .legal_orders import legal_orders_for_power
+
+__all__ = [
+    "POLICIES",
+    "cached_estimate",
+    "estimate_order_odds",
+    "odds_executor",
+    "wilson_interval",
+]
+
+POLICIES = ("legal", "simple_ai")
+
+DEFAULT_BUDGET_S = 1.0
+MAX_BUDGET_S = 10.0
+DEFAULT_MAX_SAMPLES = 20_000
+MIN_SAMPLES = 200
+BATCH_SIZE = 100
+# Stop early once every order's 95% interval is at most +/- this wide.
+TARGET_HALF_WIDTH = 0.02
+_Z95 = 1.959964
+
+ODDS_CACHE_SIZE = 256
+_SAMPLER_CACHE_SIZE = 8
+
+
+def wilson_interval(successes: int, n: int, z: float = _Z95) -> tuple[float, float]:
+    """The Wilson score interval for ``successes`` out of ``n`` (``(0, 1)`` at n=0)."""
+    if n == 0:
+        return 0.0, 1.0
+    p = successes / n
+    denom = 1 + z * z / n
+    centre = (p + z * z / (2 * n)) / denom
+    half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+    lo = 0.0 if successes == 0 else max(0.0, centre - half)
+    hi = 1.0 if successes == n else min(1.0, centre + half)
+    return lo, hi
+
+
+# ---------------------------------------------------------------------------
+# Sampling (runs in-process or in a worker)
+# ---------------------------------------------------------------------------
+
+
+class _Sampler:
+    """Everything needed to sample and adjudicate one position repeatedly."""
+
+    def __init__(
+        self, map: MapData, state: GameState, power: str, orders: list[Order], policy: str
+    ) -> None:
+        self.map = map
+        self.state = state
+        self.policy = policy
+        self.session = AdjudicationSession(map, state)
+        self.session.set_orders(orders)
+        self.own = [o.unit.province for o in self.session.orders]
+        self.opponents = sorted({u.power for u in state.units} - {power})
+        self.choices: list[list[Order]] = []
+        if policy == "legal":
+            for other in self.opponents:
+                data = legal_orders_for_power(map, state, other)
+                for strings in data["orders_by_unit"].values():
+                    parsed = [
+                        o
+                        for o in parse_orders_bulk(strings, power=other, map=map)
+                        if not isinstance(o, OrderParseError)
+                    ]
+                    if parsed:
+                        self.choices.append(parsed)
+
+    def run(self, n: int, seed: int) -> list[tuple[int, int]]:
+        """``(successes, dislodged)`` per own order over ``n`` samples."""
+        rng = random.Random(seed)
+        own = set(self.own)
+        tallies = {p: [0, 0] for p in self.own}
+        for _ in range(n):
+            for order in self._sample(rng):
+                if order.unit.province not in own:
+                    self.session.set_order(order)
+            for r in self.session.results_for(own):
+                tally = tallies[r.order.unit.province]
+                if r.result is ResultCode.OK and not r.dislodged:
+                    tally[0] += 1
+                if r.dislodged:
+                    tally[1] += 1
+        return [(tallies[p][0], tallies[p][1]) for p in self.own]
+
+    def _sample(self, rng: random.Random) -> list[Order]:
+        if self.policy == "legal":
+            return [rng.choice(options) for options in self.choices]
+        return [
+            o
+            for other in self.opponents
+            for o in generate_orders(self.map, self.state, other, rng)
+        ]
+
+
+_samplers: OrderedDict[Hashable, _Sampler] = OrderedDict()
+_samplers_lock = threading.Lock()
+
+
+def _sampler(
+    state_blob: bytes,
+    power: str,
+    order_strings: tuple[str, ...],
+    policy: str,
+    map: MapData | None = None,
+) -> _Sampler:
+    """The cached sampler for a position; one caller at a time (it is popped
+    out of the cache while in use and put back by :func:`_sample_batch`)."""
+    key = (state_blob, power, order_strings, policy)
+    with _samplers_lock:
+        sampler = _samplers.pop(key, None)
+    if sampler is None:
+        map = map or load_standard_map()
+        state = state_from_bytes(state_blob, map)
+        orders = [
+            o
+            for o in parse_orders_bulk(list(order_strings), power=power, map=map)
+            if not isinstance(o, OrderParseError)
+        ]
+        sampler = _Sampler(map, state, power, orders, policy)
+    return sampler
+
+
+def _sample_batch(
+    state_blob: bytes,
+    power: str,
+    order_strings: tuple[str, ...],
+    policy: str,
+    n: int,
+    seed: int,
+    map: MapData | None = None,
+) -> list[tuple[int, int]]:
+    """Run ``n`` samples of one position. Top-level so a worker can run it."""
+    sampler = _sampler(state_blob, power, order_strings, policy, map)
+    try:
+        return sampler.run(n, seed)
+    finally:
+        with _samplers_lock:
+            _samplers[(state_blob, power, order_strings, policy)] = sampler
+            while len(_samplers) > _SAMPLER_CACHE_SIZE:
+                _samplers.popitem(last=False)
+
+
+# ---------------------------------------------------------------------------
+# Estimation
+# ---------------------------------------------------------------------------
+
+
+def odds_executor() -> Executor | None:
+    """The shared worker pool, or ``None`` to sample in-process.
+
+    This is ``executors.cpu_pool()``, sized by ``DIPLOMACY_CPU_WORKERS`` (or
+    ``DIPLOMACY_ODDS_WORKERS``; default 0: in-process). Workers are spawned,
+    not forked, so they never inherit the server's sockets or DB pool, and
+    they load the standard map themselves.
+    """
+    return cpu_pool()
+
+
+def estimate_order_odds(
+    map: MapData,
+    state: GameState,
+    power: str,
+    orders: list[Order],
+    *,
+    policy: str = "legal",
+    budget: float = DEFAULT_BUDGET_S,
+    max_samples: int = DEFAULT_MAX_SAMPLES,
+    min_samples: int = MIN_SAMPLES,
+    target_half_width: float = TARGET_HALF_WIDTH,
+    seed: int | None = None,
+    executor: Executor | None = None,
+) -> dict[str, Any]:
+    """Estimate each of ``orders``' success probability against sampled opponents.
+
+    An order succeeds in a sample when its result is ``OK`` and its unit is not
+    dislodged (for a hold: it stays put). ``power``'s units without an order
+    hold, as they would at adjudication. Returns::
+
+        {
+          "phase": "S1901M", "power": "FRANCE", "policy": "legal",
+          "samples": 1400, "elapsed_ms": 212.5, "stopped": "converged",
+          "orders": [{"order": "A PAR - BUR", "p": 0.62, "ci": [0.59, 0.64],
+                      "successes": 868, "dislodged": 0.0}],
+        }
+
+    ``stopped`` is ``converged`` (every interval within ``target_half_width``
+    after ``min_samples``), ``budget`` (``budget`` seconds elapsed) or
+    ``max_samples``. Raises ``ValueError`` outside movement phases or for an
+    unknown policy.
+    """
+    if state.phase_type is not PhaseType.MOVEMENT:
+        raise ValueError("order odds are only available in movement phases")
+    if policy not in POLICIES:
+        raise ValueError(f"unknown policy {policy!r}; expected one of {', '.join(POLICIES)}")
+    started = time.monotonic()
+    power = power.upper()
+    session = AdjudicationSession(map, state)
+    session.set_orders(orders)
+    own = session.orders  # one per unit, only for units actually on the board
+    kinds = {u.province: u.kind.value for u in state.units}
+    order_strings = tuple(format_order(o) for o in own)
+    state_blob = state_to_bytes(state, map)
+    base_seed = seed if seed is not None else random.SystemRandom().randrange(2**32)
+
+    successes = [0] * len(own)
+    dislodged = [0] * len(own)
+    samples = 0
+
+    def add(batch: list[tuple[int, int]], n: int) -> None:
+        nonlocal samples
+        for i, (ok, lost) in enumerate(batch):
+            successes[i] += ok
+            dislodged[i] += lost
+        samples += n
+
+    def stop_reason() -> str | None:
+        if samples >= max_samples:
+            return "max_samples"
+        if samples >= min_samples and all(
+            (hi - lo) / 2 <= target_half_width
+            for lo, hi in (wilson_interval(s, samples) for s in successes)
+        ):
+            return "converged"
+        if time.monotonic() - started >= budget:
+            return "budget"
+        return None
+
+    stopped = "converged" if not own else None
+    batch_index = 0
+    if stopped is None and executor is None:
+        while stopped is None:
+            n = min(BATCH_SIZE, max_samples - samples)
+            add(
+                _sample_batch(
+                    state_blob, power, order_strings, policy, n, base_seed + batch_index, map
+                ),
+                n,
+            )
+            batch_index += 1
+            stopped = stop_reason()
+    elif stopped is None:
+        in_flight: dict[Future, int] = {}
+        workers = getattr(executor, "_max_workers", 1)
+        queued = 0
+        while stopped is None or in_flight:
+            while stopped is None and len(in_flight) < 2 * workers and samples + queued < max_samples:
+                n = min(BATCH_SIZE, max_samples - samples - queued)
+                future = executor.submit(
+                    _sample_batch,
+                    state_blob, power, order_strings, policy, n, base_seed + batch_index,
+                )
+                in_flight[future] = n
+                queued += n
+                batch_index += 1
+            remaining = max(0.0, budget - (time.monotonic() - started))
+            done, _ = wait(in_flight, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                n = in_flight.pop(future)
+                queued -= n
+                add(future.result(), n)
+            if stopped is None:
+                stopped = stop_reason()
+            if stopped is not None:
+                for future in in_flight:
+                    future.cancel()
+                # Batches already running finish in the background; their
+                # counts are simply not waited for.
+                in_flight.clear()
+
+    results = []
+    for i, order in enumerate(own):
+        lo, hi = wilson_interval(successes[i], samples)
+        results.append(
+            {
+                "order": format_order(order, kinds),
+                "p": successes[i] / samples if samples else None,
+                "ci": [round(lo, 4), round(hi, 4)],
+                "successes": successes[i],
+                "dislodged": dislodged[i] / samples if samples else None,
+            }
+        )
+    return {
+        "phase": state.phase_name,
+        "power": power,
+        "policy": policy,
+        "samples": samples,
+        "elapsed_ms": round((time.monotonic() - started) * 1000, 1),
+        "stopped": stopped,
+        "orders": results,
+    }
+
+
+_cache: OrderedDict[Hashable, tuple[float, dict[str, Any]]] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def cached_estimate(
+    key: Hashable, compute: Callable[[], dict[str, Any]], *, budget: float = 0.0
+) -> dict[str, Any]:
+    """``compute()``'s estimate, memoized under ``key`` in a bounded LRU.
+
+    Callers key on everything the estimate depends on -- the API uses (game,
+    phase, state version, power, order strings, policy) -- so a new turn or a
+    changed order simply misses. ``budget`` is what ``compute`` will be given:
+    an entry computed with a smaller one that stopped on its budget is too
+    coarse to serve, so it is recomputed and replaced. Returned dicts carry
+    ``cached`` True/False.
+    """
+    with _cache_lock:
+        hit = _cache.get(key)
+        if hit is not None:
+            hit_budget, hit_result = hit
+            if hit_budget >= budget or hit_result.get("stopped") != "budget":
+                _cache.move_to_end(key)
+                return {**hit_result, "cached": True}
+    result = compute()
+    with _cache_lock:
+        _cache[key] = (budget, result)
+        _cache.move_to_end(key)
+        while len(_cache) > ODDS_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return {**result, "cached": False}
@@ -0,0 +1,163 @@
+"""
+Background dispatcher for the post-turn outbox (``outbox_events``).
+
+After committing a processed turn, ``POST /games/{id}/process_turn`` used to
+write the map snapshot, DM every player (HTTP to the bot's notify server, up
+to 2 s each), post a notice and a freshly rendered map to a linked channel
+and update the deadline, all before it replied. A crash part-way through
+lost whatever had not run yet. Now ``GameService.process_turn`` commits one
+``outbox_events`` row per side effect in the same transaction as the new
+state (``GameRepo.save_state`` / ``PostTurnWrites``), the route returns, and
+``OutboxDispatcher`` runs the rows on a daemon thread through a handler per
+``kind`` (registered in ``api/shared.py``).
+
+- **At least once.** A row is marked ``done`` only after its handler returns.
+  Claiming leases the row (``DatabaseService.claim_outbox_events``), so a
+  worker that dies mid-handler leaves it to come due again. With several
+  uvicorn workers, ``FOR UPDATE SKIP LOCKED`` hands each row to one of them.
+- **Idempotent handlers.** Because a row can run twice, handlers check before
+  writing (a snapshot for that turn already exists; the game has already
+  moved past that turn, so its map is stale). Telegram sends that fail
+  individually are logged by the notification helpers and do not fail the
+  row -- re-sending to everyone to retry one recipient would be worse.
+- **Retries.** A handler that raises (database down, renderer crashed) is
+  retried with exponential backoff, ``retry_base`` doubling up to
+  ``retry_max`` seconds, then marked ``dead`` after ``max_attempts``. The
+  error is kept in ``last_error``.
+- **Prompt.** ``wake()`` after a commit dispatches immediately; otherwise the
+  thread polls every ``poll_interval`` seconds, which also picks up rows other
+  workers committed and rows whose retry came due.
+- **Timed.** Each handler run is observed in
+  ``diplomacy_outbox_handler_seconds`` by kind and outcome (``GET /metrics``).
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from datetime import timedelta
+from typing import Any
+
+from metrics import REGISTRY
+from persistence.database import utcnow_naive
+
+logger = logging.getLogger("diplomacy.server.outbox")
+
+HANDLER_SECONDS = REGISTRY.histogram(
+    "diplomacy_outbox_handler_seconds",
+    "Time to run one post-turn outbox row, by kind and outcome.",
+    ("kind", "outcome"),
+)
+
+DEFAULT_POLL_INTERVAL = 5.0
+DEFAULT_BATCH_SIZE = 20
+DEFAULT_MAX_ATTEMPTS = 8
+DEFAULT_RETRY_BASE = 2.0
+DEFAULT_RETRY_MAX = 600.0
+DEFAULT_LEASE = 300.0
+
+OutboxHandler = Callable[[dict[str, Any]], None]
+
+
+class OutboxDispatcher:
+    """Runs due ``outbox_events`` rows through ``handlers[kind]``.
+
+    ``db`` is a ``DatabaseService``. Each handler receives the claimed row as a
+    dict (``id``, ``game_pk``, ``game_id``, ``turn``, ``kind``, ``payload``,
+    ``attempts``). ``drain()`` runs everything due on the calling thread;
+    ``start()`` does the same on a background thread until ``stop()``.
+    """
+
+    def __init__(
+        self,
+        db: Any,
+        handlers: dict[str, OutboxHandler],
+        *,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        retry_base: float = DEFAULT_RETRY_BASE,
+        retry_max: float = DEFAULT_RETRY_MAX,
+        lease: float = DEFAULT_LEASE,
+    ) -> None:
+        self.db = db
+        self.handlers = handlers
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.lease = timedelta(seconds=lease)
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="outbox-dispatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop after the row in hand; unfinished rows stay leased and are
+        picked up again once the lease runs out."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def wake(self) -> None:
+        """Dispatch now rather than at the next poll (call after a commit)."""
+        self._wake.set()
+
+    def drain(self) -> int:
+        """Run every row that is due, in batches, until none are left (or the
+        dispatcher is stopping). Returns how many rows were attempted."""
+        attempted = 0
+        while not self._stop.is_set():
+            events = self.db.claim_outbox_events(self.batch_size, self.lease)
+            if not events:
+                break
+            for event in events:
+                if self._stop.is_set():
+                    break
+                self.dispatch(event)
+                attempted += 1
+        return attempted
+
+    def dispatch(self, event: dict[str, Any]) -> bool:
+        """Run one claimed row's handler and record the outcome. True on success."""
+        handler = self.handlers.get(event["kind"])
+        started = time.perf_counter()
+        try:
+            if handler is None:
+                raise LookupError(f"no outbox handler for kind {event['kind']!r}")
+            handler(event)
+        except Exception as e:  # noqa: BLE001 -- recorded on the row and retried
+            HANDLER_SECONDS.labels(event["kind"], "failed").observe(time.perf_counter() - started)
+            retry_at = None
+            if event["attempts"] < self.max_attempts:
+                delay = min(self.retry_max, self.retry_base * 2 ** (event["attempts"] - 1))
+                retry_at = utcnow_naive() + timedelta(seconds=delay)
+            logger.warning(
+                f"Outbox {event['kind']} for game {event['game_id']} turn {event['turn']} "
+                f"failed (attempt {event['attempts']}): {e}"
+                + ("" if retry_at else "; giving up")
+            )
+            self.db.retry_outbox_event(event["id"], f"{type(e).__name__}: {e}", retry_at)
+            return False
+        HANDLER_SECONDS.labels(event["kind"], "done").observe(time.perf_counter() - started)
+        self.db.complete_outbox_event(event["id"])
+        return True
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.drain()
+            except Exception as e:  # noqa: BLE001 -- keep polling through DB outages
+                logger.error(f"Outbox dispatcher error: {e}")
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
@@ -0,0 +1,78 @@
+"""
+Per-request latency and database round-trips, recorded for ``GET /metrics``.
+
+``RequestMetricsMiddleware`` wraps the whole API app as plain ASGI (no
+``BaseHTTPMiddleware``, which would buffer streamed bodies such as the SSE
+stream). For each HTTP request it records:
+
+- ``diplomacy_http_request_seconds{method,route}`` -- time until the app
+  returned, i.e. the response was sent.
+- ``diplomacy_http_requests_total{method,route,status}``.
+- ``diplomacy_http_db_statements{route}`` -- SQL statements the request
+  ran (``persistence.engine.counting_statements``), including those made
+  from ``def`` routes and ``run_blocking`` threads.
+
+``route`` is the matched route's path template (``/games/{game_id}/state``),
+never the raw path, so game ids don't become series; unmatched paths share
+``<unmatched>``.
+"""
+from __future__ import annotations
+
+import time
+from collections.abc import Awaitable, Callable, MutableMapping
+from typing import Any
+
+from metrics import REGISTRY
+from persistence.engine import counting_statements
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+UNMATCHED = "<unmatched>"
+
+REQUEST_SECONDS = REGISTRY.histogram(
+    "diplomacy_http_request_seconds", "HTTP request latency by route template.", ("method", "route")
+)
+REQUESTS = REGISTRY.counter(
+    "diplomacy_http_requests_total", "HTTP requests by route template and status.", ("method", "route", "status")
+)
+REQUEST_STATEMENTS = REGISTRY.histogram(
+    "diplomacy_http_db_statements",
+    "SQL statements run per HTTP request, by route template.",
+    ("route",),
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55),
+)
+
+
+class RequestMetricsMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        with counting_statements() as statements:
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                elapsed = time.perf_counter() - started
+                # The router stores the matched route in the (shared) scope.
+                route = getattr(scope.get("route"), "path", UNMATCHED)
+                method = scope["method"]
+                REQUEST_SECONDS.labels(method, route).observe(elapsed)
+                REQUESTS.labels(method, route, status).inc()
+                REQUEST_STATEMENTS.labels(route).observe(statements[0])
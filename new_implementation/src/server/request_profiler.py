@@ -0,0 +1,295 @@
+"""
+On-demand cProfile captures of slow API requests, for the admin dashboard.
+
+A ``/games/{id}/map/resolution`` or ``process_turn`` call that occasionally
+takes seconds in production leaves nothing behind but its latency.
+``RequestProfilerMiddleware`` runs chosen requests under ``cProfile`` and
+keeps the slow ones in ``RequestProfiler``'s ring buffer, which the
+``/dashboard/api/profiles`` routes serve.
+
+- **Sampled, kept if slow.** A request is profiled when its route template
+  has a sampling rate (``DIPLOMACY_PROFILE_ROUTES``, e.g.
+  ``/games/{game_id}/process_turn=1,/games/{game_id}/map/resolution=0.25``;
+  every other route uses ``DIPLOMACY_PROFILE_DEFAULT_RATE``) and the coin
+  comes up. Its profile is kept only when it took at least
+  ``DIPLOMACY_PROFILE_SLOW_MS``. A request sent with ``X-Profile: 1`` and a
+  valid ``X-Admin-Token`` is always profiled and kept. The rates and the
+  threshold can be changed at runtime (``PUT /dashboard/api/profiles/config``).
+- **Free when off.** With no rate above zero, a request costs one attribute
+  check and a scan of its header names for ``x-profile`` (about half a
+  microsecond more than an empty middleware).
+- **One at a time.** Since Python 3.12, ``cProfile`` records every thread,
+  so the work a ``def`` route or ``run_blocking`` hands to a thread is in the
+  profile. Only one profiler can run per process, though: a request picked
+  while another is being profiled runs unprofiled (counted as ``skipped``).
+  Anything else the process did meanwhile (other requests on the event loop,
+  the outbox thread) shows up in the profile too.
+- **Top N only.** A kept profile stores the ``DIPLOMACY_PROFILE_TOP``
+  functions with the most cumulative time (default 40), not the raw stats;
+  the buffer holds the last ``DIPLOMACY_PROFILE_BUFFER`` profiles (default 50).
+"""
+from __future__ import annotations
+
+import cProfile
+import hmac
+import itertools
+import os
+import pstats
+import random
+import re
+import threading
+import time
+from collections import deque
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from starlette.routing import compile_path
+
+from metrics import REGISTRY
+
+from .request_metrics import ASGIApp, Message, Receive, Scope, Send
+
+__all__ = ["ProfilerConfig", "RequestProfile", "RequestProfiler", "RequestProfilerMiddleware"]
+
+PROFILE_HEADER = b"x-profile"
+ADMIN_HEADER = b"x-admin-token"
+
+DEFAULT_TOP = 40
+DEFAULT_BUFFER = 50
+
+_OUTCOMES = REGISTRY.counter(
+    "diplomacy_request_profiles_total",
+    "Requests picked for profiling, by outcome (kept, discarded as fast, skipped as busy).",
+    ("outcome",),
+)
+_KEPT, _DISCARDED, _SKIPPED = (_OUTCOMES.labels(o) for o in ("kept", "discarded", "skipped"))
+
+
+def _parse_routes(raw: str) -> dict[str, float]:
+    routes: dict[str, float] = {}
+    for item in filter(None, (part.strip() for part in raw.split(","))):
+        template, _, rate = item.rpartition("=")
+        routes[template.strip()] = float(rate)
+    return routes
+
+
+@dataclass(frozen=True)
+class ProfilerConfig:
+    slow_ms: float = 0.0
+    default_rate: float = 0.0
+    routes: Mapping[str, float] = field(default_factory=dict)
+    top: int = DEFAULT_TOP
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str] = os.environ) -> ProfilerConfig:
+        return cls(
+            slow_ms=float(environ.get("DIPLOMACY_PROFILE_SLOW_MS", "") or 0),
+            default_rate=float(environ.get("DIPLOMACY_PROFILE_DEFAULT_RATE", "") or 0),
+            routes=_parse_routes(environ.get("DIPLOMACY_PROFILE_ROUTES", "")),
+            top=int(environ.get("DIPLOMACY_PROFILE_TOP", "") or DEFAULT_TOP),
+        )
+
+    def validate(self) -> None:
+        """Raise ``ValueError`` for a rate outside [0, 1], a negative threshold or
+        a route template Starlette cannot compile."""
+        if self.slow_ms < 0 or self.top < 1:
+            raise ValueError("slow_ms must be >= 0 and top >= 1")
+        for rate in (self.default_rate, *self.routes.values()):
+            if not 0 <= rate <= 1:
+                raise ValueError(f"sampling rate {rate} is not between 0 and 1")
+        for template in self.routes:
+            if not template.startswith("/"):
+                raise ValueError(f"route template {template!r} must start with '/'")
+            try:
+                compile_path(template)
+            except (AssertionError, ValueError) as e:  # unknown convertor, duplicate param
+                raise ValueError(f"invalid route template {template!r}: {e}") from e
+
+    @property
+    def sampling(self) -> bool:
+        return self.default_rate > 0 or any(rate > 0 for rate in self.routes.values())
+
+
+@dataclass
+class RequestProfile:
+    id: int
+    method: str
+    path: str
+    route: str
+    status: int
+    duration_ms: float
+    reason: str  # "header" or "sampled"
+    started_at: str
+    total_calls: int
+    functions: list[dict[str, Any]]
+
+    def summary(self) -> dict[str, Any]:
+        out = asdict(self)
+        del out["functions"]
+        return out
+
+
+def _short_path(filename: str) -> str:
+    parts = filename.replace("\\", "/").split("/")
+    return "/".join(parts[-3:])
+
+
+def _top_functions(profile: cProfile.Profile, top: int) -> tuple[int, list[dict[str, Any]]]:
+    raw = pstats.Stats(profile).stats  # type: ignore[attr-defined]
+    total_calls = sum(nc for _, nc, _, _, _ in raw.values())
+    ranked = sorted(raw.items(), key=lambda item: item[1][3], reverse=True)[:top]
+    return total_calls, [
+        {
+            "function": f"{_short_path(filename)}:{line}({name})",
+            "calls": nc,
+            "primitive_calls": cc,
+            "tottime_ms": round(tt * 1000, 3),
+            "cumtime_ms": round(ct * 1000, 3),
+        }
+        for (filename, line, name), (cc, nc, tt, ct, _) in ranked
+    ]
+
+
+class RequestProfiler:
+    """Which requests to profile, and the ring buffer of kept profiles."""
+
+    def __init__(self, config: ProfilerConfig, *, admin_token: str, capacity: int = DEFAULT_BUFFER) -> None:
+        config.validate()
+        self.admin_token = admin_token
+        self._profiles: deque[RequestProfile] = deque(maxlen=capacity)
+        self._ids = itertools.count(1)
+        self._busy = threading.Lock()
+        self._lock = threading.Lock()
+        self.configure(config)
+
+    @classmethod
+    def from_env(cls, *, admin_token: str, environ: Mapping[str, str] = os.environ) -> RequestProfiler:
+        capacity = int(environ.get("DIPLOMACY_PROFILE_BUFFER", "") or DEFAULT_BUFFER)
+        return cls(ProfilerConfig.from_env(environ), admin_token=admin_token, capacity=capacity)
+
+    def configure(self, config: ProfilerConfig) -> None:
+        config.validate()
+        patterns = [(compile_path(template)[0], rate) for template, rate in config.routes.items()]
+        # One assignment each, so a request never sees half of a new config.
+        self._patterns: list[tuple[re.Pattern[str], float]] = patterns
+        self.config = config
+        self.sampling = config.sampling
+
+    def rate_for(self, path: str) -> float:
+        for pattern, rate in self._patterns:
+            if pattern.match(path):
+                return rate
+        return self.config.default_rate
+
+    def forced(self, headers: list[tuple[bytes, bytes]]) -> bool:
+        """``X-Profile: 1`` with the right ``X-Admin-Token``."""
+        values = dict(headers)
+        token = values.get(ADMIN_HEADER, b"").decode("latin-1")
+        return values.get(PROFILE_HEADER) == b"1" and bool(self.admin_token) and hmac.compare_digest(
+            token, self.admin_token
+        )
+
+    def try_begin(self) -> bool:
+        """Claim the process's one profiler slot; ``False`` if it is taken."""
+        return self._busy.acquire(blocking=False)
+
+    def end(self) -> None:
+        self._busy.release()
+
+    def stats(self) -> dict[str, int]:
+        return {outcome: int(child.value) for outcome, child in
+                (("kept", _KEPT), ("discarded", _DISCARDED), ("skipped", _SKIPPED))}
+
+    def record(self, profile: RequestProfile) -> None:
+        with self._lock:
+            self._profiles.append(profile)
+
+    def next_id(self) -> int:
+        return next(self._ids)
+
+    def profiles(self) -> list[RequestProfile]:
+        """Kept profiles, newest first."""
+        with self._lock:
+            return list(reversed(self._profiles))
+
+    def get(self, profile_id: int) -> RequestProfile | None:
+        return next((p for p in self.profiles() if p.id == profile_id), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._profiles.clear()
+
+
+class RequestProfilerMiddleware:
+    def __init__(self, app: ASGIApp, profiler: RequestProfiler) -> None:
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        profiler = self.profiler
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        reason = ""
+        for name, _ in scope["headers"]:
+            if name == PROFILE_HEADER:
+                if profiler.forced(scope["headers"]):
+                    reason = "header"
+                break
+        if not reason and profiler.sampling and random.random() < profiler.rate_for(scope["path"]):
+            reason = "sampled"
+        if reason:
+            await self._profiled(scope, receive, send, reason)
+        else:
+            await self.app(scope, receive, send)
+
+    async def _profiled(self, scope: Scope, receive: Receive, send: Send, reason: str) -> None:
+        profiler = self.profiler
+        if not profiler.try_begin():
+            _SKIPPED.inc()
+            await self.app(scope, receive, send)
+            return
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        profile = cProfile.Profile()
+        started_at = datetime.now(UTC).isoformat()
+        started = time.perf_counter()
+        try:
+            try:
+                profile.enable()
+            except ValueError:  # another profiling tool (a debugger, a test's profiler) is active
+                _SKIPPED.inc()
+                await self.app(scope, receive, send)
+                return
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                profile.disable()
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                if reason == "header" or elapsed_ms >= profiler.config.slow_ms:
+                    total_calls, functions = _top_functions(profile, profiler.config.top)
+                    profiler.record(RequestProfile(
+                        id=profiler.next_id(),
+                        method=scope["method"],
+                        path=scope["path"],
+                        route=getattr(scope.get("route"), "path", ""),
+                        status=status,
+                        duration_ms=round(elapsed_ms, 3),
+                        reason=reason,
+                        started_at=started_at,
+                        total_calls=total_calls,
+                        functions=functions,
+                    ))
+                    _KEPT.inc()
+                else:
+                    _DISCARDED.inc()
+        finally:
+            profiler.end()
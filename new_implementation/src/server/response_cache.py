@@ -7,7 +7,8 @@ performance and reduce database load for frequently accessed data.
 Features:
 - In-memory caching with TTL (Time To Live)
 - Cache invalidation strategies
-- Cache statistics and monitoring
+- Cache statistics and monitoring (per-endpoint hits and misses in
+  ``diplomacy_response_cache_lookups_total``, served at ``GET /metrics``)
 - Configurable cache policies per endpoint
 """
 
@@ -17,10 +18,19 @@ import json
 import logging
 from typing import Dict, Any, Optional, Callable
 from functools import wraps
+import inspect
 import threading
 
+from metrics import REGISTRY
+
 logger = logging.getLogger(__name__)
 
+_LOOKUPS = REGISTRY.counter(
+    "diplomacy_response_cache_lookups_total",
+    "Response cache lookups by cached endpoint and result.",
+    ("endpoint", "result"),
+)
+
 class ResponseCache:
     """High-performance response cache with TTL and invalidation support."""
     
@@ -273,13 +283,16 @@ def cached_response(ttl: int = None, key_params: list = None, invalidate_on: lis
         ttl: Time-to-live in seconds (uses default if None)
         key_params: List of parameter names to include in cache key
         invalidate_on: List of endpoints that should invalidate this cache
+
+    Works on ``async def`` functions too (the wrapper is then a coroutine
+    function, so FastAPI still awaits it on the event loop).
     """
     def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            # Extract endpoint name from function
-            endpoint = f"{func.__module__}.{func.__name__}"
-            
+        # Extract endpoint name from function
+        endpoint = f"{func.__module__}.{func.__name__}"
+        hits, misses = _LOOKUPS.labels(func.__name__, "hit"), _LOOKUPS.labels(func.__name__, "miss")
+
+        def params_for(args, kwargs) -> Dict[str, Any]:
             # Build cache key parameters from all arguments
             cache_params = {}
             if key_params:
@@ -289,18 +302,39 @@ def cached_response(ttl: int = None, key_params: list = None, invalidate_on: lis
                         cache_params[param_name] = kwargs[param_name]
             else:
                 # Use all arguments (both positional and keyword)
-                import inspect
                 sig = inspect.signature(func)
                 bound_args = sig.bind(*args, **kwargs)
                 bound_args.apply_defaults()
                 cache_params = dict(bound_args.arguments)
+            return cache_params
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                cache_params = params_for(args, kwargs)
+                cached_result = _response_cache.get(endpoint, cache_params)
+                if cached_result is not None:
+                    hits.inc()
+                    return cached_result
+                misses.inc()
+                result = await func(*args, **kwargs)
+                _response_cache.put(endpoint, result, ttl, cache_params)
+                return result
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            cache_params = params_for(args, kwargs)
             
             # Try to get from cache
             cached_result = _response_cache.get(endpoint, cache_params)
             if cached_result is not None:
+                hits.inc()
                 return cached_result
             
             # Cache miss - execute function
+            misses.inc()
             result = func(*args, **kwargs)
             
             # Cache the result
@@ -11,6 +11,7 @@ from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, InputMe
 from telegram.ext import ContextTypes
 
 from .api_client import api_post
+from .cache import invalidate_user
 from .help_text import DEMO_EXAMPLE_ORDERS, ORDER_FORMAT_NOTES
 from .maps import send_game_map
 from .utils import escape_markdown, safe_markdown_path
@@ -26,7 +27,7 @@ async def start_demo_game(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
 
         # Register the user first (required for joining games)
         try:
-            api_post("/users/persistent_register", {
+            await api_post("/users/persistent_register", {
                 "telegram_id": user_id,
                 "full_name": user_name
             })
@@ -35,15 +36,16 @@ async def start_demo_game(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             logger.info(f"User registration note: {e}")
 
         # Create a demo game
-        game_resp = api_post("/games/create", {"map_name": "demo"})
+        game_resp = await api_post("/games/create", {"map_name": "demo"})
         game_id = game_resp["game_id"]
 
         # Add the user as Germany
-        api_post(f"/games/{game_id}/join", {
+        await api_post(f"/games/{game_id}/join", {
             "telegram_id": user_id,
             "game_id": int(game_id),
             "power": "GERMANY"
         })
+        invalidate_user(user_id)
 
         # Add AI players for other powers (they won't submit orders)
         other_powers = ["AUSTRIA", "ENGLAND", "FRANCE", "ITALY", "RUSSIA", "TURKEY"]
@@ -51,7 +53,7 @@ async def start_demo_game(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             ai_telegram_id = f"ai_{power.lower()}"
             # Register AI player
             try:
-                api_post("/users/persistent_register", {
+                await api_post("/users/persistent_register", {
                     "telegram_id": ai_telegram_id,
                     "full_name": f"AI {power}"
                 })
@@ -60,7 +62,7 @@ async def start_demo_game(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
                 logger.info(f"AI player registration note: {e}")
 
             # Join the game
-            api_post(f"/games/{game_id}/join", {
+            await api_post(f"/games/{game_id}/join", {
                 "telegram_id": ai_telegram_id,
                 "game_id": int(game_id),
                 "power": power
@@ -1,26 +1,44 @@
 """
 API client utilities for communicating with the Diplomacy API server.
+
+Every call goes through one pooled ``httpx.AsyncClient`` (see
+``server.async_http``): handlers ``await`` it instead of blocking the bot's
+event loop, and connections are kept alive across calls.
 """
 import logging
 import os
 import random
 import time
-import requests
-from typing import Optional
+from dataclasses import dataclass
+from typing import Any, Optional
 from urllib.parse import urlparse
 
+import httpx
+
+from ..async_http import PooledAsyncClient
 from .config import API_URL
 
 # BOT_SECRET is used to authenticate telegram_id-based requests to the API.
 # Must match DIPLOMACY_BOT_SECRET on the server.
 BOT_SECRET = os.environ.get("DIPLOMACY_BOT_SECRET", "")
 
-# Request timeout (seconds) for all outbound calls to the API. A bot request
-# that hangs forever on a stuck connection is an availability bug, not just
-# lint noise (bandit B113) -- every requests.* call in this module and in
-# telegram_bot/channel_commands.py uses this constant.
+# Request timeout (seconds) for outbound calls to the API. A bot request that
+# hangs forever on a stuck connection is an availability bug, not just lint
+# noise (bandit B113). This is the default; ENDPOINT_TIMEOUTS overrides it for
+# the routes that legitimately take longer.
 DEFAULT_API_TIMEOUT = 10
 
+# (path regex, seconds), first match wins. Map renders (cairosvg + Pillow)
+# and turn adjudication are the slow routes; everything else is a lookup.
+ENDPOINT_TIMEOUTS = (
+    (r"/process_turn$", 60),
+    (r"/map(/|$)|\.png$", 30),
+)
+
+_pool = PooledAsyncClient(
+    API_URL, default_timeout=DEFAULT_API_TIMEOUT, endpoint_timeouts=ENDPOINT_TIMEOUTS
+)
+
 logger = logging.getLogger("diplomacy.telegram_bot.api_client")
 
 
@@ -45,8 +63,8 @@ def wait_for_api_health(max_attempts: int = 10, base_delay: float = 0.5) -> None
     for attempt in range(1, max_attempts + 1):
         for ep in endpoints:
             try:
-                resp = requests.get(f"{API_URL}{ep}", timeout=2)
-                if resp.ok:
+                resp = httpx.get(f"{API_URL}{ep}", timeout=2)
+                if resp.is_success:
                     logger.info(f"API health check succeeded on {ep} (attempt {attempt})")
                     return
                 last_error = Exception(f"HTTP {resp.status_code} on {ep}")
@@ -69,35 +87,35 @@ def _bot_headers() -> dict:
     return {}
 
 
-class ApiError(requests.HTTPError):
+class ApiError(httpx.HTTPStatusError):
     """An HTTP error from the API, with the server's ``detail`` message (if
     any) folded into the exception's string.
 
     FastAPI error responses are shaped ``{"detail": "<human-readable
     reason>"}`` -- "Power already taken", "Sender not in game", "Not
     authenticated", etc (see ``src/server/api/routes/*.py``). Plain
-    ``requests.HTTPError.__str__`` only ever produces the generic ``"401
-    Client Error: Unauthorized for url: ..."`` line, discarding that reason
-    entirely -- and every ``except Exception as e: reply_text(f"...: {e}")``
-    handler across the bot package (dozens of them) relies on ``str(e)``
-    being something worth showing a player. Subclassing ``HTTPError``
-    (rather than a bare ``Exception``) means call sites that already catch
-    ``requests.HTTPError`` specifically (``link_account.py``, which reads
-    ``e.response.status_code``/``.json()`` itself) keep working unchanged --
-    ``.response`` is still populated -- while every generic ``except
-    Exception`` at the other ~40 call sites starts showing the real reason
+    ``httpx.HTTPStatusError.__str__`` only ever produces the generic
+    ``"Client error '401 Unauthorized' for url ..."`` line, discarding that
+    reason entirely -- and every ``except Exception as e:
+    reply_text(f"...: {e}")`` handler across the bot package (dozens of them)
+    relies on ``str(e)`` being something worth showing a player. Subclassing
+    ``HTTPStatusError`` (rather than a bare ``Exception``) keeps
+    ``.response`` populated for the call sites that catch ``ApiError``
+    specifically (``link_account.py``, which reads
+    ``e.response.status_code``/``.json()`` itself), while every generic
+    ``except Exception`` at the other ~40 call sites shows the real reason
     for free.
     """
 
 
-def _raise_for_status(resp: requests.Response) -> None:
+def _raise_for_status(resp: httpx.Response) -> None:
     """Like ``resp.raise_for_status()``, but raises :class:`ApiError` whose
     message is the server's JSON ``detail`` field when present, falling back
-    to the normal ``HTTPError`` text otherwise (non-JSON body, or JSON
+    to the normal ``HTTPStatusError`` text otherwise (non-JSON body, or JSON
     without a ``detail`` key)."""
     try:
         resp.raise_for_status()
-    except requests.HTTPError as exc:
+    except httpx.HTTPStatusError as exc:
         detail: Optional[str] = None
         try:
             body = resp.json()
@@ -106,10 +124,16 @@ def _raise_for_status(resp: requests.Response) -> None:
         if isinstance(body, dict) and isinstance(body.get("detail"), str):
             detail = body["detail"]
         message = detail if detail else str(exc)
-        raise ApiError(message, response=resp, request=resp.request) from exc
+        raise ApiError(message, request=resp.request, response=resp) from exc
+
+
+async def _request(method: str, endpoint: str, **kwargs: Any) -> httpx.Response:
+    resp = await _pool.request(method, endpoint, headers=_bot_headers(), **kwargs)
+    _raise_for_status(resp)
+    return resp
 
 
-def api_post(endpoint: str, json_data: dict) -> dict:
+async def api_post(endpoint: str, json_data: dict) -> dict:
     """Make a POST request to the API.
 
     Sends X-Bot-Secret header for server-side auth on management endpoints.
@@ -119,14 +143,11 @@ def api_post(endpoint: str, json_data: dict) -> dict:
     payload = dict(json_data)
     if "telegram_id" in payload and BOT_SECRET:
         payload.setdefault("bot_secret", BOT_SECRET)
-    resp = requests.post(
-        f"{API_URL}{endpoint}", json=payload, headers=_bot_headers(), timeout=DEFAULT_API_TIMEOUT
-    )
-    _raise_for_status(resp)
+    resp = await _request("POST", endpoint, json=payload)
     return resp.json()
 
 
-def api_get(endpoint: str, telegram_id: Optional[str] = None) -> dict:
+async def api_get(endpoint: str, telegram_id: Optional[str] = None) -> dict:
     """Make a GET request to the API.
 
     Mirrors ``api_post``'s ``bot_secret`` injection, but via the query string:
@@ -142,20 +163,54 @@ def api_get(endpoint: str, telegram_id: Optional[str] = None) -> dict:
         params["telegram_id"] = telegram_id
         if BOT_SECRET:
             params["bot_secret"] = BOT_SECRET
-    resp = requests.get(
-        f"{API_URL}{endpoint}", headers=_bot_headers(), params=params, timeout=DEFAULT_API_TIMEOUT
-    )
-    _raise_for_status(resp)
+    resp = await _request("GET", endpoint, params=params or None)
     return resp.json()
 
 
-def api_get_bytes(endpoint: str) -> bytes:
+async def api_get_bytes(endpoint: str) -> bytes:
     """Make a GET request to the API and return the raw response body (e.g. a PNG).
 
     Mirrors ``api_get``'s auth handling (``X-Bot-Secret`` header via
     ``_bot_headers()``); unlike ``api_get`` the response is not JSON-decoded.
     """
-    resp = requests.get(f"{API_URL}{endpoint}", headers=_bot_headers(), timeout=DEFAULT_API_TIMEOUT)
-    _raise_for_status(resp)
+    resp = await _request("GET", endpoint)
     return resp.content
 
+
+@dataclass(frozen=True)
+class ApiImage:
+    """An image fetched with ``api_get_image``.
+
+    ``content`` is ``None`` when the server answered ``304 Not Modified`` to the
+    ``If-None-Match`` the caller sent -- the caller already has this image.
+    """
+    content: Optional[bytes]
+    etag: Optional[str]
+
+
+async def api_get_image(endpoint: str, if_none_match: Optional[str] = None) -> ApiImage:
+    """Conditional GET for a rendered image (the ``/maps`` and ``/games/{id}/map*`` routes).
+
+    Those routes send a strong ``ETag`` derived from their render inputs; passing
+    the ETag of an image the bot already uploaded lets the server answer 304
+    without rendering or sending the PNG again.
+    """
+    headers = _bot_headers()
+    if if_none_match:
+        headers["If-None-Match"] = if_none_match
+    resp = await _pool.request("GET", endpoint, headers=headers)
+    if resp.status_code == 304:
+        return ApiImage(content=None, etag=resp.headers.get("ETag", if_none_match))
+    _raise_for_status(resp)
+    return ApiImage(content=resp.content, etag=resp.headers.get("ETag"))
+
+
+async def api_delete(endpoint: str) -> dict:
+    """Make a DELETE request to the API (same auth handling as ``api_get``)."""
+    resp = await _request("DELETE", endpoint)
+    return resp.json()
+
+
+async def close_api_client() -> None:
+    """Close the pooled HTTP client; registered as the bot's post-shutdown hook."""
+    await _pool.aclose()
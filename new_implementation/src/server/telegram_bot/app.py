@@ -12,7 +12,6 @@ import time
 import uvicorn
 from datetime import datetime
 
-import requests
 from telegram import BotCommand, Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import (
     Application, ApplicationBuilder, CommandHandler, ContextTypes, CallbackQueryHandler,
@@ -21,7 +20,10 @@ from telegram.ext import (
 
 # Import directly from modules
 from server.telegram_bot.config import TELEGRAM_TOKEN, API_URL
-from server.telegram_bot.api_client import api_post, api_get, wait_for_api_health, _validate_api_url
+from server.telegram_bot.api_client import (
+    ApiError, api_post, api_get, close_api_client, wait_for_api_health, _validate_api_url
+)
+from server.telegram_bot.cache import invalidate_user
 from server.telegram_bot.help_text import DEMO_EXAMPLE_ORDERS, DEMO_UNITS, ORDER_FORMAT_NOTES
 from server.telegram_bot.maps import send_default_map, send_game_map, map_command, replay
 from server.telegram_bot.games import (
@@ -92,6 +94,14 @@ async def _post_init(app: Application) -> None:
     await app.bot.set_my_commands(BOT_COMMANDS)
 
 
+async def _post_shutdown(app: Application) -> None:
+    """Close the pooled API client's keep-alive connections and write out any
+    buffered channel analytics on shutdown."""
+    await close_api_client()
+    from server.api.shared import analytics_buffer
+    await asyncio.to_thread(analytics_buffer.stop)
+
+
 async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle button clicks from inline keyboards"""
     query = update.callback_query
@@ -110,13 +120,14 @@ async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         power = parts[3]
 
         try:
-            result = api_post(f"/games/{game_id}/join", {
+            result = await api_post(f"/games/{game_id}/join", {
                 "telegram_id": user_id,
                 "game_id": int(game_id),
                 "power": power
             })
+            invalidate_user(user_id)
             await query.edit_message_text(f"🎉 Successfully joined Game {game_id} as {power}!")
-        except requests.HTTPError as e:
+        except ApiError as e:
             hint = ""
             if getattr(e, "response", None) is not None and e.response.status_code == 401:
                 hint = "\n\n💡 Try /register first."
@@ -240,7 +251,7 @@ async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             return
 
         try:
-            result = api_post("/admin/delete_all_games", {})
+            result = await api_post("/admin/delete_all_games", {})
             message = (
                 "✅ *All games deleted successfully!*\n\n"
                 f"🗑️ Result: {result.get('message', 'Games deleted')}\n"
@@ -259,7 +270,7 @@ async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             return
 
         try:
-            result = api_post("/admin/recreate_admin_user", {})
+            result = await api_post("/admin/recreate_admin_user", {})
             await query.edit_message_text(
                 f"✅ *Admin User Recreated!*\n\n"
                 f"👤 Result: {result.get('message', 'User created')}\n"
@@ -276,8 +287,8 @@ async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             return
 
         try:
-            games_count = len(api_get("/admin/games_count") or [])
-            users_count = len(api_get("/admin/users_count") or [])
+            games_count = len(await api_get("/admin/games_count") or [])
+            users_count = len(await api_get("/admin/users_count") or [])
 
             status_text = (
                 "📊 *System Status*\n\n"
@@ -398,7 +409,7 @@ async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         power = parts[3]
 
         try:
-            game_state = api_get(f"/games/{game_id}/state")
+            game_state = await api_get(f"/games/{game_id}/state")
             if not game_state:
                 await query.edit_message_text(f"❌ Could not retrieve game state for game {game_id}")
                 return
@@ -427,7 +438,7 @@ async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         game_id = data.split("_")[2]
 
         try:
-            result = api_get(f"/games/{game_id}/orders/history")
+            result = await api_get(f"/games/{game_id}/orders/history")
             history = result.get("order_history", {})
 
             if not history:
@@ -460,7 +471,7 @@ async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         power = parts[3]
 
         try:
-            api_post("/games/set_orders", {
+            await api_post("/games/set_orders", {
                 "game_id": game_id,
                 "power": power,
                 "orders": [],
@@ -491,7 +502,13 @@ def main():
         print(f"Error: API health check failed: {e}")
         return
 
-    app = ApplicationBuilder().token(TELEGRAM_TOKEN).post_init(_post_init).build()
+    app = (
+        ApplicationBuilder()
+        .token(TELEGRAM_TOKEN)
+        .post_init(_post_init)
+        .post_shutdown(_post_shutdown)
+        .build()
+    )
     
     # Set telegram bot instance for channel posting
     set_telegram_bot(app.bot)
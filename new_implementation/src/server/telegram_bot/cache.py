@@ -0,0 +1,174 @@
+"""
+Bot-side caches for data that only changes when a turn is processed.
+
+One interactive order (``/selectunit`` -> unit -> support target -> order)
+used to fetch ``GET /games/{id}/legal_orders/{power}`` at every step, and every
+command re-fetched ``GET /users/{id}/games`` to resolve the player's game and
+power. Neither answer changes between turns, so both are cached here:
+
+- **Legal orders** are keyed ``(game_id, power, phase_code)``. The bot learns a
+  game's current phase from the legal-orders payload itself (``"phase"``), and
+  forgets it when a turn-processed notification for that game arrives on
+  ``/notify`` (see ``notifications.py``) or when this bot processes the turn
+  itself. An order-entry flow therefore costs one legal-orders fetch per phase.
+- **User games** are keyed by ``user_id``, dropped on any notification for that
+  user (joins, game full, turn processed) and on the bot's own join/quit/replace.
+- **Map file_ids**: Telegram hands back a ``file_id`` for every uploaded photo
+  and accepts it in place of the bytes on any later send, from any chat. Keyed
+  by the map endpoint together with the ETag the API sent for it, so the same
+  board goes to the other six players without being downloaded or uploaded
+  again, and a new board (new ETag) is uploaded once.
+
+Legal orders and user games have a short TTL as a backstop for a missed
+notification (the notify server was down, or the turn was processed from the
+web UI by the only Telegram player), so a stale entry can never outlive a few
+minutes. A map file_id can't go stale: the API's 304 is what vouches for it.
+
+The ``/notify`` endpoint runs in its own thread (``app.py``), hence the lock.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+logger = logging.getLogger("diplomacy.telegram_bot.cache")
+
+# Backstop TTLs (seconds); explicit invalidation is the normal path.
+LEGAL_ORDERS_TTL = 300
+USER_GAMES_TTL = 60
+# Telegram file_ids don't expire; this just bounds how long an unused one is kept.
+MAP_FILE_ID_TTL = 24 * 3600
+
+
+class TTLCache:
+    """A small thread-safe LRU mapping whose entries expire after ``ttl`` seconds."""
+
+    def __init__(
+        self, ttl: float, max_entries: int = 1024, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        Args:
+            ttl: Seconds an entry stays valid after ``set``.
+            max_entries: Least-recently-used entries are evicted past this size.
+            clock: Monotonic time source (tests pass a fake one).
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any | None:
+        """The cached value, or ``None`` if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if self._clock() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, predicate: Callable[[Hashable, Any], bool]) -> int:
+        """Drop every entry for which ``predicate(key, value)`` is true; returns the count."""
+        with self._lock:
+            doomed = [k for k, (_exp, v) in self._entries.items() if predicate(k, v)]
+            for key in doomed:
+                del self._entries[key]
+            return len(doomed)
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class LegalOrdersCache:
+    """Legal-orders payloads keyed ``(game_id, power, phase_code)``.
+
+    ``get`` can only hit once the game's current phase is known, which it is
+    after the first ``put`` for that game and until ``invalidate_game``.
+    """
+
+    def __init__(self, ttl: float = LEGAL_ORDERS_TTL) -> None:
+        self._orders = TTLCache(ttl)
+        self._phases: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def get(self, game_id: str, power: str) -> dict | None:
+        with self._lock:
+            phase = self._phases.get(str(game_id))
+        if phase is None:
+            return None
+        return self._orders.get((str(game_id), power.upper(), phase))
+
+    def put(self, game_id: str, power: str, data: dict) -> None:
+        phase = data.get("phase")
+        if not phase:
+            return
+        self.note_phase(game_id, phase)
+        self._orders.set((str(game_id), power.upper(), phase), data)
+
+    def note_phase(self, game_id: str, phase: str) -> None:
+        """Record ``game_id``'s current phase, dropping entries for any other phase."""
+        game_id = str(game_id)
+        with self._lock:
+            previous = self._phases.get(game_id)
+            self._phases[game_id] = phase
+        if previous is not None and previous != phase:
+            self._orders.invalidate(lambda key, _v: key[0] == game_id and key[2] != phase)
+
+    def invalidate_game(self, game_id: str) -> None:
+        game_id = str(game_id)
+        with self._lock:
+            self._phases.pop(game_id, None)
+        self._orders.invalidate(lambda key, _v: key[0] == game_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._phases.clear()
+        self._orders.clear()
+
+
+legal_orders_cache = LegalOrdersCache()
+user_games_cache = TTLCache(USER_GAMES_TTL)
+# map endpoint path -> (etag, file_id)
+map_file_ids = TTLCache(MAP_FILE_ID_TTL, max_entries=4096)
+
+
+def invalidate_game(game_id: str) -> None:
+    """A turn was processed in ``game_id``: forget its legal orders and players' game lists."""
+    game_id = str(game_id)
+    legal_orders_cache.invalidate_game(game_id)
+    user_games_cache.invalidate(
+        lambda _uid, games: any(str(g.get("game_id")) == game_id for g in games)
+    )
+    logger.debug(f"Invalidated bot caches for game {game_id}")
+
+
+def invalidate_user(user_id: str) -> None:
+    """``user_id`` joined, left or was told something changed: refetch their games."""
+    user_games_cache.pop(str(user_id))
+
+
+def _reset_caches() -> None:
+    """Test hook: empty every bot-side cache."""
+    legal_orders_cache.clear()
+    user_games_cache.clear()
+    map_file_ids.clear()
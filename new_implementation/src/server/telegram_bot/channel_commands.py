@@ -9,7 +9,7 @@ import logging
 from telegram import Update
 from telegram.ext import ContextTypes
 
-from .api_client import DEFAULT_API_TIMEOUT, api_post, api_get
+from .api_client import api_delete, api_post, api_get
 from .game_context import fetch_user_games
 from .utils import escape_markdown
 
@@ -41,7 +41,7 @@ async def link_channel(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
     try:
         # Verify user is in the game or is admin
         user_id = str(user.id)
-        user_in_game = any(str(g["game_id"]) == game_id for g in fetch_user_games(user_id))
+        user_in_game = any(str(g["game_id"]) == game_id for g in await fetch_user_games(user_id))
         
         if not user_in_game and user_id != "8019538":  # Admin check
             await update.message.reply_text(
@@ -50,7 +50,7 @@ async def link_channel(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
             return
         
         # Link channel
-        result = api_post(
+        result = await api_post(
             f"/games/{game_id}/channel/link",
             {"channel_id": channel_id}
         )
@@ -89,7 +89,7 @@ async def unlink_channel(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     try:
         # Verify user is in the game or is admin
         user_id = str(user.id)
-        user_in_game = any(str(g["game_id"]) == game_id for g in fetch_user_games(user_id))
+        user_in_game = any(str(g["game_id"]) == game_id for g in await fetch_user_games(user_id))
         
         if not user_in_game and user_id != "8019538":  # Admin check
             await update.message.reply_text(
@@ -98,13 +98,7 @@ async def unlink_channel(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             return
         
         # Unlink channel
-        import requests
-
-        from .config import API_URL
-
-        result = requests.delete(
-            f"{API_URL}/games/{game_id}/channel/unlink", timeout=DEFAULT_API_TIMEOUT
-        ).json()
+        result = await api_delete(f"/games/{game_id}/channel/unlink")
         
         if result.get("status") == "ok":
             await update.message.reply_text(
@@ -134,7 +128,7 @@ async def channel_info(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
     game_id = args[0]
     
     try:
-        channel_info = api_get(f"/games/{game_id}/channel")
+        channel_info = await api_get(f"/games/{game_id}/channel")
         
         if not channel_info.get("linked"):
             await update.message.reply_text(
@@ -211,7 +205,7 @@ async def channel_settings(update: Update, context: ContextTypes.DEFAULT_TYPE) -
         
         # Update settings
         settings = {setting: value}
-        result = api_post(
+        result = await api_post(
             f"/games/{game_id}/channel/settings",
             settings
         )
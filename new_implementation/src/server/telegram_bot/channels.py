@@ -37,10 +37,10 @@ def _log_analytics_event(
     power: Optional[str] = None,
     metadata: Optional[Dict[str, Any]] = None
 ) -> None:
-    """Helper function to log analytics events."""
+    """Queue an analytics event; the shared buffer writes it in a later batch."""
     try:
-        from ...api.shared import db_service
-        db_service.log_channel_analytics_event(
+        from ...api.shared import analytics_buffer
+        analytics_buffer.add(
             game_id=game_id,
             channel_id=channel_id,
             event_type=event_type,
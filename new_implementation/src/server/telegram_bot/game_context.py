@@ -15,9 +15,8 @@ from __future__ import annotations
 
 from typing import Any, Optional
 
-import requests
-
-from .api_client import api_get
+from .api_client import ApiError, api_get
+from .cache import user_games_cache
 
 __all__ = ["GameContextError", "fetch_user_games", "resolve_game_and_power"]
 
@@ -36,7 +35,7 @@ class GameContextError(Exception):
         self.message = message
 
 
-def fetch_user_games(user_id: str) -> list[dict[str, Any]]:
+async def fetch_user_games(user_id: str) -> list[dict[str, Any]]:
     """The list of games ``user_id`` is an active player in.
 
     Wraps ``GET /users/{user_id}/games``, which returns a **dict** shaped
@@ -47,17 +46,26 @@ def fetch_user_games(user_id: str) -> list[dict[str, Any]]:
     ``telegram_id`` yet) is treated as "zero games" rather than propagated,
     matching how several call sites already handled it ad hoc before this
     module existed.
+
+    Served from ``cache.user_games_cache`` when warm: the list only changes on
+    a join/quit/replace or a processed turn, all of which invalidate it.
     """
+    cached = user_games_cache.get(str(user_id))
+    if cached is not None:
+        return cached
     try:
-        response = api_get(f"/users/{user_id}/games")
-    except requests.exceptions.HTTPError as e:
+        response = await api_get(f"/users/{user_id}/games")
+    except ApiError as e:
         if e.response is not None and e.response.status_code == 404:
-            return []
-        raise
-    return response.get("games", []) if response else []
+            response = None
+        else:
+            raise
+    games = response.get("games", []) if response else []
+    user_games_cache.set(str(user_id), games)
+    return games
 
 
-def resolve_game_and_power(user_id: str, game_id: Optional[str] = None) -> tuple[str, str]:
+async def resolve_game_and_power(user_id: str, game_id: Optional[str] = None) -> tuple[str, str]:
     """Resolve the ``(game_id, power)`` a Telegram user is acting for.
 
     - ``game_id`` given: looks that specific game up among the user's games;
@@ -77,7 +85,7 @@ def resolve_game_and_power(user_id: str, game_id: Optional[str] = None) -> tuple
     either gets a valid pair back or a ``GameContextError`` whose
     ``.message`` is already suitable to display.
     """
-    games = fetch_user_games(user_id)
+    games = await fetch_user_games(user_id)
 
     if game_id is not None:
         for g in games:
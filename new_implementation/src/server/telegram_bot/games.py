@@ -4,11 +4,11 @@ Game management commands for the Telegram bot.
 import logging
 from typing import Optional, Tuple
 
-import requests
 from telegram import Update, ReplyKeyboardMarkup, KeyboardButton, InlineKeyboardMarkup, InlineKeyboardButton
 from telegram.ext import ContextTypes
 
-from .api_client import api_post, api_get
+from .api_client import ApiError, api_post, api_get
+from .cache import invalidate_user, legal_orders_cache
 from .game_context import GameContextError, fetch_user_games, resolve_game_and_power
 from .utils import escape_markdown
 
@@ -84,7 +84,7 @@ async def register(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     full_name = f"{user.first_name} {user.last_name}".strip() if user.last_name else user.first_name
     username = user.username or ""
     try:
-        result = api_post("/users/persistent_register", {
+        result = await api_post("/users/persistent_register", {
             "telegram_id": user_id,
             "full_name": full_name,
             "username": username
@@ -121,7 +121,7 @@ async def games(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         return
     user_id = str(user.id)
     try:
-        games_list = fetch_user_games(user_id)
+        games_list = await fetch_user_games(user_id)
 
         if not games_list:
             keyboard = [
@@ -198,7 +198,7 @@ async def status(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     game_id_arg = args[0] if args else None
 
     try:
-        game_id, power = resolve_game_and_power(user_id, game_id_arg)
+        game_id, power = await resolve_game_and_power(user_id, game_id_arg)
     except GameContextError as e:
         await update.message.reply_text(e.message)
         return
@@ -207,10 +207,12 @@ async def status(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         return
 
     try:
-        view = api_get(f"/games/{game_id}/state")
+        view = await api_get(f"/games/{game_id}/state")
     except Exception as e:
         await update.message.reply_text(f"Could not retrieve status for game {game_id}: {e}")
         return
+    if view.get("phase"):
+        legal_orders_cache.note_phase(game_id, view["phase"])
 
     status_text = (
         f"📊 *Game {game_id} Status*\n\n"
@@ -221,7 +223,7 @@ async def status(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     )
 
     try:
-        deadline_data = api_get(f"/games/{game_id}/deadline")
+        deadline_data = await api_get(f"/games/{game_id}/deadline")
         deadline = deadline_data.get("deadline") if deadline_data else None
     except Exception:
         deadline = None
@@ -229,7 +231,7 @@ async def status(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         status_text += f"⏰ **Deadline:** {deadline}\n"
 
     try:
-        orders_status = api_get(f"/games/{game_id}/orders_status", telegram_id=user_id)
+        orders_status = await api_get(f"/games/{game_id}/orders_status", telegram_id=user_id)
     except Exception:
         orders_status = None
     if orders_status:
@@ -242,7 +244,7 @@ async def status(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
             status_text += "⏳ **Waiting on:** " + ", ".join(missing) + "\n"
 
     try:
-        draw_status = api_get(f"/games/{game_id}/draw_vote_status")
+        draw_status = await api_get(f"/games/{game_id}/draw_vote_status")
     except Exception:
         draw_status = None
     if draw_status:
@@ -278,7 +280,7 @@ async def _cast_draw_vote(update: Update, context: ContextTypes.DEFAULT_TYPE, vo
     game_id_arg = args[0] if args else None
 
     try:
-        game_id, power = resolve_game_and_power(user_id, game_id_arg)
+        game_id, power = await resolve_game_and_power(user_id, game_id_arg)
     except GameContextError as e:
         await update.message.reply_text(e.message)
         return
@@ -287,7 +289,7 @@ async def _cast_draw_vote(update: Update, context: ContextTypes.DEFAULT_TYPE, vo
         return
 
     try:
-        result = api_post(
+        result = await api_post(
             f"/games/{game_id}/draw_vote",
             {"power": power, "vote": vote, "telegram_id": user_id},
         )
@@ -344,7 +346,7 @@ async def players(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     game_id_arg = args[0] if args else None
 
     try:
-        game_id, _power = resolve_game_and_power(user_id, game_id_arg)
+        game_id, _power = await resolve_game_and_power(user_id, game_id_arg)
     except GameContextError as e:
         await update.message.reply_text(e.message)
         return
@@ -354,7 +356,7 @@ async def players(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
 
     try:
         # GET /games/{id}/players returns a bare list, not {"players": [...]}.
-        players_list = api_get(f"/games/{game_id}/players")
+        players_list = await api_get(f"/games/{game_id}/players")
     except Exception as e:
         await update.message.reply_text(f"Could not retrieve players for game {game_id}: {e}")
         return
@@ -393,7 +395,7 @@ async def show_available_games(update: Update, context: ContextTypes.DEFAULT_TYP
             await update.callback_query.edit_message_text(text, reply_markup=reply_markup, parse_mode=parse_mode)
 
     try:
-        games_resp = api_get("/games")
+        games_resp = await api_get("/games")
         # Normalize response: support both {"games": [...]} and plain list
         games = []
         if isinstance(games_resp, dict) and "games" in games_resp:
@@ -422,7 +424,7 @@ async def show_available_games(update: Update, context: ContextTypes.DEFAULT_TYP
         await reply_or_edit(f"❌ Error loading games: {str(e)}")
 
 
-def _power_selection_prompt(game_id: str) -> Tuple[str, Optional[InlineKeyboardMarkup]]:
+async def _power_selection_prompt(game_id: str) -> Tuple[str, Optional[InlineKeyboardMarkup]]:
     """Build the "choose a power" text + keyboard for ``game_id``.
 
     Shared by the inline "Browse Games" callback flow (``show_power_selection``)
@@ -431,12 +433,12 @@ def _power_selection_prompt(game_id: str) -> Tuple[str, Optional[InlineKeyboardM
     into it need to render the same thing. Returns ``(text, None)`` for the
     "game not found" / "game full" cases (nothing to attach a keyboard to).
     """
-    game_state = api_get(f"/games/{game_id}/state")
+    game_state = await api_get(f"/games/{game_id}/state")
     if not game_state:
         return f"Could not retrieve game {game_id}.", None
 
     # Bare list, not {"players": [...]}.
-    players_data = api_get(f"/games/{game_id}/players")
+    players_data = await api_get(f"/games/{game_id}/players")
     taken_powers = {player.get('power') for player in (players_data or [])}
 
     keyboard = []
@@ -460,7 +462,7 @@ async def show_power_selection(update: Update, game_id: str) -> None:
     if not query:
         return
     try:
-        text, reply_markup = _power_selection_prompt(game_id)
+        text, reply_markup = await _power_selection_prompt(game_id)
     except Exception as e:
         await query.edit_message_text(f"Error: {str(e)}")
         return
@@ -489,7 +491,7 @@ async def join(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
 
     if len(args) == 1:
         try:
-            text, reply_markup = _power_selection_prompt(game_id)
+            text, reply_markup = await _power_selection_prompt(game_id)
         except Exception as e:
             await update.message.reply_text(f"Error: {e}")
             return
@@ -498,14 +500,15 @@ async def join(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
 
     power = args[1].upper()
     try:
-        result = api_post(f"/games/{game_id}/join", {"telegram_id": user_id, "game_id": int(game_id), "power": power})
+        result = await api_post(f"/games/{game_id}/join", {"telegram_id": user_id, "game_id": int(game_id), "power": power})
+        invalidate_user(user_id)
         if result.get("status") == "ok":
             await update.message.reply_text(f"🎉 Successfully joined Game {game_id} as {power}!")
         elif result.get("status") == "already_joined":
             await update.message.reply_text(f"You are already in Game {game_id} as {power}.")
         else:
             await update.message.reply_text(f"Failed to join: {result.get('message', 'Unknown error')}")
-    except requests.HTTPError as e:
+    except ApiError as e:
         hint = ""
         if getattr(e, "response", None) is not None and e.response.status_code == 401:
             hint = "\n\n💡 Try /register first."
@@ -528,7 +531,8 @@ async def quit(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         return
     game_id = args[0]
     try:
-        result = api_post(f"/games/{game_id}/quit", {"telegram_id": user_id, "game_id": int(game_id)})
+        result = await api_post(f"/games/{game_id}/quit", {"telegram_id": user_id, "game_id": int(game_id)})
+        invalidate_user(user_id)
         if result.get("status") == "ok":
             await update.message.reply_text(f"You have left Game {game_id}.")
         elif result.get("status") == "not_in_game":
@@ -554,7 +558,8 @@ async def replace(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     game_id = args[0]
     power = args[1].upper()
     try:
-        result = api_post(f"/games/{game_id}/replace", {"telegram_id": user_id, "power": power})
+        result = await api_post(f"/games/{game_id}/replace", {"telegram_id": user_id, "power": power})
+        invalidate_user(user_id)
         if result.get("status") == "ok":
             await update.message.reply_text(f"✅ Successfully replaced player for {power} in Game {game_id}!")
         else:
@@ -584,7 +589,7 @@ async def wait(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     full_name = f"{user.first_name} {user.last_name}".strip() if user.last_name else user.first_name
 
     try:
-        result = api_post(
+        result = await api_post(
             "/waiting_list/join", {"telegram_id": user_id, "full_name": full_name}
         )
     except Exception as e:
@@ -636,7 +641,7 @@ async def leave_waiting_list(update: Update, context: ContextTypes.DEFAULT_TYPE)
         return
 
     try:
-        result = api_post("/waiting_list/leave", {"telegram_id": str(user.id)})
+        result = await api_post("/waiting_list/leave", {"telegram_id": str(user.id)})
     except Exception as e:
         logger.error(f"Failed to leave waiting list for {user.id}: {e}")
         await update.message.reply_text("❌ Could not leave the waiting list right now.")
@@ -2,12 +2,11 @@
 Telegram /link command: link this Telegram account to a browser account using a one-time code.
 """
 import logging
-import requests
 
 from telegram import Update
 from telegram.ext import ContextTypes
 
-from .api_client import api_post
+from .api_client import ApiError, api_post
 
 logger = logging.getLogger("diplomacy.telegram_bot.link_account")
 
@@ -28,10 +27,10 @@ async def link_account(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
     code = parts[1].strip()
     telegram_id = str(update.effective_user.id)
     try:
-        result = api_post("/auth/telegram/link", {"telegram_id": telegram_id, "code": code})
+        result = await api_post("/auth/telegram/link", {"telegram_id": telegram_id, "code": code})
         msg = result.get("message", "Telegram linked to your account.")
         await update.message.reply_text(f"✅ {msg}")
-    except requests.HTTPError as e:
+    except ApiError as e:
         if e.response is not None:
             try:
                 detail = e.response.json().get("detail", str(e))
@@ -4,28 +4,74 @@ Map display commands for the Telegram bot.
 The bot is a thin client over the HTTP API -- it never imports the engine or
 the SVG/PNG board-drawing package. Every map image shown here is fetched as
 raw PNG bytes from a ``server.api.routes.maps`` endpoint via
-``api_client.api_get_bytes``; the server does all unit-shape conversion and
+``api_client.api_get_image``; the server does all unit-shape conversion and
 board drawing itself.
+
+Each upload's Telegram ``file_id`` is remembered with the ETag the API sent
+(``cache.map_file_ids``). The next send of the same endpoint is a conditional
+GET: a 304 means the board is unchanged and the ``file_id`` is sent instead of
+the bytes, so a board shown to seven players is downloaded and uploaded once.
 """
 import logging
 from io import BytesIO
+from typing import Any, Awaitable, Callable, Optional, Union
 
 from telegram import Update
+from telegram.error import BadRequest
 from telegram.ext import ContextTypes
 
-from .api_client import api_get_bytes
+from .api_client import api_get_image
+from .cache import map_file_ids
 
 logger = logging.getLogger("diplomacy.telegram_bot.maps")
 
+Photo = Union[str, BytesIO]
+
+
+async def _fetch_map(endpoint: str) -> tuple[Photo, Optional[str]]:
+    """What to send for ``endpoint``: the cached ``file_id`` if the API says the
+    image is unchanged, otherwise the freshly downloaded bytes. Also returns the
+    image's ETag."""
+    cached = map_file_ids.get(endpoint)
+    image = await api_get_image(endpoint, if_none_match=cached[0] if cached else None)
+    if image.content is None and cached:
+        return cached[1], image.etag
+    return BytesIO(image.content or b""), image.etag
+
+
+async def _send_map(
+    reply_photo: Callable[..., Awaitable[Any]],
+    endpoint: str,
+    photo: Photo,
+    etag: Optional[str],
+    **kwargs: Any,
+) -> None:
+    """Send ``photo`` and remember the resulting ``file_id`` for ``endpoint``."""
+    try:
+        message = await reply_photo(photo=photo, **kwargs)
+    except BadRequest:
+        if not isinstance(photo, str):
+            raise
+        # Telegram no longer accepts this file_id; upload the bytes again.
+        map_file_ids.pop(endpoint)
+        photo, etag = await _fetch_map(endpoint)
+        message = await reply_photo(photo=photo, **kwargs)
+    if etag and not isinstance(photo, str):
+        sizes = getattr(message, "photo", None) or ()
+        file_id = getattr(sizes[-1], "file_id", None) if sizes else None
+        if isinstance(file_id, str):
+            map_file_ids.set(endpoint, (etag, file_id))
+
 
 async def send_default_map(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Send the unit-less standard board, fetched from ``GET /maps/standard/preview.png``.
 
     The server renders and caches this PNG (see ``server.api.routes.maps``); the
-    bot just relays the bytes.
+    bot relays the bytes once and the ``file_id`` after that.
     """
+    endpoint = "/maps/standard/preview.png"
     try:
-        img_bytes = api_get_bytes("/maps/standard/preview.png")
+        photo, etag = await _fetch_map(endpoint)
     except Exception as e:
         error_msg = f"❌ Error fetching standard map: {e}"
         if update.callback_query:
@@ -42,20 +88,17 @@ async def send_default_map(update: Update, context: ContextTypes.DEFAULT_TYPE) -
         "🌊 *Seas & Land:* Different movement rules for fleets vs armies\n\n"
         "🎲 *Ready to play?* Use the menu to join a game!"
     )
-    if update.callback_query:
-        await update.callback_query.message.reply_photo(
-            photo=BytesIO(img_bytes), caption=caption, parse_mode='Markdown'
-        )
-    else:
-        await update.message.reply_photo(
-            photo=BytesIO(img_bytes), caption=caption, parse_mode='Markdown'
-        )
+    message = update.callback_query.message if update.callback_query else update.message
+    await _send_map(
+        message.reply_photo, endpoint, photo, etag, caption=caption, parse_mode='Markdown'
+    )
 
 
 async def send_game_map(update: Update, context: ContextTypes.DEFAULT_TYPE, game_id: str) -> None:
     """Send the live game map with current state, fetched from ``GET /games/{id}/map``."""
+    endpoint = f"/games/{game_id}/map"
     try:
-        img_bytes = api_get_bytes(f"/games/{game_id}/map")
+        photo, etag = await _fetch_map(endpoint)
     except Exception as e:
         error_msg = f"❌ Error generating game map: {e}"
         if update.callback_query:
@@ -65,14 +108,10 @@ async def send_game_map(update: Update, context: ContextTypes.DEFAULT_TYPE, game
         return
 
     caption = f"🗺️ *Game {game_id} Map*"
-    if update.callback_query:
-        await update.callback_query.message.reply_photo(
-            photo=BytesIO(img_bytes), caption=caption, parse_mode='Markdown'
-        )
-    else:
-        await update.message.reply_photo(
-            photo=BytesIO(img_bytes), caption=caption, parse_mode='Markdown'
-        )
+    message = update.callback_query.message if update.callback_query else update.message
+    await _send_map(
+        message.reply_photo, endpoint, photo, etag, caption=caption, parse_mode='Markdown'
+    )
 
 
 async def map_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -105,11 +144,13 @@ async def replay(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         await update.message.reply_text("Usage: /replay <game_id> <turn>")
         return
     game_id, turn = args[0], args[1]
+    endpoint = f"/games/{game_id}/map/history/{turn}"
     try:
-        img_bytes = api_get_bytes(f"/games/{game_id}/map/history/{turn}")
+        photo, etag = await _fetch_map(endpoint)
     except Exception as e:
         await update.message.reply_text(f"No board state found for game {game_id} turn {turn}: {e}")
         return
-    await update.message.reply_photo(
-        photo=BytesIO(img_bytes), caption=f"Board for game {game_id}, turn {turn}"
+    await _send_map(
+        update.message.reply_photo, endpoint, photo, etag,
+        caption=f"Board for game {game_id}, turn {turn}",
     )
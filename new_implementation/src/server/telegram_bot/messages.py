@@ -28,7 +28,7 @@ async def message(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     game_id, power = args[0], args[1].upper()
     text = " ".join(args[2:])
     try:
-        result = api_post(f"/games/{game_id}/message",
+        result = await api_post(f"/games/{game_id}/message",
                          {"telegram_id": user_id, "recipient_power": power, "text": text})
         if result.get("status") == "ok":
             await update.message.reply_text(f"Message sent to {power} in game {game_id}.")
@@ -53,7 +53,7 @@ async def broadcast(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     game_id = args[0]
     text = " ".join(args[1:])
     try:
-        result = api_post(f"/games/{game_id}/broadcast",
+        result = await api_post(f"/games/{game_id}/broadcast",
                          {"telegram_id": user_id, "text": text})
         if result.get("status") == "ok":
             await update.message.reply_text(f"Broadcast sent in game {game_id}.")
@@ -63,7 +63,7 @@ async def broadcast(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         await update.message.reply_text(f"Broadcast error: {e}")
 
 
-def _sender_power_map(game_id: str) -> Dict[Any, str]:
+async def _sender_power_map(game_id: str) -> Dict[Any, str]:
     """``sender_user_id`` (a numeric DB id) -> power name, built from ``GET
     /games/{id}/players``. ``GET /games/{id}/messages`` only returns
     ``sender_user_id`` (see ``src/server/api/routes/messages.py``), not the
@@ -74,7 +74,7 @@ def _sender_power_map(game_id: str) -> Dict[Any, str]:
     entirely.
     """
     try:
-        players_list = api_get(f"/games/{game_id}/players")
+        players_list = await api_get(f"/games/{game_id}/players")
     except Exception:
         return {}
     return {
@@ -84,13 +84,18 @@ def _sender_power_map(game_id: str) -> Dict[Any, str]:
     }
 
 
+# How many of a game's most recent messages /messages shows.
+MESSAGES_SHOWN = 20
+
+
 async def messages(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    """View messages for a specific game, with sender attribution.
+    """View the latest messages for a specific game, with sender attribution.
 
     Diplomacy is all about negotiation, so knowing *who* sent a message
     matters -- ``[ts] To FRANCE: ...`` alone doesn't say who sent it. Each
     line now reads ``[ts] GERMANY -> FRANCE: ...`` (sender resolved via
-    ``_sender_power_map``).
+    ``_sender_power_map``). Only the newest ``MESSAGES_SHOWN`` are fetched
+    (``limit``) rather than the game's whole history.
     """
     user = update.effective_user
     if not user or not update.message:
@@ -104,15 +109,17 @@ async def messages(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         return
     game_id = args[0]
     try:
-        result = api_get(f"/games/{game_id}/messages?telegram_id={user_id}")
+        result = await api_get(f"/games/{game_id}/messages?telegram_id={user_id}&limit={MESSAGES_SHOWN}")
         messages_list = result.get("messages", [])
         if not messages_list:
             await update.message.reply_text("No messages found for this game.")
             return
 
-        sender_power = _sender_power_map(game_id)
+        sender_power = await _sender_power_map(game_id)
 
         lines = [f"Messages for game {game_id}:"]
+        if result.get("has_more"):
+            lines[0] = f"Latest {len(messages_list)} messages for game {game_id}:"
         for m in messages_list:
             ts = m["timestamp"]
             recipient = m["recipient_power"] or "ALL"
@@ -127,7 +134,7 @@ async def show_messages_menu(update: Update, context: ContextTypes.DEFAULT_TYPE)
     """Show messages menu for user's games"""
     try:
         user_id = str(update.effective_user.id)
-        user_games = fetch_user_games(user_id)
+        user_games = await fetch_user_games(user_id)
 
         if not user_games:
             # Create helpful keyboard for users not in games
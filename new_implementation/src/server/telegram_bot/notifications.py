@@ -2,11 +2,14 @@
 Notification endpoint for the Telegram bot.
 """
 import logging
+from typing import Optional
 
 from fastapi import FastAPI
 from pydantic import BaseModel
 from telegram.ext import Application
 
+from .cache import invalidate_game, invalidate_user
+
 logger = logging.getLogger("diplomacy.telegram_bot.notifications")
 
 # FastAPI app for notification endpoint
@@ -14,14 +17,25 @@ fastapi_app = FastAPI()
 
 
 class NotifyRequest(BaseModel):
-    """Request model for notification endpoint."""
+    """Request model for notification endpoint.
+
+    ``game_id``/``event`` are optional so older API builds keep working; when
+    present they tell the bot which cached state the notification made stale.
+    """
     telegram_id: int
     message: str
+    game_id: Optional[int] = None
+    event: Optional[str] = None
 
 
 @fastapi_app.post("/notify")
 async def notify(req: NotifyRequest):
     """Send a notification message to a Telegram user."""
+    # Anything worth notifying a player about may have changed their game
+    # list; a processed turn also retires the game's cached legal orders.
+    invalidate_user(str(req.telegram_id))
+    if req.event == "turn_processed" and req.game_id is not None:
+        invalidate_game(str(req.game_id))
     try:
         # Send message using the running Telegram bot application
         if not hasattr(notify, "telegram_app"):
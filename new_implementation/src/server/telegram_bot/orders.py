@@ -12,10 +12,13 @@ coasts, or order grammar locally.
 import logging
 from typing import Any, Awaitable, Callable, Optional
 
+import httpx
+
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes
 
 from .api_client import api_post, api_get
+from .cache import invalidate_game, legal_orders_cache
 from .game_context import GameContextError, fetch_user_games, resolve_game_and_power
 
 logger = logging.getLogger("diplomacy.telegram_bot.orders")
@@ -43,9 +46,12 @@ _PROVINCE_NAMES: dict[str, str] = {}
 _PROVINCE_NAMES_FETCHED = False
 
 
-def province_names() -> dict[str, str]:
+async def province_names() -> dict[str, str]:
     """The cached code -> name table, fetching it on first use.
 
+    Handlers that build location labels await this once up front;
+    ``_location_label`` itself only reads the cache, so it stays synchronous.
+
     Best-effort: a failure caches the empty table for this process rather than
     retrying on every keystroke, because a missing display name is cosmetic and a
     per-button HTTP call would not be.
@@ -54,23 +60,37 @@ def province_names() -> dict[str, str]:
     ``except Exception`` (see ``CLAUDE.md``): a transport failure or a malformed
     payload should degrade to bare codes, but a genuine programming bug here must
     still raise instead of silently producing a code-only UI that looks like a
-    server problem. ``OSError`` is the transport case and covers HTTP errors too --
-    ``requests.RequestException`` (hence ``ApiError``) subclasses it.
+    server problem. ``httpx.HTTPError`` is the transport and HTTP-status case
+    (``ApiError`` subclasses it); ``OSError`` covers a socket failure that escapes
+    the transport.
     """
     global _PROVINCE_NAMES_FETCHED
     if not _PROVINCE_NAMES_FETCHED:
         _PROVINCE_NAMES_FETCHED = True
         try:
-            body = api_get("/maps/standard/provinces")
+            body = await api_get("/maps/standard/provinces")
             _PROVINCE_NAMES.update(
                 {code: info["name"] for code, info in (body.get("provinces") or {}).items()
                  if info.get("name")}
             )
-        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        except (httpx.HTTPError, OSError, ValueError, KeyError, TypeError, AttributeError):
             logger.warning("Province display names unavailable; falling back to codes")
     return _PROVINCE_NAMES
 
 
+async def _legal_orders(game_id: str, power: str) -> dict:
+    """``GET /games/{id}/legal_orders/{power}``, once per phase.
+
+    Every step of the interactive flow needs the same payload; it only changes
+    when the turn is processed, which invalidates ``legal_orders_cache``.
+    """
+    data = legal_orders_cache.get(game_id, power)
+    if data is None:
+        data = await api_get(f"/games/{game_id}/legal_orders/{power}")
+        legal_orders_cache.put(game_id, power, data)
+    return data
+
+
 def _reset_province_names_cache() -> None:
     """Test hook: forget the cached table so a test can control what's fetched."""
     global _PROVINCE_NAMES_FETCHED
@@ -82,9 +102,10 @@ def _location_label(location: str) -> str:
     """``"BER"`` -> ``"Berlin (BER)"``; the code stays because orders need it.
 
     A coast qualifier is kept on the code half: ``"STP/SC"`` ->
-    ``"St Petersburg (STP/SC)"``.
+    ``"St Petersburg (STP/SC)"``. Reads the cached table only -- the calling
+    handler awaits ``province_names()`` first.
     """
-    name = province_names().get(location.split("/")[0])
+    name = _PROVINCE_NAMES.get(location.split("/")[0])
     return f"{name} ({location})" if name else location
 
 
@@ -204,7 +225,7 @@ async def order(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         return
 
     try:
-        game_id, power = resolve_game_and_power(user_id, game_id_arg)
+        game_id, power = await resolve_game_and_power(user_id, game_id_arg)
     except GameContextError as e:
         await update.message.reply_text(e.message)
         return
@@ -213,7 +234,7 @@ async def order(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         return
 
     try:
-        result = api_post("/games/set_orders", {
+        result = await api_post("/games/set_orders", {
             "game_id": game_id,
             "power": power,
             "orders": order_list,
@@ -254,7 +275,7 @@ async def orders(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     order_text = " ".join(args[1:])
 
     try:
-        game_id, power = resolve_game_and_power(user_id, game_id_arg)
+        game_id, power = await resolve_game_and_power(user_id, game_id_arg)
     except GameContextError as e:
         await update.message.reply_text(e.message)
         return
@@ -268,7 +289,7 @@ async def orders(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         return
 
     try:
-        result = api_post(
+        result = await api_post(
             "/games/set_orders",
             {"game_id": game_id, "power": power, "orders": order_list, "telegram_id": user_id},
         )
@@ -301,7 +322,7 @@ async def myorders(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     game_id_arg = args[0] if args else None
 
     try:
-        game_id, power = resolve_game_and_power(user_id, game_id_arg)
+        game_id, power = await resolve_game_and_power(user_id, game_id_arg)
     except GameContextError as e:
         await update.message.reply_text(e.message)
         return
@@ -310,7 +331,7 @@ async def myorders(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         return
 
     try:
-        result = api_get(f"/games/{game_id}/orders/{power}", telegram_id=user_id)
+        result = await api_get(f"/games/{game_id}/orders/{power}", telegram_id=user_id)
     except Exception as e:
         await update.message.reply_text(f"Error retrieving orders: {e}")
         return
@@ -334,7 +355,7 @@ async def clearorders(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
     game_id_arg = args[0] if args else None
 
     try:
-        game_id, power = resolve_game_and_power(user_id, game_id_arg)
+        game_id, power = await resolve_game_and_power(user_id, game_id_arg)
     except GameContextError as e:
         await update.message.reply_text(e.message)
         return
@@ -346,7 +367,7 @@ async def clearorders(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
         # telegram_id must be present so api_post injects bot_secret into the
         # body -- the clear route requires it for auth. Without this the
         # request 401s (the bug this rewrite fixes).
-        api_post(f"/games/{game_id}/orders/{power}/clear", {"telegram_id": user_id})
+        await api_post(f"/games/{game_id}/orders/{power}/clear", {"telegram_id": user_id})
     except Exception as e:
         await update.message.reply_text(f"Error clearing orders: {e}")
         return
@@ -371,7 +392,7 @@ async def orderhistory(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
     game_id_arg = args[0] if args else None
 
     try:
-        game_id, _power = resolve_game_and_power(user_id, game_id_arg)
+        game_id, _power = await resolve_game_and_power(user_id, game_id_arg)
     except GameContextError as e:
         await update.message.reply_text(e.message)
         return
@@ -380,7 +401,7 @@ async def orderhistory(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
         return
 
     try:
-        result = api_get(f"/games/{game_id}/orders/history")
+        result = await api_get(f"/games/{game_id}/orders/history")
     except Exception as e:
         await update.message.reply_text(f"Error retrieving order history: {e}")
         return
@@ -426,7 +447,7 @@ async def processturn(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
         return
 
     try:
-        game_id, _power = resolve_game_and_power(user_id, args[0])
+        game_id, _power = await resolve_game_and_power(user_id, args[0])
     except GameContextError as e:
         await update.message.reply_text(e.message)
         return
@@ -435,7 +456,7 @@ async def processturn(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
         return
 
     try:
-        orders_status = api_get(f"/games/{game_id}/orders_status", telegram_id=user_id)
+        orders_status = await api_get(f"/games/{game_id}/orders_status", telegram_id=user_id)
     except Exception:
         orders_status = None
 
@@ -473,7 +494,7 @@ async def run_process_turn(send: Sender, game_id: str) -> None:
     separate branch; until then this is deliberately coarse.
     """
     try:
-        result = api_post(f"/games/{game_id}/process_turn", {})
+        result = await api_post(f"/games/{game_id}/process_turn", {})
     except Exception as e:
         await send(f"❌ Process turn error: {e}")
         return
@@ -483,8 +504,12 @@ async def run_process_turn(send: Sender, game_id: str) -> None:
         await send(f"❌ Failed to process turn: {error_msg}")
         return
 
+    # The server does not notify the player who pressed the button, so this
+    # bot would never hear about its own turn; drop the stale phase here.
+    invalidate_game(game_id)
+
     try:
-        game_state = api_get(f"/games/{game_id}/state")
+        game_state = await api_get(f"/games/{game_id}/state")
     except Exception:
         game_state = None
 
@@ -546,7 +571,7 @@ async def viewmap(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         return
 
     try:
-        game_id, _power = resolve_game_and_power(user_id, args[0])
+        game_id, _power = await resolve_game_and_power(user_id, args[0])
     except GameContextError as e:
         await update.message.reply_text(e.message)
         return
@@ -592,7 +617,7 @@ async def selectunit(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None
             await update.callback_query.edit_message_text(text, reply_markup=reply_markup, parse_mode=parse_mode)
 
     try:
-        game_id, power = resolve_game_and_power(user_id, game_id_arg)
+        game_id, power = await resolve_game_and_power(user_id, game_id_arg)
     except GameContextError as e:
         await reply_or_edit(e.message)
         return
@@ -601,7 +626,7 @@ async def selectunit(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None
         return
 
     try:
-        data = api_get(f"/games/{game_id}/legal_orders/{power}")
+        data = await _legal_orders(game_id, power)
     except Exception as e:
         await reply_or_edit(f"❌ Could not retrieve legal orders for game {game_id}: {e}")
         return
@@ -631,6 +656,7 @@ async def selectunit(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None
         await reply_or_edit(f"❌ No units require {label} for {power} in game {game_id}.")
         return
 
+    await province_names()
     keyboard = []
     for u in units:
         key = f"{u['kind']} {u['location']}"
@@ -681,7 +707,7 @@ async def show_possible_moves(
 
     try:
         user_id = str(query.from_user.id)
-        _, power = resolve_game_and_power(user_id, game_id)
+        _, power = await resolve_game_and_power(user_id, game_id)
     except GameContextError as e:
         await send(e.message)
         return
@@ -690,7 +716,7 @@ async def show_possible_moves(
         return
 
     try:
-        data = api_get(f"/games/{game_id}/legal_orders/{power}")
+        data = await _legal_orders(game_id, power)
     except Exception as e:
         await send(f"❌ Could not retrieve legal orders: {e}")
         return
@@ -776,7 +802,7 @@ async def show_support_options(
 
     try:
         user_id = str(query.from_user.id)
-        _, power = resolve_game_and_power(user_id, game_id)
+        _, power = await resolve_game_and_power(user_id, game_id)
     except GameContextError as e:
         await send(e.message)
         return
@@ -785,7 +811,7 @@ async def show_support_options(
         return
 
     try:
-        data = api_get(f"/games/{game_id}/legal_orders/{power}")
+        data = await _legal_orders(game_id, power)
     except Exception as e:
         await send(f"❌ Could not retrieve legal orders: {e}")
         return
@@ -797,6 +823,7 @@ async def show_support_options(
         return
 
     targets = sorted({t for t in (_support_target(o) for o in support_orders) if t})
+    await province_names()
     keyboard = [
         [InlineKeyboardButton(
             f"🎯 {_location_label(target)}",
@@ -831,7 +858,7 @@ async def show_support_choices(
 
     try:
         user_id = str(query.from_user.id)
-        _, power = resolve_game_and_power(user_id, game_id)
+        _, power = await resolve_game_and_power(user_id, game_id)
     except GameContextError as e:
         await send(e.message)
         return
@@ -840,7 +867,7 @@ async def show_support_choices(
         return
 
     try:
-        data = api_get(f"/games/{game_id}/legal_orders/{power}")
+        data = await _legal_orders(game_id, power)
     except Exception as e:
         await send(f"❌ Could not retrieve legal orders: {e}")
         return
@@ -858,6 +885,7 @@ async def show_support_choices(
     target_orders.sort(key=lambda o: (len(o.split()) > 6, o.split()[6:]))
 
     context.user_data.setdefault("pending_orders", {})[str(game_id)] = list(target_orders)
+    await province_names()
     keyboard = [
         [InlineKeyboardButton(_support_label(s), callback_data=f"ord|{game_id}|{i}")]
         for i, s in enumerate(target_orders)
@@ -887,7 +915,7 @@ async def show_convoy_options(
 
     try:
         user_id = str(query.from_user.id)
-        _, power = resolve_game_and_power(user_id, game_id)
+        _, power = await resolve_game_and_power(user_id, game_id)
     except GameContextError as e:
         await send(e.message)
         return
@@ -896,7 +924,7 @@ async def show_convoy_options(
         return
 
     try:
-        data = api_get(f"/games/{game_id}/legal_orders/{power}")
+        data = await _legal_orders(game_id, power)
     except Exception as e:
         await send(f"❌ Could not retrieve legal orders: {e}")
         return
@@ -909,6 +937,7 @@ async def show_convoy_options(
 
     # "F NTH C A LON - BEL".split() -> ["F","NTH","C","A","LON","-","BEL"]; origin province is index 4.
     origins = sorted({o.split()[4] for o in convoy_orders if len(o.split()) > 4})
+    await province_names()
     keyboard = [
         [InlineKeyboardButton(
             f"🪖 {_location_label(origin)}",
@@ -933,7 +962,7 @@ async def show_convoy_destinations(
 
     try:
         user_id = str(query.from_user.id)
-        _, power = resolve_game_and_power(user_id, game_id)
+        _, power = await resolve_game_and_power(user_id, game_id)
     except GameContextError as e:
         await send(e.message)
         return
@@ -942,7 +971,7 @@ async def show_convoy_destinations(
         return
 
     try:
-        data = api_get(f"/games/{game_id}/legal_orders/{power}")
+        data = await _legal_orders(game_id, power)
     except Exception as e:
         await send(f"❌ Could not retrieve legal orders: {e}")
         return
@@ -975,7 +1004,7 @@ async def submit_interactive_order(query: Any, game_id: str, order_text: str) ->
     """
     try:
         user_id = str(query.from_user.id)
-        _, power = resolve_game_and_power(user_id, game_id)
+        _, power = await resolve_game_and_power(user_id, game_id)
     except GameContextError as e:
         await query.edit_message_text(e.message)
         return
@@ -984,7 +1013,7 @@ async def submit_interactive_order(query: Any, game_id: str, order_text: str) ->
         return
 
     try:
-        result = api_post("/games/set_orders", {
+        result = await api_post("/games/set_orders", {
             "game_id": game_id,
             "power": power,
             "orders": [order_text],
@@ -1024,7 +1053,7 @@ async def show_my_orders_menu(update: Update, context: ContextTypes.DEFAULT_TYPE
     """Show orders menu for user's games"""
     try:
         user_id = str(update.effective_user.id)
-        user_games = fetch_user_games(user_id)
+        user_games = await fetch_user_games(user_id)
 
         # Handle different response types safely
         if not user_games or not isinstance(user_games, list) or len(user_games) == 0:
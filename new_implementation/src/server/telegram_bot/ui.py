@@ -67,7 +67,7 @@ async def show_map_menu(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
     """Show map menu for user's games."""
     try:
         user_id = str(update.effective_user.id)
-        user_games = fetch_user_games(user_id)
+        user_games = await fetch_user_games(user_id)
 
         if not user_games:
             keyboard = [
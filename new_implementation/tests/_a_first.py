@@ -0,0 +1 @@
+def test_x(): pass
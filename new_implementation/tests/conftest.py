@@ -364,6 +364,24 @@ def _reset_province_name_cache():
     _reset_province_names_cache()
 
 
+@pytest.fixture(autouse=True)
+def _reset_bot_caches():
+    """Empty the bot's legal-orders and user-games caches around every test.
+
+    Same reason as the province-name cache above: bot tests reuse game ids,
+    powers and telegram ids with different mocked payloads, and a warm cache
+    from an earlier test would answer instead of the patched `api_get`.
+    """
+    try:
+        from server.telegram_bot.cache import _reset_caches
+    except ImportError:
+        yield
+        return
+    _reset_caches()
+    yield
+    _reset_caches()
+
+
 # Markers for test categorization
 pytestmark = [
     pytest.mark.unit,  # Default to unit tests
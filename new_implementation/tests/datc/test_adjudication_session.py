@@ -0,0 +1,222 @@
+"""``AdjudicationSession``: incremental re-adjudication must always agree with a
+fresh ``adjudicate_movement`` over the same orders, after every single edit.
+
+Positions are grown as one connected cluster of mixed armies and fleets so that
+supports, convoys, head-to-heads and cycles actually interact; orders are drawn
+legal and illegal alike (the resolver voids the latter, and so must the session).
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from engine.adjudicator.movement import adjudicate_movement
+from engine.adjudicator.session import AdjudicationSession
+from engine.map_loader import load_standard_map
+from engine.orders.parser import parse_order
+from engine.types import (
+    Build,
+    Convoy,
+    GameState,
+    Hold,
+    Location,
+    Move,
+    PhaseType,
+    ProvinceType,
+    Season,
+    SupportHold,
+    SupportMove,
+    Unit,
+    UnitKind,
+)
+
+pytestmark = [pytest.mark.datc, pytest.mark.slow]
+
+_MAP = load_standard_map()
+_POWERS = ["FRANCE", "GERMANY", "ENGLAND"]
+_ALL_PROVS = sorted(_MAP.provinces)
+
+
+def _neighbours(prov: str) -> set[str]:
+    out = set(_MAP.army_moves(prov))
+    for loc in _MAP.fleet_locations(prov):
+        out |= {d.province for d in _MAP.fleet_moves(loc)}
+    return out
+
+
+def _random_unit(rng: random.Random, prov: str) -> Unit:
+    power = rng.choice(_POWERS)
+    kind_of = _MAP.province_type(prov)
+    fleet_locs = _MAP.fleet_locations(prov)
+    if kind_of is ProvinceType.WATER or (
+        kind_of is ProvinceType.COAST and fleet_locs and rng.random() < 0.4
+    ):
+        return Unit(UnitKind.FLEET, power, rng.choice(list(fleet_locs)))
+    return Unit(UnitKind.ARMY, power, Location(prov))
+
+
+def _random_cluster(rng: random.Random, n: int) -> list[Unit]:
+    """``n`` units on a connected patch of the board."""
+    provs = [rng.choice(_ALL_PROVS)]
+    while len(provs) < n:
+        frontier = sorted(set().union(*(_neighbours(p) for p in provs)) - set(provs))
+        if not frontier:
+            break
+        provs.append(rng.choice(frontier))
+    units = []
+    for prov in provs:
+        unit = _random_unit(rng, prov)
+        if unit.kind is UnitKind.FLEET and not _MAP.fleet_locations(prov):
+            continue
+        units.append(unit)
+    return units
+
+
+def _random_order(rng: random.Random, unit: Unit, units: list[Unit]):
+    here = unit.location
+    near = sorted(_neighbours(unit.province)) or [unit.province]
+    other = rng.choice(units)
+    roll = rng.random()
+    if roll < 0.15:
+        return Hold(unit.power, here)
+    if roll < 0.55:
+        if unit.kind is UnitKind.FLEET:
+            dests = sorted(_MAP.fleet_moves(here), key=str) or [Location(rng.choice(near))]
+            dest = rng.choice(dests)
+        else:
+            dest = Location(rng.choice(near if rng.random() < 0.8 else _ALL_PROVS))
+        return Move(unit.power, here, dest, via_convoy=rng.random() < 0.1)
+    if roll < 0.7:
+        return SupportHold(unit.power, here, other.location)
+    if roll < 0.9:
+        target = Location(rng.choice(sorted(_neighbours(other.province)) or near))
+        return SupportMove(unit.power, here, other.location, target)
+    dest = Location(rng.choice(sorted(_neighbours(other.province)) + near))
+    return Convoy(unit.power, here, other.location, dest)
+
+
+def _state(units: list[Unit]) -> GameState:
+    return GameState(1901, Season.SPRING, PhaseType.MOVEMENT, units=frozenset(units))
+
+
+def _canonical(resolution, post):
+    """Order-independent view of a resolution and its post-phase state."""
+    results = sorted(
+        (str(r.order.unit), repr(r.order), r.result.name, r.dislodged, r.retreat_options)
+        for r in resolution.results
+    )
+    return results, post
+
+
+@settings(max_examples=150, deadline=None)
+@given(
+    seed=st.integers(min_value=0, max_value=1_000_000),
+    n=st.integers(min_value=2, max_value=14),
+    edits=st.integers(min_value=1, max_value=25),
+)
+def test_session_agrees_with_full_adjudication_after_every_edit(seed, n, edits):
+    rng = random.Random(seed)
+    units = _random_cluster(rng, n)
+    state = _state(units)
+    session = AdjudicationSession(_MAP, state)
+
+    for _ in range(edits):
+        unit = rng.choice(units)
+        if rng.random() < 0.2:
+            session.remove_order(unit.location)
+        else:
+            session.set_order(_random_order(rng, unit, units))
+        expected = adjudicate_movement(_MAP, state, session.orders)
+        assert _canonical(*session.resolve()) == _canonical(*expected)
+
+
+class TestAdjudicationSession:
+    def _session(self, specs: dict[str, list[str]]) -> AdjudicationSession:
+        units = []
+        for power, unit_specs in specs.items():
+            for spec in unit_specs:
+                kind, loc = spec.split()
+                prov, _, coast = loc.partition("/")
+                units.append(
+                    Unit(
+                        UnitKind.ARMY if kind == "A" else UnitKind.FLEET,
+                        power,
+                        Location(prov, coast or None),
+                    )
+                )
+        return AdjudicationSession(_MAP, _state(units))
+
+    def _order(self, power: str, text: str):
+        return parse_order(text, power=power, map=_MAP)
+
+    def test_only_the_touched_component_is_re_resolved(self):
+        session = self._session(
+            {"FRANCE": ["A PAR", "A MAR"], "GERMANY": ["A MUN", "A BER"], "TURKEY": ["F ANK"]}
+        )
+        session.resolve()
+        first = session.resolved
+        session.set_order(self._order("FRANCE", "A PAR - BUR"))
+        session.resolve()
+        # PAR joins BUR; every other unit's hold component is reused.
+        assert session.resolved == first + 1
+        session.set_order(self._order("GERMANY", "A MUN - BUR"))
+        session.resolve()
+        # PAR, MUN and BUR now form one (new) component.
+        assert session.resolved == first + 2
+        resolution, post = session.resolve()
+        assert session.resolved == first + 2  # unchanged orders: cached outright
+        assert {r.result.name for r in resolution.results if isinstance(r.order, Move)} == {"BOUNCE"}
+        assert post.contested == frozenset({"BUR"})
+
+    def test_retreat_options_see_the_whole_board(self):
+        # The dislodged army's retreat to GAS is blocked by a move resolved in a
+        # component the edit never touched.
+        session = self._session({"FRANCE": ["A BUR", "A BRE"], "GERMANY": ["A MUN", "A RUH"]})
+        session.set_order(self._order("FRANCE", "A BRE - GAS"))
+        session.set_order(self._order("GERMANY", "A MUN - BUR"))
+        session.set_order(self._order("GERMANY", "A RUH S A MUN - BUR"))
+        resolution, post = session.resolve()
+        expected = adjudicate_movement(_MAP, session.state, session.orders)
+        assert _canonical(resolution, post) == _canonical(*expected)
+        (dislodged,) = post.dislodged
+        assert Location("GAS") not in dislodged.retreats
+
+    def test_results_for_resolves_only_the_asked_components(self):
+        session = self._session({"FRANCE": ["A PAR", "A BRE"], "GERMANY": ["A MUN", "A BER"]})
+        session.set_order(self._order("FRANCE", "A PAR - BUR"))
+        session.set_order(self._order("GERMANY", "A MUN - BUR"))
+        (par,) = session.results_for(["PAR"])
+        assert session.resolved == 1  # PAR/MUN/BUR only; BRE and BER untouched
+        assert par.result.name == "BOUNCE"
+        full = {r.order.unit.province: r for r in session.resolve()[0].results}
+        assert full["PAR"] == par
+
+    def test_remove_order_restores_the_hold(self):
+        session = self._session({"FRANCE": ["A PAR"]})
+        session.set_order(self._order("FRANCE", "A PAR - BUR"))
+        session.remove_order("PAR")
+        (result,) = session.resolve()[0].results
+        assert result.order == Hold("FRANCE", Location("PAR"))
+
+    def test_orders_for_empty_provinces_are_ignored(self):
+        session = self._session({"FRANCE": ["A PAR"]})
+        session.set_order(self._order("FRANCE", "A MAR - BUR"))
+        assert session.orders == []
+
+    def test_adjustment_phase_reruns_the_adjudicator(self):
+        state = GameState(
+            1901,
+            Season.WINTER,
+            PhaseType.ADJUSTMENT,
+            units=frozenset(),
+            ownership={"PAR": "FRANCE", "MAR": "FRANCE"},
+        )
+        session = AdjudicationSession(_MAP, state)
+        session.set_orders([Build("FRANCE", Location("PAR"), UnitKind.ARMY)])
+        resolution, post = session.resolve()
+        assert [u.province for u in post.units] == ["PAR"]
+        assert session.resolve()[0] is resolution
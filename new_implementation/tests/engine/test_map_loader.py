@@ -208,3 +208,63 @@ def test_impassable_switzerland_has_no_alias(m):
 def test_split_coast_aliases_map_to_base(m):
     assert m.aliases["bul/ec"] == "BUL"
     assert m.aliases["bul/sc"] == "BUL"
+
+
+# -- distance tables ----------------------------------------------------------
+
+
+def _bfs(m, start, kind):
+    """Reference fewest-move counts per province, straight off the adjacency API."""
+    dist, frontier, seen, d = {start.province: 0}, [start], {start}, 0
+    while frontier:
+        d += 1
+        nxt = []
+        for here in frontier:
+            if kind is UnitKind.FLEET:
+                steps = m.fleet_moves(here)
+            elif kind is UnitKind.ARMY:
+                steps = {Location(p) for p in m.army_moves(here.province)}
+            else:
+                steps = {Location(p) for p in m.army_moves(here.province)}
+                for loc in m.fleet_locations(here.province):
+                    steps |= {Location(n.province) for n in m.fleet_moves(loc)}
+            for loc in steps - seen:
+                seen.add(loc)
+                dist.setdefault(loc.province, d)
+                nxt.append(loc)
+        frontier = nxt
+    return dist
+
+
+@pytest.mark.parametrize("kind", [UnitKind.ARMY, UnitKind.FLEET, None])
+def test_distance_tables_match_bfs(m, kind):
+    for prov in sorted(m.provinces):
+        if kind is UnitKind.FLEET:
+            starts = m.fleet_locations(prov)
+        elif kind is UnitKind.ARMY and m.province_type(prov) is ProvinceType.WATER:
+            starts = ()
+        else:
+            starts = (Location(prov),)
+        for start in starts:
+            expected = _bfs(m, start, kind)
+            for to in m.provinces:
+                assert m.distance(start, to, kind) == expected.get(to), (start, to)
+
+
+def test_distance_examples(m):
+    assert m.distance("PAR", "PAR") == 0
+    assert m.distance("PAR", "MUN", UnitKind.ARMY) == 2
+    assert m.distance("LON", "BEL") == 2  # convoy route counts in the mixed graph
+    assert m.distance("LON", "BEL", UnitKind.ARMY) is None  # island without one
+    assert m.distance(Location("STP", "NC"), "MOS", UnitKind.FLEET) is None
+    assert m.distance(Location("BUL", "SC"), "BLA", UnitKind.FLEET) == 2
+    assert m.distance(Location("BUL", "EC"), "BLA", UnitKind.FLEET) == 1
+
+
+def test_nearest_supply_centers(m):
+    nearest = m.nearest_supply_centers("PAR", UnitKind.ARMY)
+    assert nearest[:2] == ((0, "PAR"), (1, "BRE"))
+    assert [d for d, _ in nearest] == sorted(d for d, _ in nearest)
+    # A fleet in the Adriatic never reaches a landlocked center.
+    fleet = {sc for _, sc in m.nearest_supply_centers(Location("ADR"), UnitKind.FLEET)}
+    assert "VIE" not in fleet and "TRI" in fleet
@@ -7,7 +7,8 @@ from hypothesis import given
 from hypothesis import strategies as st
 
 from engine.map_loader import load_standard_map
-from engine.orders.parser import OrderParseError, format_order, parse_order
+from engine.orders import parser as parser_module
+from engine.orders.parser import OrderParseError, format_order, parse_order, parse_orders_bulk
 from engine.types import (
     Build,
     Convoy,
@@ -415,3 +416,49 @@ def test_build_roundtrip_property(power, pair):
 def test_waive_roundtrip_property(power):
     order = Waive(power)
     assert parse_order(format_order(order), power=power, map=_MAP) == order
+
+
+# ---------------------------------------------------------------------------
+# Batch parsing and its cache
+# ---------------------------------------------------------------------------
+
+
+class TestParseOrdersBulk:
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self, monkeypatch):
+        monkeypatch.setattr(parser_module, "_parse_cache", type(parser_module._parse_cache)())
+
+    def test_matches_parse_order_and_keeps_input_order(self, m):
+        texts = ["A PAR - BUR", "F BRE H", "A MAR S A PAR - BUR"]
+        assert parse_orders_bulk(texts, power="FRANCE", map=m) == [
+            parse_order(t, power="FRANCE", map=m) for t in texts
+        ]
+
+    def test_errors_are_returned_not_raised(self, m):
+        good, bad = parse_orders_bulk(["A PAR - BUR", "A XXX H"], power="FRANCE", map=m)
+        assert good == Move("FRANCE", Location("PAR"), Location("BUR"))
+        assert isinstance(bad, OrderParseError)
+        assert "XXX" in str(bad)
+
+    def test_spelling_variants_share_one_parse(self, m, monkeypatch):
+        calls = []
+        real = parser_module.parse_order
+
+        def counting(text, **kwargs):
+            calls.append(text)
+            return real(text, **kwargs)
+
+        monkeypatch.setattr(parser_module, "parse_order", counting)
+        first, second, third = parse_orders_bulk(
+            ["A PAR - BUR", "a par-bur", "  A  PAR  -  BUR "], power="FRANCE", map=m
+        )
+        assert calls == ["A PAR - BUR"]
+        assert first is second is third
+
+    def test_cache_is_keyed_by_power_and_bounded(self, m, monkeypatch):
+        monkeypatch.setattr(parser_module, "PARSE_CACHE_SIZE", 2)
+        (france,) = parse_orders_bulk(["WAIVE"], power="FRANCE", map=m)
+        (germany,) = parse_orders_bulk(["WAIVE"], power="GERMANY", map=m)
+        assert (france.power, germany.power) == ("FRANCE", "GERMANY")
+        parse_orders_bulk(["A PAR H", "A MAR H"], power="FRANCE", map=m)
+        assert len(parser_module._parse_cache) == 2
@@ -1,4 +1,5 @@
-"""M5 tests: canonical JSON round-trips for orders, states and resolutions."""
+"""M5 tests: canonical JSON round-trips for orders, states and resolutions,
+plus the binary ``GameState`` codec checked against the JSON one."""
 
 from __future__ import annotations
 
@@ -6,14 +7,19 @@ import pytest
 from hypothesis import given, settings
 from hypothesis import strategies as st
 
+from engine.map_loader import load_standard_map
 from engine.serialization import (
+    STATE_CODEC_VERSION,
     order_from_dict,
     order_from_json,
     order_to_dict,
+    peek_state_header,
     resolution_from_dict,
     resolution_to_dict,
+    state_from_bytes,
     state_from_dict,
     state_from_json,
+    state_to_bytes,
     state_to_dict,
     to_json,
 )
@@ -177,3 +183,126 @@ def _orders(draw):
 def test_order_round_trip_property(order):
     assert order_from_dict(order_to_dict(order)) == order
     assert order_from_json(to_json(order)) == order
+
+
+# -- Binary GameState codec ---------------------------------------------------
+
+_MAP = load_standard_map()
+_PLACES = sorted(
+    [Location(p) for p in _MAP.provinces]
+    + [Location(p, c) for p in _MAP.provinces for c in _MAP.coasts_of(p)],
+    key=str,
+)
+# Off-map names go through the codec's per-blob extras table.
+_POWERS = sorted(_MAP.home_centers) + ["ATLANTIS"]
+_PROVINCES = sorted(_MAP.provinces) + ["XYZ"]
+
+
+@st.composite
+def _units(draw):
+    loc = draw(st.sampled_from(_PLACES + [Location("XYZ")]))
+    kind = UnitKind.FLEET if loc.coast else draw(st.sampled_from(list(UnitKind)))
+    return Unit(kind, draw(st.sampled_from(_POWERS)), loc)
+
+
+@st.composite
+def _states(draw):
+    status = draw(st.sampled_from(list(GameStatus)))
+    return GameState(
+        year=draw(st.integers(1901, 2100)),
+        season=draw(st.sampled_from(list(Season))),
+        phase_type=draw(st.sampled_from(list(PhaseType))),
+        units=frozenset(draw(st.lists(_units(), max_size=34))),
+        ownership=draw(
+            st.dictionaries(st.sampled_from(_PROVINCES), st.sampled_from(_POWERS), max_size=34)
+        ),
+        dislodged=tuple(
+            DislodgedUnit(
+                u,
+                attacker_origin=draw(st.none() | st.sampled_from(_PROVINCES)),
+                retreats=tuple(draw(st.lists(st.sampled_from(_PLACES), max_size=4))),
+            )
+            for u in draw(st.lists(_units(), max_size=3))
+        ),
+        contested=frozenset(draw(st.lists(st.sampled_from(_PROVINCES), max_size=5))),
+        status=status,
+        winners=(
+            frozenset(draw(st.lists(st.sampled_from(_POWERS), min_size=1, max_size=7)))
+            if status is GameStatus.COMPLETED
+            else None
+        ),
+    )
+
+
+@settings(max_examples=300, deadline=None)
+@given(state=_states())
+def test_binary_state_round_trip_matches_json(state):
+    blob = state_to_bytes(state, _MAP)
+    decoded = state_from_bytes(blob, _MAP)
+    assert decoded == state
+    assert decoded == state_from_json(to_json(state))
+    header = peek_state_header(blob)
+    assert (header.phase_name, header.status) == (state.phase_name, state.status)
+    assert header.has_winners is (state.winners is not None)
+
+
+class TestBinaryStateCodec:
+    def _opening(self) -> GameState:
+        return GameState(
+            year=_MAP.start_year,
+            season=_MAP.start_season,
+            phase_type=PhaseType.MOVEMENT,
+            units=_MAP.starting_units,
+            ownership=dict(_MAP.initial_ownership),
+        )
+
+    def test_much_smaller_than_json(self):
+        state = self._opening()
+        assert len(state_to_bytes(state, _MAP)) * 5 < len(to_json(state))
+
+    def test_encoding_is_deterministic(self):
+        state = self._opening()
+        shuffled = GameState(
+            state.year,
+            state.season,
+            state.phase_type,
+            units=frozenset(sorted(state.units, key=str, reverse=True)),
+            ownership=dict(reversed(list(state.ownership.items()))),
+        )
+        assert state_to_bytes(shuffled, _MAP) == state_to_bytes(state, _MAP)
+
+    def test_decode_reuses_units(self):
+        blob = state_to_bytes(self._opening(), _MAP)
+        first = {u.location: u for u in state_from_bytes(blob, _MAP).units}
+        second = {u.location: u for u in state_from_bytes(blob, _MAP).units}
+        assert all(second[loc] is u for loc, u in first.items())
+
+    def test_default_map_is_standard(self):
+        state = self._opening()
+        assert state_from_bytes(state_to_bytes(state)) == state
+
+    def test_header_only_decode(self):
+        blob = state_to_bytes(GameState(1907, Season.FALL, PhaseType.RETREAT), _MAP)
+        header = peek_state_header(blob[:16])  # the body is not needed
+        assert header.version == STATE_CODEC_VERSION
+        assert header.phase_name == "F1907R"
+
+    def test_corruption_is_detected(self):
+        blob = bytearray(state_to_bytes(self._opening(), _MAP))
+        blob[30] ^= 0x01
+        with pytest.raises(ValueError, match="checksum"):
+            state_from_bytes(bytes(blob), _MAP)
+
+    def test_rejects_other_versions_and_payloads(self):
+        blob = bytearray(state_to_bytes(self._opening(), _MAP))
+        blob[2] = STATE_CODEC_VERSION + 1
+        with pytest.raises(ValueError, match="version"):
+            state_from_bytes(bytes(blob), _MAP)
+        with pytest.raises(ValueError):
+            state_from_bytes(b'{"year": 1901}', _MAP)
+
+    def test_rejects_a_different_map(self):
+        other = load_standard_map()
+        other.home_centers["ATLANTIS"] = frozenset()
+        with pytest.raises(ValueError, match="different map"):
+            state_from_bytes(state_to_bytes(self._opening(), _MAP), other)
@@ -5,7 +5,7 @@ from __future__ import annotations
 import pytest
 
 from engine.map_loader import load_standard_map
-from engine.orders.validation import validate
+from engine.orders.validation import ValidationContext, validate, validate_orders
 from engine.types import (
     Build,
     Convoy,
@@ -256,3 +256,30 @@ class TestWaive:
     def test_waive_always_ok(self, m):
         state = _state([])
         assert validate(Waive("FRANCE"), state, m).ok is True
+
+
+class TestBatchValidation:
+    def test_validate_orders_matches_validate(self, m):
+        state = _state(
+            [
+                Unit(UnitKind.ARMY, "FRANCE", Location("PAR")),
+                Unit(UnitKind.FLEET, "FRANCE", Location("BRE")),
+                Unit(UnitKind.ARMY, "GERMANY", Location("MUN")),
+            ]
+        )
+        orders = [
+            Move("FRANCE", Location("PAR"), Location("BUR")),
+            Move("FRANCE", Location("BRE"), Location("MUN")),
+            Hold("FRANCE", Location("MUN")),
+            Disband("FRANCE", Location("MAR")),
+            SupportHold("FRANCE", Location("BRE"), Location("PAR")),
+        ]
+        assert validate_orders(orders, state, m) == [validate(o, state, m) for o in orders]
+
+    def test_context_indexes_by_province(self, m):
+        army = Unit(UnitKind.ARMY, "FRANCE", Location("PAR"))
+        dislodged = DislodgedUnit(Unit(UnitKind.FLEET, "ENGLAND", Location("SPA", "NC")))
+        ctx = ValidationContext(_state([army], dislodged=[dislodged]))
+        assert ctx.unit_at("PAR") is army
+        assert ctx.unit_at("BUR") is None
+        assert ctx.dislodged_at("SPA") is dislodged
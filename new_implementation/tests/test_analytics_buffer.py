@@ -0,0 +1,106 @@
+"""Tests for the batched channel-analytics writer (``server.analytics_buffer``).
+
+The writer is a plain callable here; ``log_channel_analytics_events`` itself is
+covered against the database in ``test_persistence_database_service.py``.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from server.analytics_buffer import AnalyticsBuffer
+
+
+class RecordingWriter:
+    def __init__(self, gate: threading.Event | None = None, fail: bool = False) -> None:
+        self.batches: list[list[dict]] = []
+        self.gate = gate
+        self.fail = fail
+
+    def __call__(self, events: list[dict]) -> None:
+        if self.gate is not None:
+            self.gate.wait(5)
+        if self.fail:
+            raise RuntimeError("database unavailable")
+        self.batches.append(events)
+
+    @property
+    def events(self) -> list[dict]:
+        return [e for batch in self.batches for e in batch]
+
+
+def _add(buffer: AnalyticsBuffer, n: int, start: int = 0) -> None:
+    for i in range(start, start + n):
+        assert buffer.add("game_1", "-100", "message_posted", metadata={"i": i})
+
+
+@pytest.mark.unit
+class TestAnalyticsBuffer:
+    def test_add_returns_before_anything_is_written(self) -> None:
+        gate = threading.Event()
+        writer = RecordingWriter(gate)
+        buffer = AnalyticsBuffer(writer, flush_interval=0.01)
+        _add(buffer, 3)
+        assert writer.batches == []
+        gate.set()
+        buffer.stop()
+        assert [e["metadata"]["i"] for e in writer.events] == [0, 1, 2]
+
+    def test_full_batches_are_written_without_waiting_for_the_interval(self) -> None:
+        writer = RecordingWriter()
+        buffer = AnalyticsBuffer(writer, max_batch=4, flush_interval=60.0)
+        _add(buffer, 8)
+        deadline = time.monotonic() + 5
+        while buffer.stats.written < 8 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert [len(b) for b in writer.batches] == [4, 4]
+        buffer.stop()
+
+    def test_a_partial_batch_is_written_after_the_interval(self) -> None:
+        writer = RecordingWriter()
+        buffer = AnalyticsBuffer(writer, max_batch=100, flush_interval=0.05)
+        _add(buffer, 2)
+        deadline = time.monotonic() + 5
+        while not writer.batches and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert [len(b) for b in writer.batches] == [2]
+        buffer.stop()
+
+    def test_flush_and_stop_write_everything_accepted(self) -> None:
+        writer = RecordingWriter()
+        buffer = AnalyticsBuffer(writer, max_batch=100, flush_interval=60.0)
+        _add(buffer, 5)
+        assert buffer.flush()
+        assert len(writer.events) == 5
+        _add(buffer, 3, start=5)
+        buffer.stop()
+        buffer.stop()  # idempotent
+        assert [e["metadata"]["i"] for e in writer.events] == list(range(8))
+        assert all(e["created_at"] is not None for e in writer.events)
+        assert buffer.stats.written == buffer.stats.accepted == 8
+
+    def test_a_full_buffer_drops_after_a_bounded_wait(self) -> None:
+        gate = threading.Event()
+        writer = RecordingWriter(gate)
+        buffer = AnalyticsBuffer(writer, max_batch=1, max_pending=2, put_timeout=0.01)
+        assert buffer.add("game_1", "-100", "message_posted")  # taken by the (blocked) writer
+        time.sleep(0.05)
+        _add(buffer, 2)
+        started = time.monotonic()
+        assert buffer.add("game_1", "-100", "message_posted") is False
+        assert time.monotonic() - started < 1.0
+        assert buffer.stats.dropped == 1
+        gate.set()
+        buffer.stop()
+        assert buffer.stats.written == 3
+
+    def test_writer_failures_are_counted_not_raised(self) -> None:
+        writer = RecordingWriter(fail=True)
+        buffer = AnalyticsBuffer(writer, flush_interval=0.01)
+        _add(buffer, 2)
+        buffer.stop()
+        assert buffer.stats.failed == 2
+        assert buffer.stats.written == 0
@@ -1,46 +1,75 @@
-"""Tests for ``server.telegram_bot.api_client.api_get_bytes``.
+"""Tests for ``server.telegram_bot.api_client.api_get_bytes`` and ``api_get_image``.
 
-Pure unit test: ``requests.get`` is mocked, no network and no API server needed.
+Pure unit test: the pooled client runs over ``httpx.MockTransport``, no network
+and no API server needed.
 """
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import asyncio
 
+import httpx
 import pytest
 
+from server.async_http import PooledAsyncClient
 from server.telegram_bot import api_client
 
 pytestmark = pytest.mark.unit
 
 
-def test_api_get_bytes_returns_raw_content():
-    fake_resp = MagicMock()
-    fake_resp.content = b"\x89PNG\r\n\x1a\nfakebytes"
-    fake_resp.raise_for_status = MagicMock()
-    with patch.object(api_client.requests, "get", return_value=fake_resp) as mock_get:
-        result = api_client.api_get_bytes("/games/1/map")
+@pytest.fixture
+def requests_seen(monkeypatch):
+    """Route the api_client pool through a MockTransport; yields the requests it saw."""
+    seen: list[httpx.Request] = []
+    responses: dict[str, httpx.Response] = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return responses.get(request.url.path, httpx.Response(200, content=b"\x89PNG\r\n\x1a\nfakebytes"))
+
+    pool = PooledAsyncClient(
+        api_client.API_URL, default_timeout=5, transport=httpx.MockTransport(handler)
+    )
+    monkeypatch.setattr(api_client, "_pool", pool)
+    return seen, responses
+
+
+def test_api_get_bytes_returns_raw_content(requests_seen):
+    seen, _ = requests_seen
+    result = asyncio.run(api_client.api_get_bytes("/games/1/map"))
 
     assert result == b"\x89PNG\r\n\x1a\nfakebytes"
-    mock_get.assert_called_once()
-    called_url = mock_get.call_args.args[0]
-    assert called_url == f"{api_client.API_URL}/games/1/map"
+    assert len(seen) == 1
+    assert str(seen[0].url) == f"{api_client.API_URL}/games/1/map"
 
 
-def test_api_get_bytes_sends_bot_secret_header(monkeypatch):
+def test_api_get_bytes_sends_bot_secret_header(monkeypatch, requests_seen):
+    seen, _ = requests_seen
     monkeypatch.setattr(api_client, "BOT_SECRET", "shh")
-    fake_resp = MagicMock()
-    fake_resp.content = b"data"
-    fake_resp.raise_for_status = MagicMock()
-    with patch.object(api_client.requests, "get", return_value=fake_resp) as mock_get:
-        api_client.api_get_bytes("/games/1/map/history/3")
-
-    headers = mock_get.call_args.kwargs["headers"]
-    assert headers == {"X-Bot-Secret": "shh"}
-
-
-def test_api_get_bytes_raises_on_http_error():
-    fake_resp = MagicMock()
-    fake_resp.raise_for_status.side_effect = api_client.requests.HTTPError("boom")
-    with patch.object(api_client.requests, "get", return_value=fake_resp):
-        with pytest.raises(api_client.requests.HTTPError):
-            api_client.api_get_bytes("/games/1/map")
+    asyncio.run(api_client.api_get_bytes("/games/1/map/history/3"))
+
+    assert seen[0].headers["X-Bot-Secret"] == "shh"
+
+
+def test_api_get_bytes_raises_on_http_error(requests_seen):
+    _, responses = requests_seen
+    responses["/games/1/map"] = httpx.Response(500, content=b"boom")
+    with pytest.raises(api_client.ApiError):
+        asyncio.run(api_client.api_get_bytes("/games/1/map"))
+
+
+def test_api_get_image_returns_content_and_etag(requests_seen):
+    _, responses = requests_seen
+    responses["/games/1/map"] = httpx.Response(200, content=b"png", headers={"ETag": '"abc"'})
+    image = asyncio.run(api_client.api_get_image("/games/1/map"))
+
+    assert image == api_client.ApiImage(content=b"png", etag='"abc"')
+
+
+def test_api_get_image_304_means_the_caller_already_has_it(requests_seen):
+    seen, responses = requests_seen
+    responses["/games/1/map"] = httpx.Response(304, headers={"ETag": '"abc"'})
+    image = asyncio.run(api_client.api_get_image("/games/1/map", if_none_match='"abc"'))
+
+    assert seen[0].headers["If-None-Match"] == '"abc"'
+    assert image.content is None
+    assert image.etag == '"abc"'
@@ -100,6 +100,14 @@ class TestAdminCacheManagement:
         assert data["status"] == "ok"
         assert "cache_stats" in data
 
+    def test_get_executor_stats(self, client, admin_headers):
+        """Test getting the blocking-work pools' queue depth and wait times."""
+        resp = client.get("/admin/executor_stats", headers=admin_headers)
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["status"] == "ok"
+        assert isinstance(data["executors"], dict)
+
     def test_clear_response_cache(self, client, admin_headers):
         """Test clearing response cache."""
         resp = client.post("/admin/clear_response_cache", headers=admin_headers)
@@ -150,13 +158,17 @@ class TestAdminConnectionPool:
         assert resp.status_code == 200
         data = resp.json()
         assert data["status"] == "ok"
+        assert {"size", "in_use", "idle", "checkout_wait_seconds_max", "timeouts"} <= set(data["pool_status"])
+        assert data["async_pool_status"]["driver"] in ("asyncpg", "thread")
 
     def test_reset_connection_pool(self, client, admin_headers):
         """Test resetting connection pool."""
+        before = client.get("/admin/connection_pool_status", headers=admin_headers).json()["pool_status"]
         resp = client.post("/admin/connection_pool_reset", headers=admin_headers)
         assert resp.status_code == 200
         data = resp.json()
         assert data["status"] == "ok"
+        assert data["pool_status"]["resets"] == before["resets"] + 1
 
 
 @pytest.mark.unit
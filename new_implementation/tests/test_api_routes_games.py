@@ -10,6 +10,7 @@ from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, timezone, timedelta
 
 from server.api import app
+from server.api import shared as api_shared
 from server.api.shared import db_service, server
 from tests.conftest import _get_db_url
 
@@ -107,6 +108,28 @@ class TestGetGameState:
         resp = client.get("/games/nonexistent/state")
         assert resp.status_code == 404
 
+    @pytest.mark.skipif(not _get_db_url(), reason="Database URL not configured")
+    def test_get_game_state_conditional(self, client):
+        """A repeated poll with the ETag is a bodiless 304, decided without loading
+        the state; submitting orders changes the ETag."""
+        game_id = client.post("/games/create", json={"map_name": "standard"}).json()["game_id"]
+        first = client.get(f"/games/{game_id}/state")
+        etag = first.headers["ETag"]
+        assert first.headers["Cache-Control"] == "no-cache"
+
+        with patch("server.api.routes.games.game_service.view") as view:
+            again = client.get(f"/games/{game_id}/state", headers={"If-None-Match": etag})
+        assert again.status_code == 304
+        assert again.content == b""
+        assert again.headers["ETag"] == etag
+        view.assert_not_called()
+
+        api_shared.game_service.submit_orders(game_id, "FRANCE", ["A PAR H"])
+        changed = client.get(f"/games/{game_id}/state", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["ETag"] != etag
+        assert changed.json()["orders"]["FRANCE"] == ["A PAR H"]
+
 
 @pytest.mark.unit
 class TestListGames:
@@ -438,6 +461,24 @@ class TestGameSnapshots:
         assert "status" in data
         assert "snapshots" in data
 
+    @pytest.mark.skipif(not _get_db_url(), reason="Database URL not configured")
+    def test_snapshot_listing_and_history_round_trip(self, client):
+        """The listing decodes year/season/phase from the phase code; the
+        history route returns the rebuilt board."""
+        game_id = client.post("/games/create", json={"map_name": "standard"}).json()["game_id"]
+        saved = client.post(f"/games/{game_id}/snapshot")
+        assert saved.status_code == 200, saved.text
+        [listed] = client.get(f"/games/{game_id}/snapshots").json()["snapshots"]
+        assert listed["id"] == saved.json()["snapshot_id"]
+        assert (listed["year"], listed["season"], listed["phase"], listed["phase_code"]) == (
+            1901, "SPRING", "MOVEMENT", "S1901M"
+        )
+        history = client.get(f"/games/{int(game_id)}/history/{saved.json()['turn']}")
+        assert history.status_code == 200, history.text
+        assert history.json()["phase"] == "S1901M"
+        assert len(history.json()["state"]["units"]) == 22
+        assert client.get(f"/games/{int(game_id)}/history/999").status_code == 404
+
 
 @pytest.mark.unit
 class TestLegalOrders:
@@ -473,6 +514,22 @@ class TestLegalOrders:
         assert all(o.startswith("F BRE") for o in data["orders_by_unit"]["F BRE"])
         assert "F BRE H" in data["orders"]
 
+    @pytest.mark.skipif(not _get_db_url(), reason="Database URL not configured")
+    def test_get_legal_orders_for_power_etag_survives_order_submission(self, client):
+        """Legal orders depend on the board only: submitting orders keeps the ETag,
+        processing the turn changes it."""
+        game_id = client.post("/games/create", json={"map_name": "standard"}).json()["game_id"]
+        etag = client.get(f"/games/{game_id}/legal_orders/FRANCE").headers["ETag"]
+
+        api_shared.game_service.submit_orders(game_id, "FRANCE", ["A PAR - BUR"])
+        resp = client.get(f"/games/{game_id}/legal_orders/FRANCE", headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+
+        api_shared.game_service.process_turn(game_id)
+        resp = client.get(f"/games/{game_id}/legal_orders/FRANCE", headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.json()["phase"] == "F1901M"
+
     @pytest.mark.skipif(not _get_db_url(), reason="Database URL not configured")
     def test_get_legal_orders_for_power_game_not_found(self, client):
         """Power-level route 404s for an unknown game."""
@@ -165,6 +165,30 @@ class TestGetGameOrdersMapPng:
         assert resp.headers["content-type"] == "image/png"
         assert resp.content[:8] == b"\x89PNG\r\n\x1a\n"
 
+    @pytest.mark.skipif(not _get_db_url(), reason="Database URL not configured")
+    def test_conditional_get_skips_load_and_render(self, client):
+        """With a matching If-None-Match the route answers 304 before loading the
+        game or rendering; a new order changes the orders map's ETag but not the
+        plain board's."""
+        headers = _register_and_login(client, "ordersmap3")
+        game_id = _create_game(client, headers)
+        orders_etag = client.get(f"/games/{game_id}/map/orders").headers["ETag"]
+        board_etag = client.get(f"/games/{game_id}/map").headers["ETag"]
+
+        with patch("server.api.routes.maps.game_service.view") as view, \
+             patch("server.api.routes.maps.Map") as renderer:
+            resp = client.get(f"/games/{game_id}/map/orders", headers={"If-None-Match": orders_etag})
+        assert resp.status_code == 304
+        view.assert_not_called()
+        assert not renderer.mock_calls
+
+        from server.api.shared import game_service
+        game_service.submit_orders(game_id, "FRANCE", ["A PAR H"])
+        resp = client.get(f"/games/{game_id}/map/orders", headers={"If-None-Match": orders_etag})
+        assert resp.status_code == 200
+        resp = client.get(f"/games/{game_id}/map", headers={"If-None-Match": board_etag})
+        assert resp.status_code == 304
+
 
 @pytest.mark.unit
 class TestGetGameResolutionMapPng:
@@ -151,3 +151,34 @@ class TestGetGameMessages:
         if resp.status_code == 200:
             data = resp.json()
             assert "messages" in data
+
+    @pytest.mark.skipif(not _get_db_url(), reason="Database URL not configured")
+    def test_cursors_page_and_poll(self, client):
+        """limit pages back from the newest, since_id polls forwards, and the
+        unread count agrees with what a poll would return."""
+        headers = _register_and_login(client, "msg_cursor")
+        game_id = _create_game(client, headers)
+        client.post("/users/persistent_register", json={"telegram_id": "cursor_user", "full_name": "C", "bot_secret": BOT_SECRET})
+        client.post(f"/games/{game_id}/join", json={"telegram_id": "cursor_user", "bot_secret": BOT_SECRET, "game_id": game_id, "power": "FRANCE"})
+        auth = {"telegram_id": "cursor_user", "bot_secret": BOT_SECRET}
+        for i in range(5):
+            resp = client.post(f"/games/{game_id}/broadcast", json={**auth, "text": f"m{i}"})
+            assert resp.status_code == 200, resp.text
+
+        def texts(**params):
+            data = client.get(f"/games/{game_id}/messages", params={**auth, **params}).json()
+            return [m["text"] for m in data["messages"]], data["has_more"]
+
+        everything, more = texts()
+        assert everything == ["m0", "m1", "m2", "m3", "m4"] and not more
+        ids = [m["id"] for m in client.get(f"/games/{game_id}/messages", params=auth).json()["messages"]]
+        assert texts(limit=2) == (["m3", "m4"], True)
+        assert texts(limit=2, before_id=ids[3]) == (["m1", "m2"], True)
+        assert texts(limit=2, before_id=ids[1]) == (["m0"], False)
+        assert texts(since_id=ids[1], limit=2) == (["m2", "m3"], True)
+        assert texts(since_id=ids[4]) == ([], False)
+        assert client.get(f"/games/{game_id}/messages", params={"limit": 0}).status_code == 400
+
+        unread = client.get(f"/games/{game_id}/messages/unread", params={**auth, "since_id": ids[2]}).json()
+        assert unread == {"unread": 2, "latest_id": ids[4]}
+        assert client.get("/games/no_such_game/messages/unread").status_code == 404
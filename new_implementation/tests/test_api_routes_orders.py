@@ -268,3 +268,70 @@ class TestClearOrders:
 
         resp = client.post(f"/games/{game_id_int}/orders/FRANCE/clear", json={"telegram_id": "user8", "bot_secret": BOT_SECRET})
         assert resp.status_code in [403, 500]
+
+
+@pytest.mark.unit
+class TestPreviewOrders:
+    """Test the what-if preview endpoint."""
+
+    @pytest.mark.skipif(not _get_db_url(), reason="Database URL not configured")
+    def test_preview_does_not_store_orders(self, client):
+        client.post("/users/persistent_register", json={"bot_secret": BOT_SECRET, "telegram_id": "preview_user", "full_name": "Preview"})
+        headers = _register_and_login(client, "ord_preview")
+        game_id = _create_game(client, headers)
+        client.post(f"/games/{int(game_id)}/join", json={"telegram_id": "preview_user", "bot_secret": BOT_SECRET, "game_id": int(game_id), "power": "FRANCE"})
+
+        body = {"power": "FRANCE", "orders": ["A PAR - BUR", "A MAR - XYZ"], "telegram_id": "preview_user", "bot_secret": BOT_SECRET}
+        resp = client.post(f"/games/{game_id}/preview", json=body)
+        assert resp.status_code == 200
+        data = resp.json()
+        assert [o["ok"] for o in data["orders"]] == [True, False]
+        assert {"kind": "A", "power": "FRANCE", "location": "BUR"} in data["units"]
+
+        pending = client.get(f"/games/{game_id}/orders/FRANCE", params={"telegram_id": "preview_user", "bot_secret": BOT_SECRET})
+        assert pending.json()["orders"] == []
+
+    @pytest.mark.skipif(not _get_db_url(), reason="Database URL not configured")
+    def test_preview_unauthorized(self, client):
+        client.post("/users/persistent_register", json={"bot_secret": BOT_SECRET, "telegram_id": "preview_a", "full_name": "A"})
+        client.post("/users/persistent_register", json={"bot_secret": BOT_SECRET, "telegram_id": "preview_b", "full_name": "B"})
+        headers = _register_and_login(client, "ord_preview_unauth")
+        game_id = _create_game(client, headers)
+        client.post(f"/games/{int(game_id)}/join", json={"telegram_id": "preview_a", "bot_secret": BOT_SECRET, "game_id": int(game_id), "power": "FRANCE"})
+
+        resp = client.post(f"/games/{game_id}/preview", json={"power": "FRANCE", "orders": ["A PAR - BUR"], "telegram_id": "preview_b", "bot_secret": BOT_SECRET})
+        assert resp.status_code == 403
+
+
+@pytest.mark.unit
+class TestOrderOdds:
+    """Test the Monte Carlo order-odds endpoint."""
+
+    @pytest.mark.skipif(not _get_db_url(), reason="Database URL not configured")
+    def test_odds_for_submitted_orders(self, client):
+        client.post("/users/persistent_register", json={"bot_secret": BOT_SECRET, "telegram_id": "odds_user", "full_name": "Odds"})
+        headers = _register_and_login(client, "ord_odds")
+        game_id = _create_game(client, headers)
+        client.post(f"/games/{int(game_id)}/join", json={"telegram_id": "odds_user", "bot_secret": BOT_SECRET, "game_id": int(game_id), "power": "FRANCE"})
+        client.post("/games/set_orders", json={"game_id": game_id, "power": "FRANCE", "orders": ["F BRE - MAO"], "telegram_id": "odds_user", "bot_secret": BOT_SECRET})
+
+        params = {"telegram_id": "odds_user", "bot_secret": BOT_SECRET, "budget_ms": 500}
+        resp = client.get(f"/games/{game_id}/orders/FRANCE/odds", params=params)
+        assert resp.status_code == 200
+        data = resp.json()
+        assert [o["order"] for o in data["orders"]] == ["F BRE - MAO"]
+        assert data["orders"][0]["p"] == 1.0
+        assert data["cached"] is False
+        assert client.get(f"/games/{game_id}/orders/FRANCE/odds", params=params).json()["cached"] is True
+
+    @pytest.mark.skipif(not _get_db_url(), reason="Database URL not configured")
+    def test_odds_rejects_unknown_policy_and_other_users(self, client):
+        client.post("/users/persistent_register", json={"bot_secret": BOT_SECRET, "telegram_id": "odds_a", "full_name": "A"})
+        client.post("/users/persistent_register", json={"bot_secret": BOT_SECRET, "telegram_id": "odds_b", "full_name": "B"})
+        headers = _register_and_login(client, "ord_odds_auth")
+        game_id = _create_game(client, headers)
+        client.post(f"/games/{int(game_id)}/join", json={"telegram_id": "odds_a", "bot_secret": BOT_SECRET, "game_id": int(game_id), "power": "FRANCE"})
+
+        url = f"/games/{game_id}/orders/FRANCE/odds"
+        assert client.get(url, params={"telegram_id": "odds_b", "bot_secret": BOT_SECRET}).status_code == 403
+        assert client.get(url, params={"telegram_id": "odds_a", "bot_secret": BOT_SECRET, "policy": "oracle"}).status_code == 400
@@ -0,0 +1,81 @@
+"""Tests for ``server.async_http.PooledAsyncClient``.
+
+Pure unit tests over ``httpx.MockTransport`` -- no network.
+"""
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from server.async_http import PooledAsyncClient
+
+pytestmark = pytest.mark.unit
+
+
+def _pool(handler=None, **kwargs) -> PooledAsyncClient:
+    handler = handler or (lambda request: httpx.Response(200, json={"ok": True}))
+    return PooledAsyncClient(
+        "http://api.test/", transport=httpx.MockTransport(handler), **kwargs
+    )
+
+
+def test_endpoint_timeouts_first_match_wins_and_ignore_query_string():
+    pool = _pool(
+        default_timeout=10,
+        endpoint_timeouts=((r"/process_turn$", 60), (r"/map(/|$)", 30)),
+    )
+    assert pool.timeout_for("/games/1/process_turn") == 60
+    assert pool.timeout_for("/games/1/map") == 30
+    assert pool.timeout_for("/games/1/map/history/3") == 30
+    assert pool.timeout_for("/games/1/state?telegram_id=5") == 10
+
+
+def test_request_uses_the_endpoint_timeout():
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={})
+
+    pool = _pool(handler, default_timeout=10, endpoint_timeouts=((r"/map$", 30),))
+
+    async def run() -> None:
+        await pool.request("GET", "/games/1/map")
+        await pool.request("GET", "/games/1/state")
+        await pool.request("GET", "/games/1/state", timeout=2)
+        await pool.aclose()
+
+    asyncio.run(run())
+    assert [r.extensions["timeout"]["read"] for r in seen] == [30, 10, 2]
+
+
+def test_one_client_per_event_loop():
+    """Calls on one loop share a client; a new loop (``asyncio.run`` again) gets a fresh one."""
+    pool = _pool(default_timeout=10)
+
+    async def clients() -> tuple[httpx.AsyncClient, httpx.AsyncClient]:
+        await pool.request("GET", "/a")
+        first = pool._client
+        await pool.request("GET", "/b")
+        return first, pool._client
+
+    first, second = asyncio.run(clients())
+    assert first is second
+    third, _ = asyncio.run(clients())
+    assert third is not first
+
+
+def test_aclose_is_idempotent_and_reopens_on_next_request():
+    pool = _pool(default_timeout=10)
+
+    async def run() -> int:
+        await pool.request("GET", "/a")
+        await pool.aclose()
+        await pool.aclose()
+        resp = await pool.request("GET", "/a")
+        await pool.aclose()
+        return resp.status_code
+
+    assert asyncio.run(run()) == 200
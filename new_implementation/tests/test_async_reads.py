@@ -0,0 +1,145 @@
+"""Tests for the awaitable hot reads (``persistence/async_reads.py``).
+
+Every read is checked against what the sync DAL returns for the same game,
+on both drivers: asyncpg, and the sync engine in a thread
+(``use_async_driver=False``). Needs PostgreSQL; the SQLite fallback is
+checked separately.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+
+import pytest
+
+from persistence.async_reads import AsyncReadRepo
+from persistence.database import Base
+from persistence.database_service import DatabaseService
+from persistence.engine import create_async_db_engine, get_engine
+from persistence.game_repo import GameRepo
+from server.game_service import GameService
+from tests.conftest import _get_db_url
+
+pytestmark = [
+    pytest.mark.database,
+    pytest.mark.skipif(not _get_db_url(), reason="Database not configured"),
+]
+
+
+@pytest.fixture(params=["asyncpg", "thread"])
+async def reads(request: pytest.FixtureRequest):
+    repo = AsyncReadRepo(_get_db_url(), use_async_driver=request.param == "asyncpg")
+    yield repo
+    await repo.dispose()
+
+
+@pytest.fixture
+def db_service() -> DatabaseService:
+    return DatabaseService(_get_db_url())
+
+
+@pytest.fixture
+def game(db_service: DatabaseService) -> dict:
+    """A game with two seated players (one with a user), pending orders and
+    a broadcast, a message to FRANCE and one to ENGLAND."""
+    service = GameService(GameRepo(db_service.session_factory))
+    gid = service.create_game()
+    pk = int(db_service.get_game_by_game_id(gid).id)
+    tag = uuid.uuid4().hex[:10]
+    france = db_service.create_user(telegram_id=f"ar_fra_{tag}", full_name="Fra Player")
+    germany = db_service.create_user(telegram_id=f"ar_ger_{tag}", full_name="Ger Player")
+    db_service.create_player(pk, "FRANCE", int(france.id))
+    db_service.create_player(pk, "ENGLAND", None)
+    service.submit_orders(gid, "FRANCE", ["A PAR - BUR", "F BRE - MAO"])
+    db_service.create_message(pk, int(germany.id), None, "hello all")
+    db_service.create_message(pk, int(germany.id), "FRANCE", "psst france")
+    db_service.create_message(pk, int(germany.id), "ENGLAND", "psst england")
+    return {
+        "id": gid, "pk": pk, "service": service, "france": int(france.id),
+        "germany": int(germany.id), "telegram": f"ar_fra_{tag}",
+    }
+
+
+class TestParityWithSyncReads:
+    async def test_version_matches_game_repo(self, reads: AsyncReadRepo, game: dict) -> None:
+        repo = GameRepo(DatabaseService(_get_db_url()).session_factory)
+        for with_players in (False, True):
+            assert await reads.get_version(game["id"], with_players=with_players) == repo.get_version(
+                game["id"], with_players=with_players
+            )
+        assert await reads.get_version(str(game["pk"])) == repo.get_version(str(game["pk"]))
+        assert await reads.get_version("no_such_game") is None
+
+    async def test_view_and_load_match_the_sync_service(self, reads: AsyncReadRepo, game: dict) -> None:
+        sync_service: GameService = game["service"]
+        service = GameService(sync_service._repo, map=sync_service.map, reads=reads)
+        view = await service.view_async(game["id"])
+        assert view == sync_service.view(game["id"])
+        assert view["orders"]["FRANCE"] == ["A PAR - BUR", "F BRE - MAO"]
+        assert (await service.load_async(game["id"])).state == sync_service.load(game["id"]).state
+        assert await service.view_async("no_such_game") is None
+
+    async def test_players_join_their_users(self, reads: AsyncReadRepo, game: dict) -> None:
+        players = {p["power"]: p for p in await reads.get_players(game["id"])}
+        assert players["FRANCE"] == {
+            "power": "FRANCE", "user_id": game["france"], "is_active": True,
+            "telegram_id": game["telegram"], "full_name": "Fra Player",
+        }
+        assert players["ENGLAND"]["telegram_id"] is None
+        assert await reads.get_players("no_such_game") is None
+        assert await reads.get_player_user_id(game["id"], "FRANCE") == (True, game["france"])
+        assert await reads.get_player_user_id(game["id"], "ENGLAND") == (True, None)
+        assert await reads.get_player_user_id(game["id"], "TURKEY") == (False, None)
+
+    async def test_messages_are_filtered_per_caller(self, reads: AsyncReadRepo, game: dict) -> None:
+        async def texts(user_id: int | None) -> list[str]:
+            return [m["text"] for m in await reads.get_messages(game["id"], user_id)]
+
+        assert await texts(None) == ["hello all"]
+        assert await texts(game["france"]) == ["hello all", "psst france"]
+        # The sender is not seated, so they see broadcasts only.
+        assert await texts(game["germany"]) == ["hello all"]
+        assert await reads.get_messages("no_such_game", None) is None
+
+    async def test_message_cursors_and_unread_count(self, reads: AsyncReadRepo, game: dict) -> None:
+        everything = await reads.get_messages(game["id"], game["france"])
+        first, second = (m["id"] for m in everything)
+        assert await reads.get_message_page(game["id"], game["france"], since_id=first) == ([everything[1]], False)
+        assert await reads.get_message_page(game["id"], game["france"], limit=1) == ([everything[1]], True)
+        assert await reads.get_message_page(
+            game["id"], game["france"], before_id=second, limit=1
+        ) == ([everything[0]], False)
+        assert await reads.count_unread_messages(game["id"], game["france"], first) == {
+            "unread": 1, "latest_id": second,
+        }
+        assert await reads.count_unread_messages(game["id"], None, second) == {"unread": 0, "latest_id": None}
+
+    async def test_users_and_waiting_list(self, reads: AsyncReadRepo, game: dict, db_service) -> None:
+        assert await reads.get_active_user_id(game["france"]) == game["france"]
+        assert await reads.get_active_user_id(-1) is None
+        assert await reads.get_user_id_by_telegram_id(game["telegram"]) == game["france"]
+        assert await reads.count_waiting_list() == db_service.count_waiting_list()
+
+
+def test_a_new_event_loop_gets_a_new_engine_and_keeps_the_counters(game: dict) -> None:
+    reads = AsyncReadRepo(_get_db_url(), use_async_driver=True)
+    for _ in range(2):
+        assert asyncio.run(reads.get_version(game["id"])) is not None
+    status = reads.pool_status()
+    assert status["driver"] == "asyncpg"
+    assert status["pool_class"] == "InstrumentedAsyncQueuePool"
+    assert status["checkouts"] >= 2 and status["connects"] >= 2
+    asyncio.run(reads.dispose())
+
+
+@pytest.mark.unit
+def test_other_databases_fall_back_to_threads(tmp_path) -> None:
+    url = f"sqlite:///{tmp_path / 'reads.db'}"
+    with pytest.raises(ValueError):
+        create_async_db_engine(url)
+    Base.metadata.create_all(get_engine(url))
+    reads = AsyncReadRepo(url)
+    assert asyncio.run(reads.get_version("1")) is None
+    assert asyncio.run(reads.count_waiting_list()) == 0
+    assert reads.driver == "thread"
@@ -0,0 +1,152 @@
+"""Tests for the Telegram bot's per-phase caches (``server.telegram_bot.cache``).
+
+Thin-client unit tests: every HTTP call is mocked. The load-bearing assertion
+is the budget -- walking a whole interactive order costs one legal-orders fetch
+per phase, and a turn-processed notification makes the next walk refetch.
+"""
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from server.telegram_bot import cache
+from server.telegram_bot.game_context import fetch_user_games, resolve_game_and_power
+from server.telegram_bot.notifications import NotifyRequest, notify
+from server.telegram_bot.orders import (
+    selectunit,
+    show_possible_moves,
+    show_support_choices,
+    show_support_options,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _legal(phase: str = "S1901M") -> dict:
+    bucket = ["A BER H", "A BER - SIL", "A BER S A MUN", "A BER S A MUN - TYR"]
+    return {
+        "phase": phase,
+        "phase_type": "MOVEMENT",
+        "power": "GERMANY",
+        "units": [{"kind": "A", "location": "BER", "province": "BER", "coast": None}],
+        "orders_by_unit": {"A BER": bucket},
+        "orders": bucket,
+    }
+
+
+def _legal_fetches(mock_get: Mock) -> int:
+    """Calls to the legal-orders route (``orders.api_get`` also serves province names)."""
+    return sum("/legal_orders/" in c.args[0] for c in mock_get.call_args_list)
+
+
+def _query() -> Mock:
+    query = Mock()
+    query.edit_message_text = AsyncMock()
+    query.from_user = Mock(id=12345)
+    return query
+
+
+# --- TTLCache ---------------------------------------------------------------
+
+
+def test_ttl_cache_expires_entries() -> None:
+    clock = _Clock()
+    c = cache.TTLCache(ttl=10, clock=clock)
+    c.set("k", 1)
+    clock.now = 9.9
+    assert c.get("k") == 1
+    clock.now = 10
+    assert c.get("k") is None
+
+
+def test_ttl_cache_evicts_least_recently_used() -> None:
+    c = cache.TTLCache(ttl=60, max_entries=2)
+    c.set("a", 1)
+    c.set("b", 2)
+    c.get("a")
+    c.set("c", 3)
+    assert c.get("a") == 1
+    assert c.get("b") is None
+
+
+# --- LegalOrdersCache ---------------------------------------------------------
+
+
+def test_legal_orders_are_keyed_by_phase() -> None:
+    c = cache.LegalOrdersCache()
+    assert c.get("1", "GERMANY") is None, "phase unknown: must miss"
+    c.put("1", "germany", _legal("S1901M"))
+    assert c.get("1", "GERMANY")["phase"] == "S1901M"
+
+    # Learning that the game moved on (e.g. from /status) retires the old phase.
+    c.note_phase("1", "F1901M")
+    assert c.get("1", "GERMANY") is None
+
+
+def test_invalidate_game_only_touches_that_game() -> None:
+    c = cache.LegalOrdersCache()
+    c.put("1", "GERMANY", _legal())
+    c.put("2", "GERMANY", _legal())
+    c.invalidate_game("1")
+    assert c.get("1", "GERMANY") is None
+    assert c.get("2", "GERMANY") is not None
+
+
+# --- the bot flows --------------------------------------------------------------
+
+
+def test_order_flow_fetches_legal_orders_once_per_phase() -> None:
+    games = {"games": [{"game_id": 1, "power": "GERMANY"}]}
+    update = Mock()
+    update.message = None
+    update.callback_query = _query()
+    update.effective_user = Mock(id=12345)
+    context = Mock(args=[], user_data={})
+
+    async def walk() -> None:
+        await selectunit(update, context)
+        await show_possible_moves(_query(), context, "1", "A BER")
+        await show_support_options(_query(), context, "1", "A BER")
+        await show_support_choices(_query(), context, "1", "A BER", "MUN")
+
+    with patch("server.telegram_bot.game_context.api_get", return_value=games) as games_get, \
+         patch("server.telegram_bot.orders.api_get", return_value=_legal()) as legal_get:
+        asyncio.run(walk())
+        assert _legal_fetches(legal_get) == 1, legal_get.call_args_list
+        assert games_get.call_count == 1, games_get.call_args_list
+
+        # The turn is processed; the notification retires both caches.
+        asyncio.run(notify(NotifyRequest(
+            telegram_id=12345, message="processed", game_id=1, event="turn_processed"
+        )))
+        legal_get.return_value = _legal("F1901M")
+        asyncio.run(walk())
+        assert _legal_fetches(legal_get) == 2
+        assert games_get.call_count == 2
+
+
+async def test_user_games_are_cached_until_invalidated() -> None:
+    payload = {"games": [{"game_id": 7, "power": "ITALY"}]}
+    with patch("server.telegram_bot.game_context.api_get", return_value=payload) as mock_get:
+        assert await resolve_game_and_power("42") == ("7", "ITALY")
+        assert await fetch_user_games("42") == payload["games"]
+        assert mock_get.call_count == 1
+
+        cache.invalidate_user("42")
+        await fetch_user_games("42")
+        assert mock_get.call_count == 2
+
+        # A processed turn in one of the user's games also drops the list.
+        cache.invalidate_game("7")
+        await fetch_user_games("42")
+        assert mock_get.call_count == 3
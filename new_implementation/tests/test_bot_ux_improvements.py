@@ -28,8 +28,8 @@ from __future__ import annotations
 import asyncio
 from unittest.mock import AsyncMock, Mock, patch
 
+import httpx
 import pytest
-import requests
 
 from server.telegram_bot import app as bot_app
 from server.telegram_bot.api_client import ApiError, api_get, api_post
@@ -59,23 +59,18 @@ def _make_update_and_context(user_id: int = 12345, args=None, first_name="Test",
     return update, context, message
 
 
-def _mock_response(status_code: int, json_body=None, text_body: str = "") -> Mock:
-    resp = Mock(spec=requests.Response)
-    resp.status_code = status_code
-    resp.ok = status_code < 400
-    resp.request = Mock()
-    resp.text = text_body
+def _mock_response(status_code: int, json_body=None, text_body: str = "") -> httpx.Response:
+    request = httpx.Request("GET", "http://test")
     if json_body is not None:
-        resp.json.return_value = json_body
-    else:
-        resp.json.side_effect = ValueError("no JSON body")
+        return httpx.Response(status_code, json=json_body, request=request)
+    return httpx.Response(status_code, text=text_body, request=request)
 
-    def _raise() -> None:
-        if status_code >= 400:
-            raise requests.HTTPError(f"{status_code} Client Error: X for url: http://test", response=resp)
 
-    resp.raise_for_status.side_effect = _raise
-    return resp
+def _patch_pool(resp: httpx.Response):
+    """Patch the api_client's pooled transport to answer every call with ``resp``."""
+    return patch(
+        "server.telegram_bot.api_client._pool.request", new=AsyncMock(return_value=resp)
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -86,41 +81,41 @@ def _mock_response(status_code: int, json_body=None, text_body: str = "") -> Moc
 class TestApiClientErrorDetail:
     def test_api_post_error_message_is_server_detail_not_status_line(self):
         resp = _mock_response(401, json_body={"detail": "Not authenticated"})
-        with patch("requests.post", return_value=resp):
+        with _patch_pool(resp):
             with pytest.raises(ApiError) as exc_info:
-                api_post("/games/1/join", {"telegram_id": "5"})
+                asyncio.run(api_post("/games/1/join", {"telegram_id": "5"}))
         assert str(exc_info.value) == "Not authenticated"
-        # Still a requests.HTTPError -- existing `except requests.HTTPError`
-        # call sites (link_account.py) must keep working unchanged.
-        assert isinstance(exc_info.value, requests.HTTPError)
+        # Still an httpx.HTTPStatusError with `.response` populated --
+        # link_account.py reads the status code and body off it.
+        assert isinstance(exc_info.value, httpx.HTTPStatusError)
         assert exc_info.value.response.status_code == 401
 
     def test_api_get_error_message_is_server_detail(self):
         resp = _mock_response(403, json_body={"detail": "Sender not in game"})
-        with patch("requests.get", return_value=resp):
+        with _patch_pool(resp):
             with pytest.raises(ApiError) as exc_info:
-                api_get("/games/1/messages")
+                asyncio.run(api_get("/games/1/messages"))
         assert str(exc_info.value) == "Sender not in game"
 
     def test_falls_back_to_generic_message_when_body_is_not_json(self):
         resp = _mock_response(500, json_body=None)
-        with patch("requests.post", return_value=resp):
+        with _patch_pool(resp):
             with pytest.raises(ApiError) as exc_info:
-                api_post("/games/1/process_turn", {})
+                asyncio.run(api_post("/games/1/process_turn", {}))
         # No `detail` available -- falls back to the plain HTTPError text,
         # not a crash inside the error-handling path itself.
         assert "500" in str(exc_info.value)
 
     def test_falls_back_when_json_body_has_no_detail_key(self):
         resp = _mock_response(400, json_body={"unrelated": "field"})
-        with patch("requests.post", return_value=resp):
+        with _patch_pool(resp):
             with pytest.raises(ApiError) as exc_info:
-                api_post("/games/1/join", {"telegram_id": "5"})
+                asyncio.run(api_post("/games/1/join", {"telegram_id": "5"}))
         assert "400" in str(exc_info.value)
 
     @patch("server.telegram_bot.games.api_post")
     def test_join_unregistered_user_gets_detail_and_register_hint(self, mock_post):
-        mock_post.side_effect = ApiError("Not authenticated", response=Mock(status_code=401))
+        mock_post.side_effect = ApiError("Not authenticated", request=Mock(), response=Mock(status_code=401))
         update, context, message = _make_update_and_context(args=["1", "FRANCE"])
 
         asyncio.run(join(update, context))
@@ -144,7 +139,7 @@ class TestApiClientErrorDetail:
         context = Mock()
 
         with patch("server.telegram_bot.app.api_post") as mock_post:
-            mock_post.side_effect = ApiError("Not authenticated", response=Mock(status_code=401))
+            mock_post.side_effect = ApiError("Not authenticated", request=Mock(), response=Mock(status_code=401))
             asyncio.run(bot_app.button_callback(update, context))
 
         text = query.edit_message_text.call_args[0][0]
@@ -166,19 +166,34 @@ class TestChannelAnalyticsEndpoints:
         assert resp.status_code == 404
 
     @patch("server.api.routes.channels.db_service")
-    def test_get_player_activity_stats_returns_players(
-        self, mock_db, client, mock_channel_info, sample_analytics_events
-    ):
-        # Use only player_activity events for this endpoint
-        player_events = [e for e in sample_analytics_events if e["event_type"] == "player_activity"]
+    def test_get_player_activity_stats_returns_players(self, mock_db, client, mock_channel_info):
         mock_db.get_game_channel_info.return_value = mock_channel_info
-        mock_db.get_channel_analytics.return_value = player_events
+        mock_db.get_channel_player_activity.return_value = [
+            {"user_id": 42, "power": "FRANCE", "activity_count": 3, "last_activity": "2026-01-01T00:00:00"}
+        ]
         resp = client.get("/games/game_1/channel/analytics/players")
         assert resp.status_code == 200
         data = resp.json()
         assert data["status"] == "ok"
-        assert "players" in data
-        assert data["player_count"] >= 0
-        mock_db.get_channel_analytics.assert_called_once()
+        assert data["player_count"] == 1
+        assert data["players"][0]["activity_count"] == 3
+        mock_db.get_channel_player_activity.assert_called_once()
+        mock_db.get_channel_analytics.assert_not_called()  # grouped in SQL, no raw event scan
+
+    @patch("server.api.routes.channels.db_service")
+    def test_get_analytics_pages_with_a_keyset_cursor(
+        self, mock_db, client, mock_channel_info, sample_analytics_events
+    ):
+        mock_db.get_game_channel_info.return_value = mock_channel_info
+        mock_db.get_channel_analytics.return_value = sample_analytics_events
+        resp = client.get("/games/game_1/channel/analytics", params={"limit": 1, "before_id": 9})
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["event_count"] == 1
+        assert data["next_before_id"] == 1
         call_kw = mock_db.get_channel_analytics.call_args[1]
-        assert call_kw["event_type"] == "player_activity"
+        assert call_kw["limit"] == 2 and call_kw["before_id"] == 9
+
+        mock_db.get_channel_analytics.return_value = sample_analytics_events[:1]
+        assert client.get("/games/game_1/channel/analytics").json()["next_before_id"] is None
+        assert client.get("/games/game_1/channel/analytics", params={"limit": 0}).status_code == 400
@@ -0,0 +1,83 @@
+"""Tests for the DAIDE load-test harness (``python -m server.daide.loadtest``).
+
+The wire -> `GameState` readers are checked against the session's own
+`build_now_tokens`/`build_sco_tokens`; one small run against the test
+database proves the bots play whole phases through a real listener.
+"""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from engine.game import Game
+from engine.types import DislodgedUnit, GameState, Location, PhaseType, Season, Unit, UnitKind
+from persistence.game_repo import GameRepo
+from server.daide.loadtest import ownership_from_sco, percentile, run_load_test, state_from_now
+from server.daide.session import build_now_tokens, build_sco_tokens
+from server.game_service import GameService
+
+
+@pytest.fixture(scope="module")
+def game() -> Game:
+    return Game.new_standard()
+
+
+@pytest.mark.unit
+class TestWireReaders:
+    def test_now_and_sco_round_trip_a_starting_position(self, game: Game) -> None:
+        state = game.state
+        ownership = ownership_from_sco(build_sco_tokens(state.ownership, game.map))
+        assert ownership == state.ownership
+        assert state_from_now(build_now_tokens(state, game.map), ownership, map=game.map) == state
+
+    def test_dislodged_units_keep_their_retreats(self, game: Game) -> None:
+        dislodged = DislodgedUnit(
+            Unit(UnitKind.FLEET, "RUSSIA", Location("STP", "SC")),
+            attacker_origin=None,
+            retreats=(Location("BOT"), Location("LVN")),
+        )
+        state = GameState(
+            1901,
+            Season.SPRING,
+            PhaseType.RETREAT,
+            units=frozenset({Unit(UnitKind.ARMY, "GERMANY", Location("BER"))}),
+            ownership={"BER": "GERMANY"},
+            dislodged=(dislodged,),
+        )
+        assert state_from_now(build_now_tokens(state, game.map), {"BER": "GERMANY"}, map=game.map) == state
+
+    def test_rejects_other_messages(self, game: Game) -> None:
+        sco = build_sco_tokens({}, game.map)
+        with pytest.raises(ValueError, match="NOW"):
+            state_from_now(sco, {}, map=game.map)
+        with pytest.raises(ValueError, match="SCO"):
+            ownership_from_sco(build_now_tokens(game.state, game.map))
+
+
+@pytest.mark.unit
+def test_percentile_is_nearest_rank() -> None:
+    samples = [float(i) for i in range(1, 101)]
+    assert percentile(samples, 50) == 50.0
+    assert percentile(samples, 99) == 99.0
+    assert percentile(samples, 100) == 100.0
+    assert percentile([3.0], 90) == 3.0
+
+
+@pytest.mark.database
+class TestRunLoadTest:
+    async def test_bots_play_every_phase_through_the_listener(self, temp_db) -> None:
+        service = GameService(GameRepo(sessionmaker(bind=temp_db)))
+        report = await run_load_test(service, bots=8, games=1, phases=2, phase_timeout=30.0)
+
+        assert report.errors == []
+        assert report.rejected == 1  # the eighth bot finds the one-game lobby full
+        assert report.games == 1 and report.phases == 2
+        assert report.timed_out_phases == 0
+        assert len(report.handshake) == 7
+        assert len(report.turn_now) == 7 * 2  # every seated bot saw every pushed NOW
+        assert len(report.process_turn) == 2
+        assert report.sub_thx  # movement phases always have orders to submit
+        summary = report.summary()
+        assert summary["turn_now"]["count"] == 14
+        assert summary["handshake"]["p50"] <= summary["handshake"]["max"]
@@ -26,6 +26,7 @@ from engine.types import Hold, PhaseType, Season, STANDARD_POWERS
 from persistence.game_repo import GameRepo
 from server.daide import clauses
 from server.daide import tokens as t
+from server.daide import session as session_mod
 from server.daide import wire
 from server.daide.server import DaideServer
 from server.daide.session import DaideSession, text_clause
@@ -252,6 +253,116 @@ class TestNotifyGameProcessed:
         await server.notify_game_processed(gid)
 
 
+    async def test_frames_are_encoded_once_and_shared_across_sessions(
+        self, service: GameService, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        gid = _new_game(service)
+        server = DaideServer(service, game_id=gid)
+        writers = {}
+        for power in ("AUSTRIA", "ENGLAND", "FRANCE"):
+            writers[power] = FakeWriter()
+            daide_session = DaideSession(None, writers[power], server)
+            daide_session.power = power
+            server.register(gid, power, daide_session)
+
+        prev_phase = service.view(gid)["phase"]
+        service.submit_orders(gid, "AUSTRIA", ["A BUD H"])
+        service.process_turn(gid)
+
+        decodes = []
+        real_last_resolution = service.last_resolution
+        monkeypatch.setattr(
+            service, "last_resolution", lambda g: decodes.append(g) or real_last_resolution(g)
+        )
+        await server.notify_game_processed(gid, resolved_phase=prev_phase)
+        await server.notify_game_processed(gid, resolved_phase=prev_phase)
+
+        assert len(decodes) == 1  # the second notify reused the phase's ORD frames
+        aus, eng, fra = (writers[p].sent for p in ("AUSTRIA", "ENGLAND", "FRANCE"))
+        assert len(aus) == len(eng) == len(fra)
+        assert all(a is e is f for a, e, f in zip(aus, eng, fra))  # the very same bytes
+        assert _decode_frame(aus[0])[0] == t.NOW
+        # SCO goes out once; the repeat notify has nothing new to report.
+        assert sum(_decode_frame(f)[0] == t.SCO for f in aus) == 1
+
+
+# ---------------------------------------------------------------------------
+# Outbound queues / slow consumers
+# ---------------------------------------------------------------------------
+
+
+class _StallingWriter(FakeWriter):
+    """Takes the handshake, then never drains again -- a bot that stopped reading.
+
+    ``abort()`` ends the session's read side, as a real transport's would."""
+
+    def __init__(self, reader: asyncio.StreamReader) -> None:
+        super().__init__()
+        self.reader = reader
+        self.transport = self
+        self.aborted = False
+        self._drains = 0
+
+    async def drain(self) -> None:
+        self._drains += 1
+        if self._drains > 1:
+            await asyncio.Event().wait()
+
+    def abort(self) -> None:
+        self.aborted = True
+        self.reader.feed_eof()
+
+
+async def _running_session(server: DaideServer, make_writer) -> tuple[DaideSession, asyncio.Task]:
+    """A `DaideSession.run()` task fed IM + NME through an in-memory reader."""
+    reader = asyncio.StreamReader()
+    reader.feed_data(wire.InitialMessage().to_bytes())
+    payload = b"".join(bytes(tok) for tok in (t.NME, *text_clause("bot"), *text_clause("1.0")))
+    reader.feed_data(wire.DiplomacyMessage(payload=payload).to_bytes())
+    daide_session = DaideSession(reader, make_writer(reader), server)
+    task = asyncio.create_task(daide_session.run())
+    for _ in range(100):
+        if daide_session.power is not None:
+            break
+        await asyncio.sleep(0.01)
+    return daide_session, task
+
+
+class TestSlowConsumers:
+    async def test_full_outbox_disconnects_only_the_slow_session(
+        self, service: GameService, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(session_mod, "OUTBOX_FRAMES", 4)
+        gid = _new_game(service)
+        server = DaideServer(service, game_id=gid)
+        fast, fast_task = await _running_session(server, lambda reader: FakeWriter())
+        slow, slow_task = await _running_session(server, _StallingWriter)
+        try:
+            for i in range(8):
+                await server.broadcast_admin(gid, "admin", text_clause(f"m{i}"))
+                await asyncio.sleep(0)
+            await asyncio.wait_for(slow_task, timeout=5)
+
+            assert slow.closed and slow.writer.aborted
+            assert set(server.sessions_for(gid)) == {fast.power}
+            adm = [f for f in fast.writer.sent[1:] if _decode_frame(f)[0] == t.ADM]  # [0] is RM
+            assert len(adm) == 8
+        finally:
+            fast.reader.feed_eof()
+            await asyncio.wait_for(fast_task, timeout=5)
+
+    async def test_socket_that_never_drains_times_out(
+        self, service: GameService, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(session_mod, "SEND_TIMEOUT_S", 0.05)
+        server = DaideServer(service, game_id=_new_game(service))
+        slow, slow_task = await _running_session(server, _StallingWriter)
+        # The HLO reply itself never drains.
+        await asyncio.wait_for(slow_task, timeout=5)
+        assert slow.closed and slow.writer.aborted
+        assert server.sessions_for(slow.game_id) == {}
+
+
 # ---------------------------------------------------------------------------
 # D5 -- full end-to-end raw-socket round trip, one continuous connection
 # ---------------------------------------------------------------------------
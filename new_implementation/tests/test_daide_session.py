@@ -119,7 +119,7 @@ class TestNmeHlo:
 
     async def test_nme_rejected_once_every_power_is_claimed(self, service: GameService) -> None:
         gid = _new_game(service)
-        server = DaideServer(service, game_id=gid)
+        server = DaideServer(service, game_id=gid, max_games=1)
         for power in STANDARD_POWERS:
             server.register(gid, power, object())  # dummy occupant; never sent to
         writer = FakeWriter()
@@ -130,6 +130,47 @@ class TestNmeHlo:
         assert session.power is None
         assert frames[0][0] == t.REJ
 
+    async def test_finished_games_do_not_count_against_max_games(self, service: GameService) -> None:
+        gid = _new_game(service)
+        server = DaideServer(service, game_id=gid, max_games=1)
+        for power in STANDARD_POWERS:
+            server.register(gid, power, DaideSession(None, FakeWriter(), server))
+
+        await server.broadcast_draw_completion(gid)
+        writer = FakeWriter()
+        session = DaideSession(None, writer, server)
+        frames = await _dispatch(session, writer, t.NME, *text_clause("Bot"), *text_clause("1.0"))
+
+        assert frames[0][0] == t.HLO
+        assert session.game_id != gid and server.games == (gid, session.game_id)
+
+    async def test_nme_opens_a_new_lobby_game_once_every_power_is_claimed(self, service: GameService) -> None:
+        gid = _new_game(service)
+        server = DaideServer(service, game_id=gid)
+        for power in STANDARD_POWERS:
+            server.register(gid, power, object())
+        writer = FakeWriter()
+        session = DaideSession(None, writer, server)
+
+        frames = await _dispatch(session, writer, t.NME, *text_clause("Bot"), *text_clause("1.0"))
+
+        assert frames[0][0] == t.HLO
+        assert session.game_id != gid and service.exists(session.game_id)
+        assert server.games == (gid, session.game_id)
+        assert session.power == STANDARD_POWERS[0]
+
+    async def test_nme_fills_the_first_game_with_a_free_seat(self, service: GameService) -> None:
+        first, second = _new_game(service), _new_game(service)
+        server = DaideServer(service, game_id=first)
+        server.host_game(second)
+        server.register(first, "AUSTRIA", object())
+        writer = FakeWriter()
+        session = DaideSession(None, writer, server)
+
+        await _dispatch(session, writer, t.NME, *text_clause("Bot"), *text_clause("1.0"))
+
+        assert (session.game_id, session.power) == (first, "ENGLAND")
+
     async def test_iam_reclaims_power_after_disconnect(self, service: GameService) -> None:
         gid = _new_game(service)
         server = DaideServer(service, game_id=gid)
@@ -158,6 +199,30 @@ class TestNmeHlo:
         assert s2.power == power
         assert frames[0][0] == t.YES
 
+    async def test_iam_routes_to_the_game_that_issued_the_passcode(self, service: GameService) -> None:
+        first, second = _new_game(service), _new_game(service)
+        server = DaideServer(service, game_id=first)
+        server.host_game(second)
+        passcode = server.register(second, "FRANCE", object())
+        server.unregister(second, "FRANCE", server.sessions_for(second)["FRANCE"])
+
+        writer = FakeWriter()
+        session = DaideSession(None, writer, server)
+        frames = await _dispatch(
+            session,
+            writer,
+            t.IAM,
+            t.OPEN_PAREN,
+            t.FRA,
+            t.CLOSE_PAREN,
+            t.OPEN_PAREN,
+            Token.from_int(passcode),
+            t.CLOSE_PAREN,
+        )
+
+        assert frames[0][0] == t.YES
+        assert (session.game_id, session.power) == (second, "FRANCE")
+
     async def test_iam_wrong_passcode_is_rejected(self, service: GameService) -> None:
         gid = _new_game(service)
         server = DaideServer(service, game_id=gid)
@@ -268,3 +268,33 @@ def test_registering_a_duplicate_token_text_raises():
 def test_registering_a_duplicate_token_bytes_raises():
     with pytest.raises(ValueError):
         tokens._register("__NEW_NAME__", 0x48, 0x04)  # HLO's bytes
+
+
+# ---------------------------------------------------------------------------
+# Bulk codec
+# ---------------------------------------------------------------------------
+
+
+def test_decode_tokens_agrees_with_the_first_principles_decoder_for_every_code():
+    payload = b"".join(code.to_bytes(2, "big") for code in range(0x10000))
+    valid = [code for code in range(0x10000) if Token._decode_slow(code.to_bytes(2, "big")) is not None]
+    decoded = tokens.decode_tokens(b"".join(c.to_bytes(2, "big") for c in valid))
+    assert decoded == [Token._decode_slow(c.to_bytes(2, "big")) for c in valid]
+    assert len(valid) < 0x10000  # some codes (e.g. 0x4FFF) decode to nothing
+    with pytest.raises(ValueError):
+        tokens.decode_tokens(payload)
+
+
+def test_decode_tokens_accepts_memoryview_and_roundtrips_with_encode_tokens():
+    stream = [tokens.NOW, tokens.OPEN_PAREN, tokens.SPR, Token.from_int(-1901), Token.from_str("x"), tokens.CLOSE_PAREN]
+    raw = tokens.encode_tokens(stream)
+    assert raw == b"".join(bytes(tok) for tok in stream)
+    assert tokens.decode_tokens(memoryview(bytearray(raw))) == stream
+    assert tokens.decode_tokens(b"") == []
+
+
+def test_decode_tokens_rejects_odd_length_and_names_the_bad_code():
+    with pytest.raises(ValueError):
+        tokens.decode_tokens(b"\x48")
+    with pytest.raises(ValueError, match=r"O\\xff"):
+        tokens.decode_tokens(bytes(tokens.NOW) + bytes((0x4F, 0xFF)))
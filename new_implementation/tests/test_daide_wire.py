@@ -21,11 +21,13 @@ from server.daide.wire import (
     ErrorCode,
     ErrorMessage,
     FinalMessage,
+    FrameReader,
     InitialMessage,
     MessageType,
     RepresentationMessage,
     read_message,
     write_message,
+    write_messages,
 )
 
 
@@ -207,3 +209,66 @@ async def test_write_then_read_roundtrips_a_diplomacy_message():
     message = await read_message(_reader_for(writer.written))
     assert isinstance(message, DiplomacyMessage)
     assert message.payload == payload
+
+
+# ---------------------------------------------------------------------------
+# Batched framing: FrameReader / write_messages
+# ---------------------------------------------------------------------------
+
+
+class _ChunkedReader:
+    """Hands out fixed byte chunks per ``read()``, counting the calls."""
+
+    def __init__(self, *chunks: bytes) -> None:
+        self.chunks = list(chunks)
+        self.reads = 0
+
+    async def read(self, n: int) -> bytes:
+        self.reads += 1
+        return self.chunks.pop(0) if self.chunks else b""
+
+
+async def test_frame_reader_parses_a_burst_from_one_read():
+    frames = [DiplomacyMessage(bytes((0x48, 0x04, 0x41, i))) for i in range(5)] + [FinalMessage()]
+    reader = _ChunkedReader(b"".join(f.to_bytes() for f in frames))
+    frame_reader = FrameReader(reader)
+    assert [await frame_reader.read_message() for _ in frames] == frames
+    assert reader.reads == 1
+
+
+async def test_frame_reader_reassembles_frames_split_across_reads():
+    data = InitialMessage().to_bytes() + DiplomacyMessage(bytes((0x48, 0x04, 0x41, 0x01))).to_bytes()
+    frame_reader = FrameReader(_ChunkedReader(*(data[i : i + 3] for i in range(0, len(data), 3))))
+    assert await frame_reader.read_message() == InitialMessage()
+    assert await frame_reader.read_message() == DiplomacyMessage(bytes((0x48, 0x04, 0x41, 0x01)))
+
+
+async def test_frame_reader_errors_match_read_message():
+    frame_reader = FrameReader(_ChunkedReader(bytes((MessageType.DIPLOMACY, 0, 0, 1, 0x48)), b""))
+    with pytest.raises(DaideWireError):
+        await frame_reader.read_message()
+    truncated = FrameReader(_reader_for(bytes((MessageType.INITIAL, 0, 0, 4, 0, 1))))
+    with pytest.raises(asyncio.IncompleteReadError):
+        await truncated.read_message()
+    with pytest.raises(asyncio.IncompleteReadError):
+        await FrameReader(_reader_for(b"")).read_message()
+
+
+async def test_write_messages_writes_a_burst_with_one_drain():
+    class _CountingWriter(_RecordingWriter):
+        def __init__(self) -> None:
+            super().__init__()
+            self.writes = self.drains = 0
+
+        def write(self, data: bytes) -> None:
+            self.writes += 1
+            super().write(data)
+
+        async def drain(self) -> None:
+            self.drains += 1
+
+    writer = _CountingWriter()
+    messages = [DiplomacyMessage(bytes((0x48, 0x04, 0x41, i))) for i in range(10)]
+    await write_messages(writer, messages)
+    assert (writer.writes, writer.drains) == (1, 1)
+    assert writer.written == b"".join(m.to_bytes() for m in messages)
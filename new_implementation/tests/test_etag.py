@@ -0,0 +1,85 @@
+"""Tests for conditional-GET support: ``server.etag`` and ``GameRepo.get_version``.
+
+The route-level behaviour (304s on ``/state``, legal orders, maps) is covered in
+``test_api_routes_games.py`` / ``test_api_routes_maps.py``; these check the
+pieces those ETags are made of.
+"""
+from __future__ import annotations
+
+import uuid
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from persistence.game_repo import GameRepo
+from server.etag import etag_matches, not_modified, strong_etag
+from server.game_service import GameService
+
+
+class TestEtagHelpers:
+    pytestmark = pytest.mark.unit
+
+    def test_strong_etag_is_quoted_and_deterministic(self):
+        etag = strong_etag("1", {"b": 2, "a": 1}, "FRANCE")
+        assert etag.startswith('"') and etag.endswith('"')
+        assert etag == strong_etag("1", {"a": 1, "b": 2}, "FRANCE")
+        assert etag != strong_etag("1", {"a": 1, "b": 2}, "GERMANY")
+
+    @pytest.mark.parametrize(
+        "header, expected",
+        [
+            (None, False),
+            ('"abc"', True),
+            ('W/"abc"', True),
+            ('"old", "abc"', True),
+            ("*", True),
+            ('"other"', False),
+        ],
+    )
+    def test_etag_matches(self, header, expected):
+        assert etag_matches(header, '"abc"') is expected
+
+    def test_not_modified_is_an_empty_304(self):
+        request = Mock(headers={"if-none-match": '"abc"'})
+        resp = not_modified(request, '"abc"')
+        assert resp.status_code == 304
+        assert resp.body == b""
+        assert resp.headers["ETag"] == '"abc"'
+        assert not_modified(Mock(headers={}), '"abc"') is None
+
+
+@pytest.mark.database
+class TestGameVersion:
+    @pytest.fixture
+    def service(self, temp_db):
+        return GameService(GameRepo(sessionmaker(bind=temp_db)))
+
+    def test_unknown_game_has_no_version(self, service):
+        assert service.version(f"missing-{uuid.uuid4().hex[:8]}") is None
+
+    def test_counters_track_state_and_order_writes_separately(self, service):
+        gid = service.create_game(f"etag-{uuid.uuid4().hex[:8]}")
+        v0 = service.version(gid)
+        assert (v0["phase_code"], v0["state_version"], v0["orders_version"]) == ("S1901M", 0, 0)
+
+        service.submit_orders(gid, "FRANCE", ["A PAR - BUR"])
+        v1 = service.version(gid)
+        assert (v1["state_version"], v1["orders_version"]) == (0, 1)
+
+        service.process_turn(gid)
+        v2 = service.version(gid)
+        assert v2["phase_code"] == "F1901M"
+        assert v2["state_version"] == 1
+        assert v2["orders_version"] == 2  # pending orders cleared
+
+    def test_version_does_not_read_state_json(self, service, monkeypatch):
+        gid = service.create_game(f"etag-{uuid.uuid4().hex[:8]}")
+        monkeypatch.setattr(
+            GameRepo, "get_state_json", Mock(side_effect=AssertionError("decoded state"))
+        )
+        assert service.version(gid)["phase_code"] == "S1901M"
+
+    def test_with_players_includes_assignments(self, service):
+        gid = service.create_game(f"etag-{uuid.uuid4().hex[:8]}")
+        assert service.version(gid, with_players=True)["players"] == []
@@ -0,0 +1,150 @@
+"""Tests for the shared blocking-work pools (``server.executors``).
+
+The pools' counters are checked on private ``BlockingPool`` instances. The
+event-loop lag tests run the real call sites' pattern -- ``await
+run_blocking(...)`` -- next to a ticker coroutine and assert the loop kept
+ticking while the blocking call ran, first with a plain sleep, then with a
+real ``GameService.process_turn`` against the test database.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from server import executors
+from server.executors import BlockingPool, run_blocking
+from tests.conftest import _get_db_url
+
+# The loop must never go this long without running a ready callback while
+# blocking work is offloaded. Generous for CI; a direct call to the blocking
+# functions below stalls it for at least 0.3 s.
+MAX_LOOP_LAG_S = 0.1
+
+
+def _pool(workers: int) -> BlockingPool:
+    return BlockingPool("test", ThreadPoolExecutor(max_workers=workers), workers)
+
+
+async def _max_lag_while(work: Any, interval: float = 0.005) -> tuple[Any, float]:
+    """Await ``work`` while a ticker measures the longest gap between ticks."""
+    lag = 0.0
+    done = asyncio.Event()
+
+    async def ticker() -> None:
+        nonlocal lag
+        while not done.is_set():
+            before = time.monotonic()
+            await asyncio.sleep(interval)
+            lag = max(lag, time.monotonic() - before - interval)
+
+    tick = asyncio.create_task(ticker())
+    try:
+        result = await work
+    finally:
+        done.set()
+        await tick
+    return result, lag
+
+
+@pytest.mark.unit
+class TestBlockingPool:
+    def test_counts_queue_depth_and_wait_time(self) -> None:
+        pool = _pool(1)
+        gate = threading.Event()
+        try:
+            first = pool.submit(gate.wait, 5)
+            rest = [pool.submit(lambda i=i: i * 2) for i in range(3)]
+            assert pool.in_flight == 4
+            assert pool.queued == 3
+            time.sleep(0.05)
+            gate.set()
+            assert first.result(5) is True
+            assert [f.result(5) for f in rest] == [0, 2, 4]
+        finally:
+            pool.shutdown()
+        stats = pool.snapshot()
+        assert (stats["submitted"], stats["completed"], stats["in_flight"], stats["queued"]) == (4, 4, 0, 0)
+        assert stats["wait_seconds_max"] >= 0.05
+        assert stats["wait_seconds_mean"] > 0
+
+    def test_failures_and_cancellations_are_counted(self) -> None:
+        pool = _pool(1)
+        gate = threading.Event()
+        try:
+            blocker = pool.submit(gate.wait, 5)
+            queued = pool.submit(lambda: "never")
+            assert queued.cancel()
+            assert queued.cancelled()
+            failing = pool.submit(lambda: 1 / 0)
+            gate.set()
+            blocker.result(5)
+            with pytest.raises(ZeroDivisionError):
+                failing.result(5)
+        finally:
+            pool.shutdown()
+        stats = pool.snapshot()
+        assert (stats["completed"], stats["failed"], stats["cancelled"], stats["in_flight"]) == (1, 1, 1, 0)
+
+    def test_run_blocking_returns_and_raises_like_the_call(self) -> None:
+        async def main() -> Any:
+            assert await run_blocking(divmod, 7, 2) == (3, 1)
+            assert await run_blocking(sorted, [3, 1, 2], reverse=True) == [3, 2, 1]
+            with pytest.raises(KeyError):
+                await run_blocking({}.__getitem__, "missing")
+            with pytest.raises(ValueError):
+                await run_blocking(divmod, 7, 2, kind="gpu")
+            # No worker processes configured: cpu work runs on the thread pool.
+            return await run_blocking(threading.current_thread, kind="cpu")
+
+        thread = asyncio.run(main())
+        assert thread is not threading.main_thread()
+        stats = executors.executor_stats()["io"]
+        assert stats["completed"] >= 3 and stats["failed"] >= 1
+
+    def test_shutdown_then_run_blocking_starts_a_new_pool(self) -> None:
+        asyncio.run(run_blocking(int))
+        first = executors.io_pool()
+        executors.shutdown_executors()
+        assert executors.executor_stats() == {}
+        assert asyncio.run(run_blocking(int, "5")) == 5
+        assert executors.io_pool() is not first
+
+
+@pytest.mark.unit
+def test_offloaded_blocking_call_does_not_stall_the_loop() -> None:
+    async def main() -> float:
+        _, lag = await _max_lag_while(run_blocking(time.sleep, 0.3))
+        return lag
+
+    assert asyncio.run(main()) < MAX_LOOP_LAG_S
+
+
+@pytest.mark.integration
+@pytest.mark.database
+@pytest.mark.skipif(not _get_db_url(), reason="Database not configured")
+def test_event_loop_lag_stays_low_during_a_turn() -> None:
+    from persistence.database_service import DatabaseService
+    from persistence.game_repo import GameRepo
+    from server.game_service import GameService
+
+    service = GameService(GameRepo(DatabaseService(_get_db_url()).session_factory))
+    game_id = service.create_game()
+    service.submit_orders(game_id, "FRANCE", ["A PAR - BUR", "A MAR - SPA", "F BRE - MAO"])
+
+    async def main() -> tuple[list[str], float]:
+        phases, worst = [], 0.0
+        for _ in range(3):
+            result, lag = await _max_lag_while(run_blocking(service.process_turn, game_id))
+            phases.append(result["phase"])
+            worst = max(worst, lag)
+        return phases, worst
+
+    phases, lag = asyncio.run(main())
+    assert phases[0] == "F1901M"
+    assert lag < MAX_LOOP_LAG_S
@@ -0,0 +1,158 @@
+"""Tests for the game event bus behind ``GET /games/{id}/events`` (``server.events``)."""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import uuid
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from persistence.game_repo import GameRepo
+from server.events import RESYNC, GameEvent, GameEventBus, PostgresEventBridge
+from server.game_service import GameService
+
+
+class FakeClock:
+    """Nanosecond clock frozen at a fixed instant: ids then count up by one."""
+
+    def __init__(self, start_ns: int = 1_700_000_000_000_000_000) -> None:
+        self.now = start_ns
+
+    def __call__(self) -> int:
+        return self.now
+
+
+async def _drain(sub, limit=20):
+    out = []
+    for _ in range(limit):
+        event = await sub.get(timeout=0.05)
+        if event is None:
+            break
+        out.append(event)
+    return out
+
+
+@pytest.mark.unit
+class TestGameEventBus:
+    async def test_subscriber_receives_only_its_game(self):
+        bus = GameEventBus()
+        sub = bus.subscribe("g1")
+        bus.publish("g1", "orders", {"power": "FRANCE"})
+        bus.publish("g2", "orders", {"power": "ENGLAND"})
+        events = await _drain(sub)
+        assert [(e.game_id, e.type, e.data) for e in events] == [("g1", "orders", {"power": "FRANCE"})]
+        sub.close()
+        assert bus.subscriber_count("g1") == 0
+
+    async def test_ids_increase_even_with_a_frozen_clock(self):
+        bus = GameEventBus(clock=FakeClock())
+        ids = [bus.publish("g1", "orders").id for _ in range(3)]
+        assert ids == sorted(ids) and len(set(ids)) == 3
+
+    def test_sse_frame(self):
+        frame = GameEvent(id=7, game_id="g1", type="phase", data={"phase": "F1901M"}).to_sse()
+        assert frame == 'id: 7\nevent: phase\ndata: {"game_id": "g1", "phase": "F1901M"}\n\n'
+
+    async def test_last_event_id_replays_missed_events(self):
+        bus = GameEventBus()
+        seen = bus.publish("g1", "orders", {"n": 1})
+        bus.publish("g1", "orders", {"n": 2})
+        bus.publish("g1", "phase", {"n": 3})
+        sub = bus.subscribe("g1", last_event_id=seen.id)
+        assert [e.data["n"] for e in await _drain(sub)] == [2, 3]
+
+    async def test_evicted_history_resyncs(self):
+        bus = GameEventBus(history=2)
+        first = bus.publish("g1", "orders")
+        for _ in range(3):
+            bus.publish("g1", "orders")
+        sub = bus.subscribe("g1", last_event_id=first.id)
+        assert [e.type for e in await _drain(sub)] == [RESYNC]
+
+    async def test_id_from_before_the_bus_started_resyncs(self):
+        bus = GameEventBus()
+        sub = bus.subscribe("g1", last_event_id=1)
+        assert [e.type for e in await _drain(sub)] == [RESYNC]
+
+    async def test_slow_subscriber_is_bounded_and_resynced(self):
+        bus = GameEventBus()
+        sub = bus.subscribe("g1", max_buffer=3)
+        for n in range(10):
+            bus.publish("g1", "orders", {"n": n})
+        await asyncio.sleep(0)  # let the loop run the queued deliveries
+        events = await _drain(sub)
+        assert [e.type for e in events] == [RESYNC]
+        assert sub.dropped > 0
+        bus.publish("g1", "phase")
+        assert [e.type for e in await _drain(sub)] == ["phase"]
+
+    async def test_publish_from_another_thread(self):
+        bus = GameEventBus()
+        sub = bus.subscribe("g1")
+        worker = threading.Thread(target=bus.publish, args=("g1", "phase", {"phase": "F1901M"}))
+        worker.start()
+        worker.join()
+        event = await sub.get(timeout=1)
+        assert event is not None and event.data == {"phase": "F1901M"}
+
+    async def test_get_times_out_with_none(self):
+        sub = GameEventBus().subscribe("g1")
+        assert await sub.get(timeout=0.01) is None
+
+    async def test_forward_failure_does_not_break_publish(self):
+        bus = GameEventBus()
+        sub = bus.subscribe("g1")
+
+        def broken(event):
+            raise ConnectionError("down")
+
+        bus.forward = broken
+        bus.publish("g1", "orders")
+        assert [e.type for e in await _drain(sub)] == ["orders"]
+
+
+@pytest.mark.database
+class TestGameServiceEvents:
+    async def test_orders_and_turns_publish(self, temp_db):
+        bus = GameEventBus()
+        service = GameService(GameRepo(sessionmaker(bind=temp_db)), events=bus)
+        gid = service.create_game(f"events-{uuid.uuid4().hex[:8]}")
+        sub = bus.subscribe(gid)
+
+        service.submit_orders(gid, "FRANCE", ["A PAR - BUR"])
+        service.process_turn(gid)
+
+        events = await _drain(sub)
+        assert [e.type for e in events] == ["orders", "phase"]
+        assert events[0].data == {"phase": "S1901M", "power": "FRANCE"}
+        assert events[1].data["previous_phase"] == "S1901M"
+        assert events[1].data["phase"] == "F1901M"
+
+
+@pytest.mark.database
+class TestPostgresEventBridge:
+    async def test_relays_between_buses(self, temp_db):
+        dsn = PostgresEventBridge.dsn_from_url(temp_db.url.render_as_string(hide_password=False))
+        channel = f"test_events_{uuid.uuid4().hex[:8]}"
+        sender_bus, receiver_bus = GameEventBus(), GameEventBus()
+        sender = PostgresEventBridge(sender_bus, dsn, channel=channel)
+        receiver = PostgresEventBridge(receiver_bus, dsn, channel=channel)
+        await asyncio.to_thread(receiver.start)
+        await asyncio.to_thread(sender.start)
+        try:
+            local = sender_bus.subscribe("g1")
+            remote = receiver_bus.subscribe("g1")
+            published = await asyncio.to_thread(sender_bus.publish, "g1", "phase", {"phase": "F1901M"})
+
+            deadline = time.monotonic() + 5
+            event = None
+            while event is None and time.monotonic() < deadline:
+                event = await remote.get(timeout=0.2)
+            assert event == published
+            # The sender's own notification is not delivered a second time.
+            assert [e.id for e in await _drain(local)] == [published.id]
+        finally:
+            await asyncio.to_thread(sender.stop)
+            await asyncio.to_thread(receiver.stop)
@@ -7,7 +7,7 @@ import uuid
 import pytest
 from sqlalchemy.orm import sessionmaker
 
-from engine.serialization import state_to_dict
+from engine.serialization import order_from_dict, state_to_dict
 from engine.types import GameState, GameStatus, Location, PhaseType, Season, Unit, UnitKind
 from persistence.game_repo import GameRepo
 from rendering.map import Map
@@ -104,6 +104,108 @@ class TestLifecycle:
         assert service.view("does-not-exist") is None
 
 
+class TestBinaryState:
+    """``games.state_blob`` (the binary codec) is written with every state and read
+    in preference to ``state_json``."""
+
+    def test_load_reads_the_blob(self, service, monkeypatch):
+        gid = _new_game(service)
+        service.submit_orders(gid, "FRANCE", ["A PAR - BUR"])
+        service.process_turn(gid)
+        assert isinstance(service._repo.get_state_payload(gid), bytes)
+
+        def no_json(*args, **kwargs):
+            raise AssertionError("state_json read")
+
+        monkeypatch.setattr(GameRepo, "get_state_json", no_json)
+        game = service.load(gid)
+        assert game.state.phase_name == "F1901M"
+        assert any(str(u.location) == "BUR" and u.power == "FRANCE" for u in game.state.units)
+
+    def test_json_only_rows_still_load(self, service):
+        gid = _new_game(service)
+        state = service.load(gid).state
+        # A write without a blob (e.g. a row from before the column) clears it.
+        service._repo.update_state_json(
+            gid, state_to_dict(state), phase_code=state.phase_name, status="active"
+        )
+        assert isinstance(service._repo.get_state_payload(gid), dict)
+        assert service.load(gid).state == state
+
+
+class TestParsedPendingOrders:
+    """Submitted orders are stored parsed too, so later reads don't reparse."""
+
+    def test_process_turn_does_not_reparse(self, service, monkeypatch):
+        gid = _new_game(service)
+        service.submit_orders(gid, "FRANCE", ["A PAR - BUR", "F BRE - MAO"])
+        service.submit_orders(gid, "GERMANY", ["A MUN - RUH"])
+
+        def no_parse(*args, **kwargs):
+            raise AssertionError("order text reparsed")
+
+        monkeypatch.setattr("engine.orders.parser.parse_order", no_parse)
+        monkeypatch.setattr("server.game_service.parse_orders_bulk", no_parse)
+        assert service.pending_orders_parsed(gid)["GERMANY"] == [
+            order_from_dict({"type": "MOVE", "power": "GERMANY", "unit": "MUN", "dest": "RUH"})
+        ]
+        service.process_turn(gid)
+        provinces = {u["location"] for u in service.view(gid)["units"]}
+        assert {"BUR", "MAO", "RUH"} <= provinces
+
+    def test_rows_without_parsed_orders_fall_back_to_parsing(self, service):
+        gid = _new_game(service)
+        service._repo.set_pending_orders(gid, {"FRANCE": ["A PAR - BUR"]})
+        assert service._repo.get_pending_orders_with_parsed(gid)[1] is None
+        service.submit_orders(gid, "GERMANY", ["A MUN - RUH"])
+        pending, parsed = service._repo.get_pending_orders_with_parsed(gid)
+        assert set(parsed) == set(pending) == {"FRANCE", "GERMANY"}
+        service.process_turn(gid)
+        provinces = {u["location"] for u in service.view(gid)["units"]}
+        assert {"BUR", "RUH"} <= provinces
+
+
+class TestPreview:
+    """preview adjudicates a draft through a reused session and stores nothing."""
+
+    def test_preview_matches_the_turn_and_stores_nothing(self, service):
+        gid = _new_game(service)
+        preview = service.preview(
+            gid, "FRANCE", ["A PAR - BUR"], assumed={"GERMANY": ["A MUN - BUR"]}
+        )
+        assert service.view(gid)["orders"] == {}
+        results = {r["order"]["unit"]: r["result"] for r in preview["resolution"]["results"]}
+        assert results["PAR"] == results["MUN"] == "BOUNCE"
+
+        service.submit_orders(gid, "FRANCE", ["A PAR - BUR"])
+        service.submit_orders(gid, "GERMANY", ["A MUN - BUR"])
+        turn = service.process_turn(gid)
+        assert {r["order"]["unit"]: r["result"] for r in turn["resolution"]["results"]} == results
+
+    def test_session_is_reused_until_the_phase_moves_on(self, service):
+        gid = _new_game(service)
+        service.preview(gid, "FRANCE", ["A PAR - BUR"], session_key="u1")
+        session = service._previews["u1"][1]
+        resolved = session.resolved
+        service.preview(gid, "FRANCE", ["A PAR - PIC"], session_key="u1")
+        assert service._previews["u1"][1] is session
+        assert session.resolved == resolved + 1  # only PAR's component again
+
+        service.process_turn(gid)
+        preview = service.preview(gid, "FRANCE", ["A PAR - BUR"], session_key="u1")
+        assert service._previews["u1"][1] is not session
+        assert preview["phase"] == "F1901M"
+
+    def test_other_powers_pending_orders_are_not_used(self, service):
+        gid = _new_game(service)
+        service.submit_orders(gid, "GERMANY", ["A MUN - BUR"])
+        preview = service.preview(gid, "FRANCE", ["A PAR - BUR"])
+        assert {"kind": "A", "power": "FRANCE", "location": "BUR"} in preview["units"]
+
+    def test_missing_game(self, service):
+        assert service.preview("no-such-game", "FRANCE", []) is None
+
+
 class TestResolutionPersistence:
     """process_turn stores the adjudication for later resolution-map rendering."""
 
@@ -0,0 +1,126 @@
+"""Tests for the metrics registry (``metrics.py``) and ``GET /metrics``."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from engine.game import Game
+from metrics import REGISTRY, Registry, Sample
+from persistence.engine import counting_statements
+from server.executors import run_blocking
+from server.legal_orders import legal_orders_for_power
+from tests.conftest import _get_db_url
+
+pytestmark = pytest.mark.unit
+
+
+def _value(text: str, series: str) -> float:
+    for line in text.splitlines():
+        if line.startswith(series + " "):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"{series} not in output")
+
+
+def test_histogram_buckets_are_cumulative_with_sum_and_count() -> None:
+    registry = Registry()
+    hist = registry.histogram("work_seconds", "Work.", ("kind",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        hist.labels("a").observe(value)
+    text = registry.render()
+    assert "# TYPE work_seconds histogram" in text
+    assert _value(text, 'work_seconds_bucket{kind="a",le="0.1"}') == 2
+    assert _value(text, 'work_seconds_bucket{kind="a",le="1"}') == 3
+    assert _value(text, 'work_seconds_bucket{kind="a",le="+Inf"}') == 4
+    assert _value(text, 'work_seconds_count{kind="a"}') == 4
+    assert _value(text, 'work_seconds_sum{kind="a"}') == pytest.approx(3.65)
+
+
+def test_counters_gauges_and_label_escaping() -> None:
+    registry = Registry()
+    counter = registry.counter("hits_total", "Hits.", ("path",))
+    counter.labels('a"b\\c').inc(2)
+    gauge = registry.gauge("open", "Open.")
+    gauge.inc()
+    gauge.inc()
+    gauge.dec()
+    text = registry.render()
+    assert _value(text, 'hits_total{path="a\\"b\\\\c"}') == 2
+    assert _value(text, "open") == 1
+    with pytest.raises(ValueError):
+        counter.inc(-1)
+    with pytest.raises(ValueError):
+        counter.inc()  # labelled metrics need .labels()
+
+
+def test_registration_is_idempotent_but_typed() -> None:
+    registry = Registry()
+    first = registry.counter("x_total", "X.", ("a",))
+    assert registry.counter("x_total", "X.", ("a",)) is first
+    with pytest.raises(ValueError):
+        registry.gauge("x_total", "X.", ("a",))
+    with pytest.raises(ValueError):
+        registry.counter("x_total", "X.", ("b",))
+    with pytest.raises(ValueError):
+        registry.counter("bad-name", "Bad.")
+
+
+def test_collectors_are_read_at_scrape_time_and_isolated() -> None:
+    registry = Registry()
+    depth = {"io": 3}
+
+    def queues() -> list[Sample]:
+        return [Sample("queue_depth", "Depth.", "gauge", ("pool",), {(k,): v for k, v in depth.items()})]
+
+    def broken() -> list[Sample]:
+        raise RuntimeError("boom")
+
+    registry.register_collector(queues)
+    registry.register_collector(broken)
+    assert _value(registry.render(), 'queue_depth{pool="io"}') == 3
+    depth["io"] = 5
+    assert _value(registry.render(), 'queue_depth{pool="io"}') == 5
+
+
+def test_hot_paths_record_into_the_default_registry() -> None:
+    game = Game.new_standard()
+    series = 'diplomacy_legal_orders_seconds_count{phase_type="MOVEMENT"}'
+    before = _value(REGISTRY.render(), series) if series in REGISTRY.render() else 0
+    legal_orders_for_power(game.map, game.state, "FRANCE")
+    assert _value(REGISTRY.render(), series) == before + 1
+
+
+@pytest.mark.skipif(not _get_db_url(), reason="Database URL not configured")
+def test_statement_tally_follows_run_blocking_threads() -> None:
+    from server.api.shared import db_service
+
+    async def count() -> int:
+        with counting_statements() as tally:
+            await run_blocking(db_service.get_game_count)
+        return tally[0]
+
+    assert asyncio.run(count()) >= 1
+
+
+@pytest.mark.skipif(not _get_db_url(), reason="Database URL not configured")
+def test_metrics_endpoint_reports_routes_by_template() -> None:
+    from server.api import app
+    from server.api.shared import game_service
+
+    client = TestClient(app)
+    game_id = game_service.create_game()
+    assert client.get(f"/games/{game_id}/state").status_code == 200
+
+    resp = client.get("/metrics")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = resp.text
+    route = 'method="GET",route="/games/{game_id}/state"'
+    assert _value(text, f"diplomacy_http_request_seconds_count{{{route}}}") >= 1
+    assert _value(text, f'diplomacy_http_requests_total{{{route},status="200"}}') >= 1
+    assert _value(text, 'diplomacy_http_db_statements_sum{route="/games/{game_id}/state"}') >= 1
+    assert f"/games/{game_id}/" not in text
+    assert 'diplomacy_db_pool_in_use{engine="sync"}' in text
+    assert "diplomacy_response_cache_entries" in text
@@ -0,0 +1,143 @@
+"""Tests for the Monte Carlo order-odds estimator (``server.odds``)."""
+from __future__ import annotations
+
+import random
+from dataclasses import replace
+
+import pytest
+
+from engine.adjudicator.movement import adjudicate_movement
+from engine.game import Game
+from engine.orders.parser import parse_order
+from engine.types import PhaseType, ResultCode
+from server import odds
+from server.odds import cached_estimate, estimate_order_odds, wilson_interval
+
+
+@pytest.fixture(scope="module")
+def game():
+    return Game.new_standard()
+
+
+def _orders(game, power, *texts):
+    return [parse_order(t, power=power, map=game.map) for t in texts]
+
+
+@pytest.mark.unit
+class TestWilsonInterval:
+    def test_contains_the_point_estimate(self):
+        lo, hi = wilson_interval(30, 100)
+        assert lo < 0.3 < hi
+        assert hi - lo < 0.2
+
+    def test_extremes_stay_in_range(self):
+        assert wilson_interval(0, 50)[0] == 0.0
+        assert wilson_interval(50, 50)[1] == 1.0
+        assert wilson_interval(0, 0) == (0.0, 1.0)
+
+
+@pytest.mark.unit
+class TestSampler:
+    @pytest.mark.parametrize("policy", ["legal", "simple_ai"])
+    def test_counts_match_full_adjudication_of_the_same_samples(self, game, policy):
+        own = _orders(game, "FRANCE", "A PAR - BUR", "A MAR - PIE", "F BRE - MAO")
+        sampler = odds._Sampler(game.map, game.state, "FRANCE", own, policy)
+        counts = sampler.run(150, seed=7)
+
+        replay = odds._Sampler(game.map, game.state, "FRANCE", own, policy)
+        rng = random.Random(7)
+        expected = [[0, 0] for _ in own]
+        for _ in range(150):
+            resolution, _ = adjudicate_movement(
+                game.map, game.state, own + replay._sample(rng)
+            )
+            for i, order in enumerate(own):
+                (r,) = [r for r in resolution.results if r.order == order]
+                expected[i][0] += r.result is ResultCode.OK and not r.dislodged
+                expected[i][1] += r.dislodged
+        assert counts == [tuple(e) for e in expected]
+
+    def test_legal_policy_covers_every_opponent_unit(self, game):
+        sampler = odds._Sampler(game.map, game.state, "FRANCE", [], "legal")
+        opponents = [u for u in game.state.units if u.power != "FRANCE"]
+        assert len(sampler.choices) == len(opponents)
+
+
+@pytest.mark.unit
+class TestEstimate:
+    def test_uncontested_move_always_succeeds(self, game):
+        result = estimate_order_odds(
+            game.map, game.state, "FRANCE", _orders(game, "FRANCE", "F BRE - MAO"), seed=1
+        )
+        (order,) = result["orders"]
+        assert order["order"] == "F BRE - MAO"
+        assert order["p"] == 1.0
+        assert result["stopped"] == "converged"
+        assert result["samples"] >= odds.MIN_SAMPLES
+
+    def test_contested_move_is_uncertain(self, game):
+        result = estimate_order_odds(
+            game.map,
+            game.state,
+            "FRANCE",
+            _orders(game, "FRANCE", "A PAR - BUR"),
+            seed=1,
+            max_samples=600,
+            target_half_width=0.0,
+        )
+        (order,) = result["orders"]
+        assert result["stopped"] == "max_samples" and result["samples"] == 600
+        assert 0.5 < order["p"] < 1.0
+        assert order["ci"][0] < order["p"] < order["ci"][1]
+
+    def test_time_budget_stops_sampling(self, game):
+        result = estimate_order_odds(
+            game.map,
+            game.state,
+            "FRANCE",
+            _orders(game, "FRANCE", "A PAR - BUR"),
+            budget=0.0,
+            target_half_width=0.0,
+        )
+        assert result["stopped"] == "budget"
+        assert result["samples"] == odds.BATCH_SIZE
+
+    def test_no_orders_means_no_sampling(self, game):
+        result = estimate_order_odds(game.map, game.state, "FRANCE", [])
+        assert result["samples"] == 0 and result["orders"] == []
+
+    def test_rejects_other_phases_and_unknown_policies(self, game):
+        retreat = replace(game.state, phase_type=PhaseType.RETREAT)
+        with pytest.raises(ValueError, match="movement"):
+            estimate_order_odds(game.map, retreat, "FRANCE", [])
+        with pytest.raises(ValueError, match="policy"):
+            estimate_order_odds(game.map, game.state, "FRANCE", [], policy="oracle")
+
+
+@pytest.mark.unit
+def test_cached_estimate_computes_once():
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"samples": 5}
+
+    key = ("game", "S1901M", 1, "FRANCE", (), "legal", random.random())
+    assert cached_estimate(key, compute) == {"samples": 5, "cached": False}
+    assert cached_estimate(key, compute) == {"samples": 5, "cached": True}
+    assert len(calls) == 1
+
+
+@pytest.mark.unit
+def test_cached_estimate_recomputes_for_a_longer_budget():
+    results = iter([{"samples": 5, "stopped": "budget"}, {"samples": 900, "stopped": "converged"}])
+
+    def compute():
+        return next(results)
+
+    key = ("game", "S1901M", 1, "FRANCE", (), "legal", random.random())
+    assert cached_estimate(key, compute, budget=0.0)["samples"] == 5
+    assert cached_estimate(key, compute, budget=0.0)["cached"] is True
+    assert cached_estimate(key, compute, budget=1.0) == {"samples": 900, "stopped": "converged", "cached": False}
+    # Converged: no budget would change it.
+    assert cached_estimate(key, compute, budget=5.0)["cached"] is True
@@ -0,0 +1,221 @@
+"""Tests for the post-turn outbox (``server/outbox.py``, ``outbox_events``).
+
+``OutboxDispatcher``'s retry bookkeeping is checked against an in-memory
+stand-in for ``DatabaseService``. The rest runs against the test database:
+rows are committed with the turn (or not at all), claims lease them, and the
+``process_turn`` route replies before any side effect has run.
+
+Claims are not scoped to one game, so the database tests only assert on rows
+for the games they create.
+"""
+
+from __future__ import annotations
+
+import datetime
+from datetime import timedelta
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from engine.types import GameState
+from persistence.database import utcnow_naive
+from persistence.database_service import DatabaseService
+from persistence.game_repo import GameRepo, PostTurnWrites, StaleGameError
+from server.game_service import GameService
+from server.outbox import OutboxDispatcher
+from tests.conftest import _get_db_url
+
+
+class FakeOutboxDb:
+    def __init__(self, events: list[dict[str, Any]]) -> None:
+        self.events = events
+        self.completed: list[int] = []
+        self.retried: list[tuple[int, str, datetime.datetime | None]] = []
+
+    def claim_outbox_events(self, limit: int, lease: timedelta) -> list[dict[str, Any]]:
+        batch, self.events = self.events[:limit], self.events[limit:]
+        return batch
+
+    def complete_outbox_event(self, event_id: int) -> None:
+        self.completed.append(event_id)
+
+    def retry_outbox_event(self, event_id: int, error: str, retry_at: datetime.datetime | None) -> None:
+        self.retried.append((event_id, error, retry_at))
+
+
+def _event(event_id: int, kind: str = "notify_players", attempts: int = 1) -> dict[str, Any]:
+    return {
+        "id": event_id, "game_pk": 1, "game_id": "1", "turn": 1,
+        "kind": kind, "payload": {}, "attempts": attempts,
+    }
+
+
+@pytest.mark.unit
+class TestOutboxDispatcher:
+    def test_runs_each_row_through_its_kind_and_completes_it(self) -> None:
+        seen: list[tuple[str, int]] = []
+        db = FakeOutboxDb([_event(i, kind) for i, kind in enumerate(["a", "b", "a"] * 10)])
+        dispatcher = OutboxDispatcher(
+            db,
+            {"a": lambda e: seen.append(("a", e["id"])), "b": lambda e: seen.append(("b", e["id"]))},
+            batch_size=7,
+        )
+        assert dispatcher.drain() == 30
+        assert [event_id for _, event_id in seen] == list(range(30))
+        assert db.completed == list(range(30))
+        assert db.retried == []
+
+    def test_failures_back_off_exponentially_then_go_dead(self) -> None:
+        def boom(event: dict[str, Any]) -> None:
+            raise RuntimeError("renderer crashed")
+
+        db = FakeOutboxDb([_event(1, attempts=1), _event(2, attempts=3), _event(3, attempts=4)])
+        dispatcher = OutboxDispatcher(db, {"notify_players": boom}, max_attempts=4, retry_base=10.0)
+        before = utcnow_naive()
+        dispatcher.drain()
+        (_, error, first), (_, _, third), (_, _, dead) = db.retried
+        assert error == "RuntimeError: renderer crashed"
+        assert timedelta(seconds=10) <= first - before < timedelta(seconds=11)
+        assert timedelta(seconds=40) <= third - before < timedelta(seconds=41)
+        assert dead is None
+        assert db.completed == []
+
+    def test_an_unknown_kind_is_a_failure_not_a_crash(self) -> None:
+        db = FakeOutboxDb([_event(1, kind="mystery"), _event(2)])
+        dispatcher = OutboxDispatcher(db, {"notify_players": lambda e: None})
+        assert dispatcher.drain() == 2
+        assert [r[0] for r in db.retried] == [1]
+        assert "mystery" in db.retried[0][1]
+        assert db.completed == [2]
+
+    def test_the_thread_dispatches_on_wake(self) -> None:
+        db = FakeOutboxDb([])
+        done = []
+        dispatcher = OutboxDispatcher(db, {"notify_players": done.append}, poll_interval=60.0)
+        dispatcher.start()
+        try:
+            db.events.append(_event(1))
+            dispatcher.wake()
+            deadline = datetime.datetime.now() + timedelta(seconds=5)
+            while not db.completed and datetime.datetime.now() < deadline:
+                dispatcher._wake.wait(0.01)
+        finally:
+            dispatcher.stop()
+        assert db.completed == [1]
+
+
+def _post_turn(state: GameState) -> PostTurnWrites:
+    return PostTurnWrites(
+        deadline=datetime.datetime(2030, 1, 1),
+        outbox=(("snapshot", {"phase_code": state.phase_name}), ("notify_players", {"x": 1})),
+    )
+
+
+@pytest.mark.database
+@pytest.mark.skipif(not _get_db_url(), reason="Database not configured")
+class TestOutboxRows:
+    @pytest.fixture
+    def db_service(self) -> DatabaseService:
+        return DatabaseService(_get_db_url())
+
+    @pytest.fixture
+    def service(self, db_service: DatabaseService) -> GameService:
+        return GameService(GameRepo(db_service.session_factory))
+
+    def _new_game(self, service: GameService, db_service: DatabaseService) -> tuple[str, int]:
+        gid = service.create_game()
+        return gid, int(db_service.get_game_by_game_id(gid).id)
+
+    def test_rows_and_deadline_are_committed_with_the_turn(
+        self, service: GameService, db_service: DatabaseService
+    ) -> None:
+        gid, pk = self._new_game(service, db_service)
+        result = service.process_turn(gid, post_turn=_post_turn)
+        rows = db_service.get_outbox_events(pk)
+        assert [(r["kind"], r["turn"], r["status"]) for r in rows] == [
+            ("snapshot", 1, "pending"), ("notify_players", 1, "pending"),
+        ]
+        assert rows[0]["payload"] == {"phase_code": result["phase"]}
+        assert db_service.get_game_by_id(pk).deadline == datetime.datetime(2030, 1, 1)
+
+    def test_a_stale_turn_writes_no_rows(self, service: GameService, db_service: DatabaseService) -> None:
+        gid, pk = self._new_game(service, db_service)
+        repo = GameRepo(db_service.session_factory)
+        with pytest.raises(StaleGameError):
+            repo.save_state(
+                gid, service.state_json(gid), phase_code="F1901M", status="active",
+                expected_phase_code="S1999M", post_turn=_post_turn(service.load(gid).state),
+            )
+        assert db_service.get_outbox_events(pk) == []
+
+    def test_claims_lease_rows_until_completed_or_rescheduled(
+        self, service: GameService, db_service: DatabaseService
+    ) -> None:
+        gid, pk = self._new_game(service, db_service)
+        service.process_turn(gid, post_turn=_post_turn)
+
+        def mine(events: list[dict[str, Any]]) -> list[dict[str, Any]]:
+            return [e for e in events if e["game_pk"] == pk]
+
+        claimed = mine(db_service.claim_outbox_events(1000, timedelta(minutes=5)))
+        assert [(e["kind"], e["attempts"], e["game_id"]) for e in claimed] == [
+            ("snapshot", 1, gid), ("notify_players", 1, gid),
+        ]
+        assert mine(db_service.claim_outbox_events(1000, timedelta(minutes=5))) == []  # leased
+
+        snapshot, notify = claimed
+        db_service.complete_outbox_event(snapshot["id"])
+        db_service.retry_outbox_event(notify["id"], "OSError: down", utcnow_naive() - timedelta(seconds=1))
+        (again,) = mine(db_service.claim_outbox_events(1000, timedelta(minutes=5)))
+        assert (again["id"], again["attempts"]) == (notify["id"], 2)
+        db_service.retry_outbox_event(notify["id"], "OSError: still down", None)
+
+        rows = {r["kind"]: r for r in db_service.get_outbox_events(pk)}
+        assert rows["snapshot"]["status"] == "done"
+        assert rows["notify_players"]["status"] == "dead"
+        assert rows["notify_players"]["last_error"] == "OSError: still down"
+
+
+@pytest.mark.integration
+@pytest.mark.database
+@pytest.mark.skipif(not _get_db_url(), reason="Database not configured")
+def test_process_turn_route_replies_before_side_effects_run() -> None:
+    from fastapi.testclient import TestClient
+
+    from server.api import app
+    from server.api import shared as api_shared
+    from server.api.shared import BOT_SECRET
+
+    client = TestClient(app)
+    game_id = api_shared.game_service.create_game()
+    pk = int(api_shared.db_service.get_game_by_game_id(game_id).id)
+
+    with patch("server.api.shared.requests.post") as mock_post:
+        resp = client.post(f"/games/{game_id}/process_turn", headers={"X-Bot-Secret": BOT_SECRET})
+        assert resp.status_code == 200, resp.text
+        rows = api_shared.db_service.get_outbox_events(pk)
+        assert {r["kind"] for r in rows} == {"snapshot", "notify_players", "channel_post", "prerender"}
+        assert all(r["status"] == "pending" for r in rows)
+        assert api_shared.db_service.get_game_snapshot_by_game_id_and_turn(pk, 1) is None
+        assert api_shared.db_service.get_game_by_id(pk).deadline is not None
+        mock_post.assert_not_called()
+
+        api_shared.outbox.drain()
+
+    status = {r["kind"]: r["status"] for r in api_shared.db_service.get_outbox_events(pk)}
+    assert status["snapshot"] == status["notify_players"] == status["channel_post"] == "done"
+    snapshot = api_shared.db_service.get_game_snapshot_by_game_id_and_turn(pk, 1)
+    assert snapshot is not None and snapshot.phase_code == resp.json()["phase"]
+
+    # Re-running a row (a worker died before marking it done) does not
+    # duplicate the snapshot.
+    (row,) = [r for r in api_shared.db_service.get_outbox_events(pk) if r["kind"] == "snapshot"]
+    api_shared.outbox.dispatch({
+        "id": row["id"], "game_pk": pk, "game_id": game_id, "turn": row["turn"],
+        "kind": "snapshot", "payload": row["payload"], "attempts": 2,
+    })
+    with api_shared.db_service.session_factory() as session:
+        from persistence.database import MapSnapshotModel
+
+        assert session.query(MapSnapshotModel).filter_by(game_id=pk, turn_number=1).count() == 1
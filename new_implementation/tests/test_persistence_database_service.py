@@ -10,14 +10,19 @@ used to mutate a row returned by get_game_by_game_id and then call db_service
 which opens and commits its own session).
 """
 import datetime
+import random
+import uuid
 
 import pytest
+from sqlalchemy.orm.exc import DetachedInstanceError
 
 from tests.conftest import _get_db_url
-from persistence.database_service import DatabaseService
+from persistence.database_service import DatabaseService, _analytics_window
 from persistence.game_repo import GameRepo
+from engine.game import Game
 from engine.map_loader import load_standard_map
-from engine.serialization import state_to_dict
+from engine.serialization import state_from_dict, state_to_dict, unit_to_dict
+from engine.simple_ai import generate_orders
 from engine.types import GameState, PhaseType
 
 pytestmark = pytest.mark.skipif(not _get_db_url(), reason="Database not configured")
@@ -139,6 +144,58 @@ class TestSnapshots:
         )
         assert db_service.get_game_snapshot_by_id(snap.id, numeric_id + 999_999) is None
 
+    def test_keyframes_and_deltas_rebuild_every_snapshot(
+        self, db_service: DatabaseService, game_ids: tuple[str, int], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A self-played game, one snapshot per phase the way the post-turn
+        outbox writes them: every snapshot reads back exactly as written."""
+        monkeypatch.setenv("DIPLOMACY_SNAPSHOT_KEYFRAME_INTERVAL", "4")
+        _, numeric_id = game_ids
+        game = Game.new_standard()
+        rng = random.Random(3)
+        written = []
+        for turn in range(10):
+            state = game.state
+            view = {
+                "units": [unit_to_dict(u) for u in sorted(state.units, key=lambda x: str(x.location))],
+                "supply_centers": dict(state.ownership),
+            }
+            snap = db_service.create_game_snapshot(
+                game_id=numeric_id, turn=turn, year=state.year, season=state.season.value,
+                phase=state.phase_type.value, phase_code=state.phase_name,
+                game_state=view, state_json=state_to_dict(state),
+            )
+            written.append((snap.id, turn, view, state))
+            powers = sorted({u.power for u in state.units})
+            _, game = game.adjudicate([o for p in powers for o in generate_orders(game.map, state, p, rng)])
+
+        listed = db_service.get_game_snapshots_by_game_id(numeric_id)
+        assert [s.kind for s in listed] == ["keyframe", "delta", "delta", "delta"] * 2 + ["keyframe", "delta"]
+        for snap_id, turn, view, state in written:
+            for fetched in (
+                db_service.get_game_snapshot_by_id(snap_id, numeric_id),
+                db_service.get_game_snapshot_by_game_id_and_turn(numeric_id, turn),
+            ):
+                assert fetched.units == view["units"]
+                assert fetched.supply_centers == view["supply_centers"]
+                assert state_from_dict(fetched.state_json) == state
+        assert db_service.has_game_snapshot(numeric_id, 9, written[-1][3].phase_name)
+        assert not db_service.has_game_snapshot(numeric_id, 9, "S1901M")
+
+    def test_listing_reads_metadata_only(
+        self, db_service: DatabaseService, game_ids: tuple[str, int]
+    ) -> None:
+        _, numeric_id = game_ids
+        db_service.create_game_snapshot(
+            game_id=numeric_id, turn=0, year=1901, season="SPRING",
+            phase="MOVEMENT", phase_code="S1901M",
+            game_state={"units": [], "supply_centers": {"LON": "ENGLAND"}},
+        )
+        [listed] = db_service.get_game_snapshots_by_game_id(numeric_id)
+        assert listed.phase_code == "S1901M" and listed.kind == "keyframe"
+        with pytest.raises(DetachedInstanceError):
+            listed.supply_centers
+
 
 class TestPlayers:
     def test_get_players_by_game_id(
@@ -175,3 +232,144 @@ class TestCommitIsANoOp:
         refetched = db_service.get_game_by_id(numeric_id)
         assert refetched is not None
         assert refetched.status == original_status
+
+
+class TestChannelAnalyticsRollup:
+    """The summaries answer from channel_analytics_daily (+ raw rows for partial
+    edge days) and must always agree with counting the raw events directly."""
+
+    CHANNEL = "-100777"
+
+    def _log_events(self, db_service: DatabaseService, gid: str) -> list[int]:
+        users = [int(db_service.create_user(f"analytics-{uuid.uuid4().hex[:10]}").id) for _ in range(2)]
+        for event_type, subtype, user, power in [
+            ("message_posted", "map", None, None),
+            ("message_posted", "map", None, None),
+            ("message_posted", "broadcast", None, None),
+            ("player_activity", None, users[0], "FRANCE"),
+            ("player_activity", None, users[0], "FRANCE"),
+            ("player_activity", None, users[1], "ENGLAND"),
+            ("player_activity", None, None, "TURKEY"),
+            ("vote_cast", None, users[1], "ENGLAND"),
+        ]:
+            db_service.log_channel_analytics_event(gid, self.CHANNEL, event_type, subtype, user, power)
+        db_service.log_channel_analytics_event(gid, "-100other", "message_posted", "map")
+        return users
+
+    @staticmethod
+    def _count_raw(events: list[dict]) -> dict:
+        by_type: dict[str, int] = {}
+        by_subtype: dict[str, int] = {}
+        for e in events:
+            by_type[e["event_type"]] = by_type.get(e["event_type"], 0) + 1
+            if e["event_subtype"]:
+                by_subtype[e["event_subtype"]] = by_subtype.get(e["event_subtype"], 0) + 1
+        return {
+            "total_events": len(events),
+            "events_by_type": by_type,
+            "events_by_subtype": by_subtype,
+            "unique_users": len({e["user_id"] for e in events if e["user_id"]}),
+            "message_count": by_type.get("message_posted", 0),
+            "player_activity_count": by_type.get("player_activity", 0),
+        }
+
+    def test_summary_matches_the_raw_events_for_every_window_shape(
+        self, db_service: DatabaseService, game_ids: tuple[str, int]
+    ) -> None:
+        gid, _ = game_ids
+        self._log_events(db_service, gid)
+        now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+        today = datetime.datetime.combine(now.date(), datetime.time.min)
+        windows = [
+            (None, None),
+            (now - datetime.timedelta(days=3), now + datetime.timedelta(days=3)),  # rollup + two edges
+            (now - datetime.timedelta(hours=1), now + datetime.timedelta(hours=1)),  # raw rows only
+            (today, None),  # whole days from the rollup only
+            (now + datetime.timedelta(minutes=5), None),  # nothing yet
+        ]
+        for start, end in windows:
+            raw = db_service.get_channel_analytics(gid, channel_id=self.CHANNEL, start_date=start, end_date=end)
+            summary = db_service.get_channel_analytics_summary(
+                gid, channel_id=self.CHANNEL, start_date=start, end_date=end
+            )
+            assert summary == self._count_raw(raw), (start, end)
+        assert db_service.get_channel_analytics_summary(gid, channel_id=self.CHANNEL)["total_events"] == 8
+
+    def test_player_activity_is_grouped_by_user_then_power(
+        self, db_service: DatabaseService, game_ids: tuple[str, int]
+    ) -> None:
+        gid, _ = game_ids
+        users = self._log_events(db_service, gid)
+        players = db_service.get_channel_player_activity(gid, channel_id=self.CHANNEL)
+        counts = {(p["user_id"], p["power"]): p["activity_count"] for p in players}
+        assert counts == {(users[0], "FRANCE"): 2, (users[1], "ENGLAND"): 1, (None, "TURKEY"): 1}
+        assert all(p["last_activity"] for p in players)
+
+    def test_events_page_by_keyset_cursor(
+        self, db_service: DatabaseService, game_ids: tuple[str, int]
+    ) -> None:
+        gid, _ = game_ids
+        self._log_events(db_service, gid)
+        everything = db_service.get_channel_analytics(gid, channel_id=self.CHANNEL)
+        pages, cursor = [], None
+        while True:
+            page = db_service.get_channel_analytics(gid, channel_id=self.CHANNEL, limit=3, before_id=cursor)
+            if not page:
+                break
+            pages.extend(page)
+            cursor = page[-1]["id"]
+        assert pages == everything
+        assert [e["id"] for e in everything] == sorted((e["id"] for e in everything), reverse=True)
+
+    def test_batch_write_matches_one_at_a_time(
+        self, db_service: DatabaseService, game_ids: tuple[str, int]
+    ) -> None:
+        gid, _ = game_ids
+        now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+        yesterday = now - datetime.timedelta(days=1)
+        events = [
+            {"game_id": gid, "channel_id": self.CHANNEL, "event_type": "message_posted", "event_subtype": "map"},
+            {"game_id": gid, "channel_id": self.CHANNEL, "event_type": "message_posted", "event_subtype": "map"},
+            {"game_id": gid, "channel_id": self.CHANNEL, "event_type": "message_posted",
+             "event_subtype": "map", "created_at": yesterday},
+            {"game_id": gid, "channel_id": self.CHANNEL, "event_type": "player_activity",
+             "power": "FRANCE", "metadata": {"message_id": 7}},
+            {"game_id": "no-such-game", "channel_id": self.CHANNEL, "event_type": "message_posted"},
+        ]
+        assert db_service.log_channel_analytics_events(events) == 4
+        assert db_service.log_channel_analytics_events([]) == 0
+
+        raw = db_service.get_channel_analytics(gid, channel_id=self.CHANNEL)
+        assert len(raw) == 4
+        assert [e["event_data"] for e in raw if e["event_type"] == "player_activity"] == [{"message_id": 7}]
+        assert db_service.get_channel_analytics_summary(gid, channel_id=self.CHANNEL) == self._count_raw(raw)
+        today = datetime.datetime.combine(now.date(), datetime.time.min)
+        since_today = db_service.get_channel_analytics_summary(gid, channel_id=self.CHANNEL, start_date=today)
+        assert since_today["total_events"] == 3  # the backdated event landed in yesterday's rollup
+
+
+class TestAnalyticsWindow:
+    def test_splits_whole_days_from_partial_edges(self) -> None:
+        start = datetime.datetime(2026, 3, 1, 12, 0)
+        end = datetime.datetime(2026, 3, 4, 6, 0)
+        use_rollup, first, last, edges = _analytics_window(start, end)
+        assert use_rollup
+        assert (first, last) == (datetime.date(2026, 3, 2), datetime.date(2026, 3, 3))
+        assert edges == [
+            (start, datetime.datetime(2026, 3, 2), False),
+            (datetime.datetime(2026, 3, 4), end, True),
+        ]
+
+    def test_midnight_start_needs_no_raw_edge_and_same_day_needs_no_rollup(self) -> None:
+        assert _analytics_window(datetime.datetime(2026, 3, 1), None) == (
+            True, datetime.date(2026, 3, 1), None, []
+        )
+        start, end = datetime.datetime(2026, 3, 1, 1), datetime.datetime(2026, 3, 1, 2)
+        assert _analytics_window(start, end) == (False, None, None, [(start, end, True)])
+        assert _analytics_window(end, start) == (False, None, None, [])
+
+    def test_aware_bounds_are_converted_to_naive_utc(self) -> None:
+        aware = datetime.datetime(2026, 3, 1, 0, 30, tzinfo=datetime.timezone(datetime.timedelta(hours=2)))
+        _, first, _, edges = _analytics_window(aware, None)
+        assert first == datetime.date(2026, 3, 1)
+        assert edges == [(datetime.datetime(2026, 2, 28, 22, 30), datetime.datetime(2026, 3, 1), False)]
@@ -0,0 +1,107 @@
+"""Tests for the shared, instrumented engine (``persistence.engine``).
+
+Pool behaviour is checked on a file-backed SQLite engine with a one-connection
+pool, so exhaustion is deterministic; the statement timeout needs PostgreSQL.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy import exc, text
+
+from persistence.database_service import DatabaseService
+from persistence.engine import (
+    InstrumentedQueuePool,
+    PoolSettings,
+    create_db_engine,
+    get_engine,
+    pool_status,
+    reset_pool,
+)
+from tests.conftest import _get_db_url
+
+
+@pytest.mark.unit
+class TestPoolSettings:
+    def test_defaults_without_environment(self) -> None:
+        assert PoolSettings.from_env({}) == PoolSettings()
+
+    def test_reads_environment(self) -> None:
+        settings = PoolSettings.from_env({
+            "DIPLOMACY_DB_POOL_SIZE": "20",
+            "DIPLOMACY_DB_MAX_OVERFLOW": "0",
+            "DIPLOMACY_DB_POOL_TIMEOUT": "2.5",
+            "DIPLOMACY_DB_POOL_RECYCLE": "600",
+            "DIPLOMACY_DB_POOL_PRE_PING": "false",
+            "DIPLOMACY_DB_STATEMENT_TIMEOUT_MS": "15000",
+        })
+        assert settings == PoolSettings(
+            pool_size=20, max_overflow=0, pool_timeout=2.5, pool_recycle=600,
+            pre_ping=False, statement_timeout_ms=15000,
+        )
+
+
+@pytest.mark.unit
+class TestInstrumentedPool:
+    @pytest.fixture
+    def engine(self, tmp_path: Path):
+        engine = create_db_engine(
+            f"sqlite:///{tmp_path / 'pool.db'}",
+            PoolSettings(pool_size=1, max_overflow=0, pool_timeout=0.05),
+        )
+        yield engine
+        engine.dispose()
+
+    def test_counts_checkouts_in_use_and_timeouts(self, engine) -> None:
+        assert isinstance(engine.pool, InstrumentedQueuePool)
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            status = pool_status(engine)
+            assert (status["size"], status["in_use"], status["idle"]) == (1, 1, 0)
+            with pytest.raises(exc.TimeoutError):
+                engine.connect()
+        status = pool_status(engine)
+        assert (status["in_use"], status["idle"]) == (0, 1)
+        assert status["checkouts"] == 1
+        assert status["timeouts"] == 1
+        assert status["connects"] == 1
+        assert status["peak_in_use"] == 1
+        assert status["checkout_wait_seconds_max"] >= 0
+
+    def test_reset_replaces_the_pool_and_keeps_the_counters(self, engine) -> None:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        old_pool = engine.pool
+        reset_pool(engine)
+        assert engine.pool is not old_pool
+        assert pool_status(engine)["idle"] == 0
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        status = pool_status(engine)
+        assert (status["resets"], status["checkouts"], status["connects"]) == (1, 2, 2)
+
+    def test_memory_sqlite_keeps_the_default_pool(self) -> None:
+        engine = create_db_engine("sqlite://")
+        assert not isinstance(engine.pool, InstrumentedQueuePool)
+        assert "checkouts" not in pool_status(engine)
+
+
+@pytest.mark.database
+@pytest.mark.skipif(not _get_db_url(), reason="Database not configured")
+class TestSharedEngine:
+    def test_database_services_share_one_engine(self) -> None:
+        first, second = DatabaseService(_get_db_url()), DatabaseService(_get_db_url())
+        assert first.engine is second.engine is get_engine(_get_db_url())
+        assert isinstance(first.engine.pool, InstrumentedQueuePool)
+
+    def test_statement_timeout_is_set_on_each_connection(self) -> None:
+        engine = create_db_engine(_get_db_url(), PoolSettings(statement_timeout_ms=1500))
+        try:
+            with engine.connect() as conn:
+                assert conn.execute(text("SHOW statement_timeout")).scalar() == "1500ms"
+                with pytest.raises(exc.OperationalError):
+                    conn.execute(text("SELECT pg_sleep(3)"))
+        finally:
+            engine.dispose()
@@ -0,0 +1,109 @@
+"""Tests for the ``map_snapshots`` keyframe + delta codec (``persistence/snapshots.py``).
+
+Pure functions, no database: the DAL side (chains, locking, deferred
+columns) is covered in ``test_persistence_database_service.py``.
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from engine.game import Game
+from engine.serialization import state_from_dict, state_to_dict, unit_to_dict
+from engine.simple_ai import generate_orders
+from engine.types import GameStatus
+from persistence import snapshots
+
+pytestmark = pytest.mark.unit
+
+
+def _documents(phases: int, seed: int = 1) -> list[dict]:
+    """One snapshot document per phase of a seeded self-play game, shaped like
+    the post-turn outbox's."""
+    game = Game.new_standard()
+    rng = random.Random(seed)
+    docs = []
+    for _ in range(phases):
+        state = game.state
+        docs.append({
+            "units": [unit_to_dict(u) for u in sorted(state.units, key=lambda x: str(x.location))],
+            "supply_centers": dict(state.ownership),
+            "state_json": state_to_dict(state),
+        })
+        if state.status is not GameStatus.ACTIVE:
+            break
+        powers = sorted({u.power for u in state.units})
+        _, game = game.adjudicate([o for p in powers for o in generate_orders(game.map, state, p, rng)])
+    return docs
+
+
+def _store(docs: list[dict], interval: int) -> list[tuple[str, dict]]:
+    """What ``create_game_snapshot`` would write for ``docs``, as (kind, columns)."""
+    rows: list[tuple[str, dict]] = []
+    previous = None
+    for i, doc in enumerate(docs):
+        if previous is not None and i % interval:
+            delta = snapshots.encode_delta(previous, doc)
+            if snapshots.worth_a_delta(delta, doc):
+                rows.append((snapshots.DELTA, delta))
+                previous = snapshots.apply_delta(previous, delta)
+                continue
+        columns = snapshots.encode_keyframe(doc)
+        rows.append((snapshots.KEYFRAME, columns))
+        previous = snapshots.decode_keyframe(**columns)
+    return rows
+
+
+def test_every_phase_of_a_game_rebuilds_exactly() -> None:
+    docs = _documents(60)
+    current = None
+    for doc, (kind, columns) in zip(docs, _store(docs, interval=20)):
+        if kind == snapshots.KEYFRAME:
+            current = snapshots.decode_keyframe(**columns)
+        else:
+            current = snapshots.apply_delta(current, columns)
+        assert current["units"] == doc["units"]
+        assert current["supply_centers"] == doc["supply_centers"]
+        assert state_from_dict(current["state_json"]) == state_from_dict(doc["state_json"])
+
+
+def test_storage_drops_by_an_order_of_magnitude() -> None:
+    docs = _documents(120)
+    full = sum(snapshots.encoded_size(doc) for doc in docs)
+    stored = sum(snapshots.encoded_size(columns) for _, columns in _store(docs, interval=20))
+    assert full / stored >= 8
+
+
+def test_keyframes_derive_the_view_columns_from_state_json() -> None:
+    doc = _documents(1)[0]
+    columns = snapshots.encode_keyframe(doc)
+    assert columns["units"] is None and columns["supply_centers"] is None
+    assert snapshots.decode_keyframe(**columns) == doc
+
+
+def test_state_json_reuses_the_view_diff() -> None:
+    first, second = _documents(2)
+    delta = snapshots.encode_delta(first, second)
+    assert delta["state_json"]["units"] == "units"
+    assert set(delta["units"]["set"]) and all(isinstance(e, list) for e in delta["units"]["set"].values())
+
+
+def test_unkeyable_values_are_stored_whole() -> None:
+    previous = {"units": {"ENGLAND": []}, "supply_centers": {}, "state_json": None}
+    snapshot = {"units": {"ENGLAND": ["F LON"]}, "supply_centers": {"LON": "ENGLAND"}, "state_json": {"year": 1901}}
+    delta = snapshots.encode_delta(previous, snapshot)
+    assert delta["units"] == {"=": snapshot["units"]}
+    assert delta["state_json"] == {"=": snapshot["state_json"]}
+    assert snapshots.apply_delta(previous, delta) == snapshot
+    assert snapshots.encode_delta(snapshot, snapshot) == {}
+    # Legacy keyframes carry every column and no state_json.
+    assert snapshots.decode_keyframe(**previous) == previous
+
+
+def test_keyframe_interval_and_phase_fields() -> None:
+    assert snapshots.keyframe_interval({}) == snapshots.DEFAULT_KEYFRAME_INTERVAL
+    assert snapshots.keyframe_interval({"DIPLOMACY_SNAPSHOT_KEYFRAME_INTERVAL": "0"}) == 1
+    assert snapshots.phase_fields("F1905R") == {"year": 1905, "season": "FALL", "phase_type": "RETREAT"}
+    assert snapshots.phase_fields("bogus")["year"] is None
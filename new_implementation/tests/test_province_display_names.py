@@ -132,7 +132,7 @@ def test_bot_location_label_shows_name_and_code() -> None:
 
 
 @pytest.mark.unit
-def test_bot_location_label_falls_back_to_the_code() -> None:
+async def test_bot_location_label_falls_back_to_the_code() -> None:
     """The table is fetched lazily and best-effort, so this path is normal."""
     from unittest.mock import patch
 
@@ -141,13 +141,14 @@ def test_bot_location_label_falls_back_to_the_code() -> None:
     bot_orders._reset_province_names_cache()
     try:
         with patch("server.telegram_bot.orders.api_get", side_effect=OSError("api down")):
+            assert await bot_orders.province_names() == {}
             assert bot_orders._location_label("BER") == "BER"
     finally:
         bot_orders._reset_province_names_cache()
 
 
 @pytest.mark.unit
-def test_bot_fetches_province_names_at_most_once() -> None:
+async def test_bot_fetches_province_names_at_most_once() -> None:
     """A per-button HTTP call would be a real cost; a missing name is cosmetic."""
     from unittest.mock import patch
 
@@ -158,7 +159,8 @@ def test_bot_fetches_province_names_at_most_once() -> None:
         payload = {"provinces": {"BER": {"name": "Berlin"}}}
         with patch("server.telegram_bot.orders.api_get", return_value=payload) as mock_get:
             for _ in range(5):
-                bot_orders._location_label("BER")
+                await bot_orders.province_names()
+                assert bot_orders._location_label("BER") == "Berlin (BER)"
         assert mock_get.call_count == 1, mock_get.call_count
     finally:
         bot_orders._reset_province_names_cache()
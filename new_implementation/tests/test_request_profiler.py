@@ -0,0 +1,130 @@
+"""Tests for slow-request profiling (``server/request_profiler.py``) and its dashboard routes."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from server.request_profiler import ProfilerConfig, RequestProfiler, RequestProfilerMiddleware
+from tests.conftest import _get_db_url
+
+pytestmark = pytest.mark.unit
+
+TOKEN = "s3cret"
+
+
+def _busy_work(ms: float) -> None:
+    end = time.perf_counter() + ms / 1000
+    while time.perf_counter() < end:
+        pass
+
+
+def _client(config: ProfilerConfig, capacity: int = 10) -> tuple[TestClient, RequestProfiler]:
+    async def resolution(request):
+        _busy_work(float(request.query_params.get("ms", 0)))
+        return PlainTextResponse("map")
+
+    def fast(request):  # a sync endpoint, run in a thread
+        return PlainTextResponse("ok")
+
+    app = Starlette(routes=[Route("/games/{game_id}/map/resolution", resolution), Route("/fast", fast)])
+    profiler = RequestProfiler(config, admin_token=TOKEN, capacity=capacity)
+    app.add_middleware(RequestProfilerMiddleware, profiler=profiler)
+    return TestClient(app), profiler
+
+
+def test_disabled_profiler_passes_requests_through() -> None:
+    client, profiler = _client(ProfilerConfig())
+    assert client.get("/games/1/map/resolution").text == "map"
+    assert client.get("/fast", headers={"X-Profile": "1", "X-Admin-Token": "wrong"}).text == "ok"
+    assert profiler.profiles() == []
+
+
+def test_sampled_route_is_kept_only_when_slow() -> None:
+    config = ProfilerConfig(slow_ms=20, routes={"/games/{game_id}/map/resolution": 1.0})
+    client, profiler = _client(config)
+    client.get("/games/1/map/resolution?ms=0")
+    client.get("/fast")  # no rate for this route
+    assert profiler.profiles() == []
+
+    client.get("/games/GAME-7/map/resolution?ms=40")
+    [profile] = profiler.profiles()
+    assert profile.path == "/games/GAME-7/map/resolution"
+    assert profile.route == "/games/{game_id}/map/resolution"
+    assert (profile.status, profile.reason) == (200, "sampled")
+    assert profile.duration_ms >= 40
+    assert any("_busy_work" in f["function"] for f in profile.functions)
+    assert profile.functions == sorted(profile.functions, key=lambda f: f["cumtime_ms"], reverse=True)
+
+
+def test_admin_header_forces_a_profile_including_threaded_work() -> None:
+    # A large ``top``: the near-instant ``fast`` can rank below thread-pool plumbing.
+    client, profiler = _client(ProfilerConfig(slow_ms=10_000, top=10_000), capacity=2)
+    for _ in range(3):
+        assert client.get("/fast", headers={"X-Profile": "1", "X-Admin-Token": TOKEN}).status_code == 200
+    profiles = profiler.profiles()
+    assert [p.id for p in profiles] == [3, 2]  # ring buffer, newest first
+    assert profiles[0].reason == "header"
+    assert any("(fast)" in f["function"] for f in profiles[0].functions)
+    assert profiler.get(1) is None
+
+
+def test_config_is_validated_and_skips_while_busy() -> None:
+    with pytest.raises(ValueError):
+        ProfilerConfig(routes={"/x": 1.5}).validate()
+    with pytest.raises(ValueError, match="route template"):
+        ProfilerConfig(routes={"/games/{game_id:conv}": 1.0}).validate()
+    config = ProfilerConfig.from_env(
+        {"DIPLOMACY_PROFILE_ROUTES": "/games/{game_id}/process_turn=1, /fast=0.5", "DIPLOMACY_PROFILE_SLOW_MS": "250"}
+    )
+    assert config.routes == {"/games/{game_id}/process_turn": 1.0, "/fast": 0.5}
+    assert config.slow_ms == 250
+
+    client, profiler = _client(ProfilerConfig(default_rate=1.0))
+    before = profiler.stats()["skipped"]
+    assert profiler.try_begin()
+    try:
+        assert client.get("/fast").text == "ok"
+    finally:
+        profiler.end()
+    assert profiler.stats()["skipped"] == before + 1
+    assert profiler.profiles() == []
+
+
+@pytest.mark.skipif(not _get_db_url(), reason="Database URL not configured")
+def test_dashboard_profile_routes() -> None:
+    from server.api import app
+    from server.api.shared import ADMIN_TOKEN, request_profiler
+
+    client = TestClient(app)
+    admin = {"X-Admin-Token": ADMIN_TOKEN}
+    assert client.get("/dashboard/api/profiles").status_code == 422
+    assert client.put("/dashboard/api/profiles/config", json={"default_rate": 2}, headers=admin).status_code == 400
+    bad_route = {"routes": {"/games/{game_id:conv}": 1.0}}
+    assert client.put("/dashboard/api/profiles/config", json=bad_route, headers=admin).status_code == 400
+
+    client.delete("/dashboard/api/profiles", headers=admin)
+    assert client.get("/health", headers={**admin, "X-Profile": "1"}).status_code == 200
+    listing = client.get("/dashboard/api/profiles", headers=admin).json()
+    [summary] = listing["profiles"]
+    assert summary["route"] == "/health"
+    assert "functions" not in summary
+    detail = client.get(f"/dashboard/api/profiles/{summary['id']}", headers=admin).json()
+    assert detail["functions"]
+    assert client.get("/dashboard/api/profiles/0", headers=admin).status_code == 404
+
+    original = request_profiler.config
+    try:
+        resp = client.put(
+            "/dashboard/api/profiles/config", json={"slow_ms": 500, "routes": {"/games/{game_id}/process_turn": 0.5}},
+            headers=admin,
+        )
+        assert resp.json()["routes"] == {"/games/{game_id}/process_turn": 0.5}
+        assert request_profiler.rate_for("/games/42/process_turn") == 0.5
+    finally:
+        request_profiler.configure(original)
@@ -5,6 +5,7 @@ Tests cover ResponseCache class including TTL expiration, LRU eviction,
 thread safety, cache statistics, and error handling.
 """
 
+import inspect
 import pytest
 import time
 import threading
@@ -396,7 +397,23 @@ class TestCachedResponseDecorator:
         assert result3["result"] == "test_456"
         assert result3["call_count"] == 2
         assert call_count == 2
-    
+
+    async def test_cached_response_async_function(self, cache):
+        """Coroutine functions stay coroutine functions, and are cached."""
+        call_count = 0
+
+        @cached_response(ttl=60, key_params=["game_id"])
+        async def test_function(game_id: str) -> Dict[str, Any]:
+            nonlocal call_count
+            call_count += 1
+            return {"game_id": game_id, "call_count": call_count}
+
+        assert inspect.iscoroutinefunction(test_function)
+        assert (await test_function(game_id="async_1"))["call_count"] == 1
+        assert (await test_function(game_id="async_1"))["call_count"] == 1
+        assert (await test_function(game_id="async_2"))["call_count"] == 2
+        assert call_count == 2
+
     def test_cached_response_with_custom_ttl(self, cache):
         """Test cached_response with custom TTL."""
         call_count = 0
@@ -23,6 +23,7 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
+from server.telegram_bot.cache import _reset_caches
 from server.telegram_bot.orders import (
     show_possible_moves,
     show_support_choices,
@@ -106,7 +107,13 @@ class _Harness:
 
 
 def _run(coro_fn, harness: _Harness, bucket: list[str], unit_key: str, *args) -> None:
-    """Drive one menu function. `unit_key` is both the bucket key and the argument."""
+    """Drive one menu function. `unit_key` is both the bucket key and the argument.
+
+    Each call is its own position, so the bot's per-phase legal-orders cache is
+    emptied first -- otherwise a second call in the same test would be served
+    the first call's bucket.
+    """
+    _reset_caches()
     games = {"games": [{"game_id": 1, "power": "GERMANY"}]}
     legal = _legal_orders(bucket, unit_key)
     with patch("server.telegram_bot.game_context.api_get", return_value=games), \
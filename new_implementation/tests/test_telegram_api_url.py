@@ -8,14 +8,14 @@ import pytest
 
 @pytest.mark.unit
 def test_telegram_bot_reads_api_url_from_env(monkeypatch):
-    # Ensure fresh import
+    # Ensure fresh import; monkeypatch puts the original modules back afterwards
+    # so later tests still patch the same module objects their imports bound to.
     modules_to_clear = [
         'server.telegram_bot.config',
         'server.telegram_bot.api_client',
     ]
     for mod_name in modules_to_clear:
-        if mod_name in sys.modules:
-            del sys.modules[mod_name]
+        monkeypatch.delitem(sys.modules, mod_name, raising=False)
     
     monkeypatch.setenv('TELEGRAM_BOT_TOKEN', '12345:abcdefghijklmnopqrstuvwxyz')
     monkeypatch.setenv('DIPLOMACY_API_URL', 'https://api.example.com')
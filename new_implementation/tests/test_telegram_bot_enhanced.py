@@ -7,6 +7,7 @@ and edge cases using pytest with proper mocking.
 
 import pytest
 import asyncio
+import httpx
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from typing import Dict, Any, List
 
@@ -69,29 +70,27 @@ class TestBotCommands:
             result = get_telegram_token()
             assert result == ''
     
-    @patch('server.telegram_bot.api_client.requests.post')
-    def test_api_post_success(self, mock_post):
+    @patch('server.telegram_bot.api_client._pool')
+    def test_api_post_success(self, mock_pool):
         """Test successful API POST request."""
-        mock_response = Mock()
-        mock_response.json.return_value = {'status': 'success'}
-        mock_response.raise_for_status.return_value = None
-        mock_post.return_value = mock_response
+        mock_pool.request = AsyncMock(
+            return_value=httpx.Response(200, json={'status': 'success'}, request=httpx.Request('POST', 'http://api/test'))
+        )
 
-        result = api_post('/test', {'data': 'test'})
+        result = asyncio.run(api_post('/test', {'data': 'test'}))
         assert result == {'status': 'success'}
-        mock_post.assert_called_once()
+        mock_pool.request.assert_called_once()
 
-    @patch('server.telegram_bot.api_client.requests.get')
-    def test_api_get_success(self, mock_get):
+    @patch('server.telegram_bot.api_client._pool')
+    def test_api_get_success(self, mock_pool):
         """Test successful API GET request."""
-        mock_response = Mock()
-        mock_response.json.return_value = {'data': 'test'}
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        mock_pool.request = AsyncMock(
+            return_value=httpx.Response(200, json={'data': 'test'}, request=httpx.Request('GET', 'http://api/test'))
+        )
 
-        result = api_get('/test')
+        result = asyncio.run(api_get('/test'))
         assert result == {'data': 'test'}
-        mock_get.assert_called_once()
+        mock_pool.request.assert_called_once()
 
 
 # `TestProcessWaitingList` was removed with G5. It tested
@@ -1,7 +1,7 @@
 """Tests for the rewritten ``telegram_bot/maps.py``.
 
 The bot must never import or call ``rendering.map.Map`` -- every map image it
-shows is fetched as PNG bytes from the API (``api_client.api_get_bytes``),
+shows is fetched as PNG bytes from the API (``api_client.api_get_image``),
 which does the SVG->PNG rendering server-side. See the "PR 4" section of
 ``docs/specs/done_fixes.md``: the pre-rewrite bot called ``Map.render_board_png``
 directly in five places, including one (``/replay``) that crashed outright
@@ -15,6 +15,7 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
+from server.telegram_bot.api_client import ApiImage
 from server.telegram_bot.maps import map_command, replay, send_default_map, send_game_map
 from rendering.map import Map
 
@@ -38,33 +39,33 @@ def _make_message_update(args: list[str]):
     return update, context, message
 
 
-@patch("server.telegram_bot.maps.api_get_bytes")
+@patch("server.telegram_bot.maps.api_get_image")
 def test_send_game_map_fetches_bytes_from_api(mock_get_bytes):
     """``send_game_map`` fetches ``GET /games/{id}/map`` bytes and posts them --
     it never touches the renderer."""
-    mock_get_bytes.return_value = b"fake-png-bytes"
+    mock_get_bytes.return_value = ApiImage(b"fake-png-bytes", None)
     update, context, message = _make_message_update([])
 
     asyncio.run(send_game_map(update, context, "42"))
 
-    mock_get_bytes.assert_called_once_with("/games/42/map")
+    mock_get_bytes.assert_called_once_with("/games/42/map", if_none_match=None)
     message.reply_photo.assert_called_once()
     kwargs = message.reply_photo.call_args.kwargs
     assert kwargs["photo"].read() == b"fake-png-bytes"
 
 
-@patch("server.telegram_bot.maps.api_get_bytes")
+@patch("server.telegram_bot.maps.api_get_image")
 def test_map_command_delegates_to_send_game_map(mock_get_bytes):
-    mock_get_bytes.return_value = b"fake-png-bytes"
+    mock_get_bytes.return_value = ApiImage(b"fake-png-bytes", None)
     update, context, message = _make_message_update(["42"])
 
     asyncio.run(map_command(update, context))
 
-    mock_get_bytes.assert_called_once_with("/games/42/map")
+    mock_get_bytes.assert_called_once_with("/games/42/map", if_none_match=None)
     message.reply_photo.assert_called_once()
 
 
-@patch("server.telegram_bot.maps.api_get_bytes")
+@patch("server.telegram_bot.maps.api_get_image")
 def test_map_command_requires_game_id_arg(mock_get_bytes):
     update, context, message = _make_message_update([])
 
@@ -75,22 +76,22 @@ def test_map_command_requires_game_id_arg(mock_get_bytes):
     assert "Usage" in message.reply_text.call_args[0][0]
 
 
-@patch("server.telegram_bot.maps.api_get_bytes")
+@patch("server.telegram_bot.maps.api_get_image")
 def test_replay_fetches_history_endpoint(mock_get_bytes):
     """``/replay`` used to crash with ``'list' object has no attribute 'items'``
     because the renderer wanted ``{power: [...]}`` and the new view's ``units``
     is a list of dicts. Fetching bytes removes that conversion from the bot
     entirely -- the server does it in ``rendering.view_adapter``."""
-    mock_get_bytes.return_value = b"fake-png-bytes"
+    mock_get_bytes.return_value = ApiImage(b"fake-png-bytes", None)
     update, context, message = _make_message_update(["42", "3"])
 
     asyncio.run(replay(update, context))
 
-    mock_get_bytes.assert_called_once_with("/games/42/map/history/3")
+    mock_get_bytes.assert_called_once_with("/games/42/map/history/3", if_none_match=None)
     message.reply_photo.assert_called_once()
 
 
-@patch("server.telegram_bot.maps.api_get_bytes")
+@patch("server.telegram_bot.maps.api_get_image")
 def test_replay_requires_two_args(mock_get_bytes):
     update, context, message = _make_message_update(["42"])
 
@@ -101,28 +102,28 @@ def test_replay_requires_two_args(mock_get_bytes):
     assert "Usage" in message.reply_text.call_args[0][0]
 
 
-@patch("server.telegram_bot.maps.api_get_bytes")
+@patch("server.telegram_bot.maps.api_get_image")
 def test_send_default_map_fetches_bytes_from_api(mock_get_bytes):
     """``send_default_map`` (the "View Sample Map" button's target) fetches
     ``GET /maps/standard/preview.png`` bytes and posts them -- the server does
     the unit-less board rendering, not the bot."""
-    mock_get_bytes.return_value = b"fake-png-bytes"
+    mock_get_bytes.return_value = ApiImage(b"fake-png-bytes", None)
     update, context, message = _make_message_update([])
 
     asyncio.run(send_default_map(update, context))
 
-    mock_get_bytes.assert_called_once_with("/maps/standard/preview.png")
+    mock_get_bytes.assert_called_once_with("/maps/standard/preview.png", if_none_match=None)
     message.reply_photo.assert_called_once()
     kwargs = message.reply_photo.call_args.kwargs
     assert kwargs["photo"].read() == b"fake-png-bytes"
 
 
-@patch("server.telegram_bot.maps.api_get_bytes")
+@patch("server.telegram_bot.maps.api_get_image")
 def test_send_default_map_via_callback_query_replies_on_the_query_message(mock_get_bytes):
     """Invoked from the inline "View Sample Map" button, the map is posted as a
     new photo on the callback query's message rather than via ``update.message``
     (which is ``None`` on a pure callback update)."""
-    mock_get_bytes.return_value = b"fake-png-bytes"
+    mock_get_bytes.return_value = ApiImage(b"fake-png-bytes", None)
     update = Mock()
     context = Mock()
     query = Mock()
@@ -132,18 +133,18 @@ def test_send_default_map_via_callback_query_replies_on_the_query_message(mock_g
 
     asyncio.run(send_default_map(update, context))
 
-    mock_get_bytes.assert_called_once_with("/maps/standard/preview.png")
+    mock_get_bytes.assert_called_once_with("/maps/standard/preview.png", if_none_match=None)
     query.message.reply_photo.assert_called_once()
 
 
-@patch("server.telegram_bot.maps.api_get_bytes")
+@patch("server.telegram_bot.maps.api_get_image")
 def test_render_board_png_never_called_from_bot_for_a_game_map(mock_get_bytes):
     """The bot is a thin client over the HTTP API: rendering a map must never
     invoke ``rendering.map.Map.render_board_png`` from bot code -- all four
     PNG-producing paths (``/map``, ``/viewmap`` -> ``send_game_map``, ``/replay``,
     and the "View Sample Map" button -> ``send_default_map``) go through
-    ``api_get_bytes`` instead."""
-    mock_get_bytes.return_value = b"fake-png-bytes"
+    ``api_get_image`` instead."""
+    mock_get_bytes.return_value = ApiImage(b"fake-png-bytes", None)
 
     with patch.object(Map, "render_board_png") as mock_render:
         asyncio.run(send_game_map(*_make_message_update([])[:2], "42"))
@@ -155,3 +156,46 @@ def test_render_board_png_never_called_from_bot_for_a_game_map(mock_get_bytes):
         asyncio.run(send_default_map(update, context))
 
         mock_render.assert_not_called()
+
+
+def _uploaded(file_id: str) -> Mock:
+    """What ``reply_photo`` returns: a Message whose largest ``PhotoSize`` has ``file_id``."""
+    return Mock(photo=[Mock(file_id="thumb"), Mock(file_id=file_id)])
+
+
+@patch("server.telegram_bot.maps.api_get_image")
+def test_unchanged_board_is_sent_by_file_id_not_uploaded_again(mock_get_image):
+    """First send uploads bytes; the next sends a conditional GET and, on 304,
+    Telegram's ``file_id`` -- no download, no upload."""
+    mock_get_image.return_value = ApiImage(b"fake-png-bytes", '"v1"')
+    update, context, message = _make_message_update([])
+    message.reply_photo.return_value = _uploaded("FILE-1")
+    asyncio.run(send_game_map(update, context, "42"))
+
+    mock_get_image.return_value = ApiImage(None, '"v1"')
+    update, context, message = _make_message_update([])
+    asyncio.run(send_game_map(update, context, "42"))
+
+    assert mock_get_image.call_args.kwargs == {"if_none_match": '"v1"'}
+    assert message.reply_photo.call_args.kwargs["photo"] == "FILE-1"
+
+
+@patch("server.telegram_bot.maps.api_get_image")
+def test_changed_board_is_uploaded_and_replaces_the_file_id(mock_get_image):
+    mock_get_image.return_value = ApiImage(b"turn-1", '"v1"')
+    update, context, message = _make_message_update([])
+    message.reply_photo.return_value = _uploaded("FILE-1")
+    asyncio.run(send_game_map(update, context, "42"))
+
+    # The turn was processed: the server answers 200 with a new ETag.
+    mock_get_image.return_value = ApiImage(b"turn-2", '"v2"')
+    update, context, message = _make_message_update([])
+    message.reply_photo.return_value = _uploaded("FILE-2")
+    asyncio.run(send_game_map(update, context, "42"))
+    assert message.reply_photo.call_args.kwargs["photo"].read() == b"turn-2"
+
+    mock_get_image.return_value = ApiImage(None, '"v2"')
+    update, context, message = _make_message_update([])
+    asyncio.run(send_game_map(update, context, "42"))
+    assert mock_get_image.call_args.kwargs == {"if_none_match": '"v2"'}
+    assert message.reply_photo.call_args.kwargs["photo"] == "FILE-2"
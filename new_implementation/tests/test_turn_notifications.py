@@ -11,8 +11,9 @@ Before this, the two paths told players wildly different amounts:
   to the channel.
 
 So the failure case was richly instrumented and the success case was silent. Both
-now go through `shared.notify_turn_processed`; these tests pin that they agree, by
-driving both triggers against the *same* fake notifier and comparing recipients.
+now commit the same outbox rows (`shared.post_turn_writes`), run here with
+`outbox.drain()`; these tests pin that they agree, by driving both triggers
+against the *same* fake notifier and comparing recipients.
 
 The interesting assertion is not "a notification was sent" but "the same set of
 players is reached either way, minus the caller" — a bolt-on `notify_players` call
@@ -118,6 +119,7 @@ def test_manual_and_deadline_triggers_notify_the_same_players() -> None:
     with patch("server.api.shared.requests.post") as mock_post:
         resp = client.post(f"/games/{game_id}/process_turn", headers=caller_headers)
         assert resp.status_code == 200, resp.text
+        api_shared.outbox.drain()
         manual_recipients = _recipients(mock_post)
 
     all_telegram_ids = {tg for _h, tg in users}
@@ -138,6 +140,7 @@ def test_manual_and_deadline_triggers_notify_the_same_players() -> None:
 
     with patch("server.api.shared.requests.post") as mock_post:
         process_due_deadlines(datetime.datetime.now(datetime.timezone.utc))
+        api_shared.outbox.drain()
         deadline_recipients = _recipients(mock_post)
 
     all_telegram_ids2 = {tg for _h, tg in users2}
@@ -166,6 +169,7 @@ def test_manual_trigger_notifies_the_ordinary_case_not_only_game_end() -> None:
     with patch("server.api.shared.requests.post") as mock_post:
         resp = client.post(f"/games/{game_id}/process_turn", headers=users[0][0])
         assert resp.status_code == 200, resp.text
+        api_shared.outbox.drain()
         recipients = _recipients(mock_post)
 
     assert resp.json()["game_status"] != "COMPLETED", "fixture game ended unexpectedly"
@@ -194,6 +198,7 @@ def test_reminder_flag_is_reset_by_both_triggers() -> None:
     api_shared.reminder_sent[row_id] = True
     with patch("server.api.shared.requests.post"):
         resp = client.post(f"/games/{game_id}/process_turn", headers=users[0][0])
+        api_shared.outbox.drain()
     assert resp.status_code == 200, resp.text
     assert api_shared.reminder_sent.get(row_id) is False, (
         "manual process_turn left the reminder flag set, suppressing every future reminder"
@@ -210,6 +215,7 @@ def test_notification_failure_does_not_fail_the_turn() -> None:
 
     with patch("server.api.shared.requests.post", side_effect=OSError("telegram down")):
         resp = client.post(f"/games/{game_id}/process_turn", headers=users[0][0])
+        api_shared.outbox.drain()
 
     assert resp.status_code == 200, resp.text
     after = client.get(f"/games/{game_id}/state").json()["phase"]